@@ -8,6 +8,8 @@ import asyncio
 import logging
 import time
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, ClassVar, Final, Literal, TypeVar
 
 # This module only supports Python 3.11+ and depends on browser-use
@@ -39,6 +41,7 @@ from langcrew.tools import (
     HitlGetHandoverInfoTool,
     StreamEventType,
     StreamingBaseTool,
+    StreamRunState,
 )
 from pydantic import BaseModel, Field, PrivateAttr
 from typing_extensions import override
@@ -93,6 +96,21 @@ class BrowserCompletionEvent(BaseModel):
     intervention_info: dict[str, Any] | None = None
 
 
+@dataclass
+class BrowserRunState(StreamRunState):
+    """State of one BrowserStreamingTool invocation"""
+
+    event_queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=200)
+    )
+    agent_finished: asyncio.Event = field(default_factory=asyncio.Event)
+    agent_error: Exception | None = None
+    agent: Agent | None = None
+    previous_goal: str | None = None
+    previous_screenshot: str | None = None
+    runnable_config: RunnableConfig | None = None
+
+
 class BrowserStreamingTool(
     StreamingBaseTool, SandboxMixin, S3ClientMixin, HitlGetHandoverInfoTool
 ):
@@ -101,6 +119,7 @@ class BrowserStreamingTool(
     DESKTOP_RESOLUTION: Final[tuple[int, int]] = (1280, 1020)
 
     name: ClassVar[str] = "browser-use"
+    run_state_class: ClassVar[type[StreamRunState]] = BrowserRunState
     args_schema: type[BaseModel] = BrowserUseInput
     description: ClassVar[str] = (
         "Use this tool to interact with web browsers. Input should be a natural language description of what you want to do with the browser, such as 'Go to google.com and search for browser-use', or 'Navigate to Reddit and find the top post about AI'."
@@ -125,16 +144,10 @@ class BrowserStreamingTool(
     desktop_resolution: tuple[int, int] = Field(
         default=..., description="Desktop resolution"
     )
-    # Private attributes
-    _event_queue: asyncio.Queue | None = PrivateAttr(default=None)
-    _agent_finished: asyncio.Event | None = PrivateAttr(default=None)
-    _agent_error: Exception | None = PrivateAttr(default=None)
-    _agent: Agent | None = PrivateAttr(default=None)
+    # Private attributes of the sandbox browser, shared by all invocations.
+    # State of an invocation is kept in its BrowserRunState.
     _sandbox_id: str | None = PrivateAttr(default=None)
     _vnc_url: str | None = PrivateAttr(default=None)
-    _previous_goal: str | None = PrivateAttr(default=None)
-    _previous_screenshot: str | None = PrivateAttr(default=None)
-    _runnable_config: RunnableConfig | None = PrivateAttr(default=None)
     _browser_session: BrowserSession | None = PrivateAttr(default=None)
 
     def __init__(
@@ -180,14 +193,10 @@ class BrowserStreamingTool(
         if self.page_extraction_llm is None:
             self.page_extraction_llm = self.vl_llm
 
-        # Initialize async objects
-        self._event_queue = asyncio.Queue(maxsize=200)
-        self._agent_finished = asyncio.Event()
-
     @override
     def configure_runnable(self, config: RunnableConfig):
         """Configure runnable with  interface"""
-        self._runnable_config = config
+        self.run_state.runnable_config = config
 
     @override
     async def handle_external_completion(
@@ -208,8 +217,9 @@ class BrowserStreamingTool(
             result = "Agent add new task"
 
         agent_result = "nothing"
-        if self._agent.state.last_model_output:
-            output = self._agent.state.last_model_output
+        agent = self.run_state.agent
+        if agent and agent.state.last_model_output:
+            output = agent.state.last_model_output
             agent_result = (
                 f"thinking:{output.thinking}\n"
                 f"evaluation_previous_goal:{output.evaluation_previous_goal}\n"
@@ -325,7 +335,7 @@ class BrowserStreamingTool(
             )
             self._browser_session = sandbox_browser_session_manager._browser_session
 
-    async def init_agent(self, instruction: str):
+    async def init_agent(self, instruction: str, state: BrowserRunState):
         # init sandbox
         async_sandbox = await self.get_sandbox()
         await self._init_sandbox(async_sandbox)
@@ -346,32 +356,33 @@ class BrowserStreamingTool(
 
         agent = Agent(**agent_params)
 
-        # Set up callbacks
-        agent.register_new_step_callback = self._new_step_callback
-        agent.register_done_callback = self._done_callback
-        agent.register_external_agent_status_raise_error_callback = (
-            self._status_callback
+        # Set up callbacks, bound to the invocation
+        agent.register_new_step_callback = partial(self._new_step_callback, state)
+        agent.register_done_callback = partial(self._done_callback, state)
+        agent.register_external_agent_status_raise_error_callback = partial(
+            self._status_callback, state
         )
-        self._agent = agent
+        state.agent = agent
 
     async def _new_step_callback(
         self,
+        state: BrowserRunState,
         browser_state: BrowserStateSummary,
         model_output: AgentOutput,
         step_number: int,
     ) -> None:
         """Callback for new step events - pushes to event queue immediately"""
-        init_handle_page_created(self._agent)
+        init_handle_page_created(state.agent)
 
         is_url = browser_state.url.startswith("http")
         if (
             not is_url
-            and self._previous_screenshot is None
+            and state.previous_screenshot is None
             and self.first_screenshot_url
         ):
-            self._previous_screenshot = self.first_screenshot_url
+            state.previous_screenshot = self.first_screenshot_url
         elif browser_state.screenshot:
-            self._previous_screenshot = browser_state.screenshot
+            state.previous_screenshot = browser_state.screenshot
 
         try:
             event_data = BrowserStepEvent(
@@ -388,32 +399,32 @@ class BrowserStreamingTool(
                 ]
                 if model_output.action
                 else [],
-                screenshot=self._previous_screenshot,
+                screenshot=state.previous_screenshot,
                 interactive_elements_count=len(browser_state.selector_map)
                 if browser_state.selector_map
                 else 0,
-                previous_goal=self._previous_goal,
+                previous_goal=state.previous_goal,
             )
-            self._previous_goal = model_output.next_goal
+            state.previous_goal = model_output.next_goal
 
             # Format event with consistent structure
             formatted_event = self._format_event(
                 event_data.model_dump(), "intermediate"
             )
 
-            # Immediately push to queue (type check ensures queue is not None)
-            if self._event_queue is not None:
-                await self._event_queue.put(("intermediate", formatted_event))
+            # Immediately push to queue
+            await state.event_queue.put(("intermediate", formatted_event))
 
             logger.debug(f"Step {step_number} event queued")
 
         except Exception as e:
             logger.error(f"Error in step callback: {e}")
-            if self._event_queue is not None:
-                error_event = self._format_event({"step": step_number}, "error", str(e))
-                await self._event_queue.put(("intermediate", error_event))
+            error_event = self._format_event({"step": step_number}, "error", str(e))
+            await state.event_queue.put(("intermediate", error_event))
 
-    async def _done_callback(self, history: AgentHistoryList) -> None:
+    async def _done_callback(
+        self, state: BrowserRunState, history: AgentHistoryList
+    ) -> None:
         """Completion callback - pushes end event and marks agent as finished"""
         try:
             event_data = BrowserCompletionEvent(
@@ -422,31 +433,29 @@ class BrowserStreamingTool(
                 total_steps=len(history.history),
                 errors=[e for e in history.errors() if e is not None],
                 urls=[u for u in history.urls() if u is not None],
-                previous_goal=self._previous_goal,
-                screenshot=self._previous_screenshot,
+                previous_goal=state.previous_goal,
+                screenshot=state.previous_screenshot,
             )
 
             logger.info(f"BrowserCompletionEvent errors: {event_data.errors}")
 
             last_action = history.last_action()
             if last_action and "request_human_intervention" in last_action:
-                await self._intervention_callback(history)
+                await self._intervention_callback(state, history)
             else:
                 # Format event with consistent structure
                 formatted_event = self._format_event(event_data.model_dump(), "end")
                 # Notify converter that an intermediate event has been completed
-                await self._event_queue.put(("intermediate", formatted_event))
-                await self._event_queue.put(("end", history.final_result()))
+                await state.event_queue.put(("intermediate", formatted_event))
+                await state.event_queue.put(("end", history.final_result()))
 
         except Exception as e:
             logger.error(f"Error in done callback: {e}")
-            if self._event_queue is not None:
-                error_event = self._format_event({}, "error", str(e))
-                await self._event_queue.put(("end", error_event))
+            error_event = self._format_event({}, "error", str(e))
+            await state.event_queue.put(("end", error_event))
         finally:
             # Mark agent as finished (double insurance)
-            if self._agent_finished is not None:
-                self._agent_finished.set()
+            state.agent_finished.set()
 
     @override
     async def get_handover_info(self) -> dict | None:
@@ -460,7 +469,9 @@ class BrowserStreamingTool(
             }
         return None
 
-    async def _intervention_callback(self, history: AgentHistoryList) -> None:
+    async def _intervention_callback(
+        self, state: BrowserRunState, history: AgentHistoryList
+    ) -> None:
         """Handle human intervention callback"""
         human_intervention_action: HumanInterventionAction = (
             history.history[-1].model_output.action[-1].root.request_human_intervention
@@ -473,12 +484,12 @@ class BrowserStreamingTool(
         )
 
         intervention_dict["intervention_url"] = intervention_url
-        intervention_dict["screenshot"] = self._previous_screenshot
+        intervention_dict["screenshot"] = state.previous_screenshot
         formatted_event = self._format_event(intervention_dict, "end")
         # Notify converter that an intermediate event has been completed
-        await self._event_queue.put(("intermediate", formatted_event))
+        await state.event_queue.put(("intermediate", formatted_event))
         # Tool normal output result
-        await self._event_queue.put((
+        await state.event_queue.put((
             "end",
             self.to_human_intervention_prompt(intervention_dict["suggestion"]),
         ))
@@ -490,54 +501,41 @@ class BrowserStreamingTool(
             "You MUST now use tool to request instructions from the user on how to proceed. This is a mandatory next step."
         )
 
-    async def _status_callback(self) -> bool:
+    async def _status_callback(self, state: BrowserRunState) -> bool:
         """Status callback - returns whether agent should stop"""
-        if self._agent.state:
-            logger.info(f"Status callback: {self._agent.state.last_model_output}")
-        return (
-            self._agent_finished.is_set() if self._agent_finished is not None else False
-        )
+        if state.agent.state:
+            logger.info(f"Status callback: {state.agent.state.last_model_output}")
+        return state.agent_finished.is_set()
 
-    async def _run_agent_with_completion(self, max_steps: int) -> None:
+    async def _run_agent_with_completion(
+        self, state: BrowserRunState, max_steps: int
+    ) -> None:
         """Wrapper for agent.run() that ensures completion flag is set"""
         try:
-            await self._agent.run(max_steps=max_steps)
+            await state.agent.run(max_steps=max_steps)
         except Exception as e:
             logger.error(f"Agent execution failed: {e}")
-            self._agent_error = e
+            state.agent_error = e
             # Even on error, push error event
-            if self._event_queue is not None:
-                error_event = self._format_event({}, "error", str(e))
-                await self._event_queue.put(("end", error_event))
+            error_event = self._format_event({}, "error", str(e))
+            await state.event_queue.put(("end", error_event))
         finally:
             # Always mark agent as finished
-            if self._agent_finished is not None:
-                self._agent_finished.set()
-
-    # The same tool will be called multiple times during agent execution, need to reset state
-    def reset_state(self):
-        """Reset state for new execution"""
-        # Reset state
-        if self._agent_finished is not None:
-            self._agent_finished.clear()
-        self._agent_error = None
-        # Clear any existing events in queue
-        if self._event_queue is not None:
-            while not self._event_queue.empty():
-                try:
-                    self._event_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
+            state.agent_finished.set()
 
     def safe_resume(self):
-        """Safe resume method"""
-        if self._agent.state.stopped:
+        """Safe resume method for the agent of the current invocation"""
+        state = self.run_state
+        agent = state.agent if state else None
+        if agent is None:
+            return False
+        if agent.state.stopped:
             logger.error("Agent stopped, cannot resume")
             return False
-        elif self._agent.state.paused:
+        elif agent.state.paused:
             logger.info("Resuming agent execution...")
             try:
-                self._agent.resume()
+                agent.resume()
             except Exception as e:
                 logger.warning(f"Error resuming agent: {e}")
                 # Source code recovery exception, do not handle
@@ -547,16 +545,20 @@ class BrowserStreamingTool(
             return True
 
     def safe_pause(self):
-        """Safe pause method"""
-        if self._agent.state.stopped:
+        """Safe pause method for the agent of the current invocation"""
+        state = self.run_state
+        agent = state.agent if state else None
+        if agent is None:
+            return False
+        if agent.state.stopped:
             logger.error("Agent stopped, cannot pause")
             return False
-        elif self._agent.state.paused:
+        elif agent.state.paused:
             logger.info("Agent already paused")
             return True
         else:
             logger.info("Pausing agent execution...")
-            self._agent.pause()
+            agent.pause()
             return True
 
     @override
@@ -569,17 +571,17 @@ class BrowserStreamingTool(
         self, instruction: str, **kwargs: Any
     ) -> AsyncIterator[tuple[StreamEventType, StandardStreamEvent]]:
         """Stream events using  interface"""
-        self.reset_state()
-        await self.init_agent(instruction)
-        self._previous_goal = "open_browser"
+        state = self.run_state
+        await self.init_agent(instruction, state)
+        state.previous_goal = "open_browser"
 
         # Send start event with consistent format
         start_event = self._format_event(
             data={
                 "task": instruction,
-                "next_goal": self._previous_goal,
-                "agent_id": self._agent.task_id,
-                "model": self._agent.llm.model,
+                "next_goal": state.previous_goal,
+                "agent_id": state.agent.task_id,
+                "model": state.agent.llm.model,
             },
             type="start",
         )
@@ -588,57 +590,37 @@ class BrowserStreamingTool(
 
         # Start agent (don't wait for completion)
         agent_task = asyncio.create_task(
-            self._run_agent_with_completion(self.step_limit)
+            self._run_agent_with_completion(state, self.step_limit)
         )
 
         try:
             # Consume events until agent completes and queue is empty
             while True:
                 try:
-                    # Wait for event with timeout (type check ensures queue is not None)
-                    if self._event_queue is not None:
-                        event_type, event_data = await asyncio.wait_for(
-                            self._event_queue.get(), timeout=0.1
-                        )
-
-                        if event_type == "intermediate":
-                            yield (
-                                StreamEventType.INTERMEDIATE,
-                                self.start_standard_stream_event(event_data),
-                            )
-                        elif event_type == "end":
-                            yield (
-                                StreamEventType.END,
-                                self.end_standard_stream_event(event_data),
-                            )
-                            break
+                    # Wait for event with timeout
+                    event_type, event_data = await asyncio.wait_for(
+                        state.event_queue.get(), timeout=0.1
+                    )
 
-                    else:
-                        # If queue is None, something went wrong
-                        error_event = self._format_event(
-                            type="error", error_msg="Event queue is None"
+                    if event_type == "intermediate":
+                        yield (
+                            StreamEventType.INTERMEDIATE,
+                            self.start_standard_stream_event(event_data),
+                        )
+                    elif event_type == "end":
+                        yield (
+                            StreamEventType.END,
+                            self.end_standard_stream_event(event_data),
                         )
-                        yield StreamEventType.END, error_event
                         break
 
                 except TimeoutError:
                     # Check if agent is finished and queue is empty
-                    agent_finished = (
-                        self._agent_finished.is_set()
-                        if self._agent_finished is not None
-                        else True
-                    )
-                    queue_empty = (
-                        self._event_queue.empty()
-                        if self._event_queue is not None
-                        else True
-                    )
-
-                    if agent_finished and queue_empty:
+                    if state.agent_finished.is_set() and state.event_queue.empty():
                         # Agent finished but no end event - create one
-                        if self._agent_error:
+                        if state.agent_error:
                             error_event = self._format_event(
-                                type="error", error_msg=str(self._agent_error)
+                                type="error", error_msg=str(state.agent_error)
                             )
                             yield StreamEventType.END, error_event
                         else:
@@ -652,23 +634,22 @@ class BrowserStreamingTool(
                     continue
 
             # Final sweep: consume any remaining events in queue
-            if self._event_queue is not None:
-                while not self._event_queue.empty():
-                    try:
-                        event_type, event_data = self._event_queue.get_nowait()
-                        if event_type == "intermediate":
-                            yield (
-                                StreamEventType.INTERMEDIATE,
-                                self.start_standard_stream_event(event_data),
-                            )
-                        elif event_type == "end":
-                            yield (
-                                StreamEventType.END,
-                                self.end_standard_stream_event(event_data),
-                            )
-                            break
-                    except asyncio.QueueEmpty:
+            while not state.event_queue.empty():
+                try:
+                    event_type, event_data = state.event_queue.get_nowait()
+                    if event_type == "intermediate":
+                        yield (
+                            StreamEventType.INTERMEDIATE,
+                            self.start_standard_stream_event(event_data),
+                        )
+                    elif event_type == "end":
+                        yield (
+                            StreamEventType.END,
+                            self.end_standard_stream_event(event_data),
+                        )
                         break
+                except asyncio.QueueEmpty:
+                    break
 
         except Exception as e:
             logger.error(f"Error in event streaming: {e}")
@@ -680,8 +661,8 @@ class BrowserStreamingTool(
             if not agent_task.done():
                 agent_task.cancel()
             # Re-raise agent error if it occurred
-            if self._agent_error:
-                logger.error(f"Agent error occurred: {self._agent_error}")
+            if state.agent_error:
+                logger.error(f"Agent error occurred: {state.agent_error}")
 
     @override
     async def handle_standard_stream_event(
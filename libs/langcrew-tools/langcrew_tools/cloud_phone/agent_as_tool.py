@@ -29,7 +29,10 @@ from agentbox import AsyncSandbox
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
-from langcrew.utils.runnable_config_utils import RunnableStateManager
+from langcrew.utils.runnable_config_utils import (
+    INTERNAL_RUN_TAG,
+    RunnableStateManager,
+)
 from langgraph.graph.state import CompiledStateGraph
 from pydantic import BaseModel, Field, PrivateAttr
 
@@ -197,6 +200,7 @@ class CloudPhoneStreamingTool(ExternalCompletionBaseTool, HitlGetHandoverInfoToo
         final_config = {
             "configurable": {"thread_id": self.session_id + "_cloudphone"},
             "recursion_limit": self.recursion_limit,
+            "tags": [INTERNAL_RUN_TAG],
         }
         self.config = final_config
         RunnableStateManager.init_state(self.config)
@@ -282,7 +286,7 @@ class CloudPhoneStreamingTool(ExternalCompletionBaseTool, HitlGetHandoverInfoToo
         return content
 
     async def pre_model_hook(self, state: dict[str, Any]) -> dict[str, Any]:
-         await self._cloudphone_handler_with_model.pre_hook(self.base_model, state)
+        await self._cloudphone_handler_with_model.pre_hook(self.base_model, state)
 
     async def post_model_hook(self, state: dict[str, Any]) -> dict[str, Any]:
         messages = state.get("messages", [])
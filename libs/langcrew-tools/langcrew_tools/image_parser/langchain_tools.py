@@ -13,6 +13,7 @@ import httpx
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage
 from langchain_core.tools import BaseTool
+from langcrew.utils.runnable_config_utils import internal_run_config
 from pydantic import BaseModel, Field
 
 from ..base import BaseToolInput
@@ -255,7 +256,9 @@ class ImageParserTool(BaseTool):
         try:
             # Use async invoke if available, otherwise fall back to sync
             if hasattr(self.llm, "ainvoke"):
-                response = await self.llm.ainvoke([message])
+                response = await self.llm.ainvoke(
+                    [message], config=internal_run_config()
+                )
             else:
                 # Fall back to sync invoke in async context
                 loop = asyncio.get_event_loop()
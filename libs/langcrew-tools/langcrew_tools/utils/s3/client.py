@@ -8,6 +8,7 @@ from typing import Any
 import aiobotocore.session
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
+from langcrew.utils.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -139,29 +140,37 @@ class AsyncS3Client:
         Raises:
             S3ClientError: If all retries fail
         """
-        last_error = None
-
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                return await operation(*args, **kwargs)
-            except (ClientError, BotoCoreError) as e:
-                last_error = e
-                if attempt < self.config.max_retries:
-                    delay = self.config.retry_delay * (
-                        2**attempt
-                    )  # Exponential backoff
-                    logger.warning(
-                        f"Operation failed (attempt {attempt + 1}), retrying in {delay}s: {e}"
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(
-                        f"Operation failed after {self.config.max_retries + 1} attempts: {e}"
-                    )
-
-        raise S3ClientError(
-            f"Operation failed after {self.config.max_retries + 1} attempts", last_error
-        )
+        # Operations wrapped by _handle_bucket_not_found come as first argument
+        target = args[0] if operation == self._handle_bucket_not_found else operation
+        span_name = f"s3.{getattr(target, '__name__', 'operation').lstrip('_')}"
+        with trace_span(span_name, {"s3.bucket": self.config.bucket}) as span:
+            last_error = None
+
+            for attempt in range(self.config.max_retries + 1):
+                try:
+                    result = await operation(*args, **kwargs)
+                    if span is not None and attempt:
+                        span.set_attribute("s3.retries", attempt)
+                    return result
+                except (ClientError, BotoCoreError) as e:
+                    last_error = e
+                    if attempt < self.config.max_retries:
+                        delay = self.config.retry_delay * (
+                            2**attempt
+                        )  # Exponential backoff
+                        logger.warning(
+                            f"Operation failed (attempt {attempt + 1}), retrying in {delay}s: {e}"
+                        )
+                        await asyncio.sleep(delay)
+                    else:
+                        logger.error(
+                            f"Operation failed after {self.config.max_retries + 1} attempts: {e}"
+                        )
+
+            raise S3ClientError(
+                f"Operation failed after {self.config.max_retries + 1} attempts",
+                last_error,
+            )
 
     async def _handle_bucket_not_found(self, operation, *args, **kwargs):
         """
@@ -316,7 +325,7 @@ class AsyncS3Client:
                 "Bucket": bucket_name,
                 "Key": object_key,
                 "Body": content,
-                "ContentType": content_type
+                "ContentType": content_type,
             }
 
             if metadata:
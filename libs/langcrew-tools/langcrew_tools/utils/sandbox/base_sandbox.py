@@ -4,6 +4,7 @@ from typing import Any, Final, TypeVar, Union
 
 from agentbox import AsyncSandbox
 from langcrew.utils import CheckpointerSessionStateManager
+from langcrew.utils.tracing import trace_span
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from ..env_config import env_config
@@ -31,7 +32,9 @@ class SandboxMixin(BaseModel):
         super().__init__(**kwargs)
 
     async def get_sandbox(self) -> AsyncSandbox:
-        if not self._sandbox:
+        if self._sandbox:
+            return self._sandbox
+        with trace_span("sandbox.get"):
             # Handle different types of async_sandbox_provider
             # async_sandbox_provider handles concurrent loading issues
 
@@ -105,18 +108,22 @@ async def create_sandbox_from_env_config(
     template = E2B_CONFIG.get("template")
 
     if sandbox_id:
-        running_sandboxes = await AsyncSandbox.list(api_key=api_key, domain=domain)
-        for sandbox in running_sandboxes:
-            if sandbox.sandbox_id == sandbox_id:
-                return await AsyncSandbox.connect(
-                    sandbox_id=sandbox_id,
-                    api_key=api_key,
-                    domain=domain,
-                )
-
-    return await AsyncSandbox.create(
-        api_key=api_key,
-        template=template,
-        timeout=timeout,
-        domain=domain,
-    )
+        with trace_span("sandbox.connect", {"sandbox.id": sandbox_id}) as span:
+            running_sandboxes = await AsyncSandbox.list(api_key=api_key, domain=domain)
+            for sandbox in running_sandboxes:
+                if sandbox.sandbox_id == sandbox_id:
+                    return await AsyncSandbox.connect(
+                        sandbox_id=sandbox_id,
+                        api_key=api_key,
+                        domain=domain,
+                    )
+            if span is not None:
+                span.set_attribute("sandbox.found", False)
+
+    with trace_span("sandbox.create", {"sandbox.template": template or ""}):
+        return await AsyncSandbox.create(
+            api_key=api_key,
+            template=template,
+            timeout=timeout,
+            domain=domain,
+        )
@@ -0,0 +1,106 @@
+"""Benchmark per-token overhead of the LangGraphAdapter event engines.
+
+Streams a long answer from a fake chat model through a LangGraph agent (prompt,
+model and output parser inside a node) and measures ``LangGraphAdapter.execute``
+with the ``events`` engine (astream_events) and the ``stream`` engine (astream
+stream modes), each with and without RunMetrics. The time of streaming the
+model on its own is subtracted to get the overhead added per token.
+
+Usage:
+    python benchmarks/bench_adapter_engines.py [--tokens 2000]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Annotated, TypedDict
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.metrics import RunMetrics
+from langcrew.web.protocol import TaskInput
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+def _fake_model(tokens: int) -> GenericFakeChatModel:
+    # GenericFakeChatModel splits on whitespace, keeping separators as tokens
+    answer = " ".join(["token"] * ((tokens + 1) // 2))
+    return GenericFakeChatModel(messages=iter([AIMessage(content=answer)] * 1000))
+
+
+def build_graph(tokens: int):
+    prompt = ChatPromptTemplate.from_messages([("placeholder", "{messages}")])
+    chain = prompt | _fake_model(tokens) | StrOutputParser()
+
+    async def agent(state: State):
+        answer = await chain.ainvoke({"messages": state["messages"]})
+        return {"messages": [AIMessage(content=answer)]}
+
+    builder = StateGraph(State)
+    builder.add_node("agent", agent)
+    builder.add_edge(START, "agent")
+    builder.add_edge("agent", END)
+    return builder.compile()
+
+
+async def model_only(tokens: int) -> tuple[float, int]:
+    model = _fake_model(tokens)
+    count = 0
+    start = time.perf_counter()
+    async for _ in model.astream("hi"):
+        count += 1
+    return time.perf_counter() - start, count
+
+
+async def adapter_run(
+    engine: str, tokens: int, metrics: bool = False
+) -> tuple[float, int]:
+    adapter = LangGraphAdapter(
+        compiled_graph=build_graph(tokens),
+        engine=engine,
+        metrics=RunMetrics() if metrics else None,
+    )
+    count = 0
+    start = time.perf_counter()
+    async for _ in adapter.execute(TaskInput(session_id="bench", message="hi")):
+        count += 1
+    return time.perf_counter() - start, count
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    async def best(run) -> tuple[float, int]:
+        results = [await run() for _ in range(args.repeat)]
+        return min(elapsed for elapsed, _ in results), results[0][1]
+
+    baseline, tokens = await best(lambda: model_only(args.tokens))
+    print(f"{tokens} tokens, best of {args.repeat} runs")
+    print(f"  {'model only':<26} {baseline / tokens * 1e6:6.1f} us/token")
+    for engine in LangGraphAdapter.ENGINES:
+        for metrics in (False, True):
+            elapsed, messages = await best(
+                lambda e=engine, m=metrics: adapter_run(e, args.tokens, m)
+            )
+            overhead = (elapsed - baseline) / tokens * 1e6
+            label = f"{engine} engine" + (" + metrics" if metrics else "")
+            print(
+                f"  {label:<26} {elapsed / tokens * 1e6:6.1f} us/token"
+                f"  (+{overhead:.1f} us overhead, {messages} SSE messages)"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+"""Benchmark astream_events volume with and without adapter event filters.
+
+Runs a multi-turn, multi-tool LangGraph offline: every agent turn goes through
+a prompt, a streaming fake chat model and an output parser, then several tools
+run in parallel, each invoking its own helper chains and an internal model call
+tagged with ``INTERNAL_RUN_TAG``. The events reaching ``LangGraphAdapter`` are
+counted with ``filter_events`` off and on.
+
+Usage:
+    python benchmarks/bench_event_filtering.py [--turns 4] [--tools 3]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Annotated, TypedDict
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import tool
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from langcrew.utils.runnable_config_utils import internal_run_config
+from langcrew.web.adapter import LangGraphAdapter
+
+ANSWER = " ".join(f"token{i}" for i in range(60))
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+    turn: int
+
+
+def _fake_model(text: str) -> GenericFakeChatModel:
+    return GenericFakeChatModel(messages=iter([AIMessage(content=text)] * 1000))
+
+
+@tool
+async def search(query: str) -> str:
+    """Search documents."""
+    normalize = RunnableLambda(str.strip) | RunnableLambda(str.lower)
+    terms = await normalize.ainvoke(query)
+    summary = await (_fake_model("short internal summary") | StrOutputParser()).ainvoke(
+        terms, config=internal_run_config()
+    )
+    return f"{terms}: {summary}"
+
+
+def build_graph(turns: int, tools: int):
+    prompt = ChatPromptTemplate.from_messages([("placeholder", "{messages}")])
+    chain = prompt | _fake_model(ANSWER) | StrOutputParser()
+
+    async def agent(state: State):
+        answer = await chain.ainvoke({"messages": state["messages"]})
+        return {"messages": [AIMessage(content=answer)], "turn": state["turn"] + 1}
+
+    async def run_tools(state: State):
+        results = await asyncio.gather(
+            *(search.ainvoke(f" Query {i} ") for i in range(tools))
+        )
+        return {"messages": [HumanMessage(content=result) for result in results]}
+
+    def route(state: State):
+        return "tools" if state["turn"] < turns else END
+
+    builder = StateGraph(State)
+    builder.add_node("agent", agent)
+    builder.add_node("tools", run_tools)
+    builder.add_edge(START, "agent")
+    builder.add_conditional_edges("agent", route, ["tools", END])
+    builder.add_edge("tools", "agent")
+    return builder.compile()
+
+
+async def measure(
+    filter_events: bool, turns: int, tools: int
+) -> tuple[int, int, float]:
+    adapter = LangGraphAdapter(
+        compiled_graph=build_graph(turns, tools), filter_events=filter_events
+    )
+    config = adapter._build_config("bench")
+    events = 0
+    tokens = 0
+    start = time.perf_counter()
+    async for event in adapter._astream_events_until_stopped(
+        "bench", {"messages": [HumanMessage(content="hi")], "turn": 0}, config
+    ):
+        events += 1
+        tokens += event["event"] == "on_chat_model_stream"
+    return events, tokens, time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=4)
+    parser.add_argument("--tools", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.turns} agent turns, {args.tools} tools per turn")
+    for name, filter_events in (("unfiltered", False), ("filtered", True)):
+        runs = [
+            await measure(filter_events, args.turns, args.tools)
+            for _ in range(args.repeat)
+        ]
+        events, tokens, _ = runs[0]
+        best = min(elapsed for _, _, elapsed in runs)
+        print(
+            f"  {name:<11} {events:5d} events ({events - tokens:4d} besides tokens)"
+            f"  {best * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
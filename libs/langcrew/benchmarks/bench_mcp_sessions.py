@@ -0,0 +1,89 @@
+"""Benchmark MCP tool call latency with and without pooled sessions.
+
+Starts a local stdio FastMCP server and calls one of its tools through
+``MCPToolAdapter`` tools, once opening a new session (and server process)
+per call and once on the long-lived sessions of ``MCPSessionManager``.
+
+Usage:
+    python benchmarks/bench_mcp_sessions.py [--calls 20]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from langcrew.tools.mcp import MCPToolAdapter
+from langcrew.tools.mcp_sessions import MCPSessionManager
+
+SERVER = """
+from mcp.server.fastmcp import FastMCP
+
+server = FastMCP("echo", log_level="WARNING")
+
+
+@server.tool()
+def echo(text: str) -> str:
+    \"\"\"Echo the text back.\"\"\"
+    return text
+
+
+server.run()
+"""
+
+
+async def measure(servers: dict, calls: int, pooled: bool) -> list[float]:
+    MCPToolAdapter.clear_cache()
+    manager = MCPSessionManager() if pooled else None
+    if not pooled:
+        os.environ["LANGCREW_MCP_SESSION_POOL"] = "false"
+    try:
+        (tool,) = await MCPToolAdapter(session_manager=manager).from_servers(servers)
+        latencies = []
+        for i in range(calls):
+            start = time.perf_counter()
+            await tool.ainvoke({"text": f"call {i}"})
+            latencies.append(time.perf_counter() - start)
+        return latencies
+    finally:
+        os.environ.pop("LANGCREW_MCP_SESSION_POOL", None)
+        if manager is not None:
+            await manager.aclose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=20, help="Tool calls per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / "echo_server.py"
+        script.write_text(SERVER)
+        servers = {
+            "echo": {
+                "command": sys.executable,
+                "args": [str(script)],
+                "transport": "stdio",
+            }
+        }
+        results = [
+            ("session per call", await measure(servers, args.calls, pooled=False)),
+            ("pooled sessions", await measure(servers, args.calls, pooled=True)),
+        ]
+
+    print(f"{args.calls} calls to a local stdio MCP server")
+    print(f"{'mode':<18}{'first':>10}{'p50':>10}{'p95':>10}")
+    for label, latencies in results:
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(
+            f"{label:<18}{latencies[0] * 1000:>8.1f}ms"
+            f"{statistics.median(latencies) * 1000:>8.1f}ms{p95 * 1000:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Benchmark per-event SSE serialization cost on the model token path.
+
+Compares the original path (dict copy for metadata, StreamMessage construction
+and ``model_dump_json``) with the precomputed ``TaskEnvelope`` path used by
+``LangGraphAdapter`` for model tokens.
+
+Usage:
+    python benchmarks/bench_sse_serialization.py [--events 100000]
+"""
+
+import argparse
+import time
+import timeit
+
+from langcrew.utils.message_utils import generate_message_id
+from langcrew.web.protocol import MessageType, StreamMessage
+from langcrew.web.serialization import TaskEnvelope, dumps_stream_message
+
+SESSION_ID = "3f2a9c1e7b5d4a60"
+TASK_ID = f"{SESSION_ID}_204041"
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+EVENT = {
+    "event": "on_chat_model_stream",
+    "run_id": "0f6a3c43-2a8c-4a4e-9d35-3c3e2f1a8b77",
+    "metadata": {"langcrew_agent": "researcher", "langcrew_task": "research"},
+}
+TOKEN = " token"
+
+
+def legacy_path() -> str:
+    detail = {"streaming": True, "run_id": EVENT["run_id"]}
+    metadata = EVENT.get("metadata", {})
+    langcrew_info = {}
+    if metadata.get("langcrew_agent"):
+        langcrew_info["langcrew_agent"] = metadata["langcrew_agent"]
+    if metadata.get("langcrew_task"):
+        langcrew_info["langcrew_task"] = metadata["langcrew_task"]
+    detail = {**detail, **langcrew_info}
+    message = StreamMessage(
+        id=generate_message_id(),
+        type=MessageType.TEXT,
+        content=TOKEN,
+        detail=detail,
+        role="assistant",
+        timestamp=int(time.time() * 1000),
+        session_id=SESSION_ID,
+        task_id=TASK_ID,
+        field_name="content",
+    )
+    message.trace_id = TRACE_ID
+    return f"data: {message.model_dump_json()}\n\n"
+
+
+def message_path() -> str:
+    detail = {"streaming": True, "run_id": EVENT["run_id"]}
+    detail["langcrew_agent"] = EVENT["metadata"]["langcrew_agent"]
+    detail["langcrew_task"] = EVENT["metadata"]["langcrew_task"]
+    message = StreamMessage(
+        id=generate_message_id(),
+        type=MessageType.TEXT,
+        content=TOKEN,
+        detail=detail,
+        role="assistant",
+        timestamp=int(time.time() * 1000),
+        session_id=SESSION_ID,
+        task_id=TASK_ID,
+        trace_id=TRACE_ID,
+        field_name="content",
+    )
+    return f"data: {dumps_stream_message(message)}\n\n"
+
+
+ENVELOPE = TaskEnvelope(SESSION_ID, TASK_ID, TRACE_ID)
+
+
+def envelope_path() -> str:
+    detail = {"streaming": True, "run_id": EVENT["run_id"]}
+    detail["langcrew_agent"] = EVENT["metadata"]["langcrew_agent"]
+    detail["langcrew_task"] = EVENT["metadata"]["langcrew_task"]
+    payload = ENVELOPE.text_chunk(
+        generate_message_id(), TOKEN, detail, int(time.time() * 1000)
+    )
+    return f"data: {payload}\n\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    paths = [
+        ("model_dump_json (before)", legacy_path),
+        ("StreamMessage + orjson", message_path),
+        ("TaskEnvelope (token path)", envelope_path),
+    ]
+
+    print(f"{args.events} events, best of {args.repeat} runs")
+    baseline = None
+    for name, func in paths:
+        best = min(timeit.repeat(func, number=args.events, repeat=args.repeat))
+        per_event_us = best / args.events * 1e6
+        baseline = baseline or per_event_us
+        print(
+            f"  {name:<28} {per_event_us:6.2f} us/event"
+            f"  ({baseline / per_event_us:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
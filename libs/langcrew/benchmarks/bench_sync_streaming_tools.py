@@ -0,0 +1,126 @@
+"""Benchmark sync Crew.invoke runs calling streaming tools.
+
+Each run of a crew calls a ``StreamingBaseTool`` through a fake tool-calling
+model. The tool talks to a fake service through an async client bound to the
+event loop it was created on, like an HTTP connection pool, with a fixed
+connection setup cost. Sync runs are measured once with a new event loop per
+tool call (the former ``asyncio.run`` in ``StreamingBaseTool._run``) and once
+on the shared bridge loop, where the client is reused.
+
+Usage:
+    python benchmarks/bench_sync_streaming_tools.py [--runs 20] [--connect-ms 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import weakref
+from pathlib import Path
+
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
+
+from langcrew.agent import Agent
+from langcrew.crew import Crew
+from langcrew.tools import StreamEventType, StreamingBaseTool
+
+sys.path.insert(0, str(Path(__file__).parent / "server"))
+
+from fakes import FakeStreamingChatModel  # noqa: E402
+
+
+class FakeServiceClient:
+    """Async client of a fake service, usable only on the loop it was created on"""
+
+    connect_seconds = 0.02
+    created = 0
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.connected = False
+
+    @classmethod
+    def for_running_loop(cls) -> "FakeServiceClient":
+        loop = asyncio.get_running_loop()
+        client = _clients.get(loop)
+        if client is None:
+            client = _clients[loop] = cls()
+            cls.created += 1
+        return client
+
+    async def request(self, query: str) -> str:
+        assert asyncio.get_running_loop() is self.loop
+        if not self.connected:
+            await asyncio.sleep(self.connect_seconds)  # Connection and TLS setup
+            self.connected = True
+        await asyncio.sleep(0.001)
+        return f"result for {query}"
+
+
+# Client per event loop, like the HTTP clients of real tools
+_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class SearchTool(StreamingBaseTool):
+    name: str = "search"
+    description: str = "Search the fake service"
+
+    async def _astream_events(self, query: str):
+        yield StreamEventType.START, self.start_standard_stream_event(query)
+        client = FakeServiceClient.for_running_loop()
+        result = await client.request(query)
+        yield StreamEventType.END, self.end_standard_stream_event(result)
+
+
+class LoopPerCallSearchTool(SearchTool):
+    def _run(self, config: RunnableConfig, *args, **kwargs):
+        return asyncio.run(self._arun(config, *args, **kwargs))
+
+
+def measure(tool: StreamingBaseTool, runs: int) -> tuple[list[float], int]:
+    model = FakeStreamingChatModel(answer_tokens=5, tokens_per_second=0, ttft_seconds=0)
+    agent = Agent(
+        role="Researcher",
+        goal="Answer with search results",
+        backstory="Searches before answering",
+        llm=model,
+        tools=[tool],
+    )
+    crew = Crew(agents=[agent])
+    FakeServiceClient.created = 0
+    latencies = []
+    for i in range(runs):
+        start = time.perf_counter()
+        crew.invoke({"messages": [HumanMessage(content=f"question {i}")]})
+        latencies.append(time.perf_counter() - start)
+    return latencies, FakeServiceClient.created
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=20, help="Crew runs per mode")
+    parser.add_argument(
+        "--connect-ms", type=float, default=20, help="Connection setup of the client"
+    )
+    args = parser.parse_args()
+    FakeServiceClient.connect_seconds = args.connect_ms / 1000
+
+    results = [
+        ("loop per call", *measure(LoopPerCallSearchTool(), args.runs)),
+        ("shared loop", *measure(SearchTool(), args.runs)),
+    ]
+
+    print(f"{args.runs} sync Crew.invoke runs, {args.connect_ms:.0f}ms client setup")
+    print(f"{'mode':<16}{'clients':>9}{'first':>10}{'p50':>10}{'p95':>10}")
+    for label, latencies, clients in results:
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(
+            f"{label:<16}{clients:>9}{latencies[0] * 1000:>8.1f}ms"
+            f"{statistics.median(latencies) * 1000:>8.1f}ms{p95 * 1000:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark ToolRegistry startup with and without the discovery index.
+
+Generates a project with N tool files under ``./tools``. Each file pays a
+simulated import cost (heavy dependencies) and each tool a constructor cost
+(client setup). Every measurement runs in a fresh process, like a server
+start: ``list_tools()`` without an index, with a cold index (first start,
+which writes it) and with a warm index, followed by the first ``get_tool()``.
+
+Usage:
+    python benchmarks/bench_tool_discovery.py [--files 40] [--import-ms 20]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TOOL_FILE = """
+import time
+
+from langchain_core.tools import BaseTool
+
+time.sleep({import_s})  # Heavy imports
+
+
+class Tool{i}(BaseTool):
+    name: str = "tool_{i}"
+    description: str = "Generated tool {i}"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        time.sleep({init_s})  # Client setup
+
+    def _run(self) -> str:
+        return "result {i}"
+"""
+
+STARTUP = """
+import json
+import time
+
+from langcrew.tools.registry import ToolRegistry
+
+start = time.perf_counter()
+tools = ToolRegistry.list_tools()
+listed = time.perf_counter()
+ToolRegistry.get_tool("tool_0")
+fetched = time.perf_counter()
+print(json.dumps({"tools": len(tools), "list": listed - start, "get": fetched - listed}))
+"""
+
+
+def make_project(root: Path, files: int, import_ms: float, init_ms: float) -> None:
+    tools_dir = root / "tools"
+    tools_dir.mkdir()
+    for i in range(files):
+        (tools_dir / f"tool_{i}.py").write_text(
+            TOOL_FILE.format(i=i, import_s=import_ms / 1000, init_s=init_ms / 1000)
+        )
+
+
+def start(project: Path, index: str) -> dict:
+    env = {**os.environ, "LANGCREW_TOOL_INDEX": index}
+    output = subprocess.run(
+        [sys.executable, "-c", STARTUP],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--files", type=int, default=40, help="Tool files")
+    parser.add_argument(
+        "--import-ms", type=float, default=20, help="Import cost per file"
+    )
+    parser.add_argument(
+        "--init-ms", type=float, default=5, help="Constructor cost per tool"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp)
+        make_project(project, args.files, args.import_ms, args.init_ms)
+        index = str(project / "tool_index.json")
+
+        runs = [
+            ("no index", start(project, "")),
+            ("cold index", start(project, index)),
+            ("warm index", start(project, index)),
+        ]
+
+    print(
+        f"{args.files} tool files, {args.import_ms:.0f}ms import, "
+        f"{args.init_ms:.0f}ms constructor"
+    )
+    print(f"{'startup':<12}{'tools':>7}{'list_tools':>14}{'first get_tool':>17}")
+    for label, run in runs:
+        print(
+            f"{label:<12}{run['tools']:>7}{run['list'] * 1000:>12.1f}ms"
+            f"{run['get'] * 1000:>15.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Deterministic fake model and tools for the AdapterServer load test.
+
+FakeStreamingChatModel behaves like a tool-calling chat model with a fixed
+time to first token and token rate: when the conversation ends with a user
+message it streams a short preamble and calls every bound tool, once the tool
+results are in it streams the final answer. Fake tools sleep for a fixed
+latency. Nothing leaves the process.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.chat_models import (
+    agenerate_from_stream,
+    generate_from_stream,
+)
+from langchain_core.messages import AIMessageChunk, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.tools import BaseTool, StructuredTool
+
+
+class FakeStreamingChatModel(BaseChatModel):
+    """Chat model streaming canned answers at a configurable pace.
+
+    Args:
+        answer_tokens: Tokens of the final answer
+        tokens_per_second: Streaming rate after the first token (0 for no delay)
+        ttft_seconds: Delay before the first token
+        tool_names: Tools called on the first turn, set by ``bind_tools``
+    """
+
+    answer_tokens: int = 50
+    tokens_per_second: float = 50.0
+    ttft_seconds: float = 0.2
+    tool_names: list[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-streaming"
+
+    def bind_tools(
+        self, tools: Sequence[Any], **kwargs: Any
+    ) -> "FakeStreamingChatModel":
+        names = [
+            tool.name if isinstance(tool, BaseTool) else tool["function"]["name"]
+            for tool in tools
+        ]
+        return self.model_copy(update={"tool_names": names})
+
+    def _plan(self, messages: list[BaseMessage]) -> tuple[list[str], list[dict]]:
+        """Tokens and tool calls of the next reply."""
+        if self.tool_names and not isinstance(messages[-1], ToolMessage):
+            tokens = ["Let", " me", " check", "."]
+            calls = [
+                {
+                    "name": name,
+                    "args": json.dumps({"query": "load test"}),
+                    "id": f"call_{len(messages)}_{index}",
+                    "index": index,
+                }
+                for index, name in enumerate(self.tool_names)
+            ]
+            return tokens, calls
+        return [f" token{i}" for i in range(self.answer_tokens)], []
+
+    def _chunks(self, messages: list[BaseMessage]):
+        tokens, calls = self._plan(messages)
+        for token in tokens:
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        if calls:
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(content="", tool_call_chunks=calls)
+            )
+
+    def _delay(self, index: int) -> float:
+        if index == 0:
+            return self.ttft_seconds
+        return 1 / self.tokens_per_second if self.tokens_per_second else 0
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        for index, chunk in enumerate(self._chunks(messages)):
+            delay = self._delay(index)
+            if delay:
+                await asyncio.sleep(delay)
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        for index, chunk in enumerate(self._chunks(messages)):
+            delay = self._delay(index)
+            if delay:
+                time.sleep(delay)
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await agenerate_from_stream(
+            self._astream(messages, stop, run_manager, **kwargs)
+        )
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return generate_from_stream(self._stream(messages, stop, run_manager, **kwargs))
+
+
+def make_fake_tools(count: int, latency_seconds: float) -> list[BaseTool]:
+    """Tools named fake_tool_<i> that sleep ``latency_seconds`` and echo."""
+
+    def make(index: int) -> BaseTool:
+        async def run(query: str) -> str:
+            await asyncio.sleep(latency_seconds)
+            return f"fake_tool_{index} result for {query}"
+
+        return StructuredTool.from_function(
+            coroutine=run,
+            name=f"fake_tool_{index}",
+            description=f"Fake tool {index} answering after a fixed latency.",
+        )
+
+    return [make(index) for index in range(count)]
@@ -0,0 +1,301 @@
+"""Load test the AdapterServer with concurrent SSE clients.
+
+Starts ``create_server(crew)`` in-process on a local port (uvicorn) for a
+one-agent Crew backed by a deterministic fake streaming model and fake tools,
+then drives N concurrent clients, each sending R chats on its own session
+through ``POST /api/v1/chat``. Model speed (time to first token, tokens per
+second) and tool latency are configurable, so the numbers reflect LangCrew's
+own overhead rather than a provider's. Everything runs offline.
+
+Reports run throughput, client-side time to first token (p50/p95/p99, from
+sending the request to the first ``text`` message), event-loop lag sampled
+while the load runs, and memory per session (peak RSS growth per concurrent
+session, RSS still held per session once the load is over). The server and
+the clients share one process and event loop, so the lag includes client
+parsing work.
+
+With ``--max-p95-ttft-ms`` / ``--min-runs-per-second`` the script exits with
+status 1 when a threshold is missed, for use as a CI regression gate.
+
+Usage:
+    python benchmarks/server/load_test.py [--clients 50] [--requests 3]
+        [--ttft-ms 200] [--tokens-per-second 50] [--answer-tokens 50]
+        [--tools 1] [--tool-latency-ms 100] [--engine events]
+        [--max-concurrent-runs 0] [--json]
+        [--max-p95-ttft-ms 1000] [--min-runs-per-second 10]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import resource
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+import uvicorn
+from langgraph.checkpoint.memory import InMemorySaver
+
+from langcrew.agent import Agent
+from langcrew.crew import Crew
+from langcrew.web import create_server
+from langcrew.web.admission import AdmissionController
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fakes import FakeStreamingChatModel, make_fake_tools  # noqa: E402
+
+CHAT_PATH = "/api/v1/chat"
+LAG_INTERVAL = 0.01
+
+
+@dataclass
+class RequestResult:
+    ttft: float | None
+    duration: float
+    events: int
+    status: str | None
+
+
+@dataclass
+class LoopMonitor:
+    """Samples event-loop lag and process RSS while the load runs."""
+
+    lags: list[float] = field(default_factory=list)
+    peak_rss: int = 0
+
+    async def run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_INTERVAL)
+            self.lags.append(time.perf_counter() - start - LAG_INTERVAL)
+            self.peak_rss = max(self.peak_rss, rss_bytes())
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # Peak RSS only (kilobytes on Linux, bytes on macOS)
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == "darwin" else usage * 1024
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def build_server(args: argparse.Namespace):
+    model = FakeStreamingChatModel(
+        answer_tokens=args.answer_tokens,
+        tokens_per_second=args.tokens_per_second,
+        ttft_seconds=args.ttft_ms / 1000,
+    )
+    agent = Agent(
+        role="Load Test Assistant",
+        goal="Answer every question",
+        backstory="A deterministic assistant used for load testing",
+        llm=model,
+        tools=make_fake_tools(args.tools, args.tool_latency_ms / 1000),
+    )
+    crew = Crew(agents=[agent], async_checkpointer=InMemorySaver())
+    server_options = {}
+    if args.max_concurrent_runs:
+        server_options["admission"] = AdmissionController(
+            max_concurrent_runs=args.max_concurrent_runs,
+            max_queue_size=args.clients * args.requests,
+        )
+    return create_server(crew, server_options=server_options, engine=args.engine)
+
+
+async def chat(
+    client: httpx.AsyncClient, message: str, session_id: str | None
+) -> tuple[RequestResult, str | None]:
+    """Send one chat and read its SSE stream to the end."""
+    ttft = None
+    events = 0
+    status = None
+    start = time.perf_counter()
+    headers = {"X-Session-ID": session_id} if session_id else {}
+    payload = {"message": message, "session_id": session_id}
+    async with client.stream("POST", CHAT_PATH, json=payload, headers=headers) as r:
+        r.raise_for_status()
+        session_id = r.headers.get("X-Session-ID", session_id)
+        async for line in r.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            events += 1
+            event = json.loads(line[6:])
+            if ttft is None and event["type"] == "text":
+                ttft = time.perf_counter() - start
+            elif event["type"] == "finish_reason":
+                status = event["detail"].get("status")
+    return RequestResult(ttft, time.perf_counter() - start, events, status), session_id
+
+
+async def client_loop(
+    client: httpx.AsyncClient, index: int, requests: int
+) -> list[RequestResult]:
+    results = []
+    session_id = None
+    for turn in range(requests):
+        result, session_id = await chat(
+            client, f"client {index} question {turn}", session_id
+        )
+        results.append(result)
+    return results
+
+
+async def run_load(args: argparse.Namespace) -> dict:
+    server = build_server(args)
+    config = uvicorn.Config(
+        server.app, host="127.0.0.1", port=0, log_level="warning", lifespan="on"
+    )
+    uvicorn_server = uvicorn.Server(config)
+    serve_task = asyncio.create_task(uvicorn_server.serve())
+    while not uvicorn_server.started:
+        if serve_task.done():
+            serve_task.result()
+        await asyncio.sleep(0.01)
+    port = uvicorn_server.servers[0].sockets[0].getsockname()[1]
+
+    limits = httpx.Limits(max_connections=args.clients + 1)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", timeout=None, limits=limits
+        ) as client:
+            # Warm up imports, graph compilation and connection setup
+            await chat(client, "warm up", None)
+            gc.collect()
+            rss_before = rss_bytes()
+
+            monitor = LoopMonitor(peak_rss=rss_before)
+            monitor_task = asyncio.create_task(monitor.run())
+            start = time.perf_counter()
+            per_client = await asyncio.gather(
+                *(client_loop(client, i, args.requests) for i in range(args.clients))
+            )
+            elapsed = time.perf_counter() - start
+            monitor_task.cancel()
+
+            gc.collect()
+            rss_after = rss_bytes()
+    finally:
+        uvicorn_server.should_exit = True
+        await serve_task
+
+    results = [result for client_results in per_client for result in client_results]
+    ttfts = [r.ttft for r in results if r.ttft is not None]
+    return {
+        "clients": args.clients,
+        "requests_per_client": args.requests,
+        "engine": args.engine,
+        "runs": len(results),
+        "completed": sum(r.status == "completed" for r in results),
+        "elapsed_seconds": elapsed,
+        "runs_per_second": len(results) / elapsed,
+        "events_per_second": sum(r.events for r in results) / elapsed,
+        "ttft_ms": {f"p{pct}": percentile(ttfts, pct) * 1000 for pct in (50, 95, 99)},
+        "run_duration_ms_p50": statistics.median(r.duration for r in results) * 1000,
+        "loop_lag_ms": {
+            "p50": percentile(monitor.lags, 50) * 1000,
+            "p99": percentile(monitor.lags, 99) * 1000,
+            "max": max(monitor.lags, default=0) * 1000,
+        },
+        "peak_rss_kib_per_session": (monitor.peak_rss - rss_before)
+        / args.clients
+        / 1024,
+        "retained_rss_kib_per_session": (rss_after - rss_before) / args.clients / 1024,
+    }
+
+
+def print_report(report: dict, args: argparse.Namespace) -> None:
+    ttft = report["ttft_ms"]
+    lag = report["loop_lag_ms"]
+    print(
+        f"{report['clients']} clients x {report['requests_per_client']} requests, "
+        f"{report['engine']} engine (model ttft {args.ttft_ms:g} ms, "
+        f"{args.tokens_per_second:g} tok/s, {args.tools} tools "
+        f"@ {args.tool_latency_ms:g} ms)"
+    )
+    print(
+        f"  throughput      {report['runs_per_second']:8.1f} runs/s"
+        f"  {report['events_per_second']:8.0f} events/s"
+        f"  ({report['completed']}/{report['runs']} completed"
+        f" in {report['elapsed_seconds']:.1f} s)"
+    )
+    print(
+        f"  ttft            p50 {ttft['p50']:7.1f} ms"
+        f"  p95 {ttft['p95']:7.1f} ms  p99 {ttft['p99']:7.1f} ms"
+    )
+    print(
+        f"  loop lag        p50 {lag['p50']:7.1f} ms"
+        f"  p99 {lag['p99']:7.1f} ms  max {lag['max']:7.1f} ms"
+    )
+    print(
+        f"  memory/session  peak {report['peak_rss_kib_per_session']:7.1f} KiB"
+        f"  retained {report['retained_rss_kib_per_session']:7.1f} KiB"
+    )
+
+
+def check_thresholds(report: dict, args: argparse.Namespace) -> list[str]:
+    failures = []
+    if report["completed"] != report["runs"]:
+        failures.append(f"{report['runs'] - report['completed']} runs did not complete")
+    p95 = report["ttft_ms"]["p95"]
+    if args.max_p95_ttft_ms is not None and not p95 <= args.max_p95_ttft_ms:
+        failures.append(f"p95 ttft {p95:.1f} ms > {args.max_p95_ttft_ms:g} ms")
+    rate = report["runs_per_second"]
+    if args.min_runs_per_second is not None and rate < args.min_runs_per_second:
+        failures.append(
+            f"throughput {rate:.1f} runs/s < {args.min_runs_per_second:g} runs/s"
+        )
+    return failures
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=3)
+    parser.add_argument("--ttft-ms", type=float, default=200)
+    parser.add_argument("--tokens-per-second", type=float, default=50)
+    parser.add_argument("--answer-tokens", type=int, default=50)
+    parser.add_argument("--tools", type=int, default=1)
+    parser.add_argument("--tool-latency-ms", type=float, default=100)
+    parser.add_argument("--engine", choices=("events", "stream"), default="events")
+    parser.add_argument(
+        "--max-concurrent-runs",
+        type=int,
+        default=0,
+        help="Admission limit, 0 admits every request",
+    )
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    parser.add_argument("--max-p95-ttft-ms", type=float)
+    parser.add_argument("--min-runs-per-second", type=float)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    report = await run_load(args)
+    failures = check_thresholds(report, args)
+    if args.json:
+        print(json.dumps({**report, "failures": failures}, indent=2))
+    else:
+        print_report(report, args)
+        for failure in failures:
+            print(f"  FAILED: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -19,6 +19,8 @@ from .hitl import HITLConfig
 from .memory import MemoryConfig
 from .prompt_builder import PromptBuilder
 from .tools.mcp import MCPToolAdapter
+from .tools.policies import ToolPolicyWrapper
+from .tools.result_cache import ToolResultCache
 from .types import TaskSpec
 
 # Setup logger
@@ -60,8 +62,12 @@ class Agent:
         # Guardrail support
         input_guards: list[GuardrailFunc] | None = None,
         output_guards: list[GuardrailFunc] | None = None,
+        speculative_guards: bool = False,
         # Context management
         context_config: ContextConfig | None = None,
+        # Tool execution policies and result caching
+        tool_policies: ToolPolicyWrapper | None = None,
+        tool_cache: ToolResultCache | None = None,
     ):
         """Initialize Agent with configuration.
 
@@ -89,7 +95,13 @@ class Agent:
             is_entry: Whether this agent is an entry point for the crew
             input_guards: List of input guardrail functions to apply to all tasks
             output_guards: List of output guardrail functions to apply to all tasks
+            speculative_guards: Start async runs while input guardrails are checked,
+                cancelling them if a guardrail fails. Model output, tool calls and
+                custom events are held until the guardrails pass, the model request
+                itself is still sent with input a guardrail may reject
             context_config: Context management configuration (ContextConfig instance or None)
+            tool_policies: Concurrency limits, timeouts, retries and circuit breakers per tool
+            tool_cache: Cache reusing results of the tools it has a policy for, across sessions
         """
         # Handle CrewAI-style config
         if config:
@@ -148,6 +160,11 @@ class Agent:
         # Guardrail configuration
         self.input_guards = input_guards or []
         self.output_guards = output_guards or []
+        self.speculative_guards = speculative_guards
+
+        # Tool policies and result cache, also applied to MCP tools
+        self.tool_policies = tool_policies
+        self.tool_cache = tool_cache
 
         # MCP configuration
         self.mcp_servers = mcp_servers
@@ -199,6 +216,10 @@ class Agent:
         # Entry agent flag
         self.is_entry = is_entry
 
+        # Tool policies and result caching, applied before HITL so approvals
+        # are still requested
+        self.tools = self._wrap_tools(self.tools)
+
         # HITL configuration
         if hitl is None:
             self.hitl_config = None
@@ -218,11 +239,19 @@ class Agent:
         goal_str = self.goal if self.goal else "N/A"
         return f"Agent(role='{role_str}', goal='{goal_str}')"
 
+    def _wrap_tools(self, tools: list[BaseTool]) -> list[BaseTool]:
+        """Apply tool policies, then the result cache so cache hits skip them"""
+        if self.tool_policies is not None:
+            tools = self.tool_policies.wrap_tools(tools)
+        if self.tool_cache is not None:
+            tools = self.tool_cache.wrap_tools(tools)
+        return tools
+
     def _setup_and_process_mcp_tools(self, tools):
         """Process MCP tools result and add to agent's tool list"""
         # Add MCP tools to agent's tool list
         if tools:
-            self.tools.extend(tools)
+            self.tools.extend(self._wrap_tools(tools))
             self._mcp_tools = tools
         else:
             self._mcp_tools = []
@@ -237,38 +266,37 @@ class Agent:
         if self.verbose:
             logger.info(f"Loading MCP tools for agent '{self.role or 'Agent'}'...")
 
+        if self._mcp_adapter is None:
+            self._mcp_adapter = MCPToolAdapter()
+
+        # Tools already loaded for the same servers (e.g. by another agent)
+        # need neither a connection nor an event loop
+        tools = self._mcp_adapter.from_cache(
+            servers=self.mcp_servers, tool_filter=self.mcp_tool_filter
+        )
+        if tools is not None:
+            self._setup_and_process_mcp_tools(tools)
+            return
+
+        coroutine = self._mcp_adapter.from_servers(
+            servers=self.mcp_servers, tool_filter=self.mcp_tool_filter
+        )
+
         # Check if we're already in an async context
         try:
             # Try to get the running loop
             asyncio.get_running_loop()
-            # If we're here, we're in an async context - use ThreadPoolExecutor
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                # Create adapter if not exists (must be done in main thread)
-                if self._mcp_adapter is None:
-                    self._mcp_adapter = MCPToolAdapter()
-
-                # Submit the async work to thread pool
-                future = executor.submit(
-                    asyncio.run,
-                    self._mcp_adapter.from_servers(
-                        servers=self.mcp_servers, tool_filter=self.mcp_tool_filter
-                    ),
-                )
-                tools = future.result()
-                self._setup_and_process_mcp_tools(tools)
         except RuntimeError:
             # No running loop, safe to use asyncio.run directly
-            if self._mcp_adapter is None:
-                self._mcp_adapter = MCPToolAdapter()
+            tools = asyncio.run(coroutine)
+        else:
+            # In an async context - run the load on a loop in another thread
+            import concurrent.futures
 
-            tools = asyncio.run(
-                self._mcp_adapter.from_servers(
-                    servers=self.mcp_servers, tool_filter=self.mcp_tool_filter
-                )
-            )
-            self._setup_and_process_mcp_tools(tools)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                tools = executor.submit(asyncio.run, coroutine).result()
+
+        self._setup_and_process_mcp_tools(tools)
 
     async def _aload_mcp_tools(self):
         """Async version of MCP tools loading for use in async contexts"""
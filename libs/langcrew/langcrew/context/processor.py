@@ -15,6 +15,7 @@ from langchain_core.messages import (
 )
 from langchain_core.messages.modifier import RemoveMessage
 
+from ..utils.runnable_config_utils import internal_run_config
 from .config import CompressorProtocol
 from .token_utils import count_message_tokens
 
@@ -176,7 +177,9 @@ class MessageProcessor:
             return {"messages": messages, "running_summary": running_summary}
 
         # Generate summary using sync LLM call
-        response = llm.invoke(prep_data["messages_for_llm"])
+        response = llm.invoke(
+            prep_data["messages_for_llm"], config=internal_run_config()
+        )
 
         result = self._build_summarization_result(prep_data, response)
         if result is None:
@@ -204,7 +207,9 @@ class MessageProcessor:
             return {"messages": messages, "running_summary": running_summary}
 
         # Generate summary using async LLM call
-        response = await llm.ainvoke(prep_data["messages_for_llm"])
+        response = await llm.ainvoke(
+            prep_data["messages_for_llm"], config=internal_run_config()
+        )
 
         result = self._build_summarization_result(prep_data, response)
         if result is None:
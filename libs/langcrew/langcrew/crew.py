@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
+import time
 from collections.abc import AsyncIterator, Callable, Iterator, Sequence
 from contextlib import asynccontextmanager, contextmanager
 from typing import (
@@ -24,11 +26,15 @@ from .hitl import HITLConfig
 from .memory import MemoryConfig
 from .memory.context import MemoryContextManager
 from .task import Task
-from .tools import ToolCallback
+from .tools import ToolCallback, ToolRegistry
 from .types import CrewState, OrderCallback
+from .utils.tracing import trace_checkpointer, with_tracing
 
 logger = logging.getLogger(__name__)
 
+# Session read during warm-up, by the adapter's checkpointer and stop flag checks
+WARMUP_THREAD_ID = "__langcrew_warmup__"
+
 
 class Crew:
     """LangCrew main orchestration class.
@@ -343,7 +349,7 @@ class Crew:
         self._is_registered_tools = True
 
         compiled = builder.compile(
-            checkpointer=checkpointer,
+            checkpointer=trace_checkpointer(checkpointer),
             store=store,
             interrupt_before=interrupt_before,
             interrupt_after=interrupt_after,
@@ -371,6 +377,24 @@ class Crew:
         # order by order_id
         self.add_after_execute_callbacks(after_execute_callbacks)
 
+    def callback_tool_names(self) -> list[str]:
+        """Names of the ToolCallback tools of the crew's agents
+
+        Streaming tools send their custom events under the tool name. Also
+        available before the graph is built, unlike the registered tools.
+        """
+        agents = [*self.agents, *(task.agent for task in self.tasks)]
+        names = {
+            tool.name
+            for agent in agents
+            for tool in getattr(agent, "tools", None) or []
+            if isinstance(tool, ToolCallback)
+        }
+        names.update(
+            tool.name for tool in self._tools if isinstance(tool, ToolCallback)
+        )
+        return sorted(names)
+
     def _create_generic_node_factory(
         self,
         is_async: bool,
@@ -1042,6 +1066,8 @@ class Crew:
             The output of the graph run
         """
 
+        config = with_tracing(config)
+
         def execute_with_memory(checkpointer, store):
             compiled_graph = self._get_compiled_graph(
                 checkpointer, store, is_async=False
@@ -1081,6 +1107,8 @@ class Crew:
             Output from graph execution
         """
 
+        config = with_tracing(config)
+
         async def execute_with_memory(checkpointer, store):
             compiled_graph = self._get_compiled_graph(
                 checkpointer, store, is_async=True
@@ -1130,6 +1158,8 @@ class Crew:
             The output of each step in the graph
         """
 
+        config = with_tracing(config)
+
         def execute_with_memory(checkpointer, store):
             compiled_graph = self._get_compiled_graph(
                 checkpointer, store, is_async=False
@@ -1181,6 +1211,8 @@ class Crew:
             The output of each step in the graph
         """
 
+        config = with_tracing(config)
+
         async def execute_with_memory(checkpointer, store):
             compiled_graph = self._get_compiled_graph(
                 checkpointer, store, is_async=True
@@ -1273,6 +1305,8 @@ class Crew:
                     print(f"Starting task: {event['data']['task_name']}")
         """
 
+        config = with_tracing(config)
+
         async def execute_with_memory(checkpointer, store):
             compiled_graph = self._get_compiled_graph(
                 checkpointer, store, is_async=True
@@ -1551,3 +1585,68 @@ class Crew:
         async with self._memory_manager._get_async_context() as (checkpointer, store):
             compiled = self._get_compiled_graph(checkpointer, store, is_async=True)
             yield compiled
+
+    async def awarmup(self) -> dict[str, float]:
+        """
+        Prepare what the first run would otherwise set up lazily.
+
+        Runs concurrently: tool registry discovery, loading the MCP tools of
+        agents that have not loaded them yet, and opening the checkpointer
+        and store once to create their tables when needed. The graph is built
+        once as well, so configuration errors surface before the first run.
+        Runs still compile the graph and open their own connections. Calling
+        it again is cheap.
+
+        Returns:
+            dict[str, float]: Seconds spent in each warm-up step
+
+        Example:
+            timings = await crew.awarmup()
+        """
+        timings: dict[str, float] = {}
+
+        async def timed(step: str, awaitable) -> None:
+            start = time.perf_counter()
+            await awaitable
+            timings[step] = time.perf_counter() - start
+
+        async def warm_graph() -> None:
+            async with self._memory_manager._get_async_context() as (
+                checkpointer,
+                store,
+            ):
+                # Not kept: each run compiles the graph with its connections
+                self._get_compiled_graph(checkpointer, store, is_async=True)
+
+        steps = [
+            timed("tool_discovery", asyncio.to_thread(ToolRegistry._run_discovery)),
+            timed("graph", warm_graph()),
+        ]
+        for index, agent in enumerate(self.agents):
+            if agent.mcp_servers and not agent._mcp_tools:
+                steps.append(timed(f"mcp_tools.{index}", agent._aload_mcp_tools()))
+        await asyncio.gather(*steps)
+
+        logger.info(
+            "Crew warm-up finished: "
+            + ", ".join(f"{step} {seconds:.3f}s" for step, seconds in timings.items())
+        )
+        return timings
+
+    @asynccontextmanager
+    async def get_async_checkpointer(self):
+        """
+        Get the asynchronous checkpointer holding the crew's session state.
+
+        Returns:
+            AsyncContextManager: Yields the checkpointer, or None when the crew
+            runs without one
+
+        Example:
+            async with crew.get_async_checkpointer() as checkpointer:
+                state = await checkpointer.aget_tuple(
+                    {"configurable": {"thread_id": "session_123"}}
+                )
+        """
+        async with self._memory_manager._get_async_context() as (checkpointer, _):
+            yield checkpointer
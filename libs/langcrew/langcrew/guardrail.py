@@ -4,11 +4,26 @@ from __future__ import annotations
 
 import asyncio
 import functools
-from collections.abc import Callable
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine
 from typing import Any, TypeAlias
 
-# Type definition for guardrail functions
-GuardrailFunc: TypeAlias = Callable[[Any], tuple[bool, str]]
+from langchain_core.callbacks import AsyncCallbackHandler, BaseCallbackManager
+from langchain_core.runnables import RunnableConfig
+
+from .utils.async_utils import run_coroutine
+
+# Type definition for guardrail functions, async guards return an awaitable
+GuardrailFunc: TypeAlias = Callable[
+    [Any], tuple[bool, str] | Awaitable[tuple[bool, str]]
+]
+
+DEFAULT_VERDICT_CACHE_SIZE = int(os.getenv("LANGCREW_GUARDRAIL_CACHE_SIZE", "1024"))
 
 
 class GuardrailError(Exception):
@@ -31,42 +46,168 @@ def output_guard(func: GuardrailFunc) -> GuardrailFunc:
     return func
 
 
-def _check_guardrails_impl(guardrails: list[GuardrailFunc], data: Any) -> None:
-    """Internal implementation of guardrail checking logic
+class VerdictCache:
+    """LRU of the verdicts of one guardrail, keyed on a hash of the checked data
 
     Args:
-        guardrails: List of guardrail functions to check
-        data: The data to check (input or output)
+        maxsize: Verdicts kept, the least recently used are evicted first
+    """
 
-    Raises:
-        GuardrailError: If any guardrail check fails
+    def __init__(self, maxsize: int = DEFAULT_VERDICT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._verdicts: OrderedDict[str, tuple[bool, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    @staticmethod
+    def content_key(data: Any) -> str:
+        """Hash of the data, dict keys are sorted and other objects use str()"""
+        payload = json.dumps(
+            data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> tuple[bool, str] | None:
+        with self._lock:
+            verdict = self._verdicts.get(key)
+            if verdict is not None:
+                self._verdicts.move_to_end(key)
+            return verdict
+
+    def put(self, key: str, verdict: tuple[bool, str]) -> None:
+        with self._lock:
+            self._verdicts[key] = verdict
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self.maxsize:
+                self._verdicts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._verdicts.clear()
+
+
+def cached_guard(
+    func: GuardrailFunc | None = None, *, maxsize: int = DEFAULT_VERDICT_CACHE_SIZE
+) -> Any:
+    """Decorator caching the verdicts of a pure guardrail
+
+    Only for guards whose verdict depends on the checked data alone, e.g. a
+    moderation API or a classifier. Errors raised by the guard are not cached.
+
+    Example:
+        @input_guard
+        @cached_guard(maxsize=4096)
+        async def moderation_guard(data): ...
     """
-    for guard in guardrails:
-        guard_name = getattr(guard, "__name__", "unnamed")
 
-        # Auto-detect guard type from decorator attributes
-        if hasattr(guard, "_is_input_guard") and guard._is_input_guard:
-            guard_type = "input"
-        elif hasattr(guard, "_is_output_guard") and guard._is_output_guard:
-            guard_type = "output"
-        else:
-            guard_type = "guardrail"
+    def decorate(guard: GuardrailFunc) -> GuardrailFunc:
+        guard._verdict_cache = VerdictCache(maxsize)  # type: ignore
+        return guard
+
+    return decorate(func) if func is not None else decorate
+
+
+def _guard_label(guard: GuardrailFunc) -> tuple[str, str]:
+    """Type and name of a guard, as used in GuardrailError messages"""
+    guard_name = getattr(guard, "__name__", "unnamed")
+
+    # Auto-detect guard type from decorator attributes
+    if hasattr(guard, "_is_input_guard") and guard._is_input_guard:
+        guard_type = "input"
+    elif hasattr(guard, "_is_output_guard") and guard._is_output_guard:
+        guard_type = "output"
+    else:
+        guard_type = "guardrail"
+    return guard_type, guard_name
 
+
+def _is_async_guard(guard: GuardrailFunc) -> bool:
+    return inspect.iscoroutinefunction(guard) or inspect.iscoroutinefunction(
+        getattr(guard, "__call__", None)
+    )
+
+
+def _cached_verdict(
+    guard: GuardrailFunc, data: Any
+) -> tuple[VerdictCache | None, str | None, tuple[bool, str] | None]:
+    """Verdict cache of a guard, the key of the data and the cached verdict"""
+    cache = getattr(guard, "_verdict_cache", None)
+    if cache is None:
+        return None, None, None
+    key = cache.content_key(data)
+    return cache, key, cache.get(key)
+
+
+def _check_verdict(guard: GuardrailFunc, verdict: tuple[bool, str]) -> None:
+    is_valid, message = verdict
+    if not is_valid:
+        guard_type, guard_name = _guard_label(guard)
+        raise GuardrailError(
+            f"{guard_type} guardrail '{guard_name}' failed: {message}",
+            guardrail_name=guard_name,
+        )
+
+
+def _guard_error(guard: GuardrailFunc, error: Exception) -> GuardrailError:
+    guard_type, guard_name = _guard_label(guard)
+    return GuardrailError(
+        f"{guard_type} guardrail '{guard_name}' error: {str(error)}",
+        guardrail_name=guard_name,
+    )
+
+
+def _check_guard(guard: GuardrailFunc, data: Any) -> None:
+    """Check one guard synchronously, async guards run on the bridge loop"""
+    cache, key, verdict = _cached_verdict(guard, data)
+    if verdict is None:
         try:
-            is_valid, message = guard(data)
+            verdict = guard(data)
+            if inspect.iscoroutine(verdict):
+                verdict = run_coroutine(verdict)
+            is_valid, message = verdict
+        except GuardrailError:
+            raise
+        except Exception as e:
+            raise _guard_error(guard, e) from e
+        if cache is not None:
+            cache.put(key, (is_valid, message))
+    _check_verdict(guard, verdict)
 
-            if not is_valid:
-                raise GuardrailError(
-                    f"{guard_type} guardrail '{guard_name}' failed: {message}",
-                    guardrail_name=guard_name,
-                )
+
+async def _acheck_guard(guard: GuardrailFunc, data: Any) -> None:
+    """Check one guard, awaiting async guards"""
+    cache, key, verdict = _cached_verdict(guard, data)
+    if verdict is None:
+        try:
+            verdict = guard(data)
+            if inspect.isawaitable(verdict):
+                verdict = await verdict
+            is_valid, message = verdict
         except GuardrailError:
             raise
         except Exception as e:
-            raise GuardrailError(
-                f"{guard_type} guardrail '{guard_name}' error: {str(e)}",
-                guardrail_name=guard_name,
-            ) from e
+            raise _guard_error(guard, e) from e
+        if cache is not None:
+            cache.put(key, (is_valid, message))
+    _check_verdict(guard, verdict)
+
+
+def _check_guardrails_impl(guardrails: list[GuardrailFunc], data: Any) -> None:
+    """Internal implementation of guardrail checking logic
+
+    Guards are checked one after another, async guards run on the bridge loop.
+
+    Args:
+        guardrails: List of guardrail functions to check
+        data: The data to check (input or output)
+
+    Raises:
+        GuardrailError: If any guardrail check fails
+    """
+    for guard in guardrails:
+        _check_guard(guard, data)
 
 
 def check_guardrails_sync(guardrails: list[GuardrailFunc], data: Any) -> None:
@@ -85,6 +226,10 @@ def check_guardrails_sync(guardrails: list[GuardrailFunc], data: Any) -> None:
 async def check_guardrails(guardrails: list[GuardrailFunc], data: Any) -> None:
     """Async version: Check a list of guardrails and raise GuardrailError if any fail
 
+    Sync guards are checked first, in order, on the event loop: they are
+    expected to be cheap. Async guards, e.g. moderation APIs, then run
+    concurrently. The first failure cancels the async guards still running.
+
     Args:
         guardrails: List of guardrail functions to check
         data: The data to check (input or output)
@@ -92,7 +237,102 @@ async def check_guardrails(guardrails: list[GuardrailFunc], data: Any) -> None:
     Raises:
         GuardrailError: If any guardrail check fails
     """
-    _check_guardrails_impl(guardrails, data)
+    async_guards = [guard for guard in guardrails if _is_async_guard(guard)]
+    _check_guardrails_impl(
+        [guard for guard in guardrails if guard not in async_guards], data
+    )
+    if len(async_guards) <= 1:
+        for guard in async_guards:
+            await _acheck_guard(guard, data)
+        return
+
+    tasks = [
+        asyncio.ensure_future(_acheck_guard(guard, data)) for guard in async_guards
+    ]
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_EXCEPTION
+            )
+            # Report the first failed guard in list order
+            for task in tasks:
+                if task in done and task.exception() is not None:
+                    raise task.exception()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class _GuardGate(AsyncCallbackHandler):
+    """Holds a speculative run at its first visible step until its guards pass
+
+    Handlers running inline are called one after another before the others,
+    so a gate placed first delays model tokens and results, tool starts and
+    custom events for every other handler, including event streams. The model
+    request itself is already in flight.
+    """
+
+    run_inline = True
+
+    def __init__(self):
+        self.passed = asyncio.Event()
+
+    async def on_llm_new_token(self, *args: Any, **kwargs: Any) -> None:
+        await self.passed.wait()
+
+    async def on_llm_end(self, *args: Any, **kwargs: Any) -> None:
+        await self.passed.wait()
+
+    async def on_tool_start(self, *args: Any, **kwargs: Any) -> None:
+        await self.passed.wait()
+
+    async def on_custom_event(self, *args: Any, **kwargs: Any) -> None:
+        await self.passed.wait()
+
+
+def _with_gate(config: RunnableConfig | None, gate: _GuardGate) -> RunnableConfig:
+    """Copy of a config whose callbacks call the gate before any other handler"""
+    config = dict(config or {})
+    callbacks = config.get("callbacks")
+    if isinstance(callbacks, BaseCallbackManager):
+        callbacks = callbacks.copy()
+        callbacks.handlers.insert(0, gate)
+        callbacks.inheritable_handlers.insert(0, gate)
+        config["callbacks"] = callbacks
+    else:
+        config["callbacks"] = [gate, *(callbacks or [])]
+    return config
+
+
+async def _run_speculatively(
+    guard_check: Coroutine[Any, Any, None],
+    func: Callable[..., Coroutine[Any, Any, Any]],
+    args: tuple,
+    kwargs: dict[str, Any],
+) -> Any:
+    """Run a call while its input guards are checked, cancel it if they fail
+
+    The call's config (second argument or ``config`` keyword) gets a
+    _GuardGate, so model output, tool calls and custom events wait for the
+    guards. Work done before the first of them, e.g. graph nodes without
+    callbacks, is not held back.
+    """
+    gate = _GuardGate()
+    if len(args) > 1:
+        args = (args[0], _with_gate(args[1], gate), *args[2:])
+    else:
+        kwargs = {**kwargs, "config": _with_gate(kwargs.get("config"), gate)}
+
+    call_task = asyncio.ensure_future(func(*args, **kwargs))
+    try:
+        await guard_check
+    except BaseException:
+        call_task.cancel()
+        await asyncio.gather(call_task, return_exceptions=True)
+        raise
+    gate.passed.set()
+    return await call_task
 
 
 def with_guardrails(func: Callable) -> Callable:
@@ -106,6 +346,12 @@ def with_guardrails(func: Callable) -> Callable:
     The decorated method's class should have:
     - input_guards: list[GuardrailFunc] attribute for input checking
     - output_guards: list[GuardrailFunc] attribute for output checking
+    - speculative_guards: optional bool attribute, async methods then start
+      while input guards are checked and are cancelled if a guard fails. Model
+      output, tool calls and custom events of runs using the method's config
+      are held until the guards pass. The model request itself is still sent
+      with input a guard may reject, so do not enable it for guards keeping
+      data away from the model provider
 
     Args:
         func: The method to decorate
@@ -124,10 +370,18 @@ def with_guardrails(func: Callable) -> Callable:
                 and args
                 and isinstance(args[0], dict)
             ):
-                await check_guardrails(self.input_guards, args[0])
-
-            # Execute original method
-            result = await func(self, *args, **kwargs)
+                input_check = check_guardrails(self.input_guards, args[0])
+                if getattr(self, "speculative_guards", False):
+                    # Start the method while input guardrails are checked
+                    result = await _run_speculatively(
+                        input_check, functools.partial(func, self), args, kwargs
+                    )
+                else:
+                    await input_check
+                    result = await func(self, *args, **kwargs)
+            else:
+                # Execute original method
+                result = await func(self, *args, **kwargs)
 
             # Check output guardrails if available
             if hasattr(self, "output_guards") and self.output_guards:
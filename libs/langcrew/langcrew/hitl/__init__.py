@@ -9,9 +9,19 @@ For tool-related functionality, please import from langcrew.tools.hitl.
 """
 
 from .config import HITLConfig
+from .execution_state import (
+    ExecutionState,
+    ExecutionStateStore,
+    InMemoryExecutionStateStore,
+    SharedExecutionStateStore,
+)
 from .tool_wrapper import HITLToolWrapper
 
 __all__ = [
+    "ExecutionState",
+    "ExecutionStateStore",
     "HITLConfig",
     "HITLToolWrapper",
+    "InMemoryExecutionStateStore",
+    "SharedExecutionStateStore",
 ]
@@ -4,6 +4,7 @@ import logging
 import warnings
 from dataclasses import dataclass, field
 
+from .execution_state import ExecutionStateStore
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +75,14 @@ class HITLConfig:
         },
     )
 
+    tool_state_store: ExecutionStateStore | None = field(
+        default=None,
+        metadata={
+            "description": "Store of interrupted tool call states, share it between workers to resume on any of them. Defaults to a bounded in-memory store.",
+            "effective_in": "all",
+        },
+    )
+
     # Node-level interrupt configuration (LangGraph native)
     interrupt_before_nodes: list[str] | None = field(
         default=None,
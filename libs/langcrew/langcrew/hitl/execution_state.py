@@ -0,0 +1,136 @@
+"""Execution state of tool calls wrapped by HITLToolWrapper
+
+A tool call interrupted for approval or review runs again from the start when
+the graph resumes. Its ``ExecutionState`` records the steps already done and
+the tool result, so the tool is not executed twice. States are kept in an
+``ExecutionStateStore``:
+
+- ``InMemoryExecutionStateStore`` (default): a process-local LRU with a TTL,
+  abandoned interrupts no longer accumulate in long-running servers
+- ``SharedExecutionStateStore``: JSON in a ``ToolResultCacheBackend`` such as
+  ``RedisToolResultCache``, so a resume handled by another worker or after a
+  restart finds the state
+"""
+
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from ..tools.result_cache import ToolResultCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExecutionState:
+    """Tool execution state tracking"""
+
+    before_interrupt_processed: bool = False
+    tool_executed: bool = False
+    tool_result: Any | None = None
+    after_interrupt_processed: bool = False
+    saved_kwargs: dict[str, Any] | None = None  # Save kwargs for resume
+
+
+class ExecutionStateStore(ABC):
+    """Interface for storing execution states of interrupted tool calls."""
+
+    @abstractmethod
+    async def get(self, execution_id: str) -> ExecutionState | None:
+        """Return the state of a tool call, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, execution_id: str, state: ExecutionState) -> None:
+        """Store the state of a tool call."""
+
+    @abstractmethod
+    async def delete(self, execution_id: str) -> None:
+        """Remove the state of a finished tool call."""
+
+
+class InMemoryExecutionStateStore(ExecutionStateStore):
+    """Process-local LRU of execution states.
+
+    Args:
+        max_entries: States kept, the least recently used are evicted first
+        ttl: Seconds a state of an unanswered interrupt is kept
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 24 * 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, ExecutionState]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, execution_id: str) -> ExecutionState | None:
+        with self._lock:
+            entry = self._entries.get(execution_id)
+            if entry is None:
+                return None
+            expires_at, state = entry
+            if expires_at <= time.monotonic():
+                del self._entries[execution_id]
+                return None
+            self._entries.move_to_end(execution_id)
+            return state
+
+    async def set(self, execution_id: str, state: ExecutionState) -> None:
+        with self._lock:
+            self._entries[execution_id] = (time.monotonic() + self.ttl, state)
+            self._entries.move_to_end(execution_id)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug(f"Evicted HITL execution state {evicted}")
+
+    async def delete(self, execution_id: str) -> None:
+        with self._lock:
+            self._entries.pop(execution_id, None)
+
+
+class SharedExecutionStateStore(ExecutionStateStore):
+    """Execution states stored as JSON in a shared cache backend.
+
+    States whose tool result is not JSON serializable are not stored, such a
+    tool runs again when its interrupt is resumed.
+
+    Args:
+        backend: Backend shared by the workers, e.g. ``RedisToolResultCache``
+            with its own ``key_prefix``
+        ttl: Seconds a state of an unanswered interrupt is kept
+    """
+
+    def __init__(self, backend: ToolResultCacheBackend, ttl: float = 24 * 3600):
+        self.backend = backend
+        self.ttl = ttl
+
+    async def get(self, execution_id: str) -> ExecutionState | None:
+        value = await self.backend.get(execution_id)
+        if value is None:
+            return None
+        try:
+            return ExecutionState(**json.loads(value))
+        except (TypeError, ValueError):
+            logger.debug(f"Ignoring unreadable HITL execution state {execution_id}")
+            return None
+
+    async def set(self, execution_id: str, state: ExecutionState) -> None:
+        try:
+            value = json.dumps(asdict(state), ensure_ascii=False)
+        except (TypeError, ValueError):
+            logger.warning(
+                f"HITL execution state {execution_id} is not JSON serializable, "
+                f"not stored"
+            )
+            return
+        await self.backend.set(execution_id, value, self.ttl)
+
+    async def delete(self, execution_id: str) -> None:
+        await self.backend.delete(execution_id)
@@ -1,7 +1,6 @@
 import asyncio
 import inspect
 import logging
-from dataclasses import dataclass
 from typing import Any
 
 from langchain_core.callbacks.manager import adispatch_custom_event
@@ -9,29 +8,38 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
 from langgraph.types import interrupt
 
+from ..tools.result_cache import ToolResultCache
 from .config import HITLConfig
+from .execution_state import (
+    ExecutionState,
+    ExecutionStateStore,
+    InMemoryExecutionStateStore,
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class ExecutionState:
-    """Tool execution state tracking"""
-
-    before_interrupt_processed: bool = False
-    tool_executed: bool = False
-    tool_result: Any | None = None
-    after_interrupt_processed: bool = False
-    saved_kwargs: dict[str, Any] | None = None  # Save kwargs for resume
-
-
 class HITLToolWrapper:
-    """Wrapper for tools that require human-in-the-loop interaction"""
+    """Wrapper for tools that require human-in-the-loop interaction
 
-    def __init__(self, hitl_config: HITLConfig):
+    Args:
+        hitl_config: Tools to interrupt before or after execution
+        state_store: Where execution states of interrupted tool calls are kept,
+            defaults to hitl_config.tool_state_store or a bounded in-memory store
+    """
+
+    def __init__(
+        self,
+        hitl_config: HITLConfig,
+        state_store: ExecutionStateStore | None = None,
+    ):
         self.hitl_config = hitl_config
-        # Tool execution state cache to prevent duplicate execution
-        self._execution_cache: dict[str, ExecutionState] = {}
+        # Tool execution states to prevent duplicate execution on resume
+        if state_store is None:
+            state_store = hitl_config.tool_state_store
+        if state_store is None:
+            state_store = InMemoryExecutionStateStore()
+        self.state_store = state_store
 
     def wrap_tools(self, tools: list[BaseTool]) -> list[BaseTool]:
         """Wrap tools that require interrupt before or after execution"""
@@ -65,8 +73,9 @@ class HITLToolWrapper:
     ) -> BaseTool:
         """Create interrupt wrapper for a single tool using model_copy approach"""
 
-        # Store reference to outer class instance
-        outer_self = self
+        # Store references used by the wrapped methods
+        state_store = self.state_store
+        tool_name = original_tool.name
 
         # Inspect original tool signatures to handle config parameter correctly
         arun_sig = (
@@ -183,16 +192,14 @@ class HITLToolWrapper:
             if config and config.get("configurable"):
                 thread_id = config["configurable"].get("thread_id", "default")
 
-            # Generate stable execution ID with thread isolation (no timestamp)
+            # Generate stable execution ID with thread isolation (no timestamp),
+            # identical across processes so resumes work on any worker
             execution_id = (
-                f"{thread_id}_{original_tool.name}_{hash(str(sorted(kwargs.items())))}"
+                f"{thread_id}_{ToolResultCache.cache_key(tool_name, (), kwargs)}"
             )
 
             # Get or create execution state
-            if execution_id not in outer_self._execution_cache:
-                outer_self._execution_cache[execution_id] = ExecutionState()
-
-            exec_state = outer_self._execution_cache[execution_id]
+            exec_state = await state_store.get(execution_id) or ExecutionState()
 
             # Before interrupt
             if interrupt_before and not exec_state.before_interrupt_processed:
@@ -205,6 +212,7 @@ class HITLToolWrapper:
 
                 # Use saved kwargs if current kwargs are empty
                 effective_kwargs = kwargs if kwargs else (exec_state.saved_kwargs or {})
+                await state_store.set(execution_id, exec_state)
 
                 before_request = {
                     "type": "tool_interrupt_before",
@@ -248,9 +256,8 @@ class HITLToolWrapper:
                 # Process user response
                 if not parsed_response.get("approved", False):
                     reason = parsed_response.get("reason", "User denied tool execution")
-                    # Clean up cache before returning
-                    if execution_id in outer_self._execution_cache:
-                        del outer_self._execution_cache[execution_id]
+                    # Clean up state before returning
+                    await state_store.delete(execution_id)
                     return f"Tool execution denied by user: {reason}"
 
                 # Apply parameter modifications
@@ -307,6 +314,9 @@ class HITLToolWrapper:
                 # Save tool execution result and state
                 exec_state.tool_executed = True
                 exec_state.tool_result = result
+                if interrupt_after:
+                    # Kept for the resume of the after interrupt
+                    await state_store.set(execution_id, exec_state)
             else:
                 # Use cached result
                 result = exec_state.tool_result
@@ -361,9 +371,8 @@ class HITLToolWrapper:
                 # Mark after interrupt as processed
                 exec_state.after_interrupt_processed = True
 
-            # Clean up cache after execution completes
-            if execution_id in outer_self._execution_cache:
-                del outer_self._execution_cache[execution_id]
+            # Clean up state after execution completes
+            await state_store.delete(execution_id)
 
             return result
 
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import inspect
 import logging
 from collections.abc import AsyncGenerator, Sequence
@@ -62,8 +63,11 @@ class RunnableCrew(Crew):
         super()._register_tools()
         for tool in self._tools:
             if isinstance(tool, StreamingBaseTool):
+                # Tool instances may be shared, only complete this session's runs
                 self.trigger_external_completion_callback.append(
-                    tool.trigger_external_completion
+                    functools.partial(
+                        tool.trigger_external_completion, thread_id=self.session_id
+                    )
                 )
 
     async def callback_on_cancel(
@@ -290,7 +294,10 @@ class RunnableCrew(Crew):
                     tool_result = await callback(event, value)
                 else:
                     tool_result = callback(event, value)
-                if tool_result:
+                if isinstance(tool_result, list):
+                    # Results of several runs of the tool
+                    result.extend(tool_result)
+                elif tool_result:
                     result.append(tool_result)
             except Exception as e:
                 logger.exception(f"Error in trigger external completion callback: {e}")
@@ -34,6 +34,7 @@ class Task(Runnable):
         # Guardrail support
         input_guards: list[GuardrailFunc] | None = None,
         output_guards: list[GuardrailFunc] | None = None,
+        speculative_guards: bool = False,
     ):
         # Handle CrewAI-style config
         if config:
@@ -73,6 +74,7 @@ class Task(Runnable):
         # Guardrail configuration
         self.input_guards = input_guards or []
         self.output_guards = output_guards or []
+        self.speculative_guards = speculative_guards
 
     # Properties delegated to TaskSpec
     @property
@@ -5,17 +5,43 @@ from .astream_tool import (
     HitlGetHandoverInfoTool,
     StreamEventType,
     StreamingBaseTool,
+    StreamRunState,
     ToolCallback,
 )
 from .converter import ToolConverter, convert_tools
+from .policies import (
+    ToolCircuitOpenError,
+    ToolPolicy,
+    ToolPolicyError,
+    ToolPolicyWrapper,
+    ToolTimeoutError,
+)
 from .registry import ToolRegistry
+from .result_cache import (
+    InMemoryToolResultCache,
+    RedisToolResultCache,
+    ToolCachePolicy,
+    ToolResultCache,
+    ToolResultCacheBackend,
+)
 
 __all__ = [
     "ToolConverter",
     "convert_tools",
     "ToolRegistry",
+    "ToolPolicy",
+    "ToolPolicyWrapper",
+    "ToolPolicyError",
+    "ToolTimeoutError",
+    "ToolCircuitOpenError",
+    "ToolResultCache",
+    "ToolCachePolicy",
+    "ToolResultCacheBackend",
+    "InMemoryToolResultCache",
+    "RedisToolResultCache",
     "ToolCallback",
     "StreamingBaseTool",
+    "StreamRunState",
     "ExternalCompletionBaseTool",
     "GraphStreamingBaseTool",
     "EventType",
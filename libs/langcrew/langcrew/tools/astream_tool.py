@@ -10,6 +10,8 @@ Key Features:
 - External completion mechanism for user interruption
 - Custom event dispatching through LangChain's callback system
 - Robust error handling and timeout management
+- Run-scoped state, so one tool instance serves concurrent calls
+- Optional batching of intermediate events (stream_event_batch_ms)
 
 Usage Examples:
 
@@ -140,10 +142,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import uuid
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
 
 try:
     from typing import override
@@ -152,12 +159,18 @@ except ImportError:
 
 from langchain_core.callbacks import adispatch_custom_event
 from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import ensure_config
 from langchain_core.runnables.schema import StandardStreamEvent
 from langchain_core.tools.base import BaseTool
 from pydantic import Field
 
+from ..utils.async_utils import run_coroutine
+
 logger = logging.getLogger(__name__)
 
+# Custom event carrying several intermediate events of a streaming tool
+STREAM_EVENT_BATCH = "on_langcrew_stream_event_batch"
+
 
 class EventType(str, Enum):
     """External completion event type enumeration"""
@@ -189,6 +202,136 @@ class StreamTimeoutError(Exception):
             super().__init__(f"Stream event timeout after {timeout_seconds}s")
 
 
+@dataclass
+class StreamRunState:
+    """
+    State of one invocation of a streaming tool
+
+    Tool instances are shared by parallel tool calls and sessions, so anything
+    specific to an invocation lives here instead of on the tool. Subclasses
+    extend it with their own fields and set it as the tool's run_state_class.
+    """
+
+    run_key: str  # tool_call_id, else the tool run id
+    run_id: uuid.UUID | None = None
+    tool_call_id: str | None = None
+    thread_id: str | None = None
+    external_completion_future: asyncio.Future[Any] | None = None
+
+
+# Invocation running in the current context
+_current_run: ContextVar[StreamRunState | None] = ContextVar(
+    "langcrew_stream_run", default=None
+)
+# tool_call_id of the tool call, passed by arun/run to _arun
+_current_tool_call_id: ContextVar[str | None] = ContextVar(
+    "langcrew_tool_call_id", default=None
+)
+
+
+def unbatch_custom_event(custom_event: dict) -> list[dict]:
+    """
+    Custom events carried by a STREAM_EVENT_BATCH event
+
+    Each returned event is the batch event with the name and data of one
+    batched event, in dispatch order.
+    """
+    batch = custom_event.get("data") or {}
+    return [
+        {**custom_event, "name": batch.get("name"), "data": data}
+        for data in batch.get("events", [])
+    ]
+
+
+class _EventBatcher:
+    """
+    Coalesces intermediate events of one run into batched dispatches
+
+    The first buffered event opens a window of ``window`` seconds; the batch is
+    dispatched when the window closes, when it holds ``max_events`` events or
+    when the stream ends. A batch of one event is dispatched as a plain event.
+    """
+
+    def __init__(
+        self,
+        tool: StreamingBaseTool,
+        custom_event_name: str,
+        config: RunnableConfig | None,
+        can_dispatch: bool,
+    ):
+        self.tool = tool
+        self.custom_event_name = custom_event_name
+        self.config = config
+        self.can_dispatch = can_dispatch
+        self.window = tool.stream_event_batch_ms / 1000
+        self.max_events = tool.stream_event_batch_size
+        self.enabled = can_dispatch and self.window > 0 and self.max_events > 1
+        self._events: list[Any] = []
+        self._timer: asyncio.Task | None = None
+        # Keeps batches in order when the timer and the stream flush together
+        self._lock = asyncio.Lock()
+
+    async def add(self, custom_event_data: Any) -> None:
+        if not self.enabled:
+            await self._dispatch(self.custom_event_name, custom_event_data)
+            return
+        self._events.append(custom_event_data)
+        if len(self._events) >= self.max_events:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Dispatch the buffered events now"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Waits for a batch being dispatched by the timer
+        async with self._lock:
+            events, self._events = self._events, []
+            if len(events) == 1:
+                await self._dispatch(self.custom_event_name, events[0])
+            elif events:
+                await self._dispatch(
+                    STREAM_EVENT_BATCH,
+                    {"name": self.custom_event_name, "events": events},
+                )
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        self._timer = None  # Dispatching, no longer cancelled by flush
+        await self.flush()
+
+    async def _dispatch(self, name: str, data: Any) -> None:
+        await self.tool._dispatch_or_log_event(
+            name, data, config=self.config, can_dispatch=self.can_dispatch
+        )
+
+
+def _resolve_future(
+    future: asyncio.Future[Any], result: Any = None, error: BaseException | None = None
+) -> None:
+    """Complete a future from any thread, it belongs to the loop of its run"""
+
+    def resolve():
+        if future.done():
+            return
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    loop = future.get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        resolve()
+    else:
+        loop.call_soon_threadsafe(resolve)
+
+
 class ToolCallback(BaseTool, ABC):
     """
     Tool interface that contains ordered callback methods
@@ -232,11 +375,87 @@ class StreamingBaseTool(ToolCallback):
         "Prevents streaming tasks from blocking indefinitely by throwing "
         "StreamTimeoutError if interval between _astream_events exceeds this value.",
     )
+    stream_event_batch_ms: float = Field(
+        default_factory=lambda: float(os.getenv("LANGCREW_STREAM_EVENT_BATCH_MS", "0")),
+        description="Coalesce intermediate events dispatched within this window "
+        "into one STREAM_EVENT_BATCH custom event. 0 disables batching. "
+        "Defaults to LANGCREW_STREAM_EVENT_BATCH_MS (0).",
+    )
+    stream_event_batch_size: int = Field(
+        default_factory=lambda: int(
+            os.getenv("LANGCREW_STREAM_EVENT_BATCH_SIZE", "32")
+        ),
+        description="Dispatch a batch as soon as it holds this many events. "
+        "Defaults to LANGCREW_STREAM_EVENT_BATCH_SIZE (32).",
+    )
+    # State created for each invocation, see run_state
+    run_state_class: ClassVar[type[StreamRunState]] = StreamRunState
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # Optimization: Use Future to handle both waiting and data storage
-        self._external_completion_future: asyncio.Future[Any] | None = None
+        # Invocations in progress by run key, shared with copies of the tool
+        self._runs: dict[str, StreamRunState] = {}
+
+    @property
+    def run_state(self) -> StreamRunState | None:
+        """
+        State of this tool's invocation running in the current context
+
+        Available in _astream_events, configure_runnable, handle_timeout_error
+        and handle_external_completion, and in tasks they create.
+        """
+        state = _current_run.get()
+        if state is not None and self._runs.get(state.run_key) is state:
+            return state
+        return None
+
+    @property
+    def active_runs(self) -> list[StreamRunState]:
+        """States of the invocations in progress"""
+        return list(self._runs.values())
+
+    @override
+    async def arun(
+        self, tool_input: str | dict[str, Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        token = _current_tool_call_id.set(kwargs.get("tool_call_id"))
+        try:
+            return await super().arun(tool_input, *args, **kwargs)
+        finally:
+            _current_tool_call_id.reset(token)
+
+    @override
+    def run(self, tool_input: str | dict[str, Any], *args: Any, **kwargs: Any) -> Any:
+        token = _current_tool_call_id.set(kwargs.get("tool_call_id"))
+        try:
+            return super().run(tool_input, *args, **kwargs)
+        finally:
+            _current_tool_call_id.reset(token)
+
+    @contextmanager
+    def _run_scope(self, config: RunnableConfig | None) -> Iterator[StreamRunState]:
+        """Register the state of an invocation for the duration of the block"""
+        callbacks = ensure_config().get("callbacks")
+        run_id = getattr(callbacks, "parent_run_id", None)
+        tool_call_id = _current_tool_call_id.get()
+        run_key = tool_call_id or (str(run_id) if run_id else uuid.uuid4().hex)
+        if run_key in self._runs:
+            run_key = f"{run_key}:{uuid.uuid4().hex[:8]}"
+        state = self.run_state_class(
+            run_key=run_key,
+            run_id=run_id,
+            tool_call_id=tool_call_id,
+            thread_id=((config or {}).get("configurable") or {}).get("thread_id"),
+            external_completion_future=asyncio.get_running_loop().create_future(),
+        )
+        self._runs[run_key] = state
+        token = _current_run.set(state)
+        try:
+            yield state
+        finally:
+            _current_run.reset(token)
+            if self._runs.get(run_key) is state:
+                del self._runs[run_key]
 
     async def handle_external_completion(
         self, event_type: EventType, event_data: Any
@@ -283,42 +502,77 @@ class StreamingBaseTool(ToolCallback):
         }
 
     async def trigger_external_completion(
-        self, event_type: EventType, event_data: Any
+        self,
+        event_type: EventType,
+        event_data: Any,
+        *,
+        run_id: uuid.UUID | str | None = None,
+        tool_call_id: str | None = None,
+        thread_id: str | None = None,
     ) -> Any:  # type: ignore
         """
         Method for tools to accept cancellation events
 
         Generally registered at the Agent layer (RunnableCrew) to receive cancellation
-        events. Uses _external_completion_future to determine if the current object is
-        already executing/finished. For tools currently in progress, calls
-        handle_external_completion to implement the actual cancellation logic.
+        events. The event is routed to the invocations in progress that match the
+        given run_id, tool_call_id and thread_id; runs without a thread id match
+        any thread. For each of them, handle_external_completion is called with
+        the invocation's run_state to implement the actual cancellation logic.
 
         Workflow:
-        1. Check if tool is currently executing via _external_completion_future
-        2. If executing, call handle_external_completion for actual cancellation logic
-        3. Set result in _external_completion_future to notify waiting stream processor
+        1. Select the matching invocations that have not completed yet
+        2. For each, call handle_external_completion for actual cancellation logic
+        3. Set result in the run's external completion future to notify its
+           waiting stream processor
         4. Return result from handle_external_completion
 
         Args:
             event_type: Type of external event (STOP or NEW_MESSAGE)
             event_data: Event data to pass to cancellation handler
+            run_id: Only complete the invocation with this tool run id
+            tool_call_id: Only complete the invocation of this tool call
+            thread_id: Only complete invocations of this thread (session)
 
         Returns:
-            Result from handle_external_completion, or None if tool not executing
+            Result from handle_external_completion, a list of results if several
+            invocations matched, or None if no matching invocation is executing
         """
-        if (
-            not self._external_completion_future
-            or self._external_completion_future.done()
-        ):
+        runs = [
+            state
+            for state in self.active_runs
+            if (run_id is None or str(state.run_id) == str(run_id))
+            and (tool_call_id is None or state.tool_call_id == tool_call_id)
+            and (
+                thread_id is None
+                or state.thread_id is None
+                or state.thread_id == thread_id
+            )
+        ]
+        if not runs:
+            logger.debug("External completion ignored: no matching run in progress")
+            return None
+        results = [
+            await self._complete_run(state, event_type, event_data) for state in runs
+        ]
+        if len(results) == 1:
+            return results[0]
+        return [result for result in results if result] or None
+
+    async def _complete_run(
+        self, state: StreamRunState, event_type: EventType, event_data: Any
+    ) -> Any:
+        """Complete one invocation with the result of handle_external_completion"""
+        future = state.external_completion_future
+        if future is None or future.done():
             logger.debug("External completion ignored: future already done")
-            return
+            return None
+        token = _current_run.set(state)
         result = None
         try:
             result = await self.handle_external_completion(event_type, event_data)
             if result:
-                self._external_completion_future.set_result(
-                    result
-                )  # Set result and notify waiters simultaneously
+                # Set result and notify waiters simultaneously
+                _resolve_future(future, result=result)
                 logger.info(f"External completion triggered: {event_data}")
             else:
                 logger.debug(
@@ -327,13 +581,11 @@ class StreamingBaseTool(ToolCallback):
         except asyncio.CancelledError:
             pass
         except BaseException as e:
-            self._external_completion_future.set_exception(e)
+            _resolve_future(future, error=e)
+        finally:
+            _current_run.reset(token)
         return result
 
-    def _reset_external_completion(self):
-        """Reset external completion state for new execution"""
-        self._external_completion_future = asyncio.Future()
-
     @abstractmethod
     async def _astream_events(
         self, *args: Any, **kwargs: Any
@@ -505,6 +757,8 @@ class StreamingBaseTool(ToolCallback):
         """
 
         try:
+            if custom_event.get("name") == STREAM_EVENT_BATCH:
+                return await self._batch_event_hook(custom_event)
             if custom_event.get("name") != self.name:
                 return custom_event
             if custom_event.get("event") == "on_custom_event":
@@ -517,6 +771,20 @@ class StreamingBaseTool(ToolCallback):
             logger.exception(f"Error in custom_event_hook: {e}")
             return custom_event
 
+    async def _batch_event_hook(self, custom_event: dict) -> Any:
+        """Process the events of a batch of this tool one by one"""
+        events = unbatch_custom_event(custom_event)
+        if not events or events[0].get("name") != self.name:
+            return custom_event
+        results = []
+        for event in events:
+            result = await self.custom_event_hook(event)
+            if isinstance(result, list):
+                results.extend(result)
+            elif result:
+                results.append(result)
+        return results
+
     def configure_runnable(self, config: RunnableConfig):
         """
         Hook method for configuring runtime parameters.
@@ -606,6 +874,7 @@ class StreamingBaseTool(ToolCallback):
     ) -> Any:
         """Independent stream processor that can be interrupted by external events"""
         final_event_data = None
+        batcher = _EventBatcher(self, custom_event_name, config, can_dispatch_events)
 
         try:
             async for event_type, custom_event_data in self._astream_events(
@@ -613,13 +882,9 @@ class StreamingBaseTool(ToolCallback):
             ):
                 # Dispatch intermediate events (not the final one)
                 if event_type != StreamEventType.END:
-                    await self._dispatch_or_log_event(
-                        custom_event_name,
-                        custom_event_data,
-                        config=config,
-                        can_dispatch=can_dispatch_events,
-                    )
+                    await batcher.add(custom_event_data)
                 else:
+                    await batcher.flush()
                     # StandardStreamEvent - extract final output data
                     final_event_data = (
                         custom_event_data.get("data", {}).get("output", {})
@@ -631,6 +896,9 @@ class StreamingBaseTool(ToolCallback):
         except BaseException as e:
             logger.exception(f"Error in _run_stream_processor: {e}")
             raise e
+        finally:
+            # Flush events buffered before an error or cancellation
+            await batcher.flush()
 
         if final_event_data is not None:
             # logger.info(f"Stream completed with data: {final_event_data}")
@@ -678,11 +946,12 @@ class StreamingBaseTool(ToolCallback):
         Raises:
             StreamTimeoutError: If no events received within timeout period
         """
-        self._reset_external_completion()
+        completion_future = self.run_state.external_completion_future
         timeout_seconds = self.stream_event_timeout_seconds
 
         # Create event notification for waking up the main loop
         new_event = asyncio.Event()
+        batcher = _EventBatcher(self, custom_event_name, config, can_dispatch_events)
 
         async def event_processor():
             """Event processor that handles the stream"""
@@ -702,13 +971,10 @@ class StreamingBaseTool(ToolCallback):
                     # Notify that a new event was received
                     new_event.set()
                     # Dispatch intermediate events (not the final one)
-                    await self._dispatch_or_log_event(
-                        custom_event_name,
-                        custom_event_data,
-                        config=config,
-                        can_dispatch=can_dispatch_events,
-                    )
+                    await batcher.add(custom_event_data)
             finally:
+                # Flush buffered events on END, errors and cancellation
+                await batcher.flush()
                 new_event.set()  # Ensure the main loop unblocks if it's waiting
 
             return final_event_data if final_event_data else await self.none_result()
@@ -716,7 +982,7 @@ class StreamingBaseTool(ToolCallback):
         async def external_monitor():
             """Monitor external completion future"""
             try:
-                return await self._external_completion_future
+                return await completion_future
             finally:
                 new_event.set()  # Unblock main loop
 
@@ -757,74 +1023,60 @@ class StreamingBaseTool(ToolCallback):
                 external_task.cancel()
 
     def _run(self, config: RunnableConfig, *args: Any, **kwargs: Any) -> Any:
-        try:
-            return asyncio.run(self._arun(config, *args, **kwargs))
-        except RuntimeError as e:
-            if "cannot be called from a running event loop" in str(e):
-                # Fallback: manually create and manage event loop
-                logger.debug("Creating new event loop for sync execution")
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result = loop.run_until_complete(
-                        self._arun(config, *args, **kwargs)
-                    )
-                    return result
-                finally:
-                    loop.close()
-                    # Reset event loop policy to avoid issues
-                    asyncio.set_event_loop(None)
-            raise e
+        # Run on the shared bridge loop instead of a new loop per call, so
+        # clients bound to the loop (HTTP pools, MCP sessions) are reused
+        return run_coroutine(self._arun(config, *args, **kwargs))
 
     async def _arun(self, config: RunnableConfig, *args: Any, **kwargs: Any) -> Any:
-        try:
-            self.configure_runnable(config)
-        except BaseException as e:
-            # Unified exception handling: use exception level to record full stack trace
-            logger.exception(f"Error in set_runnable_config: {e}")
-            raise e
-        # Check if adispatch_custom_event is available
-        can_dispatch_events = self._can_dispatch_custom_events(config)
-        custom_event_name = self.name
-
-        # Get timeout configuration
-        timeout_seconds = self.stream_event_timeout_seconds
-
-        # Choose processing method based on timeout configuration
-        if timeout_seconds < 0:
+        with self._run_scope(config):
             try:
-                return await self._process_stream_without_timeout(
-                    custom_event_name=custom_event_name,
-                    config=config,
-                    can_dispatch_events=can_dispatch_events,
-                    *args,
-                    **kwargs,
-                )
-            except asyncio.CancelledError as e:
-                raise e
+                self.configure_runnable(config)
             except BaseException as e:
                 # Unified exception handling: use exception level to record full stack trace
-                logger.exception(f"Stream processing error: {e}")
-                raise e
-        else:
-            # Concurrent processing with timeout
-            try:
-                return await self._process_stream_with_timeout(
-                    custom_event_name=custom_event_name,
-                    config=config,
-                    can_dispatch_events=can_dispatch_events,
-                    *args,
-                    **kwargs,
-                )
-            except StreamTimeoutError as e:
-                # Timeout exception: log detailed information and propagate
-                logger.exception("Stream processing timeout occurred")
-                self.handle_timeout_error(e)
-                raise e
-            except BaseException as e:
-                # General exception: log detailed information and propagate
-                logger.exception(f"Stream processing error occurred:  {e}")
+                logger.exception(f"Error in set_runnable_config: {e}")
                 raise e
+            # Check if adispatch_custom_event is available
+            can_dispatch_events = self._can_dispatch_custom_events(config)
+            custom_event_name = self.name
+
+            # Get timeout configuration
+            timeout_seconds = self.stream_event_timeout_seconds
+
+            # Choose processing method based on timeout configuration
+            if timeout_seconds < 0:
+                try:
+                    return await self._process_stream_without_timeout(
+                        custom_event_name=custom_event_name,
+                        config=config,
+                        can_dispatch_events=can_dispatch_events,
+                        *args,
+                        **kwargs,
+                    )
+                except asyncio.CancelledError as e:
+                    raise e
+                except BaseException as e:
+                    # Unified exception handling: use exception level to record full stack trace
+                    logger.exception(f"Stream processing error: {e}")
+                    raise e
+            else:
+                # Concurrent processing with timeout
+                try:
+                    return await self._process_stream_with_timeout(
+                        custom_event_name=custom_event_name,
+                        config=config,
+                        can_dispatch_events=can_dispatch_events,
+                        *args,
+                        **kwargs,
+                    )
+                except StreamTimeoutError as e:
+                    # Timeout exception: log detailed information and propagate
+                    logger.exception("Stream processing timeout occurred")
+                    self.handle_timeout_error(e)
+                    raise e
+                except BaseException as e:
+                    # General exception: log detailed information and propagate
+                    logger.exception(f"Stream processing error occurred:  {e}")
+                    raise e
 
     async def _process_stream_without_timeout(
         self,
@@ -834,8 +1086,7 @@ class StreamingBaseTool(ToolCallback):
         *args,
         **kwargs,
     ) -> Any:
-        self._reset_external_completion()
-
+        completion_future = self.run_state.external_completion_future
         stream_task = asyncio.create_task(
             self._run_stream_processor(
                 custom_event_name, config, can_dispatch_events, *args, **kwargs
@@ -845,13 +1096,13 @@ class StreamingBaseTool(ToolCallback):
         try:
             # Wait for any task to complete - use Future and Task directly
             done, pending = await asyncio.wait(
-                [stream_task, self._external_completion_future],
+                [stream_task, completion_future],
                 return_when=asyncio.FIRST_COMPLETED,
             )
             # Check which task completed
-            if self._external_completion_future in done:
+            if completion_future in done:
                 logger.info("External completion won the race")
-                return await self._external_completion_future
+                return await completion_future
             else:
                 logger.info("Stream processing completed normally")
                 return await stream_task
@@ -939,66 +1190,46 @@ class ExternalCompletionBaseTool(StreamingBaseTool, ABC):
 
 
 class GraphStreamingBaseTool(StreamingBaseTool, ABC):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._stop_event: asyncio.Event = asyncio.Event()
-        self._new_message_event: asyncio.Event = asyncio.Event()
-        self._is_running: bool = False
-        self._stop_result: str | None = None
-
     @override
     async def _arun(self, config: RunnableConfig, *args: Any, **kwargs: Any) -> Any:
-        self._is_running = True
-        main_task = asyncio.create_task(self._arun_work(*args, **kwargs))
-
-        try:
-            # Wait for the main task to complete or the stop signal
-            done, pending = await asyncio.wait(
-                [
-                    main_task,
-                    asyncio.create_task(self._stop_event.wait()),
-                    asyncio.create_task(self._new_message_event.wait()),
-                ],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            # Cancel unfinished tasks
-            for task in pending:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        with self._run_scope(config) as state:
+            main_task = asyncio.create_task(self._arun_work(*args, **kwargs))
+            completion_future = state.external_completion_future
 
-            if self._stop_event.is_set():
-                logger.info("Stop signal received")
-                self._stop_event.clear()
-                return self._stop_result
-
-            if self._new_message_event.is_set():
-                logger.info("New message signal received")
-                self._new_message_event.clear()
-                return self._stop_result
-
-            result = main_task.result()
-            logger.info(f"Main task completed: {result}")
-            return result  # Get the result of the main task
+            try:
+                # Wait for the main task to complete or the stop / new message signal
+                await asyncio.wait(
+                    [main_task, completion_future],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
 
-        except asyncio.CancelledError:
-            logger.info("Main task cancelled")
-            # Cancel main task
-            if not main_task.done():
-                main_task.cancel()
-            return "tool execution cancelled"
+                if completion_future.done():
+                    logger.info("Stop or new message signal received")
+                    if not main_task.done():
+                        main_task.cancel()
+                        try:
+                            await main_task
+                        except asyncio.CancelledError:
+                            pass
+                    return completion_future.result()
+
+                result = main_task.result()
+                logger.info(f"Main task completed: {result}")
+                return result  # Get the result of the main task
+
+            except asyncio.CancelledError:
+                logger.info("Main task cancelled")
+                # Cancel main task
+                if not main_task.done():
+                    main_task.cancel()
+                return "tool execution cancelled"
 
-        except BaseException as e:
-            logger.exception(f"Error in _arun: {e}")
-            # Cancel main task
-            if not main_task.done():
-                main_task.cancel()
-            return f"Error in tool execution: {e}"
-        finally:
-            self._is_running = False
+            except BaseException as e:
+                logger.exception(f"Error in _arun: {e}")
+                # Cancel main task
+                if not main_task.done():
+                    main_task.cancel()
+                return f"Error in tool execution: {e}"
 
     @abstractmethod
     async def _arun_work(self, *args: Any, **kwargs: Any) -> Any:
@@ -1021,28 +1252,13 @@ class GraphStreamingBaseTool(StreamingBaseTool, ABC):
             result = f"Agent add new task: {message}"
         return result
 
-    # External callback function, used to trigger the tool execution process if it needs to stop or new message
+    # Called for the runs to stop or to hand over to a new message
     @override
-    async def trigger_external_completion(
+    async def handle_external_completion(
         self, event_type: EventType, event_data: Any
     ) -> Any:
-        result = None
-        if not self._is_running:
-            return result
-        try:
-            if event_type == EventType.STOP:
-                result = await self.tool_stop_result(EventType.STOP, None)
-                self._stop_result = result
-                self._stop_event.set()
-            elif event_type == EventType.NEW_MESSAGE:
-                result = await self.tool_stop_result(
-                    EventType.NEW_MESSAGE, str(event_data)
-                )
-                self._stop_result = result
-                self._new_message_event.set()
-        except BaseException as e:
-            result = f"Error occurred during tool execution: {e}"
-        return result
+        message = str(event_data) if event_type == EventType.NEW_MESSAGE else None
+        return await self.tool_stop_result(event_type, message)
 
     # Deprecated
     @override
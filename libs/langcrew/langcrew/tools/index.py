@@ -0,0 +1,166 @@
+"""Persisted tool discovery index for the ToolRegistry
+
+Discovering tools means importing every file under ``./tools`` and whole
+external tool packages. The index remembers which tools each source defines,
+so later processes can list them and import only the module of a tool that
+is actually requested:
+
+- project tool files are keyed by their modification time and size
+- external tool packages are keyed by their installed version
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ToolLocation:
+    """Where an indexed tool class is defined."""
+
+    module: str  # Module name the class is imported from
+    attribute: str  # Name of the class in that module
+    path: str | None = None  # Source file, for project tools outside sys.path
+
+
+def default_index_path() -> Path | None:
+    """Index file from LANGCREW_TOOL_INDEX, None when set to an empty value.
+
+    Defaults to ``$XDG_CACHE_HOME/langcrew/tool_index.json``.
+    """
+    configured = os.getenv("LANGCREW_TOOL_INDEX")
+    if configured is not None:
+        return Path(configured).expanduser() if configured else None
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "langcrew" / "tool_index.json"
+
+
+def package_version(module_path: str) -> str | None:
+    """Installed version of the distribution providing a module, if known."""
+    distribution = module_path.split(".")[0].replace("_", "-")
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class ToolDiscoveryIndex:
+    """Tool name manifest of project tool files and external tool packages
+
+    Args:
+        path: JSON file the index is loaded from and saved to
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._data = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict[str, Any]:
+        empty = {"version": INDEX_FORMAT_VERSION, "directories": {}, "packages": {}}
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return empty
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable tool index {self.path}: {e}")
+            return empty
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return empty
+        return data
+
+    # =====================================
+    # Project tool files
+    # =====================================
+
+    @staticmethod
+    def _file_key(py_file: Path) -> list[int]:
+        stat = py_file.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def get_file(self, directory: Path, py_file: Path) -> dict[str, str] | None:
+        """Tool names and class names of an unchanged file, None if unknown."""
+        files = self._data["directories"].get(str(directory.resolve()), {})
+        entry = files.get(py_file.relative_to(directory).as_posix())
+        try:
+            if entry is None or entry["key"] != self._file_key(py_file):
+                return None
+        except OSError:
+            return None
+        return entry["tools"]
+
+    def set_directory(self, directory: Path, files: dict[Path, dict[str, str]]) -> None:
+        """Record the tools of every file of a scanned directory.
+
+        Args:
+            directory: Scanned directory
+            files: Tool name to class name mapping of each file
+        """
+        entries = {}
+        for py_file, tools in files.items():
+            try:
+                key = self._file_key(py_file)
+            except OSError:
+                continue
+            entries[py_file.relative_to(directory).as_posix()] = {
+                "key": key,
+                "tools": tools,
+            }
+        directory_key = str(directory.resolve())
+        if self._data["directories"].get(directory_key) != entries:
+            self._data["directories"][directory_key] = entries
+            self._dirty = True
+
+    # =====================================
+    # External tool packages
+    # =====================================
+
+    def get_package(self, module_path: str) -> dict[str, ToolLocation] | None:
+        """Tools of an external package at its installed version, if indexed."""
+        entry = self._data["packages"].get(module_path)
+        version = package_version(module_path)
+        if entry is None or version is None or entry["version"] != version:
+            return None
+        return {
+            name: ToolLocation(module=module, attribute=attribute)
+            for name, (module, attribute) in entry["tools"].items()
+        }
+
+    def set_package(self, module_path: str, tools: dict[str, ToolLocation]) -> None:
+        """Record the tools of an external package at its installed version."""
+        version = package_version(module_path)
+        if version is None:
+            return
+        self._data["packages"][module_path] = {
+            "version": version,
+            "tools": {
+                name: [location.module, location.attribute]
+                for name, location in tools.items()
+            },
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the index if it changed, dropping directories that are gone."""
+        directories = self._data["directories"]
+        for directory in [d for d in directories if not Path(d).is_dir()]:
+            del directories[directory]
+            self._dirty = True
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._data))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Failed to save tool index {self.path}: {e}")
@@ -3,9 +3,22 @@ MCP Tool Adapter Module
 
 This module provides a simplified adapter class for converting MCP servers and tools
 to LangChain-compatible tools.
+
+Servers are connected concurrently, each with its own timeout. The tools of a
+server are cached process-wide per server configuration for a TTL, so agents
+listing the same server share one set of tools and connect only once. Tool
+calls run on long-lived pooled sessions (see ``mcp_sessions``).
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
 from typing import Any
 
 from langchain_core.documents.base import Blob
@@ -13,15 +26,63 @@ from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.tools import BaseTool
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
+from .mcp_sessions import MCPSessionManager, get_session_manager
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
 
+def server_cache_key(
+    server_name: str, config: dict[str, Any], variant: Any = None
+) -> str:
+    """Key of a server's tools in the schema cache, changing with its config"""
+    payload = json.dumps([server_name, config, variant], sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CachedServerTools:
+    """Tools loaded from one MCP server"""
+
+    tools: list[BaseTool]
+    expires_at: float  # time.monotonic() deadline
+
+
 class MCPToolAdapter:
     """Simplified adapter for converting MCP servers to LangChain tools"""
 
-    def __init__(self):
+    # Process-wide tools per server configuration, shared by all adapters
+    _schema_cache: dict[str, CachedServerTools] = {}
+    # Loads in progress, awaited by adapters asking for the same server
+    _loading: dict[str, concurrent.futures.Future] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        schema_ttl: float | None = None,
+        session_manager: MCPSessionManager | None = None,
+    ):
+        """
+        Args:
+            timeout: Seconds to wait for each server to list its tools.
+                     Defaults to LANGCREW_MCP_TIMEOUT (30). 0 waits forever.
+            schema_ttl: Seconds loaded tools are reused for the same server
+                        configuration. Defaults to LANGCREW_MCP_SCHEMA_TTL
+                        (300). 0 disables the cache.
+            session_manager: Pools of long-lived sessions the tools are
+                             called on. Defaults to the process-wide manager,
+                             or a new session per call when
+                             LANGCREW_MCP_SESSION_POOL is false.
+        """
         self._client = None
+        self.session_manager = session_manager or get_session_manager()
+        if timeout is None:
+            timeout = float(os.getenv("LANGCREW_MCP_TIMEOUT", "30"))
+        if schema_ttl is None:
+            schema_ttl = float(os.getenv("LANGCREW_MCP_SCHEMA_TTL", "300"))
+        self.timeout = timeout
+        self.schema_ttl = schema_ttl
 
     async def from_servers(
         self,
@@ -31,38 +92,153 @@ class MCPToolAdapter:
         """
         Create LangChain tools from MCP server configurations
 
+        Servers are loaded concurrently; cached tools are reused.
+
         Args:
             servers: Dictionary of server configurations
             tool_filter: Optional list of tool names to include
 
         Returns:
             List of LangChain tools
+
+        Raises:
+            ConnectionError: If a server fails or times out listing its tools
         """
         # Create MCP client
-        self._client = MultiServerMCPClient(servers)
+        self._client = self._create_client(servers)
+
+        server_names = list(servers)
+        results = await asyncio.gather(
+            *(self._get_server_tools(name, servers[name]) for name in server_names),
+            return_exceptions=True,
+        )
 
         # Get all tools
         all_tools = []
 
-        for server_name in servers:
-            try:
-                # Get tools from specific server
-                server_tools = await self._client.get_tools(server_name=server_name)
-            except Exception as e:
+        for server_name, server_tools in zip(server_names, results):
+            if isinstance(server_tools, BaseException):
                 raise ConnectionError(
-                    f"Failed to load tools from server '{server_name}': {str(e)}"
-                )
+                    f"Failed to load tools from server '{server_name}': "
+                    f"{str(server_tools)}"
+                ) from server_tools
+            all_tools.extend(self._filter_tools(server_tools, tool_filter))
+
+        return all_tools
+
+    def from_cache(
+        self,
+        servers: dict[str, dict[str, Any]],
+        tool_filter: list[str] | None = None,
+    ) -> list[BaseTool] | None:
+        """
+        Tools of the servers without connecting, if all of them are cached
+
+        Args:
+            servers: Dictionary of server configurations
+            tool_filter: Optional list of tool names to include
 
-            # Process each tool
-            for tool in server_tools:
-                # Apply tool filter
-                if tool_filter and tool.name not in tool_filter:
-                    continue
-                # Add tool directly without security wrapper
-                all_tools.append(tool)
+        Returns:
+            List of LangChain tools, None if a server's tools are not cached
+        """
+        all_tools = []
+        now = time.monotonic()
+        with self._cache_lock:
+            for server_name, config in servers.items():
+                cached = self._schema_cache.get(self._cache_key(server_name, config))
+                if cached is None or cached.expires_at <= now:
+                    return None
+                all_tools.extend(self._filter_tools(cached.tools, tool_filter))
 
+        self._client = self._create_client(servers)
         return all_tools
 
+    def _create_client(
+        self, servers: dict[str, dict[str, Any]]
+    ) -> MultiServerMCPClient:
+        if self.session_manager is None:
+            return MultiServerMCPClient(servers)
+        return MultiServerMCPClient(
+            servers, tool_interceptors=[self.session_manager.interceptor(servers)]
+        )
+
+    def _cache_key(self, server_name: str, config: dict[str, Any]) -> str:
+        # Tools are bound to the session manager they call through
+        manager = id(self.session_manager) if self.session_manager else None
+        return server_cache_key(server_name, config, manager)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached tools, e.g. after an MCP server was updated"""
+        with cls._cache_lock:
+            cls._schema_cache.clear()
+
+    @staticmethod
+    def _filter_tools(
+        tools: list[BaseTool], tool_filter: list[str] | None
+    ) -> list[BaseTool]:
+        # Add tools directly without security wrapper
+        return [tool for tool in tools if not tool_filter or tool.name in tool_filter]
+
+    async def _get_server_tools(
+        self, server_name: str, config: dict[str, Any]
+    ) -> list[BaseTool]:
+        """Tools of one server, from the cache or a load shared by all callers"""
+        key = self._cache_key(server_name, config)
+        with self._cache_lock:
+            cached = self._schema_cache.get(key)
+            if cached is not None and cached.expires_at > time.monotonic():
+                return cached.tools
+            # Another adapter (possibly on another thread's loop) is loading it
+            loading = self._loading.get(key)
+            if loading is None:
+                loading = concurrent.futures.Future()
+                self._loading[key] = loading
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            return await asyncio.wrap_future(loading)
+
+        start = time.perf_counter()
+        try:
+            tools = await asyncio.wait_for(
+                self._client.get_tools(server_name=server_name), self.timeout or None
+            )
+        except asyncio.TimeoutError:
+            error = TimeoutError(f"no response within {self.timeout}s")
+            self._finish_loading(key, loading, error=error)
+            raise error from None
+        except BaseException as e:
+            self._finish_loading(key, loading, error=e)
+            raise
+
+        logger.info(
+            f"Loaded {len(tools)} tools from MCP server '{server_name}' "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+        self._finish_loading(key, loading, tools=tools)
+        return tools
+
+    def _finish_loading(
+        self,
+        key: str,
+        loading: concurrent.futures.Future,
+        tools: list[BaseTool] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._cache_lock:
+            if error is None and self.schema_ttl > 0:
+                self._schema_cache[key] = CachedServerTools(
+                    tools=tools, expires_at=time.monotonic() + self.schema_ttl
+                )
+            self._loading.pop(key, None)
+        if error is None:
+            loading.set_result(tools)
+        else:
+            loading.set_exception(error)
+
     async def get_prompts(
         self,
         server_name: str,
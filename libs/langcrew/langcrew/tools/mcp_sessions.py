@@ -0,0 +1,366 @@
+"""
+Pooled MCP client sessions
+
+Tools loaded through ``MultiServerMCPClient`` open a new session for every
+call, which for stdio servers means spawning the server process each time.
+``MCPSessionManager`` keeps long-lived sessions per server instead and plugs
+into the client as a tool call interceptor:
+
+- a small pool of sessions per server, grown while all sessions are busy
+- a per-server limit on concurrent calls and a timeout per call
+- idle sessions pinged periodically and closed once idle for too long
+- reconnects with exponential backoff after a server fails to start
+
+Sessions belong to the event loop they were opened on, so pools are kept per
+running loop.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import weakref
+from typing import Any
+
+from langchain_mcp_adapters.interceptors import MCPToolCallRequest
+from langchain_mcp_adapters.sessions import create_session
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CallToolResult
+
+logger = logging.getLogger(__name__)
+
+# Reconnect backoff after a failed connection attempt
+RECONNECT_BACKOFF_BASE = 0.5
+RECONNECT_BACKOFF_MAX = 30.0
+
+
+class PooledSession:
+    """One MCP session, held open by a background task until closed"""
+
+    def __init__(self, connection: dict[str, Any]):
+        self.connection = connection
+        self.session: ClientSession | None = None
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.closed = False
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def open(self, timeout: float | None) -> None:
+        """Connect and initialize the session"""
+        opened = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._hold(opened))
+        try:
+            await asyncio.wait_for(asyncio.shield(opened), timeout)
+        except BaseException:
+            self._task.cancel()
+            raise
+
+    async def _hold(self, opened: asyncio.Future) -> None:
+        # The session context must be entered and exited by the same task
+        try:
+            async with create_session(self.connection) as session:
+                await session.initialize()
+                self.session = session
+                opened.set_result(None)
+                await self._closing.wait()
+        except asyncio.CancelledError:
+            if not opened.done():
+                opened.cancel()
+            raise
+        except Exception as e:
+            if not opened.done():
+                opened.set_exception(e)
+            else:
+                logger.debug(f"MCP session closed with error: {e}")
+        finally:
+            self.closed = True
+            self.session = None
+
+    async def close(self) -> None:
+        """Close the session and wait for its connection to shut down"""
+        self.closed = True
+        self._closing.set()
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._task, 5)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+
+
+class MCPServerPool:
+    """Long-lived sessions to one MCP server"""
+
+    def __init__(
+        self,
+        server_name: str,
+        connection: dict[str, Any],
+        max_sessions: int,
+        max_concurrency: int,
+        idle_timeout: float,
+        health_check_interval: float,
+        connect_timeout: float | None,
+        call_timeout: float | None = None,
+    ):
+        self.server_name = server_name
+        self.connection = connection
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.connect_timeout = connect_timeout
+        self.call_timeout = call_timeout
+        self._sessions: list[PooledSession] = []
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._open_lock = asyncio.Lock()
+        self._failures = 0
+        self._retry_at = 0.0
+        self._monitor: asyncio.Task | None = None
+
+    @property
+    def size(self) -> int:
+        """Number of open sessions"""
+        return len(self._live_sessions())
+
+    def _live_sessions(self) -> list[PooledSession]:
+        self._sessions = [s for s in self._sessions if not s.closed]
+        return self._sessions
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any] | None = None
+    ) -> CallToolResult:
+        """Call a tool on one of the pooled sessions
+
+        Raises:
+            ConnectionError: If no session can be opened to the server
+            TimeoutError: If the call takes longer than call_timeout
+        """
+        async with self._semaphore:
+            pooled = await self._acquire()
+            session = pooled.session
+            if session is None:
+                raise ConnectionError(
+                    f"MCP session to '{self.server_name}' closed unexpectedly"
+                )
+            pooled.in_use += 1
+            try:
+                return await asyncio.wait_for(
+                    session.call_tool(name, arguments), self.call_timeout
+                )
+            except asyncio.TimeoutError:
+                # Only this request is abandoned, the session stays usable
+                raise TimeoutError(
+                    f"MCP tool '{name}' on '{self.server_name}' did not answer "
+                    f"within {self.call_timeout}s"
+                ) from None
+            except McpError:
+                # Error reported by the server, the session is fine
+                raise
+            except Exception:
+                # Transport failure: drop the session, the next call reconnects
+                await pooled.close()
+                raise
+            finally:
+                pooled.in_use -= 1
+                pooled.last_used = time.monotonic()
+
+    async def _acquire(self) -> PooledSession:
+        """Least busy session, opening another one while all are busy"""
+        least_busy = min(self._live_sessions(), key=lambda s: s.in_use, default=None)
+        if least_busy and (least_busy.in_use == 0 or self.size >= self.max_sessions):
+            return least_busy
+
+        async with self._open_lock:
+            # Sessions may have been opened or freed while waiting for the lock
+            least_busy = min(
+                self._live_sessions(), key=lambda s: s.in_use, default=None
+            )
+            if least_busy and (
+                least_busy.in_use == 0 or self.size >= self.max_sessions
+            ):
+                return least_busy
+            try:
+                return await self._open()
+            except ConnectionError:
+                if least_busy is None:
+                    raise
+                logger.warning(
+                    f"Could not grow MCP session pool of '{self.server_name}', "
+                    f"sharing an open session"
+                )
+                return least_busy
+
+    async def _open(self) -> PooledSession:
+        delay = self._retry_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        pooled = PooledSession(self.connection)
+        try:
+            await pooled.open(self.connect_timeout)
+        except Exception as e:
+            self._failures += 1
+            backoff = min(
+                RECONNECT_BACKOFF_MAX,
+                RECONNECT_BACKOFF_BASE * 2 ** (self._failures - 1),
+            )
+            self._retry_at = time.monotonic() + backoff
+            raise ConnectionError(
+                f"Failed to connect to MCP server '{self.server_name}' "
+                f"(retry in {backoff:.1f}s): {e or type(e).__name__}"
+            ) from e
+
+        self._failures = 0
+        self._retry_at = 0.0
+        self._sessions.append(pooled)
+        logger.debug(
+            f"Opened MCP session to '{self.server_name}' ({self.size} in pool)"
+        )
+        if self._monitor is None or self._monitor.done():
+            self._monitor = asyncio.create_task(self._check_sessions())
+        return pooled
+
+    async def _check_sessions(self) -> None:
+        """Close idle sessions and ping the others, until the pool is empty"""
+        while self._live_sessions():
+            await asyncio.sleep(self.health_check_interval)
+            now = time.monotonic()
+            for pooled in self._live_sessions():
+                if pooled.in_use:
+                    continue
+                if now - pooled.last_used >= self.idle_timeout:
+                    logger.debug(f"Closing idle MCP session to '{self.server_name}'")
+                    await pooled.close()
+                    continue
+                try:
+                    await asyncio.wait_for(pooled.session.send_ping(), 5)
+                except Exception as e:
+                    logger.warning(
+                        f"MCP session to '{self.server_name}' failed health "
+                        f"check, closing it: {e or type(e).__name__}"
+                    )
+                    await pooled.close()
+
+    async def aclose(self) -> None:
+        """Close all sessions"""
+        if self._monitor is not None:
+            self._monitor.cancel()
+        for pooled in list(self._sessions):
+            await pooled.close()
+        self._sessions = []
+
+
+class PooledSessionInterceptor:
+    """Tool call interceptor running MCP tool calls on pooled sessions"""
+
+    def __init__(self, manager: "MCPSessionManager", connections: dict[str, Any]):
+        self.manager = manager
+        self.connections = connections
+
+    async def __call__(self, request: MCPToolCallRequest, handler) -> CallToolResult:
+        connection = self.connections.get(request.server_name)
+        if connection is None or request.headers is not None:
+            # Per-call headers need their own connection
+            return await handler(request)
+        pool = self.manager.get_pool(request.server_name, connection)
+        return await pool.call_tool(request.name, request.args)
+
+
+class MCPSessionManager:
+    """Pools of long-lived MCP sessions, per server configuration and event loop"""
+
+    def __init__(
+        self,
+        max_sessions: int | None = None,
+        max_concurrency: int | None = None,
+        idle_timeout: float | None = None,
+        health_check_interval: float | None = None,
+        connect_timeout: float | None = None,
+        call_timeout: float | None = None,
+    ):
+        """
+        Args:
+            max_sessions: Sessions per server, opened while all are busy.
+                          Defaults to LANGCREW_MCP_POOL_SIZE (2).
+            max_concurrency: Concurrent tool calls per server, further calls
+                             wait. Defaults to LANGCREW_MCP_MAX_CONCURRENCY (8).
+            idle_timeout: Seconds a session may stay unused before it is
+                          closed. Defaults to LANGCREW_MCP_IDLE_TIMEOUT (300).
+            health_check_interval: Seconds between idle checks and pings.
+                                   Defaults to min(30, idle_timeout).
+            connect_timeout: Seconds to wait for a session to start.
+                             Defaults to LANGCREW_MCP_TIMEOUT (30).
+            call_timeout: Seconds to wait for a tool call, 0 waits forever.
+                          Defaults to LANGCREW_MCP_CALL_TIMEOUT (300).
+        """
+        if max_sessions is None:
+            max_sessions = int(os.getenv("LANGCREW_MCP_POOL_SIZE", "2"))
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("LANGCREW_MCP_MAX_CONCURRENCY", "8"))
+        if idle_timeout is None:
+            idle_timeout = float(os.getenv("LANGCREW_MCP_IDLE_TIMEOUT", "300"))
+        if health_check_interval is None:
+            health_check_interval = min(30.0, idle_timeout)
+        if connect_timeout is None:
+            connect_timeout = float(os.getenv("LANGCREW_MCP_TIMEOUT", "30"))
+        if call_timeout is None:
+            call_timeout = float(os.getenv("LANGCREW_MCP_CALL_TIMEOUT", "300"))
+        self.max_sessions = max_sessions
+        self.max_concurrency = max_concurrency
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.connect_timeout = connect_timeout or None
+        self.call_timeout = call_timeout or None
+        self._pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, MCPServerPool]
+        ] = weakref.WeakKeyDictionary()
+
+    def get_pool(self, server_name: str, connection: dict[str, Any]) -> MCPServerPool:
+        """Pool of a server on the running event loop"""
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        key = json.dumps([server_name, connection], sort_keys=True, default=repr)
+        pool = pools.get(key)
+        if pool is None:
+            pool = MCPServerPool(
+                server_name,
+                connection,
+                max_sessions=self.max_sessions,
+                max_concurrency=self.max_concurrency,
+                idle_timeout=self.idle_timeout,
+                health_check_interval=self.health_check_interval,
+                connect_timeout=self.connect_timeout,
+                call_timeout=self.call_timeout,
+            )
+            pools[key] = pool
+        return pool
+
+    def interceptor(self, connections: dict[str, Any]) -> PooledSessionInterceptor:
+        """Interceptor for a MultiServerMCPClient with these connections"""
+        return PooledSessionInterceptor(self, connections)
+
+    async def aclose(self) -> None:
+        """Close the sessions opened on the running event loop"""
+        pools = self._pools.pop(asyncio.get_running_loop(), {})
+        for pool in pools.values():
+            await pool.aclose()
+
+
+_default_manager: MCPSessionManager | None = None
+
+
+def get_session_manager() -> MCPSessionManager | None:
+    """Process-wide session manager, None if LANGCREW_MCP_SESSION_POOL is false"""
+    global _default_manager
+    if os.getenv("LANGCREW_MCP_SESSION_POOL", "true").lower() != "true":
+        return None
+    if _default_manager is None:
+        _default_manager = MCPSessionManager()
+    return _default_manager
+
+
+async def close_mcp_sessions() -> None:
+    """Close the pooled MCP sessions of the running event loop"""
+    if _default_manager is not None:
+        await _default_manager.aclose()
@@ -0,0 +1,385 @@
+"""Per-tool concurrency limits, timeouts, retries and circuit breakers
+
+Parallel tool calls of a ReAct step and concurrent sessions may all hit the
+same slow backend. ``ToolPolicyWrapper`` wraps tools with a declarative
+``ToolPolicy`` each:
+
+- a limit on in-flight calls per process, further calls wait for a slot
+- a timeout per attempt, including the wait for a slot. A timed out sync tool
+  keeps its slot until its thread finishes
+- retries with exponential backoff and full jitter, errors the tool reports
+  itself (``ToolException``) are not retried by default
+- a circuit breaker: after consecutive failed calls the tool fails fast for
+  a while, then a single trial call decides whether it recovered
+
+Calls rejected by the breaker and calls that timed out raise a
+``ToolPolicyError``. It is a ``ToolException`` handled by the wrapped tool,
+so the agent receives an error ToolMessage instead of the run failing.
+Breaker states are exported by RunMetrics (``langcrew_tool_circuit_state``).
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, ToolException
+
+from ..utils.async_utils import get_async_bridge, run_coroutine
+
+logger = logging.getLogger(__name__)
+
+# Threads running sync tools, not awaited when a timed out call returns
+_sync_executor = concurrent.futures.ThreadPoolExecutor(
+    thread_name_prefix="langcrew-tool"
+)
+
+
+class ToolPolicyError(ToolException):
+    """A tool call rejected or abandoned by its ToolPolicy"""
+
+
+class ToolTimeoutError(ToolPolicyError):
+    """A tool call did not finish within its timeout"""
+
+
+class ToolCircuitOpenError(ToolPolicyError):
+    """A tool call rejected while the tool's circuit breaker is open"""
+
+
+class CircuitState(int, Enum):
+    """Circuit breaker state, the value is exported as metric"""
+
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+@dataclass(frozen=True)
+class ToolPolicy:
+    """Execution policy of one tool."""
+
+    max_concurrency: int | None = None  # In-flight calls per process
+    timeout: float | None = None  # Seconds per attempt, including slot wait
+    retries: int = 0  # Additional attempts after a failure
+    retry_backoff: float = 0.5  # Base delay, doubled per retry, full jitter
+    # Errors retried and counted by the breaker, besides timeouts
+    retry_on: tuple[type[BaseException], ...] = field(default=(Exception,))
+    # Errors raised as is, neither retried nor counted, even if in retry_on
+    no_retry_on: tuple[type[BaseException], ...] = field(default=(ToolException,))
+    failure_threshold: int | None = None  # Consecutive failures opening the breaker
+    recovery_timeout: float = 30.0  # Seconds the breaker stays open
+
+
+class CircuitBreaker:
+    """Consecutive failure counter of one tool, shared by all its calls"""
+
+    def __init__(self, failure_threshold: int | None, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.rejections = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def retry_in(self) -> float:
+        """Seconds until a trial call is allowed, 0 if calls are allowed"""
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a call may run, counting the rejection if not"""
+        if self.failure_threshold is None:
+            return True
+        with self._lock:
+            if self.state == CircuitState.OPEN and not self.retry_in():
+                self.state = CircuitState.HALF_OPEN
+            if self.state == CircuitState.CLOSED:
+                return True
+            if self.state == CircuitState.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            self.rejections += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._trial_running = False
+            self.state = CircuitState.CLOSED
+
+    def record_abandoned(self) -> None:
+        """A call ended without telling whether the tool is healthy"""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        if self.failure_threshold is None:
+            return
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if (
+                self.state == CircuitState.HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                self.state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+
+
+class ConcurrencyLimiter:
+    """Slots for in-flight calls, awaitable from any thread and event loop"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._waiters: deque[concurrent.futures.Future] = deque()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        waiter: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            if self.in_use < self.limit:
+                self.in_use += 1
+                return
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wrap_future(waiter)
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before the cancellation
+            with self._lock:
+                handed_over = not waiter.cancel()
+            if handed_over:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if waiter.set_running_or_notify_cancel():
+                    waiter.set_result(None)  # Hand the slot over
+                    return
+            self.in_use -= 1
+
+
+class _ThreadCall:
+    """Sync tool call run in the tool thread pool
+
+    A timed out call returns while its thread keeps running, so the thread
+    pool of asyncio.run is not used: it is awaited on exit.
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def submit(self) -> concurrent.futures.Future:
+        return _sync_executor.submit(self.func)
+
+    async def __call__(self) -> Any:
+        return await asyncio.wrap_future(self.submit())
+
+
+class ToolState:
+    """Breaker and limiter of a tool wrapped by a ToolPolicyWrapper"""
+
+    def __init__(self, name: str, policy: ToolPolicy):
+        self.name = name
+        self.policy = policy
+        self.breaker = CircuitBreaker(policy.failure_threshold, policy.recovery_timeout)
+        self.limiter = (
+            ConcurrencyLimiter(policy.max_concurrency)
+            if policy.max_concurrency
+            else None
+        )
+
+    @property
+    def in_flight(self) -> int:
+        return self.limiter.in_use if self.limiter else 0
+
+
+_wrappers: "weakref.WeakSet[ToolPolicyWrapper]" = weakref.WeakSet()
+
+
+def tool_states() -> list[ToolState]:
+    """States of the tools wrapped by all live ToolPolicyWrappers"""
+    return [state for wrapper in list(_wrappers) for state in wrapper.states.values()]
+
+
+def _handle_policy_errors(error: ToolException) -> str:
+    """handle_tool_error of wrapped tools that did not handle errors before"""
+    if isinstance(error, ToolPolicyError):
+        return str(error)
+    raise error
+
+
+class ToolPolicyWrapper:
+    """Wrapper applying execution policies to tools
+
+    State is kept per wrapper and tool name, so share one wrapper between
+    agents to limit and break calls of a tool process-wide.
+
+    Example:
+        policies = ToolPolicyWrapper(
+            {"web_fetch": ToolPolicy(max_concurrency=4, timeout=20, retries=2,
+                                     failure_threshold=5)}
+        )
+        agent = Agent(..., tools=[fetch], tool_policies=policies)
+
+    Args:
+        policies: Policy per tool name, tools without a policy are not wrapped
+    """
+
+    def __init__(self, policies: dict[str, ToolPolicy]):
+        self.policies = policies
+        self.states: dict[str, ToolState] = {}
+        _wrappers.add(self)
+
+    def wrap_tools(self, tools: list[BaseTool]) -> list[BaseTool]:
+        """Wrap the tools that have a policy, others are returned as is"""
+        return [self.wrap_tool(tool) for tool in tools]
+
+    def wrap_tool(self, tool: BaseTool) -> BaseTool:
+        """Copy of a tool whose calls follow its policy, if it has one"""
+        policy = self.policies.get(tool.name)
+        if policy is None or getattr(tool, "_tool_policies", None) is self:
+            return tool
+        state = self.states.get(tool.name)
+        if state is None:
+            state = self.states[tool.name] = ToolState(tool.name, policy)
+
+        outer_self = self
+        run_params = inspect.signature(tool._run).parameters
+        if type(tool)._arun is BaseTool._arun:
+            # The default _arun runs _run in an executor with the same arguments
+            arun_params = None
+        else:
+            arun_params = inspect.signature(tool._arun).parameters
+
+        def injected(params, config, run_manager) -> dict[str, Any]:
+            kwargs = {}
+            if "config" in params:
+                kwargs["config"] = config
+            if run_manager is not None and "run_manager" in params:
+                kwargs["run_manager"] = run_manager
+            return kwargs
+
+        def call_sync(args, kwargs, config, run_manager):
+            sync_run_manager = run_manager.get_sync() if run_manager else None
+            return tool._run(
+                *args, **kwargs, **injected(run_params, config, sync_run_manager)
+            )
+
+        async def policy_arun(
+            *args: Any, config: RunnableConfig = None, run_manager=None, **kwargs
+        ) -> Any:
+            if arun_params is None:
+                call = _ThreadCall(lambda: call_sync(args, kwargs, config, run_manager))
+            else:
+
+                async def call():
+                    return await tool._arun(
+                        *args, **kwargs, **injected(arun_params, config, run_manager)
+                    )
+
+            return await outer_self._call(state, call)
+
+        def policy_run(
+            *args: Any, config: RunnableConfig = None, run_manager=None, **kwargs
+        ) -> Any:
+            def run():
+                return tool._run(
+                    *args, **kwargs, **injected(run_params, config, run_manager)
+                )
+
+            if get_async_bridge().is_loop_thread():
+                # The policies cannot be awaited from the bridge loop itself
+                return run()
+            # Also from a thread with a running loop, e.g. sync code called
+            # from async code, which asyncio.run would refuse
+            return run_coroutine(outer_self._call(state, _ThreadCall(run)))
+
+        wrapped_tool = tool.model_copy()
+        wrapped_tool._arun = policy_arun
+        wrapped_tool._run = policy_run
+        wrapped_tool._tool_policies = self
+        if not tool.handle_tool_error:
+            wrapped_tool.handle_tool_error = _handle_policy_errors
+        return wrapped_tool
+
+    async def _call(self, state: ToolState, call) -> Any:
+        """Run a tool call with the limits, retries and breaker of its policy"""
+        policy = state.policy
+        breaker = state.breaker
+        if not breaker.allow():
+            raise ToolCircuitOpenError(
+                f"Tool '{state.name}' is temporarily unavailable after "
+                f"{breaker.failures} consecutive failures, "
+                f"retry in {breaker.retry_in():.0f}s"
+            )
+
+        for attempt in range(policy.retries + 1):
+            try:
+                result = await asyncio.wait_for(
+                    self._attempt(state, call), policy.timeout
+                )
+            except asyncio.TimeoutError:
+                error = ToolTimeoutError(
+                    f"Tool '{state.name}' did not respond within {policy.timeout}s"
+                )
+            except policy.no_retry_on:
+                # Reported by the tool itself, e.g. invalid arguments
+                breaker.record_abandoned()
+                raise
+            except policy.retry_on as e:
+                error = e
+            except BaseException:
+                breaker.record_abandoned()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
+            if attempt == policy.retries:
+                break
+            delay = random.uniform(0, policy.retry_backoff * 2**attempt)
+            logger.info(
+                f"Tool '{state.name}' failed ({error or type(error).__name__}), "
+                f"retry {attempt + 1}/{policy.retries} in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+        breaker.record_failure()
+        if breaker.state == CircuitState.OPEN:
+            logger.warning(
+                f"Circuit breaker of tool '{state.name}' opened after "
+                f"{breaker.failures} consecutive failures"
+            )
+        raise error
+
+    @staticmethod
+    async def _attempt(state: ToolState, call) -> Any:
+        limiter = state.limiter
+        if limiter is None:
+            return await call()
+        await limiter.acquire()
+        if not isinstance(call, _ThreadCall):
+            try:
+                return await call()
+            finally:
+                limiter.release()
+
+        future = call.submit()
+        # A timed out thread cannot be stopped, it keeps its slot until it ends
+        future.add_done_callback(lambda _: limiter.release())
+        return await asyncio.wrap_future(future)
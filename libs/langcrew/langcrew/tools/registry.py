@@ -4,6 +4,7 @@ This module provides a unified tool registry that:
 1. Auto-discovers tools from langcrew, custom directories, and third-party packages
 2. Supports simplified tool names without provider prefixes
 3. Handles tool instantiation and caching
+4. Persists a discovery index so later processes import tool modules lazily
 """
 
 import importlib
@@ -14,6 +15,9 @@ from typing import Any
 
 from langchain_core.tools import BaseTool
 
+from .index import ToolDiscoveryIndex, ToolLocation, default_index_path
+from .result_cache import ToolResultCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,6 +62,17 @@ class ToolRegistry:
         ToolRegistryConfig.LANGCHAIN_PROVIDER: {},  # External LangChain community tools
     }
 
+    # Tools known from the discovery index whose modules are not imported yet
+    _indexed_tools: dict[str, dict[str, ToolLocation]] = {
+        ToolRegistryConfig.CUSTOM_PROVIDER: {},
+        ToolRegistryConfig.LANGCREW_PROVIDER: {},
+        ToolRegistryConfig.CREWAI_PROVIDER: {},
+        ToolRegistryConfig.LANGCHAIN_PROVIDER: {},
+    }
+
+    # Persisted discovery index (see LANGCREW_TOOL_INDEX)
+    _index: ToolDiscoveryIndex | None = None
+
     # Flag to track if discovery has been run
     _discovery_complete = False
 
@@ -66,13 +81,16 @@ class ToolRegistry:
     # =====================================
 
     @classmethod
-    def get_tool(cls, name: str) -> BaseTool:
+    def get_tool(
+        cls, name: str, result_cache: ToolResultCache | None = None
+    ) -> BaseTool:
         """Get a tool instance by name
 
         Args:
             name: Tool name (e.g., "file_read", "csv_analyzer")
                   Can optionally include provider prefix (e.g., "crewai:scrape_website")
                   Without prefix, defaults to "local" provider with search priority
+            result_cache: Cache to wrap the tool with, if it has a policy for it
 
         Returns:
             Tool instance
@@ -87,7 +105,7 @@ class ToolRegistry:
         # Check cache first
         cached_tool = cls._get_cached_tool(name)
         if cached_tool:
-            return cached_tool
+            return result_cache.wrap_tool(cached_tool) if result_cache else cached_tool
 
         # Parse provider and tool name
         provider, tool_name = cls._parse_tool_name(name)
@@ -97,7 +115,7 @@ class ToolRegistry:
 
         # Cache and return
         cls._cache_tool(name, tool_instance)
-        return tool_instance
+        return result_cache.wrap_tool(tool_instance) if result_cache else tool_instance
 
     @classmethod
     def _find_and_instantiate_tool(
@@ -147,6 +165,10 @@ class ToolRegistry:
         for _, provider_tools in cls._discovered_tools.items():
             tools.update(provider_tools.keys())
 
+        # Add indexed tools that are not imported yet
+        for _, provider_tools in cls._indexed_tools.items():
+            tools.update(provider_tools.keys())
+
         return sorted(list(tools))
 
     # =====================================
@@ -217,7 +239,14 @@ class ToolRegistry:
 
     @classmethod
     def _scan_directory_for_tools(cls, directory: Path, provider: str) -> None:
-        """Scan a directory for tool classes"""
+        """Scan a directory for tool classes
+
+        Files unchanged since the last scan recorded in the discovery index
+        are not imported; their tools are loaded when first requested.
+        """
+        index = cls._get_index()
+        scanned: dict[Path, dict[str, str]] = {}
+
         for py_file in directory.glob("**/*.py"):
             if py_file.name.startswith("_"):
                 continue
@@ -226,24 +255,74 @@ class ToolRegistry:
             relative_path = py_file.relative_to(directory.parent)
             module_path = str(relative_path.with_suffix("")).replace("/", ".")
 
+            indexed = index.get_file(directory, py_file) if index else None
+            if indexed is not None:
+                for tool_name, attribute in indexed.items():
+                    cls._indexed_tools[provider][tool_name] = ToolLocation(
+                        module=module_path, attribute=attribute, path=str(py_file)
+                    )
+                scanned[py_file] = indexed
+                continue
+
             try:
-                spec = importlib.util.spec_from_file_location(module_path, py_file)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    cls._extract_tools_from_module(module, provider)
+                module = cls._import_file(module_path, py_file)
+                if module is not None:
+                    tools = cls._extract_tools_from_module(module, provider)
+                    scanned[py_file] = {
+                        tool_name: tool_class.__name__
+                        for tool_name, tool_class in tools.items()
+                    }
             except Exception as e:
                 logger.debug(f"Failed to import {py_file}: {e}")
 
+        if index:
+            index.set_directory(directory, scanned)
+            index.save()
+
+    @staticmethod
+    def _import_file(module_path: str, py_file: Path) -> Any:
+        """Execute a Python file as a module, None if it cannot be loaded"""
+        spec = importlib.util.spec_from_file_location(module_path, py_file)
+        if not spec or not spec.loader:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
     # =====================================
     # Utility Methods
     # =====================================
 
+    @classmethod
+    def _get_index(cls) -> ToolDiscoveryIndex | None:
+        """Discovery index at the configured path, None when disabled"""
+        path = default_index_path()
+        if path is None:
+            return None
+        if cls._index is None or cls._index.path != path:
+            cls._index = ToolDiscoveryIndex(path)
+        return cls._index
+
+    @staticmethod
+    def _get_tool_name(tool_class: type[BaseTool]) -> str:
+        """Name of a tool class, read from its field default when possible"""
+        field = getattr(tool_class, "model_fields", {}).get("name")
+        default = getattr(field, "default", None)
+        if isinstance(default, str) and default:
+            return default
+        # Name set in the constructor
+        return tool_class().name
+
     @classmethod
     def _extract_tools_from_module(
         cls, module: Any, provider: str, prefix: str = ""
-    ) -> None:
-        """Extract tool classes from a module"""
+    ) -> dict[str, type[BaseTool]]:
+        """Extract tool classes from a module
+
+        Returns:
+            Extracted tool classes by tool name
+        """
+        extracted = {}
         for name, obj in inspect.getmembers(module):
             if (
                 inspect.isclass(obj)
@@ -252,14 +331,42 @@ class ToolRegistry:
                 and not name.startswith("_")
             ):
                 # Use the tool's name field directly
-                tool_instance = obj()
-                tool_name = tool_instance.name
+                tool_name = cls._get_tool_name(obj)
 
                 # Add prefix if specified (for namespacing)
                 if prefix:
                     tool_name = f"{prefix}_{tool_name}"
 
                 cls._discovered_tools[provider][tool_name] = obj
+                extracted[tool_name] = obj
+        return extracted
+
+    @classmethod
+    def _load_indexed_tool(cls, provider: str, tool_name: str) -> type[BaseTool] | None:
+        """Import the module of an indexed tool and return its class"""
+        location = cls._indexed_tools.get(provider, {}).pop(tool_name, None)
+        if location is None:
+            return None
+
+        try:
+            if location.path:
+                # Project tool file: register every tool it defines
+                module = cls._import_file(location.module, Path(location.path))
+                if module is not None:
+                    for name in cls._extract_tools_from_module(module, provider):
+                        cls._indexed_tools[provider].pop(name, None)
+            else:
+                module = importlib.import_module(location.module)
+                cls._discovered_tools[provider][tool_name] = getattr(
+                    module, location.attribute
+                )
+        except Exception as e:
+            logger.warning(
+                f"Failed to load indexed tool '{tool_name}' from {location.module}: {e}"
+            )
+            return None
+
+        return cls._discovered_tools[provider].get(tool_name)
 
     @classmethod
     def _discover_external_tools(cls, module_path: str) -> None:
@@ -272,14 +379,34 @@ class ToolRegistry:
             provider = ToolRegistryConfig.LANGCHAIN_PROVIDER
 
         # Skip if already discovered
-        if cls._discovered_tools[provider]:
+        if cls._discovered_tools[provider] or cls._indexed_tools[provider]:
+            return
+
+        # Same package version as indexed: import tool modules on request only
+        index = cls._get_index()
+        indexed = index.get_package(module_path) if index else None
+        if indexed is not None:
+            cls._indexed_tools[provider].update(indexed)
             return
 
         try:
             module = importlib.import_module(module_path)
-            cls._extract_tools_from_module(module, provider)
+            tools = cls._extract_tools_from_module(module, provider)
         except ImportError as e:
             logger.debug(f"Failed to import {module_path}: {e}")
+            return
+
+        if index:
+            index.set_package(
+                module_path,
+                {
+                    tool_name: ToolLocation(
+                        module=tool_class.__module__, attribute=tool_class.__name__
+                    )
+                    for tool_name, tool_class in tools.items()
+                },
+            )
+            index.save()
 
     @classmethod
     def _find_tool_in_provider(
@@ -296,10 +423,15 @@ class ToolRegistry:
             ToolRegistryConfig.LANGCHAIN_PROVIDER,
             ToolRegistryConfig.LANGCREW_PROVIDER,
         ]
-        if provider in external_providers and not cls._discovered_tools[provider]:
+        if (
+            provider in external_providers
+            and not cls._discovered_tools[provider]
+            and not cls._indexed_tools[provider]
+        ):
             cls._load_external_tools(provider)
 
-        return cls._discovered_tools.get(provider, {}).get(tool_name)
+        tool_class = cls._discovered_tools.get(provider, {}).get(tool_name)
+        return tool_class or cls._load_indexed_tool(provider, tool_name)
 
     @classmethod
     def _find_local_tool(cls, tool_name: str) -> type[BaseTool] | None:
@@ -312,6 +444,9 @@ class ToolRegistry:
         for source in ToolRegistryConfig.LOCAL_SEARCH_ORDER:
             if tool_name in cls._discovered_tools[source]:
                 return cls._discovered_tools[source][tool_name]
+            tool_class = cls._load_indexed_tool(source, tool_name)
+            if tool_class:
+                return tool_class
 
         return None
 
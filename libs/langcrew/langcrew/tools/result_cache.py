@@ -0,0 +1,418 @@
+"""Cross-session cache for results of idempotent tool calls
+
+Read-only tools such as web search or page fetching are called with the same
+arguments across sessions and users many times. ``ToolResultCache`` wraps
+tools to reuse their results instead of calling the external service again:
+
+- opt-in per tool, with a TTL and a result size limit per tool
+- keyed on the tool name and its normalized arguments
+- stored in a pluggable backend: a process-local LRU (default) or Redis,
+  shared by every worker
+- concurrent identical calls through one cache share one execution, if it
+  is cancelled one of the waiting calls runs the tool instead
+- cache hits are reported as ``on_langcrew_tool_cache_hit`` custom events
+
+Results are stored as JSON, results that are not JSON serializable are not
+cached. Errors are never cached.
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.callbacks.manager import adispatch_custom_event
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
+
+from ..utils.async_utils import get_async_bridge, run_coroutine
+
+logger = logging.getLogger(__name__)
+
+CACHE_HIT_EVENT = "on_langcrew_tool_cache_hit"
+
+# Tool arguments injected by LangChain, not part of the cache key
+_INJECTED_ARGS = ("config", "run_manager", "callbacks")
+
+
+class _CallCancelled(Exception):
+    """The call shared by identical calls was cancelled, not failed"""
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    """Caching of one tool's results."""
+
+    ttl: float = 300.0  # Seconds a result is reused
+    max_result_size: int | None = 256 * 1024  # Larger results are not cached
+
+
+class ToolResultCacheBackend(ABC):
+    """Interface for storing serialized tool results."""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Return the stored value of a key, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a value that expires after ``ttl`` seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a stored value."""
+
+
+class InMemoryToolResultCache(ToolResultCacheBackend):
+    """Process-local LRU of tool results.
+
+    Args:
+        max_entries: Results kept, the least recently used are evicted first
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class RedisToolResultCache(ToolResultCacheBackend):
+    """Tool results shared through Redis (or any server speaking its protocol).
+
+    Results are stored under ``{key_prefix}{key}`` with the policy TTL, Redis
+    evicts them according to its ``maxmemory-policy``. Clients created from
+    ``url`` are created per event loop, so sync tools called from worker
+    threads can use the cache as well.
+
+    Args:
+        client: Async Redis client (``redis.asyncio.Redis`` compatible: ``get``,
+            ``set`` with ``px`` and ``delete``)
+        url: Redis URL used to create clients when ``client`` is not given
+        key_prefix: Prefix for result keys
+    """
+
+    def __init__(
+        self,
+        client: Any | None = None,
+        url: str | None = None,
+        key_prefix: str = "langcrew:tool_result:",
+    ):
+        if client is None:
+            if not url:
+                raise ValueError("Either client or url must be provided")
+            try:
+                import redis.asyncio  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "Redis tool result cache requires the redis package: "
+                    "pip install redis"
+                )
+        self.client = client
+        self.url = url
+        self.key_prefix = key_prefix
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_client(self) -> Any:
+        if self.client is not None:
+            return self.client
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            import redis.asyncio as redis
+
+            client = redis.from_url(self.url)
+            self._clients[loop] = client
+        return client
+
+    async def get(self, key: str) -> str | None:
+        value = await self._get_client().get(f"{self.key_prefix}{key}")
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._get_client().set(
+            f"{self.key_prefix}{key}", value, px=max(1, int(ttl * 1000))
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._get_client().delete(f"{self.key_prefix}{key}")
+
+
+class ToolResultCache:
+    """Wrapper caching the results of tools with a cache policy
+
+    Example:
+        cache = ToolResultCache(
+            {"web_search": ToolCachePolicy(ttl=600), "web_fetch": 3600}
+        )
+        agent = Agent(..., tools=[search, fetch, write_file], tool_cache=cache)
+
+    Args:
+        policies: Cache policy (or TTL in seconds) per tool name, tools
+            without a policy are not cached
+        backend: Where results are stored, defaults to an
+            InMemoryToolResultCache
+    """
+
+    def __init__(
+        self,
+        policies: dict[str, ToolCachePolicy | float],
+        backend: ToolResultCacheBackend | None = None,
+    ):
+        self.policies = {
+            name: policy
+            if isinstance(policy, ToolCachePolicy)
+            else ToolCachePolicy(ttl=policy)
+            for name, policy in policies.items()
+        }
+        # Not `backend or ...`: an empty InMemoryToolResultCache is falsy
+        self.backend = backend if backend is not None else InMemoryToolResultCache()
+        # Calls in progress per cache key, shared across threads and event loops
+        self._inflight: dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def wrap_tools(self, tools: list[BaseTool]) -> list[BaseTool]:
+        """Wrap the tools that have a cache policy, others are returned as is"""
+        return [self.wrap_tool(tool) for tool in tools]
+
+    def wrap_tool(self, tool: BaseTool) -> BaseTool:
+        """Copy of a tool whose results are cached, if it has a cache policy"""
+        policy = self.policies.get(tool.name)
+        if policy is None or getattr(tool, "_result_cache", None) is self:
+            return tool
+
+        outer_self = self
+        run_params = inspect.signature(tool._run).parameters
+        if type(tool)._arun is BaseTool._arun:
+            # The default _arun runs _run in an executor with the same arguments
+            arun_params = run_params
+        else:
+            arun_params = inspect.signature(tool._arun).parameters
+        restore_tuple = tool.response_format == "content_and_artifact"
+
+        def injected(params, config, run_manager) -> dict[str, Any]:
+            kwargs = {}
+            if "config" in params:
+                kwargs["config"] = config
+            if run_manager is not None and "run_manager" in params:
+                kwargs["run_manager"] = run_manager
+            return kwargs
+
+        def restore(result: Any) -> Any:
+            if restore_tuple and isinstance(result, list):
+                return tuple(result)
+            return result
+
+        async def cached_arun(
+            *args: Any, config: RunnableConfig = None, run_manager=None, **kwargs
+        ) -> Any:
+            async def call():
+                return await tool._arun(
+                    *args, **kwargs, **injected(arun_params, config, run_manager)
+                )
+
+            return restore(
+                await outer_self._get_or_call(tool.name, policy, args, kwargs, call)
+            )
+
+        def cached_run(
+            *args: Any, config: RunnableConfig = None, run_manager=None, **kwargs
+        ) -> Any:
+            def call_sync():
+                return tool._run(
+                    *args, **kwargs, **injected(run_params, config, run_manager)
+                )
+
+            if get_async_bridge().is_loop_thread():
+                # The cache cannot be awaited from the bridge loop itself
+                return call_sync()
+
+            async def call():
+                # Keep the bridge loop free while the sync tool runs
+                return await asyncio.to_thread(call_sync)
+
+            return restore(
+                run_coroutine(
+                    outer_self._get_or_call(tool.name, policy, args, kwargs, call)
+                )
+            )
+
+        wrapped_tool = tool.model_copy()
+        wrapped_tool._arun = cached_arun
+        wrapped_tool._run = cached_run
+        wrapped_tool._result_cache = self
+        return wrapped_tool
+
+    @staticmethod
+    def cache_key(tool_name: str, args: tuple, kwargs: dict[str, Any]) -> str:
+        """Key of a tool call: tool name and a hash of its normalized arguments
+
+        Keyword arguments are sorted and arguments set to None are dropped, so
+        omitted optional arguments and explicit None values share a key.
+        """
+        normalized_kwargs = {
+            name: value
+            for name, value in kwargs.items()
+            if value is not None and name not in _INJECTED_ARGS
+        }
+        payload = json.dumps(
+            [list(args), normalized_kwargs],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{tool_name}:{digest}"
+
+    async def _get_or_call(
+        self,
+        tool_name: str,
+        policy: ToolCachePolicy,
+        args: tuple,
+        kwargs: dict[str, Any],
+        call,
+    ) -> Any:
+        """Cached result of a tool call, calling the tool on a miss"""
+        key = self.cache_key(tool_name, args, kwargs)
+        while True:
+            cached = await self._lookup(key)
+            if cached is not None:
+                await self._dispatch_hit(tool_name, cached, policy)
+                return cached["result"]
+
+            with self._inflight_lock:
+                inflight = self._inflight.get(key)
+                if inflight is None:
+                    inflight = concurrent.futures.Future()
+                    self._inflight[key] = inflight
+                    leader = True
+                else:
+                    leader = False
+            if leader:
+                break
+            logger.debug(f"Waiting for identical call of tool '{tool_name}'")
+            try:
+                # Shielded: a cancelled waiter must not cancel the shared call
+                return await asyncio.shield(asyncio.wrap_future(inflight))
+            except _CallCancelled:
+                # The first waiter to get here calls the tool again
+                logger.debug(f"Identical call of tool '{tool_name}' was cancelled")
+
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            self._finish_call(key, inflight, error=_CallCancelled())
+            raise
+        except BaseException as e:
+            self._finish_call(key, inflight, error=e)
+            raise
+        try:
+            await self._store(key, tool_name, policy, result)
+        finally:
+            # Also when cancelled while storing, waiters must not hang
+            self._finish_call(key, inflight, result=result)
+        return result
+
+    def _finish_call(
+        self,
+        key: str,
+        inflight: concurrent.futures.Future,
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+        if error is None:
+            inflight.set_result(result)
+        else:
+            inflight.set_exception(error)
+
+    async def _lookup(self, key: str) -> dict[str, Any] | None:
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Tool result cache lookup failed: {e}")
+            return None
+        if value is None:
+            return None
+        try:
+            return json.loads(value)
+        except ValueError:
+            logger.debug(f"Ignoring unreadable cached tool result {key}")
+            return None
+
+    async def _store(
+        self, key: str, tool_name: str, policy: ToolCachePolicy, result: Any
+    ) -> None:
+        try:
+            value = json.dumps(
+                {"result": result, "cached_at": time.time()}, ensure_ascii=False
+            )
+        except (TypeError, ValueError):
+            logger.debug(f"Result of tool '{tool_name}' is not JSON, not cached")
+            return
+        if policy.max_result_size is not None and len(value) > policy.max_result_size:
+            logger.debug(
+                f"Result of tool '{tool_name}' exceeds {policy.max_result_size} "
+                f"characters, not cached"
+            )
+            return
+        try:
+            await self.backend.set(key, value, policy.ttl)
+        except Exception as e:
+            logger.warning(f"Failed to cache result of tool '{tool_name}': {e}")
+
+    async def _dispatch_hit(
+        self,
+        tool_name: str,
+        cached: dict[str, Any],
+        policy: ToolCachePolicy,
+    ) -> None:
+        age = max(0.0, time.time() - cached.get("cached_at", time.time()))
+        logger.debug(f"Tool result cache hit: {tool_name} ({age:.1f}s old)")
+        try:
+            await adispatch_custom_event(
+                CACHE_HIT_EVENT,
+                {"tool_name": tool_name, "age": round(age, 3), "ttl": policy.ttl},
+            )
+        except Exception:
+            pass  # Event sending failure doesn't affect the result
@@ -4,6 +4,7 @@ from .async_utils import (
     run_async_func_wait,
     run_async_no_wait,
     run_async_wait,
+    run_coroutine,
 )
 from .checkpointer_utils import (
     CheckpointerMessageManager,
@@ -21,16 +22,20 @@ from .message_utils import (
     generate_message_id,
 )
 from .runnable_config_utils import RunnableStateManager
+from .tracing import configure_tracing, trace_span
 
 __all__ = [
     "AstreamEventTaskWrapper",
     "CheckpointerMessageManager",
     "CheckpointerSessionStateManager",
     "RunnableStateManager",
+    "configure_tracing",
+    "trace_span",
     "run_async_func_wait",
     "run_async_func_no_wait",
     "run_async_wait",
     "run_async_no_wait",
+    "run_coroutine",
     "is_binary_file",
     "is_text_file",
     "detect_chinese",
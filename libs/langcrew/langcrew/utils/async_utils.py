@@ -1,8 +1,9 @@
 import asyncio
+import concurrent.futures
 import logging
 import threading
 import time
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
 from functools import wraps
 from typing import Any, Final
 
@@ -434,6 +435,48 @@ class AsyncBridge:
             logger.error(f"Failed to execute async task: {e}")
             return None
 
+    def run_coroutine(
+        self, coro: Coroutine[Any, Any, Any], timeout: float | None = None
+    ) -> Any:
+        """
+        Run a coroutine on the bridge loop and wait for its result
+
+        Unlike run_async_wait, exceptions of the coroutine are raised to the
+        caller. The caller's context variables are visible to the coroutine.
+        Objects bound to the loop, such as HTTP connection pools, survive across
+        calls. Must not be called from code running on the bridge loop itself.
+
+        Args:
+            coro: Async coroutine object
+            timeout: Timeout in seconds, the coroutine is cancelled when exceeded
+
+        Returns:
+            Return value of the coroutine
+
+        Raises:
+            TimeoutError: If the coroutine did not finish within timeout
+        """
+        if not self.is_running():
+            logger.warning("Event loop is not running, attempting to restart...")
+            self.restart()
+        if self.is_loop_thread():
+            coro.close()
+            raise RuntimeError(
+                "AsyncBridge.run_coroutine cannot wait for the bridge loop from "
+                "the bridge loop itself"
+            )
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not finish within {timeout}s")
+        except BaseException:
+            # Interrupted while waiting, do not leave the coroutine running
+            future.cancel()
+            raise
+
     def run_async_func_no_wait(
         self, async_func: Callable[..., Awaitable[Any]], *args, **kwargs
     ) -> None:
@@ -523,6 +566,10 @@ class AsyncBridge:
             and self._loop_thread.is_alive()
         )
 
+    def is_loop_thread(self) -> bool:
+        """Check if the caller runs on the bridge loop thread"""
+        return threading.current_thread() is self._loop_thread
+
     def __del__(self):
         """Destructor, cleanup resources"""
         try:
@@ -616,6 +663,30 @@ def run_async_wait(coro: Awaitable[Any], timeout: float = None) -> Any:
     return get_async_bridge().run_async_wait(coro, timeout)
 
 
+def run_coroutine(coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+    """
+    Convenience function: Run a coroutine on the global bridge loop from sync code
+
+    Exceptions of the coroutine are raised, see AsyncBridge.run_coroutine.
+
+    Usage example:
+    ```python
+    class MyTool(BaseTool):
+        def _run(self, query: str) -> str:
+            # The HTTP client pool of _arun is reused by every sync call
+            return run_coroutine(self._arun(query))
+    ```
+
+    Args:
+        coro: Async coroutine object
+        timeout: Timeout in seconds
+
+    Returns:
+        Return value of the coroutine
+    """
+    return get_async_bridge().run_coroutine(coro, timeout)
+
+
 def run_async_func_no_wait(
     async_func: Callable[..., Awaitable[Any]], *args, **kwargs
 ) -> None:
@@ -1,10 +1,40 @@
 import logging
 from typing import Any, ClassVar
 
+from langchain_core.callbacks import BaseCallbackHandler, BaseCallbackManager
 from langchain_core.runnables import RunnableConfig, ensure_config
 
 logger = logging.getLogger(__name__)
 
+# Tag for runnables invoked internally (inside tools, hooks, summarizers).
+# Tags are inherited by child runs, so their whole subtree is excluded from the
+# event stream sent to clients.
+INTERNAL_RUN_TAG = "langcrew:internal"
+
+
+def internal_run_config(config: RunnableConfig | None = None) -> RunnableConfig:
+    """Return a copy of ``config`` tagged with INTERNAL_RUN_TAG."""
+    result = dict(config or {})
+    result["tags"] = [*result.get("tags", []), INTERNAL_RUN_TAG]
+    return result
+
+
+def with_callback_handler(
+    config: RunnableConfig, handler: BaseCallbackHandler
+) -> RunnableConfig:
+    """Return a copy of ``config`` with ``handler`` added to its callbacks."""
+    config = dict(config)
+    callbacks = config.get("callbacks")
+    if callbacks is None:
+        config["callbacks"] = [handler]
+    elif isinstance(callbacks, BaseCallbackManager):
+        callbacks = callbacks.copy()
+        callbacks.add_handler(handler, inherit=True)
+        config["callbacks"] = callbacks
+    else:
+        config["callbacks"] = [*callbacks, handler]
+    return config
+
 
 class RunnableStateManager:
     """Utility class for managing state in RunnableConfig.
@@ -0,0 +1,445 @@
+"""OpenTelemetry spans for crew runs.
+
+When tracing is enabled every crew run produces a span tree::
+
+    langcrew.crew                      root graph run
+    ├── langcrew.checkpoint.load/save  checkpointer I/O
+    └── langcrew.node <node>           agent/task nodes (attributes name them)
+        ├── chat <model>               model calls, with token usage
+        └── execute_tool <tool>        tool calls
+            └── sandbox.* / s3.*       I/O made by langcrew_tools
+
+Runnable spans are opened by TracingCallbackHandler, an inline callback handler
+added to the run config by ``with_tracing``, and parented through LangChain's
+run ids, so no OpenTelemetry context has to be attached across the async tasks
+LangGraph creates. Code running inside a node or tool opens child spans with
+``trace_span``; checkpointer calls are wrapped by ``trace_checkpointer``.
+
+Tracing is off by default. Enable it with ``configure_tracing(enabled=True)``
+or LANGCREW_TRACING=true. LANGCREW_TRACE_SAMPLE_RATIO (or ``sample_ratio``)
+keeps only a fraction of the runs; all spans of a run share its sampling
+decision. Spans go to the globally configured TracerProvider unless one is
+passed to ``configure_tracing``. While disabled, ``with_tracing`` and
+``trace_span`` cost one attribute check.
+"""
+
+import functools
+import logging
+import os
+import random
+from contextlib import contextmanager, nullcontext
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler, BaseCallbackManager
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import var_child_runnable_config
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from opentelemetry import trace
+from opentelemetry.trace import Span, Status, StatusCode
+
+from .runnable_config_utils import INTERNAL_RUN_TAG, with_callback_handler
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "langcrew"
+
+# Checkpointer methods traced per operation
+CHECKPOINT_OPERATIONS = {
+    "get_tuple": "load",
+    "aget_tuple": "load",
+    "put": "save",
+    "aput": "save",
+    "put_writes": "save_writes",
+    "aput_writes": "save_writes",
+}
+
+# Scope of a run that was not sampled
+_UNSAMPLED = object()
+_NOOP_SPAN = nullcontext()
+
+
+class _TracingSettings:
+    def __init__(self):
+        self.enabled = os.getenv("LANGCREW_TRACING", "false").lower() == "true"
+        self.sample_ratio = float(os.getenv("LANGCREW_TRACE_SAMPLE_RATIO", "1.0"))
+        self.tracer_provider = None
+        self.tracer = None
+
+    def get_tracer(self) -> trace.Tracer:
+        if self.tracer is None:
+            self.tracer = trace.get_tracer(
+                TRACER_NAME, tracer_provider=self.tracer_provider
+            )
+        return self.tracer
+
+
+_settings = _TracingSettings()
+
+
+def configure_tracing(
+    enabled: bool = True,
+    sample_ratio: float | None = None,
+    tracer_provider: trace.TracerProvider | None = None,
+) -> None:
+    """Turn crew run tracing on or off.
+
+    Args:
+        enabled: Emit spans for crew runs
+        sample_ratio: Fraction of runs traced, between 0 and 1. Defaults to
+            LANGCREW_TRACE_SAMPLE_RATIO (1.0).
+        tracer_provider: Provider creating the spans. Defaults to the global
+            OpenTelemetry TracerProvider.
+    """
+    if sample_ratio is not None:
+        if not 0 <= sample_ratio <= 1:
+            raise ValueError(
+                f"sample_ratio must be between 0 and 1, got {sample_ratio}"
+            )
+        _settings.sample_ratio = sample_ratio
+    _settings.enabled = enabled
+    _settings.tracer_provider = tracer_provider
+    _settings.tracer = None
+
+
+def tracing_enabled() -> bool:
+    return _settings.enabled
+
+
+def get_tracer() -> trace.Tracer:
+    """Tracer of the configured TracerProvider (the global one by default)."""
+    return _settings.get_tracer()
+
+
+def with_tracing(config: RunnableConfig | None) -> RunnableConfig | None:
+    """Add the tracing callback handler to ``config`` when tracing is enabled.
+
+    Returns ``config`` unchanged when tracing is disabled or the handler is
+    already attached (e.g. a crew running inside a traced crew).
+    """
+    if not _settings.enabled:
+        return config
+    callbacks = (config or {}).get("callbacks")
+    if isinstance(callbacks, BaseCallbackManager):
+        callbacks = callbacks.handlers
+    if callbacks and _handler in callbacks:
+        return config
+    return with_callback_handler(config or {}, _handler)
+
+
+def trace_span(name: str, attributes: dict[str, Any] | None = None):
+    """Context manager opening a span under the current node or tool.
+
+    Yields the span, or None when tracing is disabled or the run was not
+    sampled.
+    """
+    if not _settings.enabled:
+        return _NOOP_SPAN
+    parent = _handler.parent_of_current_run()
+    if parent is _UNSAMPLED:
+        return _NOOP_SPAN
+    return _start_span(name, parent, attributes)
+
+
+def trace_checkpointer(checkpointer: Any) -> Any:
+    """Open a span around the load and save calls of a checkpointer instance.
+
+    Spans are children of the crew run of the checkpoint's thread. Wrapping is
+    idempotent and the wrappers only check a flag while tracing is disabled.
+    """
+    if not isinstance(checkpointer, BaseCheckpointSaver) or getattr(
+        checkpointer, "_langcrew_traced", False
+    ):
+        return checkpointer
+    for method_name, operation in CHECKPOINT_OPERATIONS.items():
+        method = getattr(checkpointer, method_name, None)
+        if method is None:
+            continue
+        if method_name.startswith("a"):
+            wrapper = _traced_async_checkpoint(method, operation)
+        else:
+            wrapper = _traced_checkpoint(method, operation)
+        setattr(checkpointer, method_name, wrapper)
+    checkpointer._langcrew_traced = True
+    return checkpointer
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """Opens spans for crew runs, graph nodes, model calls and tool calls.
+
+    Spans are tracked by LangChain run id, so one handler serves all
+    concurrent runs.
+    """
+
+    run_inline = True
+    ignore_retriever = True
+    ignore_retry = True
+
+    def __init__(self):
+        # Span opened for a run, by run_id
+        self._spans: dict[UUID, Span] = {}
+        # Nearest span of every tracked run (itself or an ancestor), by run_id;
+        # _UNSAMPLED for runs of unsampled crew runs
+        self._scopes: dict[UUID, Any] = {}
+        # Root span of the running crew run of each thread, for checkpoints
+        self._threads: dict[str, Span] = {}
+        # Thread of each running crew run, by run_id
+        self._run_threads: dict[UUID, str] = {}
+        # Model runs that have not streamed a token yet
+        self._awaiting_first_token: set[UUID] = set()
+
+    # ============ PARENT LOOKUP ============
+
+    def parent_of_current_run(self) -> Any:
+        """Span of the runnable executing in the current context, if any."""
+        config = var_child_runnable_config.get()
+        callbacks = config.get("callbacks") if config else None
+        run_id = getattr(callbacks, "parent_run_id", None)
+        if run_id is None:
+            return None
+        return self._scopes.get(run_id)
+
+    def parent_of_checkpoint(self, config: RunnableConfig | None) -> Any:
+        thread_id = ((config or {}).get("configurable") or {}).get("thread_id")
+        return self._threads.get(str(thread_id)) if thread_id is not None else None
+
+    # ============ CHAINS ============
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any],
+        inputs: dict[str, Any],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict[str, Any] | None = None,
+        name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        metadata = metadata or {}
+        if parent_run_id is None or parent_run_id not in self._scopes:
+            self._start_crew_run(run_id, metadata, name)
+            return
+        parent = self._scopes[parent_run_id]
+        node = metadata.get("langgraph_node")
+        if parent is _UNSAMPLED or node is None or node != name:
+            # Runnables inside nodes are folded into the node span
+            self._scopes[run_id] = parent
+            return
+        attributes = {"langcrew.node": node}
+        for key in ("langcrew_agent", "langcrew_task"):
+            if metadata.get(key):
+                attributes[key.replace("_", ".")] = metadata[key]
+        self._open(run_id, f"langcrew.node {node}", parent, attributes)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._close(run_id)
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._close(run_id, error)
+
+    def _start_crew_run(
+        self, run_id: UUID, metadata: dict[str, Any], name: str | None
+    ) -> None:
+        if random.random() >= _settings.sample_ratio:
+            self._scopes[run_id] = _UNSAMPLED
+            return
+        attributes = {"langcrew.graph": name or ""}
+        thread_id = metadata.get("thread_id")
+        if thread_id is not None:
+            attributes["langcrew.thread_id"] = str(thread_id)
+        if metadata.get("user_id"):
+            attributes["langcrew.user_id"] = str(metadata["user_id"])
+        span = self._open(run_id, "langcrew.crew", None, attributes)
+        if thread_id is not None:
+            self._threads[str(thread_id)] = span
+            self._run_threads[run_id] = str(thread_id)
+
+    # ============ MODELS ============
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        parent = self._scopes.get(parent_run_id)
+        if parent is None:
+            return
+        if parent is _UNSAMPLED:
+            self._scopes[run_id] = _UNSAMPLED
+            return
+        metadata = metadata or {}
+        model = metadata.get("ls_model_name") or ""
+        attributes = {
+            "gen_ai.operation.name": "chat",
+            "gen_ai.request.model": model,
+            "gen_ai.system": metadata.get("ls_provider") or "",
+        }
+        if metadata.get("langcrew_agent"):
+            attributes["langcrew.agent"] = metadata["langcrew_agent"]
+        if tags and INTERNAL_RUN_TAG in tags:
+            attributes["langcrew.internal"] = True
+        self._open(run_id, f"chat {model}".rstrip(), parent, attributes)
+        self._awaiting_first_token.add(run_id)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        if run_id in self._awaiting_first_token:
+            self._awaiting_first_token.discard(run_id)
+            self._spans[run_id].add_event("first_token")
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        self._awaiting_first_token.discard(run_id)
+        span = self._spans.get(run_id)
+        if span is not None:
+            span.set_attributes(_usage_attributes(response))
+        self._close(run_id)
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._awaiting_first_token.discard(run_id)
+        self._close(run_id, error)
+
+    # ============ TOOLS ============
+
+    def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict[str, Any] | None = None,
+        name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        parent = self._scopes.get(parent_run_id)
+        if parent is None:
+            return
+        if parent is _UNSAMPLED:
+            self._scopes[run_id] = _UNSAMPLED
+            return
+        tool = name or (serialized or {}).get("name") or ""
+        attributes = {"gen_ai.operation.name": "execute_tool", "gen_ai.tool.name": tool}
+        if kwargs.get("tool_call_id"):
+            attributes["gen_ai.tool.call.id"] = kwargs["tool_call_id"]
+        if metadata and metadata.get("langcrew_agent"):
+            attributes["langcrew.agent"] = metadata["langcrew_agent"]
+        self._open(run_id, f"execute_tool {tool}", parent, attributes)
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._close(run_id)
+
+    def on_tool_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._close(run_id, error)
+
+    # ============ SPANS ============
+
+    def _open(
+        self,
+        run_id: UUID,
+        name: str,
+        parent: Span | None,
+        attributes: dict[str, Any],
+    ) -> Span:
+        context = trace.set_span_in_context(parent) if parent is not None else None
+        span = _settings.get_tracer().start_span(
+            name, context=context, attributes=attributes
+        )
+        self._spans[run_id] = span
+        self._scopes[run_id] = span
+        return span
+
+    def _close(self, run_id: UUID, error: BaseException | None = None) -> None:
+        self._scopes.pop(run_id, None)
+        span = self._spans.pop(run_id, None)
+        if span is None:
+            return
+        if error is not None:
+            if _is_interrupt(error):
+                span.set_attribute("langcrew.interrupted", True)
+            else:
+                span.record_exception(error)
+                span.set_status(Status(StatusCode.ERROR, str(error)))
+        thread_id = self._run_threads.pop(run_id, None)
+        if thread_id is not None and self._threads.get(thread_id) is span:
+            del self._threads[thread_id]
+        span.end()
+
+
+_handler = TracingCallbackHandler()
+
+
+@contextmanager
+def _start_span(name: str, parent: Span | None, attributes: dict[str, Any] | None):
+    context = trace.set_span_in_context(parent) if parent is not None else None
+    with _settings.get_tracer().start_as_current_span(
+        name, context=context, attributes=attributes
+    ) as span:
+        yield span
+
+
+def _checkpoint_span(operation: str, args: tuple, kwargs: dict):
+    if not _settings.enabled:
+        return _NOOP_SPAN
+    config = args[0] if args else kwargs.get("config")
+    parent = _handler.parent_of_checkpoint(config)
+    if parent is None:
+        return _NOOP_SPAN
+    return _start_span(f"langcrew.checkpoint.{operation}", parent, None)
+
+
+def _traced_checkpoint(method, operation: str):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with _checkpoint_span(operation, args, kwargs):
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+def _traced_async_checkpoint(method, operation: str):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        with _checkpoint_span(operation, args, kwargs):
+            return await method(*args, **kwargs)
+
+    return wrapper
+
+
+def _usage_attributes(response: LLMResult) -> dict[str, Any]:
+    """Token usage and prompt cache attributes of a model response."""
+    for generations in response.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            usage = getattr(message, "usage_metadata", None)
+            if not usage:
+                continue
+            cache_read = (usage.get("input_token_details") or {}).get("cache_read") or 0
+            return {
+                "gen_ai.usage.input_tokens": usage.get("input_tokens") or 0,
+                "gen_ai.usage.output_tokens": usage.get("output_tokens") or 0,
+                "gen_ai.usage.cache_read_input_tokens": cache_read,
+                "langcrew.cache_hit": cache_read > 0,
+            }
+    return {}
+
+
+def _is_interrupt(error: BaseException) -> bool:
+    try:
+        from langgraph.errors import GraphBubbleUp
+    except ImportError:  # pragma: no cover - langgraph is a core dependency
+        return False
+    return isinstance(error, GraphBubbleUp)
@@ -7,11 +7,15 @@ configured adapters and handlers.
 
 from ..utils.message_utils import generate_message_id
 from .adapter import LangGraphAdapter
+from .admission import AdmissionController, AdmissionRejected
 from .factory import create_message_generator, create_sse_handler
+from .history import SessionHistory
 from .http_server import AdapterServer, create_langgraph_server, create_server
+from .metrics import RunMetrics
 from .protocol import (
     ChatRequest,
     MessageType,
+    SessionMessagesPage,
     StepStatus,
     StopRequest,
     StreamMessage,
@@ -19,6 +23,11 @@ from .protocol import (
     TaskInput,
     ToolResult,
 )
+from .stop_flags import (
+    InMemoryStopFlagBackend,
+    RedisStopFlagBackend,
+    StopFlagBackend,
+)
 from .tool_display import ToolDisplayManager
 
 __all__ = [
@@ -29,6 +38,10 @@ __all__ = [
     "AdapterServer",
     "create_server",
     "create_langgraph_server",
+    "AdmissionController",
+    "AdmissionRejected",
+    "RunMetrics",
+    "SessionHistory",
     # LangGraph Adapter (for advanced usage)
     "LangGraphAdapter",
     # Protocol types
@@ -36,6 +49,7 @@ __all__ = [
     "StopRequest",
     "TaskInput",
     "StreamMessage",
+    "SessionMessagesPage",
     "MessageType",
     "TaskExecutionStatus",
     "StepStatus",
@@ -43,4 +57,8 @@ __all__ = [
     "generate_message_id",
     # Tool display
     "ToolDisplayManager",
+    # Stop flag backends
+    "StopFlagBackend",
+    "InMemoryStopFlagBackend",
+    "RedisStopFlagBackend",
 ]
@@ -10,6 +10,7 @@ Key Features:
 - Comprehensive event handling with proper cleanup
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -20,13 +21,18 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
 from langchain_core.messages.human import HumanMessage
 from langchain_core.runnables.config import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
-from opentelemetry import trace
 
-from ..crew import Crew
+from ..crew import WARMUP_THREAD_ID, Crew
+from ..tools.astream_tool import unbatch_custom_event
 from ..utils.language import detect_language
 from ..utils.message_utils import generate_message_id
+from ..utils.runnable_config_utils import INTERNAL_RUN_TAG, with_callback_handler
+from ..utils.tracing import get_tracer, trace_checkpointer, with_tracing
+from .coalescer import TextChunkCoalescer
+from .metrics import RunMetrics
 from .protocol import (
     MessageType,
     StepStatus,
@@ -35,6 +41,9 @@ from .protocol import (
     TaskInput,
     ToolResult,
 )
+from .serialization import TaskEnvelope, dumps_stream_message
+from .stop_flags import InMemoryStopFlagBackend, StopFlagBackend
+from .stream_engine import StreamModeEventSource
 from .tool_display import ToolDisplayManager
 
 logger = logging.getLogger(__name__)
@@ -58,24 +67,109 @@ class LangGraphAdapter:
         "on_custom_event",
     }
 
+    # Custom events converted to messages or used to resume streaming
+    CUSTOM_EVENT_NAMES = (
+        "on_langcrew_sandbox_created",
+        "on_langcrew_agentbox_created",
+        "on_langcrew_user_input_required",
+        "on_langcrew_user_input_completed",
+        "on_langcrew_tool_interrupt_before",
+        "on_langcrew_tool_interrupt_after",
+        "on_langcrew_tool_interrupt_before_completed",
+        "on_langcrew_tool_interrupt_after_completed",
+        "on_langcrew_new_message",
+        "on_langcrew_tool_cache_hit",
+        "on_langcrew_stream_event_batch",
+    )
+
+    # Runnable types whose events are converted to messages
+    STREAMED_RUN_TYPES = ("chat_model", "llm", "tool")
+
+    # Event engines: "events" uses astream_events, "stream" uses astream
+    # stream modes (see stream_engine.py)
+    ENGINES = ("events", "stream")
+
+    # Max events buffered between the graph task and the SSE consumer
+    EVENT_QUEUE_SIZE = 256
+
     def __init__(
         self,
         crew: Crew | None = None,
         compiled_graph: Optional["CompiledStateGraph"] = None,
+        stream_coalesce_ms: float | None = None,
+        stream_coalesce_bytes: int | None = None,
+        stop_flag_backend: StopFlagBackend | None = None,
+        filter_events: bool | None = None,
+        engine: str | None = None,
+        metrics: RunMetrics | None = None,
     ):
-        """Initialize the adapter with either a Crew or a compiled LangGraph."""
+        """Initialize the adapter with either a Crew or a compiled LangGraph.
+
+        Args:
+            crew: LangCrew Crew instance
+            compiled_graph: Pre-compiled LangGraph graph
+            stream_coalesce_ms: Time window for merging consecutive text chunks
+                of the same model run into one SSE message. 0 disables
+                coalescing. Defaults to LANGCREW_STREAM_COALESCE_MS (0).
+            stream_coalesce_bytes: Flush a merged text message once it reaches
+                this size. Defaults to LANGCREW_STREAM_COALESCE_BYTES (2048).
+            stop_flag_backend: Where stop requests are stored. Use a shared
+                backend (e.g. RedisStopFlagBackend) when running several
+                workers. Defaults to an in-process backend.
+            filter_events: Let astream_events drop events the adapter never
+                converts (chains, prompts, parsers, internal runs) before they
+                are queued. Defaults to LANGCREW_FILTER_EVENTS (true).
+            engine: "events" runs the executor with astream_events, "stream"
+                with the cheaper astream stream modes. Both produce the same
+                messages. Defaults to LANGCREW_ADAPTER_ENGINE ("events").
+            metrics: Prometheus latency and outcome metrics of the runs. When
+                None, created if LANGCREW_METRICS is true (default false).
+        """
         if crew is None and compiled_graph is None:
             raise ValueError("Either crew or compiled_graph must be provided")
 
         self.crew = crew
         self.compiled_graph = compiled_graph
+        if compiled_graph is not None:
+            trace_checkpointer(getattr(compiled_graph, "checkpointer", None))
+
+        if stream_coalesce_ms is None:
+            stream_coalesce_ms = float(os.getenv("LANGCREW_STREAM_COALESCE_MS", "0"))
+        if stream_coalesce_bytes is None:
+            stream_coalesce_bytes = int(
+                os.getenv("LANGCREW_STREAM_COALESCE_BYTES", "2048")
+            )
+        self.stream_coalesce_ms = stream_coalesce_ms
+        self.stream_coalesce_bytes = stream_coalesce_bytes
+
+        self.stop_flag_backend = stop_flag_backend or InMemoryStopFlagBackend()
+        if filter_events is None:
+            filter_events = (
+                os.getenv("LANGCREW_FILTER_EVENTS", "true").lower() == "true"
+            )
+        self.filter_events = filter_events
 
-        self._session_stop_flags: dict[str, dict[str, Any]] = (
-            {}
-        )  # session_id -> stop_info
-        self._functon_call_stream: bool = os.getenv("LANGCREW_FUNCTION_CALL_STREAM", "false").lower() == "true"
+        engine = engine or os.getenv("LANGCREW_ADAPTER_ENGINE", "events")
+        if engine not in self.ENGINES:
+            raise ValueError(
+                f"Unknown engine {engine!r}, expected one of {self.ENGINES}"
+            )
+        self.engine = engine
+
+        if metrics is None and os.getenv("LANGCREW_METRICS", "false").lower() == "true":
+            metrics = RunMetrics()
+        self.metrics = metrics
+        # Value of the "crew" metrics label
+        self.metrics_label = (
+            getattr(self.executor, "name", None) or type(self.executor).__name__
+        )
+        if metrics is not None:
+            metrics.instrument_executor(self.executor, self.metrics_label)
+
+        self._functon_call_stream: bool = (
+            os.getenv("LANGCREW_FUNCTION_CALL_STREAM", "false").lower() == "true"
+        )
         logger.info(f"LANGCREW_FUNCTION_CALL_STREAM: {self._functon_call_stream}")
-    
 
     # ============ PROPERTIES ============
 
@@ -86,6 +180,40 @@ class LangGraphAdapter:
             return self.crew
         return self.compiled_graph
 
+    # ============ WARM-UP ============
+
+    async def awarmup(self) -> dict[str, float]:
+        """Prepare the executor and stop flag backend before the first run.
+
+        A Crew runs ``Crew.awarmup``; for a compiled graph its checkpointer
+        is read once to open its connections. The stop flag backend is
+        queried at the same time.
+
+        Returns:
+            dict[str, float]: Seconds spent in each warm-up step
+        """
+        timings: dict[str, float] = {}
+
+        async def warm_executor() -> None:
+            if self.crew:
+                timings.update(await self.crew.awarmup())
+                return
+            start = time.perf_counter()
+            checkpointer = getattr(self.compiled_graph, "checkpointer", None)
+            if isinstance(checkpointer, BaseCheckpointSaver):
+                await checkpointer.aget_tuple({
+                    "configurable": {"thread_id": WARMUP_THREAD_ID}
+                })
+            timings["graph"] = time.perf_counter() - start
+
+        async def warm_stop_flags() -> None:
+            start = time.perf_counter()
+            await self.stop_flag_backend.get_flag(WARMUP_THREAD_ID)
+            timings["stop_flags"] = time.perf_counter() - start
+
+        await asyncio.gather(warm_executor(), warm_stop_flags())
+        return timings
+
     # ============ TASK EXECUTION CONTROL ============
 
     def _get_task_id(self, task_input: TaskInput) -> str:
@@ -99,23 +227,143 @@ class LangGraphAdapter:
         self, session_id: str, reason: str = "User stopped"
     ) -> bool:
         """Set stop flag for a specific session."""
-        self._session_stop_flags[session_id] = {
-            "stop_requested": True,
-            "stop_reason": reason,
-            "timestamp": int(time.time() * 1000),
-        }
+        await self.stop_flag_backend.set_flag(
+            session_id,
+            {
+                "stop_requested": True,
+                "stop_reason": reason,
+                "timestamp": int(time.time() * 1000),
+            },
+        )
         logger.info(f"Stop flag set for session {session_id}: {reason}")
         return True
 
-    def _get_stop_flag(self, session_id: str) -> dict[str, Any] | None:
+    async def suspend_run(
+        self, session_id: str, reason: str = "Server shutting down"
+    ) -> bool:
+        """Stop the run of a session so that it can be continued later.
+
+        Works like a stop request, but the run finishes with
+        ``TaskExecutionStatus.SUSPENDED``: its progress stays in the last
+        checkpoint (writes of nodes that completed in the interrupted step
+        are kept as pending writes) and a chat with ``continue_run`` picks it
+        up again, on this or any other worker sharing the checkpointer.
+        """
+        await self.stop_flag_backend.set_flag(
+            session_id,
+            {
+                "stop_requested": True,
+                "stop_reason": reason,
+                "suspend": True,
+                "timestamp": int(time.time() * 1000),
+            },
+        )
+        logger.info(f"Suspend requested for session {session_id}: {reason}")
+        return True
+
+    async def _get_stop_flag(self, session_id: str) -> dict[str, Any] | None:
         """Get stop flag for a specific session."""
-        return self._session_stop_flags.get(session_id)
+        return await self.stop_flag_backend.get_flag(session_id)
 
-    def _clear_stop_flag(self, session_id: str) -> None:
+    async def _clear_stop_flag(self, session_id: str) -> None:
         """Clear stop flag for a specific session."""
-        if session_id in self._session_stop_flags:
-            del self._session_stop_flags[session_id]
-            logger.info(f"Stop flag cleared for session {session_id}")
+        try:
+            await self.stop_flag_backend.clear_flag(session_id)
+        except Exception as e:
+            logger.error(f"Failed to clear stop flag for session {session_id}: {e}")
+
+    def _event_filters(self, config: RunnableConfig) -> dict[str, Any]:
+        """Build astream_events filters for the events execute() consumes.
+
+        Only model and tool events, the custom events listed in
+        CUSTOM_EVENT_NAMES, custom events of the crew's streaming tools (sent
+        under the tool name and converted by the tool's hook) and the root
+        graph's own events (completion, errors and ``__interrupt__`` chunks)
+        are kept. Runs tagged with
+        INTERNAL_RUN_TAG are dropped together with their children. The root
+        run is matched by name, so a run name is set on ``config`` when
+        missing.
+        """
+        if not self.filter_events:
+            return {}
+        root_name = config.get("run_name")
+        if not root_name:
+            root_name = getattr(self.executor, "name", None) or "LangGraph"
+            config["run_name"] = root_name
+        tool_event_names = self.crew.callback_tool_names() if self.crew else []
+        return {
+            "include_names": [root_name, *self.CUSTOM_EVENT_NAMES, *tool_event_names],
+            "include_types": list(self.STREAMED_RUN_TYPES),
+            "exclude_tags": [INTERNAL_RUN_TAG],
+        }
+
+    async def _astream_events_until_stopped(
+        self,
+        session_id: str,
+        input_data: Any,
+        config: RunnableConfig,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream executor events, cancelling the graph as soon as a stop is requested.
+
+        The graph runs in a background task feeding a bounded queue while a
+        watcher waits on the stop flag backend. On stop, the graph task is
+        cancelled right away (instead of at the next event) and a synthetic
+        ``TaskExecutionStatus.CANCELLED`` event carrying the stop info is
+        yielded.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.EVENT_QUEUE_SIZE)
+        stream_end = object()
+        if self.engine == "stream":
+            source = StreamModeEventSource(
+                self.executor, config.get("run_name") or "LangGraph"
+            ).astream_events(input_data, config)
+        else:
+            source = self.executor.astream_events(
+                input=input_data, config=config, **self._event_filters(config)
+            )
+
+        async def produce():
+            try:
+                async for event in source:
+                    await queue.put(event)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(stream_end)
+
+        async def watch_stop_flag():
+            stop_info = await self.stop_flag_backend.wait_for_flag(session_id)
+            producer.cancel()
+            # Events not yet delivered are dropped: the run is being cancelled
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({
+                "event": TaskExecutionStatus.CANCELLED,
+                "data": stop_info,
+            })
+
+        def log_watcher_error(task: asyncio.Task) -> None:
+            # The run goes on, but can no longer be stopped
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(
+                    f"Stop flag watcher for session {session_id} failed: "
+                    f"{task.exception()!r}"
+                )
+
+        producer = asyncio.create_task(produce())
+        watcher = asyncio.create_task(watch_stop_flag())
+        watcher.add_done_callback(log_watcher_error)
+        try:
+            while True:
+                item = await queue.get()
+                if item is stream_end:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+            watcher.cancel()
 
     # ============ LANGUAGE MANAGEMENT ============
 
@@ -182,6 +430,9 @@ class LangGraphAdapter:
 
     def _prepare_input(self, task_input: TaskInput):
         """Prepare input data for execution based on execution mode."""
+        if task_input.continue_run:
+            # Continue a suspended run from its last checkpoint
+            return None
         if task_input.is_resume:
             return Command(resume=task_input.message)
         else:
@@ -192,15 +443,52 @@ class LangGraphAdapter:
 
     def _format_sse_message(self, message: StreamMessage) -> str:
         """Format a message for SSE transmission."""
-        return f"data: {message.model_dump_json()}\n\n"
+        return f"data: {dumps_stream_message(message)}\n\n"
+
+    def _flush_coalesced_text(
+        self, coalescer: TextChunkCoalescer, envelope: TaskEnvelope
+    ) -> str | None:
+        """Format the pending coalesced text, if any, as an SSE message."""
+        batch = coalescer.flush()
+        if batch is None:
+            return None
+        return self._format_text_chunk(
+            batch.event, batch.content, envelope, batch.timestamp
+        )
+
+    def _format_text_chunk(
+        self,
+        event: dict[str, Any],
+        content: str,
+        envelope: TaskEnvelope,
+        timestamp: int | None = None,
+    ) -> str:
+        """Format model output text as an SSE message (token fast path).
+
+        Produces the same payload as ``_handle_model_stream`` followed by
+        ``_format_sse_message`` without building a StreamMessage per token.
+        """
+        detail = self._enhance_detail_with_metadata(
+            event, {"streaming": True, "run_id": event.get("run_id")}
+        )
+        payload = envelope.text_chunk(
+            generate_message_id(),
+            content,
+            detail,
+            timestamp or int(time.time() * 1000),
+        )
+        return f"data: {payload}\n\n"
 
     async def execute(
         self, task_input: TaskInput, config: RunnableConfig | None = None
     ) -> AsyncGenerator[str, None]:
         """Unified execution method for both new conversations and resume scenarios."""
 
+        events = None
+        recorder = None
+        run_status = None
         try:
-            tracer = trace.get_tracer(__name__)
+            tracer = get_tracer()
             with tracer.start_as_current_span("super_agent_start") as span:
                 # ============ 1. INITIALIZATION ============
                 # Local execution state (no instance state)
@@ -208,10 +496,15 @@ class LangGraphAdapter:
                 task_ended = False
                 need_user_input = False
                 should_send_messages = True
+                coalescer = TextChunkCoalescer(
+                    self.stream_coalesce_ms, self.stream_coalesce_bytes
+                )
 
                 # Generate unique task ID for this execution
                 task_id = self._get_task_id(task_input)
                 span.set_attribute("agentops.tags", [task_input.session_id, task_id])
+                trace_id = f"{span.get_span_context().trace_id:x}"
+                envelope = TaskEnvelope(task_input.session_id, task_id, trace_id)
 
                 # Log task start with context
                 logger.info(
@@ -240,27 +533,40 @@ class LangGraphAdapter:
                 config = self._build_config(
                     task_input.session_id, task_input.user_id, config
                 )
+                config = with_tracing(config)
+                if self.metrics is not None:
+                    recorder = self.metrics.recorder(self.metrics_label)
+                    config = with_callback_handler(config, recorder)
 
                 # ============ 2. EVENT PROCESSING LOOP ============
-                async for event in self.executor.astream_events(
-                    input=input_data, config=config
-                ):
+                events = self._astream_events_until_stopped(
+                    task_input.session_id, input_data, config
+                )
+                async for event in events:
                     event_type = event.get("event")
+
+                    # Any event other than a model token releases buffered text
+                    if coalescer.has_pending and event_type != "on_chat_model_stream":
+                        yield self._flush_coalesced_text(coalescer, envelope)
+
                     # -------- 2.1 Stop Flag Check --------
-                    # Check stop signal at the beginning of each event processing
-                    control_data = self._get_stop_flag(task_input.session_id)
-                    if control_data or event_type == TaskExecutionStatus.CANCELLED:
+                    # Stop requests arrive as a synthetic CANCELLED event
+                    if event_type == TaskExecutionStatus.CANCELLED:
                         task_ended = True
-                        stop_reason = (
-                            control_data.get("stop_reason", "User requested")
-                            if control_data
-                            else "User requested"
-                        )
+                        control_data = event.get("data") or {}
+                        stop_reason = control_data.get("stop_reason", "User requested")
+                        if control_data.get("suspend"):
+                            run_status = TaskExecutionStatus.SUSPENDED
+                            extra_detail = {"resumable": True}
+                        else:
+                            run_status = TaskExecutionStatus.CANCELLED
+                            extra_detail = None
                         yield self._handle_finish_signal(
                             task_input.session_id,
                             task_id,
                             stop_reason,
-                            TaskExecutionStatus.CANCELLED,
+                            run_status,
+                            extra_detail,
                         )
                         break
 
@@ -276,6 +582,8 @@ class LangGraphAdapter:
                     ):
                         chunk_data = event_data.get("chunk", {})
                         interrupt_obj = chunk_data.get("__interrupt__")
+                        if recorder is not None:
+                            recorder.interrupted = True
 
                         # Skip tool interrupts and user_input interrupts
                         if interrupt_obj:
@@ -344,12 +652,14 @@ class LangGraphAdapter:
                                 if need_user_input
                                 else "Task completed"
                             )
+                            run_status = status
                             yield self._handle_finish_signal(
                                 task_input.session_id, task_id, reason, status
                             )
                             break
                         elif event_type == "on_chain_error":
                             task_ended = True
+                            run_status = TaskExecutionStatus.FAILED
                             error_msg = event.get("data", {}).get(
                                 "error", "Unknown error"
                             )
@@ -393,10 +703,38 @@ class LangGraphAdapter:
 
                     # Process tracked event types - only send if enabled
                     if event_type in self.TRACKED_EVENTS and should_send_messages:
-                        message = await self._convert_langgraph_event(
+                        if event_type == "on_chat_model_stream":
+                            content = self._extract_content_from_chunk(
+                                event.get("data", {}).get("chunk")
+                            )
+                            if content:
+                                if not coalescer.enabled:
+                                    yield self._format_text_chunk(
+                                        event, content, envelope
+                                    )
+                                    continue
+                                for batch in coalescer.add(event, content):
+                                    yield self._format_text_chunk(
+                                        batch.event,
+                                        batch.content,
+                                        envelope,
+                                        batch.timestamp,
+                                    )
+                                continue
+
+                        pending_text = self._flush_coalesced_text(coalescer, envelope)
+                        if pending_text:
+                            yield pending_text
+
+                        converted = await self._convert_langgraph_event(
                             event, task_input.session_id, display_language, task_id
                         )
-                        if message:
+                        # Batched custom events convert to several messages
+                        for message in (
+                            converted if isinstance(converted, list) else [converted]
+                        ):
+                            if not message:
+                                continue
                             # Update user input requirement flags
                             if message.type == MessageType.USER_INPUT:
                                 need_user_input = True
@@ -413,13 +751,18 @@ class LangGraphAdapter:
                                 and message.detail.get("intent_type") == "asking_user"
                             ):
                                 need_user_input = True
-                            message.trace_id = f"{span.get_span_context().trace_id:x}"
+                            message.trace_id = trace_id
                             yield self._format_sse_message(message)
 
                 # ============ 3. COMPLETION HANDLING ============
 
+                pending_text = self._flush_coalesced_text(coalescer, envelope)
+                if pending_text:
+                    yield pending_text
+
                 # Handle abnormal completion
                 if not task_ended:
+                    run_status = TaskExecutionStatus.FAILED
                     yield self._handle_finish_signal(
                         task_input.session_id,
                         task_id,
@@ -430,13 +773,20 @@ class LangGraphAdapter:
         except Exception as e:
             # ============ 4. ERROR HANDLING ============
             logger.exception(f"Execution failed: {e}")
+            run_status = TaskExecutionStatus.FAILED
             yield self._handle_finish_signal(
                 task_input.session_id, task_id, str(e), TaskExecutionStatus.FAILED
             )
         finally:
             # ============ 5. CLEANUP ============
+            # Cancel the graph task if the stream ended early
+            if events is not None:
+                await events.aclose()
+            if recorder is not None:
+                # A stream closed before its finish signal was abandoned
+                recorder.finish(run_status or TaskExecutionStatus.CANCELLED)
             # Clear session-specific stop flag
-            self._clear_stop_flag(task_input.session_id)
+            await self._clear_stop_flag(task_input.session_id)
             logger.info(
                 f"Task cleanup completed for session {task_input.session_id}, task {task_id}"
             )
@@ -449,7 +799,7 @@ class LangGraphAdapter:
         session_id: str,
         display_language: str,
         task_id: str,
-    ) -> StreamMessage | None:
+    ) -> StreamMessage | list[StreamMessage] | None:
         """Convert LangGraph event to StreamMessage (stateless).
 
         Tool internal event filtering is now handled in the main execute loop.
@@ -489,28 +839,19 @@ class LangGraphAdapter:
 
         content = self._extract_content_from_chunk(chunk)
         if content:
-            detail = {
-                "streaming": True,
-                "run_id": event.get("run_id"),
-            }
-            detail = self._enhance_detail_with_metadata(event, detail)
-            return StreamMessage(
-                id=generate_message_id(),
-                type=MessageType.TEXT,
-                content=content,
-                detail=detail,
-                role="assistant",
-                timestamp=int(time.time() * 1000),
-                session_id=session_id,
-                task_id=task_id,
-                field_name="content",
-            )
-        elif self._functon_call_stream and isinstance(chunk, AIMessageChunk) and hasattr(chunk, "tool_call_chunks"):
+            return self._build_text_stream_message(event, content, session_id, task_id)
+        elif (
+            self._functon_call_stream
+            and isinstance(chunk, AIMessageChunk)
+            and hasattr(chunk, "tool_call_chunks")
+        ):
             for tool_call_chunk in chunk.tool_call_chunks:
                 return StreamMessage(
                     id=generate_message_id(),
                     type=MessageType.TOOL_CALL_CHUNK,
-                    field_name="detail.name" if tool_call_chunk.get("name") else "detail.args",
+                    field_name="detail.name"
+                    if tool_call_chunk.get("name")
+                    else "detail.args",
                     content="",
                     detail={
                         "streaming": True,
@@ -522,11 +863,37 @@ class LangGraphAdapter:
                     },
                     role="assistant",
                     timestamp=int(time.time() * 1000),
-                    session_id=session_id,  
+                    session_id=session_id,
                     task_id=task_id,
                 )
         return None
 
+    def _build_text_stream_message(
+        self,
+        event: dict[str, Any],
+        content: str,
+        session_id: str,
+        task_id: str,
+        timestamp: int | None = None,
+    ) -> StreamMessage:
+        """Build a streaming TEXT message for model output."""
+        detail = {
+            "streaming": True,
+            "run_id": event.get("run_id"),
+        }
+        detail = self._enhance_detail_with_metadata(event, detail)
+        return StreamMessage(
+            id=generate_message_id(),
+            type=MessageType.TEXT,
+            content=content,
+            detail=detail,
+            role="assistant",
+            timestamp=timestamp or int(time.time() * 1000),
+            session_id=session_id,
+            task_id=task_id,
+            field_name="content",
+        )
+
     def _handle_model_end(
         self, event: dict[str, Any], session_id: str, task_id: str
     ) -> StreamMessage | None:
@@ -757,13 +1124,29 @@ class LangGraphAdapter:
         session_id: str,
         task_id: str,
         display_language: str,
-    ) -> StreamMessage | None:
-        """Handle custom events from LangCrew."""
+    ) -> StreamMessage | list[StreamMessage] | None:
+        """Handle custom events from LangCrew.
+
+        A batch of intermediate events of a streaming tool
+        (``on_langcrew_stream_event_batch``) converts to the messages of its
+        events, in order.
+        """
         data = event.get("data", {})
         event_name = event.get("name")
         message_id = generate_message_id()
 
-        if event_name == "on_langcrew_sandbox_created":
+        if event_name == "on_langcrew_stream_event_batch":
+            messages = []
+            for batched_event in unbatch_custom_event(event):
+                converted = self._handle_custom_event(
+                    batched_event, session_id, task_id, display_language
+                )
+                if isinstance(converted, list):
+                    messages.extend(converted)
+                elif converted:
+                    messages.append(converted)
+            return messages or None
+        elif event_name == "on_langcrew_sandbox_created":
             # Sandbox creation event from E2B tools
             sandbox_data = data
             return StreamMessage(
@@ -916,6 +1299,27 @@ class LangGraphAdapter:
         elif event_name == "on_langcrew_tool_interrupt_after_completed":
             logger.info(f"Tool after interrupt completed: {data.get('tool_name')}")
             return None  # Do not send to frontend, just log
+        elif event_name == "on_langcrew_tool_cache_hit":
+            # Tool result reused from ToolResultCache
+            return StreamMessage(
+                id=message_id,
+                type=MessageType.LIVE_STATUS,
+                content="tool_cache_hit",
+                detail=self._enhance_detail_with_metadata(
+                    event,
+                    {
+                        "status": "tool_cache_hit",
+                        "tool": data.get("tool_name"),
+                        "cache_age": data.get("age"),
+                        "cache_ttl": data.get("ttl"),
+                        "run_id": event.get("run_id"),
+                    },
+                ),
+                role="assistant",
+                timestamp=int(time.time() * 1000),
+                session_id=session_id,
+                task_id=task_id,
+            )
         elif event_name == "on_langcrew_new_message":
             new_message = data.get("new_message", "")
 
@@ -942,6 +1346,7 @@ class LangGraphAdapter:
         task_id: str,
         reason: str = "Task completed",
         status: TaskExecutionStatus = TaskExecutionStatus.COMPLETED,
+        extra_detail: dict[str, Any] | None = None,
     ) -> str:
         """Send finish signal."""
         return self._format_sse_message(
@@ -949,7 +1354,7 @@ class LangGraphAdapter:
                 id=generate_message_id(),
                 type=MessageType.FINISH_REASON,
                 content=reason,
-                detail={"reason": reason, "status": status},
+                detail={"reason": reason, "status": status, **(extra_detail or {})},
                 role="assistant",
                 timestamp=int(time.time() * 1000),
                 session_id=session_id,
@@ -1007,17 +1412,21 @@ class LangGraphAdapter:
     def _enhance_detail_with_metadata(
         self, event: dict[str, Any], detail: dict[str, Any]
     ) -> dict[str, Any]:
-        """Enhance detail dictionary with langcrew metadata."""
-        metadata = event.get("metadata", {})
-        langcrew_info = {}
+        """Enhance detail dictionary with langcrew metadata.
+
+        Updates ``detail`` in place; callers always pass a freshly built dict.
+        """
+        metadata = event.get("metadata")
+        if not metadata:
+            return detail
 
         if metadata.get("langcrew_agent"):
-            langcrew_info["langcrew_agent"] = metadata["langcrew_agent"]
+            detail["langcrew_agent"] = metadata["langcrew_agent"]
 
         if metadata.get("langcrew_task"):
-            langcrew_info["langcrew_task"] = metadata["langcrew_task"]
+            detail["langcrew_task"] = metadata["langcrew_task"]
 
-        return {**detail, **langcrew_info}
+        return detail
 
     def _extract_content(self, message: AIMessage) -> str:
         """Extract content from AIMessage - handle different model formats."""
@@ -1125,14 +1534,12 @@ class LangGraphAdapter:
                 status = StepStatus.PENDING
 
             # Create step object for frontend matching the required format
-            steps.append(
-                {
-                    "id": plan_id,
-                    "title": plan_content,
-                    "status": status,
-                    "started_at": timestamp,
-                }
-            )
+            steps.append({
+                "id": plan_id,
+                "title": plan_content,
+                "status": status,
+                "started_at": timestamp,
+            })
 
         return StreamMessage(
             id=generate_message_id(),
@@ -0,0 +1,220 @@
+"""Admission control for chat runs.
+
+Without limits every ``/api/v1/chat`` request starts a crew run immediately.
+Under a traffic spike all sessions then slow down together and LLM rate
+limits trigger retry storms. The AdmissionController caps concurrent runs
+globally and per user, parks the overflow in a bounded FIFO queue and rejects
+requests outright once that queue is full.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter, deque
+from collections.abc import AsyncGenerator
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when the wait queue is full."""
+
+    status_code = 429
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ServerDraining(AdmissionRejected):
+    """Raised for new runs while the server drains before shutting down."""
+
+    status_code = 503
+
+
+class SessionBusy(AdmissionRejected):
+    """Raised for a different request to a session whose run is in progress."""
+
+    status_code = 409
+
+
+class AdmissionTicket:
+    """A run's place in line: queued until admitted, then holding a slot."""
+
+    def __init__(self, controller: "AdmissionController", user_id: str | None):
+        self.controller = controller
+        self.user_id = user_id
+        self.enqueued_at = time.monotonic()
+        self.admitted = False
+        self.released = False
+        self.position = 0  # 1-based position in the wait queue, 0 once admitted
+        self.wait_seconds = 0.0  # Time spent queued, set on admission
+        self._changed = asyncio.Event()
+
+    async def wait(self) -> AsyncGenerator[int, None]:
+        """Yield the queue position each time it changes, until admitted.
+
+        Yields nothing when the run was admitted right away. Closing the
+        generator before admission gives up the place in the queue.
+        """
+        try:
+            while not self.admitted:
+                self._changed.clear()
+                yield self.position
+                if self.admitted:
+                    break
+                await self._changed.wait()
+        finally:
+            if not self.admitted:
+                self.release()
+
+    def release(self) -> None:
+        """Free the slot (or queue place) held by this ticket. Idempotent."""
+        if not self.released:
+            self.released = True
+            self.controller._release(self)
+
+    def _notify(self) -> None:
+        self._changed.set()
+
+
+class AdmissionController:
+    """Concurrency limits with a bounded wait queue.
+
+    Args:
+        max_concurrent_runs: Max runs executing at once (None for unlimited)
+        max_concurrent_runs_per_user: Max runs executing at once for a single
+            user_id (None for unlimited). Requests without user_id are only
+            subject to the global limit.
+        max_queue_size: Max runs waiting for a slot; beyond that requests are
+            rejected
+        retry_after_seconds: Retry-After hint returned with rejections
+    """
+
+    def __init__(
+        self,
+        max_concurrent_runs: int | None = None,
+        max_concurrent_runs_per_user: int | None = None,
+        max_queue_size: int = 100,
+        retry_after_seconds: int = 5,
+    ):
+        self.max_concurrent_runs = max_concurrent_runs
+        self.max_concurrent_runs_per_user = max_concurrent_runs_per_user
+        self.max_queue_size = max_queue_size
+        self.retry_after_seconds = retry_after_seconds
+
+        self._waiters: deque[AdmissionTicket] = deque()
+        self._running = 0
+        self._running_per_user: Counter[str] = Counter()
+
+        # Metrics
+        self.admitted_total = 0
+        self.rejected_total = 0
+        self.queue_wait_seconds_total = 0.0
+        self.queue_wait_seconds_max = 0.0
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def enqueue(self, user_id: str | None = None) -> AdmissionTicket:
+        """Request a slot for a run.
+
+        Returns a ticket that is either admitted already or queued. Raises
+        AdmissionRejected when the run cannot start and the queue is full.
+        """
+        ticket = AdmissionTicket(self, user_id)
+        self._waiters.append(ticket)
+        self._dispatch()
+
+        if not ticket.admitted and len(self._waiters) > self.max_queue_size:
+            self._waiters.remove(ticket)
+            ticket.released = True
+            self.rejected_total += 1
+            raise AdmissionRejected(
+                "Server is busy, please retry later",
+                retry_after=self.retry_after_seconds,
+            )
+        return ticket
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of admission metrics."""
+        waited = self.admitted_total
+        return {
+            "running": self._running,
+            "queue_depth": len(self._waiters),
+            "max_concurrent_runs": self.max_concurrent_runs,
+            "max_concurrent_runs_per_user": self.max_concurrent_runs_per_user,
+            "max_queue_size": self.max_queue_size,
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+            "queue_wait_seconds_avg": (
+                self.queue_wait_seconds_total / waited if waited else 0.0
+            ),
+            "queue_wait_seconds_max": self.queue_wait_seconds_max,
+        }
+
+    def _can_admit(self, ticket: AdmissionTicket) -> bool:
+        if (
+            self.max_concurrent_runs is not None
+            and self._running >= self.max_concurrent_runs
+        ):
+            return False
+        if (
+            self.max_concurrent_runs_per_user is not None
+            and ticket.user_id is not None
+            and self._running_per_user[ticket.user_id]
+            >= self.max_concurrent_runs_per_user
+        ):
+            return False
+        return True
+
+    def _admit(self, ticket: AdmissionTicket) -> None:
+        ticket.admitted = True
+        ticket.position = 0
+        self._running += 1
+        if ticket.user_id is not None:
+            self._running_per_user[ticket.user_id] += 1
+
+        wait = time.monotonic() - ticket.enqueued_at
+        ticket.wait_seconds = wait
+        self.admitted_total += 1
+        self.queue_wait_seconds_total += wait
+        self.queue_wait_seconds_max = max(self.queue_wait_seconds_max, wait)
+        ticket._notify()
+
+    def _release(self, ticket: AdmissionTicket) -> None:
+        if ticket.admitted:
+            self._running -= 1
+            if ticket.user_id is not None:
+                self._running_per_user[ticket.user_id] -= 1
+                if self._running_per_user[ticket.user_id] <= 0:
+                    del self._running_per_user[ticket.user_id]
+        else:
+            try:
+                self._waiters.remove(ticket)
+            except ValueError:
+                pass
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit queued runs in FIFO order, skipping users at their limit."""
+        for ticket in list(self._waiters):
+            if (
+                self.max_concurrent_runs is not None
+                and self._running >= self.max_concurrent_runs
+            ):
+                break
+            if self._can_admit(ticket):
+                self._waiters.remove(ticket)
+                self._admit(ticket)
+
+        for position, ticket in enumerate(self._waiters, start=1):
+            if ticket.position != position:
+                ticket.position = position
+                ticket._notify()
@@ -0,0 +1,161 @@
+"""Resumable SSE streams backed by a per-run event log.
+
+A chat run executes in a background task that appends every SSE chunk to a
+bounded ring buffer. HTTP responses only subscribe to that buffer, so a client
+that loses its connection does not tear down the run: it reconnects with the
+``Last-Event-ID`` of the last chunk it received, gets the missed chunks
+replayed and then follows the live ones.
+
+Event IDs have the form ``{run_id}:{seq}`` so that an ID from a previous run of
+the same session is never mistaken for a position in the current one.
+"""
+
+import asyncio
+import itertools
+import logging
+import uuid
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+
+class RunEventLog:
+    """Bounded, append-only log of the SSE chunks of one run."""
+
+    def __init__(self, max_events: int = 2000):
+        self._events: deque[tuple[int, str]] = deque(maxlen=max_events)
+        self._next_seq = 0
+        self._closed = False
+        self._condition = asyncio.Condition()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the latest chunk, -1 when empty."""
+        return self._next_seq - 1
+
+    async def append(self, chunk: str) -> int:
+        """Append a chunk and wake up subscribers. Returns its sequence number."""
+        async with self._condition:
+            seq = self._next_seq
+            self._events.append((seq, chunk))
+            self._next_seq += 1
+            self._condition.notify_all()
+        return seq
+
+    async def close(self) -> None:
+        """Mark the log complete; subscribers finish after the last chunk."""
+        async with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _events_after(self, seq: int) -> list[tuple[int, str]]:
+        if not self._events:
+            return []
+        first_seq = self._events[0][0]
+        if seq + 1 < first_seq:
+            logger.warning(
+                f"Event log overflow: events {seq + 1}..{first_seq - 1} were dropped"
+            )
+        start = max(seq + 1 - first_seq, 0)
+        return list(itertools.islice(self._events, start, None))
+
+    async def subscribe(
+        self, after_seq: int = -1
+    ) -> AsyncGenerator[tuple[int, str], None]:
+        """Yield ``(seq, chunk)`` after ``after_seq``: replayed first, then live."""
+        seq = after_seq
+        while True:
+            for event_seq, chunk in self._events_after(seq):
+                seq = event_seq
+                yield event_seq, chunk
+
+            async with self._condition:
+                await self._condition.wait_for(
+                    lambda: self.last_seq > seq or self._closed
+                )
+                if self.last_seq <= seq and self._closed:
+                    return
+
+
+class ResumableRun:
+    """A run executing in the background and recording its SSE chunks."""
+
+    def __init__(self, session_id: str, max_events: int = 2000):
+        self.session_id = session_id
+        self.run_id = uuid.uuid4().hex[:12]
+        self.log = RunEventLog(max_events=max_events)
+        self.task: asyncio.Task | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.task is not None and self.task.done()
+
+    def format_event_id(self, seq: int) -> str:
+        return f"{self.run_id}:{seq}"
+
+    def parse_event_id(self, last_event_id: str | None) -> int:
+        """Return the sequence number to resume after, -1 to replay everything."""
+        if not last_event_id:
+            return -1
+        run_id, _, seq = last_event_id.rpartition(":")
+        if run_id != self.run_id or not seq.isdigit():
+            return -1
+        return int(seq)
+
+    async def _record(self, chunks: AsyncIterator[str]) -> None:
+        try:
+            async for chunk in chunks:
+                await self.log.append(chunk)
+        except asyncio.CancelledError:
+            logger.info(f"Run {self.run_id} for session {self.session_id} cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"Run {self.run_id} for session {self.session_id} failed: {e}")
+        finally:
+            await self.log.close()
+
+    async def stream(
+        self, last_event_id: str | None = None
+    ) -> AsyncGenerator[str, None]:
+        """Yield SSE chunks with ``id:`` fields, resuming after ``last_event_id``."""
+        async for seq, chunk in self.log.subscribe(self.parse_event_id(last_event_id)):
+            yield f"id: {self.format_event_id(seq)}\n{chunk}"
+
+
+class RunRegistry:
+    """Tracks the latest resumable run of every session.
+
+    Finished runs stay available for ``retention_seconds`` so that clients
+    whose connection dropped near the end can still fetch the tail.
+    """
+
+    def __init__(self, max_events: int = 2000, retention_seconds: float = 300):
+        self.max_events = max_events
+        self.retention_seconds = retention_seconds
+        self._runs: dict[str, ResumableRun] = {}
+
+    def get(self, session_id: str) -> ResumableRun | None:
+        return self._runs.get(session_id)
+
+    def start(self, session_id: str, chunks: AsyncIterator[str]) -> ResumableRun:
+        """Start recording ``chunks`` in a background task."""
+        run = ResumableRun(session_id, max_events=self.max_events)
+        run.task = asyncio.create_task(run._record(chunks))
+        run.task.add_done_callback(lambda _: self._schedule_expiry(run))
+        self._runs[session_id] = run
+        return run
+
+    def active_runs(self) -> list[ResumableRun]:
+        return [run for run in self._runs.values() if not run.done]
+
+    def _schedule_expiry(self, run: ResumableRun) -> None:
+        def expire():
+            if self._runs.get(run.session_id) is run:
+                del self._runs[run.session_id]
+
+        asyncio.get_running_loop().call_later(self.retention_seconds, expire)
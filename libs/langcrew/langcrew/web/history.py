@@ -0,0 +1,240 @@
+"""Session message history read from the checkpointer.
+
+Reopening a session needs its past messages in the same StreamMessage format
+the chat stream used. ``CheckpointerMessageManager.merge_all_messages`` loads
+every message of every checkpoint namespace of a thread at once; SessionHistory
+reads the latest root checkpoint (which holds the whole conversation for Crew
+and plain LangGraph graphs alike) and converts only the requested page. Pages
+are served newest first so a client can render the end of a long conversation
+right away and scroll back with ``next_cursor``.
+"""
+
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from ..crew import Crew
+from ..utils.checkpointer_utils import CheckpointerMessageManager
+from .protocol import MessageType, SessionMessagesPage, StreamMessage, ToolResult
+from .tool_display import ToolDisplayManager
+
+logger = logging.getLogger(__name__)
+
+# Tools whose calls are not shown as tool messages in the chat stream
+HIDDEN_TOOLS = frozenset({
+    "user_input",
+    "dynamic_form_user_input",
+    "manage_user_memory",
+    "search_user_memory",
+    "manage_app_memory",
+    "search_app_memory",
+})
+
+
+@dataclass
+class SessionSnapshot:
+    """Messages of a session as of one checkpoint."""
+
+    version: str  # ID of the root checkpoint the messages were read from
+    timestamp: int  # Checkpoint time in milliseconds
+    messages: list[BaseMessage]
+
+
+class SessionHistory:
+    """Paginated message history of the sessions of a Crew or compiled graph."""
+
+    def __init__(self, executor: Any):
+        """
+        Args:
+            executor: Crew or compiled LangGraph graph whose checkpointer
+                      stores the sessions
+        """
+        self.executor = executor
+
+    @asynccontextmanager
+    async def _checkpointer(self) -> AsyncIterator[BaseCheckpointSaver | None]:
+        if isinstance(self.executor, Crew):
+            async with self.executor.get_async_checkpointer() as checkpointer:
+                yield checkpointer
+        else:
+            yield getattr(self.executor, "checkpointer", None)
+
+    async def load(self, session_id: str) -> SessionSnapshot | None:
+        """Read the messages of a session, None when it has no checkpoint."""
+        config = {"configurable": {"thread_id": session_id, "checkpoint_ns": ""}}
+        async with self._checkpointer() as checkpointer:
+            if not isinstance(checkpointer, BaseCheckpointSaver):
+                return None
+            checkpoint_tuple = await checkpointer.aget_tuple(config)
+            if not checkpoint_tuple or not checkpoint_tuple.checkpoint:
+                return None
+
+            checkpoint = checkpoint_tuple.checkpoint
+            messages = checkpoint.get("channel_values", {}).get("messages")
+            if not isinstance(messages, list):
+                # Graphs keeping messages only in subgraph state
+                merger = CheckpointerMessageManager(checkpointer)
+                messages = await merger.merge_all_messages(session_id)
+
+        return SessionSnapshot(
+            version=checkpoint["id"],
+            timestamp=int(datetime.fromisoformat(checkpoint["ts"]).timestamp() * 1000),
+            messages=messages,
+        )
+
+    @staticmethod
+    def page_bounds(
+        snapshot: SessionSnapshot, cursor: str | None, limit: int
+    ) -> tuple[int, int]:
+        """Message index range of a page ending before ``cursor``.
+
+        Raises:
+            ValueError: If the cursor is not a position in the history
+        """
+        total = len(snapshot.messages)
+        if cursor is None or cursor == "":
+            end = total
+        else:
+            try:
+                end = int(cursor)
+            except ValueError:
+                raise ValueError(f"Invalid cursor: {cursor}") from None
+            if not 0 <= end <= total:
+                raise ValueError(f"Invalid cursor: {cursor}")
+        return max(0, end - limit), end
+
+    @staticmethod
+    def etag(snapshot: SessionSnapshot, cursor: str | None, limit: int) -> str:
+        """Entity tag of a page, changing whenever the session does."""
+        key = f"{snapshot.version}:{cursor or ''}:{limit}"
+        return f'"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+
+    def page(
+        self,
+        session_id: str,
+        snapshot: SessionSnapshot,
+        cursor: str | None,
+        limit: int,
+        language: str | None = None,
+    ) -> SessionMessagesPage:
+        """Convert one page of the history to StreamMessages.
+
+        Raises:
+            ValueError: If the cursor is not a position in the history
+        """
+        start, end = self.page_bounds(snapshot, cursor, limit)
+        messages = []
+        for message in snapshot.messages[start:end]:
+            messages.extend(
+                to_stream_messages(message, session_id, snapshot.timestamp, language)
+            )
+        return SessionMessagesPage(
+            session_id=session_id,
+            messages=messages,
+            next_cursor=str(start) if start > 0 else None,
+            total=len(snapshot.messages),
+        )
+
+
+def _text(content: str | list) -> str:
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
+
+
+def to_stream_messages(
+    message: BaseMessage,
+    session_id: str,
+    timestamp: int,
+    language: str | None = None,
+) -> list[StreamMessage]:
+    """StreamMessages showing one checkpointed message in the chat history.
+
+    Args:
+        message: Message from the graph state
+        session_id: Session the message belongs to
+        timestamp: Timestamp to report, messages do not carry their own
+        language: Language of the tool display texts
+    """
+    common = {"timestamp": timestamp, "session_id": session_id, "task_id": ""}
+    message_id = message.id or ""
+
+    if isinstance(message, HumanMessage):
+        return [
+            StreamMessage(
+                id=message_id,
+                role="user",
+                type=MessageType.TEXT,
+                content=_text(message.content),
+                **common,
+            )
+        ]
+
+    if isinstance(message, AIMessage):
+        stream_messages = []
+        text = _text(message.content)
+        if text:
+            stream_messages.append(
+                StreamMessage(
+                    id=message_id,
+                    type=MessageType.TEXT,
+                    content=text,
+                    detail={"streaming": False},
+                    **common,
+                )
+            )
+        for tool_call in message.tool_calls:
+            if tool_call["name"] in HIDDEN_TOOLS:
+                continue
+            display = ToolDisplayManager.get_display(
+                tool_call["name"], tool_call["args"], language
+            )
+            stream_messages.append(
+                StreamMessage(
+                    id=f"{message_id}:{tool_call['id']}",
+                    type=MessageType.TOOL_CALL,
+                    content=tool_call["args"].get("brief", ""),
+                    detail={
+                        "tool": tool_call["name"],
+                        "tool_call_id": tool_call["id"],
+                        "status": ToolResult.PENDING,
+                        "param": tool_call["args"],
+                        "action": display["action"],
+                        "action_content": display["action_content"],
+                    },
+                    **common,
+                )
+            )
+        return stream_messages
+
+    if isinstance(message, ToolMessage):
+        if message.name in HIDDEN_TOOLS:
+            return []
+        failed = message.status == "error"
+        return [
+            StreamMessage(
+                id=message_id,
+                type=MessageType.TOOL_RESULT,
+                content="",
+                detail={
+                    "tool": message.name,
+                    "tool_call_id": message.tool_call_id,
+                    "result": _text(message.content),
+                    "status": ToolResult.FAILED if failed else ToolResult.SUCCESS,
+                },
+                **common,
+            )
+        ]
+
+    return []
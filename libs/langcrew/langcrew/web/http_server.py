@@ -3,36 +3,180 @@ LangCrew HTTP Server - Minimal & Focused
 """
 
 import asyncio
+import functools
+import json
 import logging
+import os
 import time
 import uuid
+import weakref
+from collections import Counter
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Query, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from .adapter import LangGraphAdapter
+from .admission import (
+    AdmissionController,
+    AdmissionRejected,
+    AdmissionTicket,
+    ServerDraining,
+    SessionBusy,
+)
+from .event_log import ResumableRun, RunRegistry
+from .history import SessionHistory
 from .protocol import (
     ChatRequest,
     MessageType,
+    SessionMessagesPage,
     StopRequest,
     StreamMessage,
+    TaskExecutionStatus,
     TaskInput,
 )
+from .websocket import WebSocketConnection
+from ..runnable_crew import RunnableCrew
+from ..tools.mcp_sessions import close_mcp_sessions
 from ..utils.message_utils import generate_message_id
 
 logger = logging.getLogger(__name__)
 
+SESSION_CONFLICT_POLICIES = ("reject", "queue")
+
+
+@dataclass
+class SessionChat:
+    """The latest accepted chat of a session, until its stream ends."""
+
+    key: str  # Identifies duplicates of the same request
+    previous: "SessionChat | None" = None  # Chat this one waits for (queue policy)
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class ChatStream:
+    """SSE chunks of an accepted chat, ending the chat exactly once.
+
+    The chat is registered and its run slot taken before the first chunk is
+    read, so ``release`` runs
+    when the chunks end, when the stream is closed and, for a stream dropped
+    without being read (client gone before the response body started), when
+    it is garbage collected.
+    """
+
+    def __init__(self, chunks: AsyncGenerator[str, None], release: Callable[[], None]):
+        self._chunks = chunks
+        # Must not reference the stream, so that it can be collected
+        self._finalizer = weakref.finalize(self, release)
+
+    def __aiter__(self) -> "ChatStream":
+        return self
+
+    async def __anext__(self) -> str:
+        try:
+            return await self._chunks.__anext__()
+        except BaseException:
+            self.release()
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self._chunks.aclose()
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        """End the chat, if not ended yet."""
+        self._finalizer()
+
 
 class AdapterServer:
     """Minimal HTTP server - just protocol conversion"""
 
-    def __init__(self, adapter: LangGraphAdapter):
+    # How long suspended runs get to save their state and finish
+    SUSPEND_GRACE_SECONDS = 10.0
+    # Delay before retrying a failed warm-up, doubled per failure
+    WARMUP_RETRY_BASE = 1.0
+    WARMUP_RETRY_MAX = 60.0
+
+    def __init__(
+        self,
+        adapter: LangGraphAdapter,
+        resumable: bool = True,
+        replay_buffer_size: int = 2000,
+        replay_retention_seconds: float = 300,
+        admission: AdmissionController | None = None,
+        drain_timeout: float | None = None,
+        session_conflict: str | None = None,
+        warmup: bool | None = None,
+    ):
+        """
+        Args:
+            adapter: LangGraphAdapter executing the runs
+            resumable: Run chats in the background and let clients reconnect
+                       with Last-Event-ID. When False, a client disconnect
+                       stops the run.
+            replay_buffer_size: Max SSE events kept per run for replay
+            replay_retention_seconds: How long a finished run can still be
+                                      replayed
+            admission: Concurrency limits and wait queue for chat runs.
+                       None admits every request immediately.
+            drain_timeout: On shutdown, how long in-flight runs may keep
+                           going before they are suspended. Defaults to
+                           LANGCREW_DRAIN_TIMEOUT (30 seconds).
+            session_conflict: What to do with a chat for a session whose run
+                              is still in progress, when it is not a retry of
+                              that run's request: "reject" (409) or "queue"
+                              (start once the running one ends). Defaults to
+                              LANGCREW_SESSION_CONFLICT ("reject").
+            warmup: On startup, prepare the executor (tool discovery, MCP
+                    tools, checkpointer tables) in the background
+                    and report ready on /ready once done. When False, /ready
+                    reports ready as soon as the server starts. Defaults to
+                    LANGCREW_WARMUP (true).
+        """
         if adapter is None:
             raise ValueError("adapter must be provided")
 
         self.adapter = adapter
+        self.runs = (
+            RunRegistry(
+                max_events=replay_buffer_size,
+                retention_seconds=replay_retention_seconds,
+            )
+            if resumable
+            else None
+        )
+        self.admission = admission
+        if drain_timeout is None:
+            drain_timeout = float(os.getenv("LANGCREW_DRAIN_TIMEOUT", "30"))
+        self.drain_timeout = drain_timeout
+        self.draining = False
+        self._inflight: Counter[str] = Counter()  # Executing runs per session
+        self._idle = asyncio.Event()
+        self._idle.set()
+        session_conflict = session_conflict or os.getenv(
+            "LANGCREW_SESSION_CONFLICT", "reject"
+        )
+        if session_conflict not in SESSION_CONFLICT_POLICIES:
+            raise ValueError(
+                f"session_conflict must be one of {SESSION_CONFLICT_POLICIES}, "
+                f"got {session_conflict!r}"
+            )
+        self.session_conflict = session_conflict
+        self._chats: dict[str, SessionChat] = {}
+        if warmup is None:
+            warmup = os.getenv("LANGCREW_WARMUP", "true").lower() == "true"
+        self.warmup_enabled = warmup
+        # starting -> warming_up -> ready | failed
+        self.warmup_status = "starting"
+        self.warmup_timings: dict[str, float] = {}
+        self.warmup_error: str | None = None
+        self.history = SessionHistory(adapter.executor)
         self.app = self._create_app()
 
     def _create_app(self) -> FastAPI:
@@ -42,8 +186,18 @@ class AdapterServer:
         async def lifespan(app: FastAPI):
             """Application lifecycle management"""
             logger.info("🚀 Starting LangCrew HTTP server")
+            warmup_task = None
+            if self.warmup_enabled:
+                # In the background, so that /health answers while warming up
+                warmup_task = asyncio.create_task(self.warmup())
+            else:
+                self.warmup_status = "ready"
             yield
             logger.info("🛑 Shutting down LangCrew HTTP server")
+            if warmup_task is not None and not warmup_task.done():
+                warmup_task.cancel()
+            await self.drain()
+            await close_mcp_sessions()
 
         app = FastAPI(
             title="LangCrew HTTP Server",
@@ -72,6 +226,19 @@ class AdapterServer:
             """Basic health check"""
             return {"status": "ok", "timestamp": int(time.time() * 1000)}
 
+        @app.get("/ready", summary="Readiness check")
+        async def readiness_check():
+            """Ready once warm-up has completed and until draining starts"""
+            status = "draining" if self.draining else self.warmup_status
+            content = {"status": status, "timestamp": int(time.time() * 1000)}
+            if self.warmup_timings:
+                content["warmup"] = self.warmup_timings
+            if self.warmup_error:
+                content["error"] = self.warmup_error
+            return JSONResponse(
+                status_code=200 if status == "ready" else 503, content=content
+            )
+
         @app.post(
             "/api/v1/chat",
             summary="Unified chat interface",
@@ -84,6 +251,20 @@ class AdapterServer:
             - Resume conversation: provide message + interrupt_data
             - Auto-handle new session creation and session continuation
 
+            When admission control is configured, runs beyond the concurrency
+            limits wait in a queue (position updates are sent as live_status
+            events) and requests are rejected with 429 once it is full.
+
+            A retry of a request whose run is still in progress (same
+            session, message and interrupt data) joins that run's stream
+            instead of starting it again. Any other chat for a busy session
+            is rejected with 409 or queued, depending on session_conflict.
+
+            While the server drains before shutdown new runs are rejected
+            with 503, and runs still going at the drain deadline finish with
+            status "suspended"; send the chat again with continue_run to
+            continue them, on any worker sharing the checkpointer.
+
             Session management, rate limiting, etc. should be handled by:
             - Frontend applications
             - API gateways
@@ -91,57 +272,68 @@ class AdapterServer:
             - Custom middleware
             """
 
-            # Session ID handling - unified logic for empty/None session_id
-            is_new_session = not request.session_id or request.session_id.strip() == ""
-            session_id = (
-                uuid.uuid4().hex[:16]  # 16位十六进制，无前缀
-                if is_new_session
-                else request.session_id
-            )
+            session_id, is_new_session = self._resolve_session(request.session_id)
+
+            # Single-flight and admission control - fail fast before streaming
+            try:
+                duplicate = self._find_duplicate(session_id, request)
+                ticket = None if duplicate else self._admit(request.user_id)
+            except AdmissionRejected as e:
+                logger.warning(f"Rejected chat for session {session_id}: {e}")
+                return JSONResponse(
+                    status_code=e.status_code,
+                    content={"detail": str(e), "retry_after": e.retry_after},
+                    headers={"Retry-After": str(e.retry_after)},
+                )
+            # Decouple execution from delivery so the run survives disconnects
+            if duplicate is not None:
+                body = self._subscribe(duplicate)
+            else:
+                chunks = self._chat_stream(request, session_id, is_new_session, ticket)
+                if self.runs is not None:
+                    run = self.runs.start(session_id, chunks)
+                    body = self._subscribe(run)
+                else:
+                    body = chunks
 
-            async def generate():
-                try:
-                    # Send SESSION_INIT message for new sessions
-                    if is_new_session:
-                        init_message = StreamMessage(
-                            id=generate_message_id(),
-                            role="assistant",
-                            type=MessageType.SESSION_INIT,
-                            content=request.message,
-                            detail={
-                                "session_id": session_id,
-                                "title": request.message,
-                            },
-                            timestamp=int(time.time() * 1000),
-                            session_id=session_id,
-                            task_id="",
-                        )
-                        yield self.adapter._format_sse_message(init_message)
-
-                    # Create task input
-                    task_input = TaskInput(
-                        session_id=session_id,
-                        user_id=request.user_id,
-                        message=request.message,
-                        language=request.language,
-                        interrupt_data=request.interrupt_data,
-                    )
-
-                    # Stream execution results
-                    async for chunk in self.adapter.execute(task_input):
-                        yield chunk
+            return StreamingResponse(
+                body,
+                media_type="text/event-stream",
+                headers={
+                    "Cache-Control": "no-cache",
+                    "Connection": "keep-alive",
+                    "X-Session-ID": session_id,
+                },
+            )
 
-                except asyncio.CancelledError:
-                    # Client disconnected - just log and exit gracefully
-                    # Don't re-raise, let the generator end naturally
-                    logger.warning(f"Client disconnected for session: {session_id}")
-                    return
+        @app.get(
+            "/api/v1/chat/{session_id}/stream",
+            summary="Resume chat stream",
+            response_class=StreamingResponse,
+        )
+        async def resume_stream(
+            session_id: str,
+            last_event_id: str | None = Header(default=None),
+            last_event_id_query: str | None = Query(
+                default=None, alias="last_event_id"
+            ),
+        ) -> StreamingResponse:
+            """
+            Reconnect to the latest run of a session
 
-                except Exception as e:
-                    logger.error(f"Execution failed for session {session_id}: {e}")
+            Replays the events after Last-Event-ID (header, or last_event_id
+            query parameter for clients that cannot set headers), then
+            follows the live events until the run finishes. Without an event
+            ID the whole retained run is replayed.
+            """
+            run = self.runs.get(session_id) if self.runs is not None else None
+            if run is None:
+                raise HTTPException(
+                    status_code=404, detail=f"No active run for session {session_id}"
+                )
 
             return StreamingResponse(
-                generate(),
+                self._subscribe(run, last_event_id or last_event_id_query),
                 media_type="text/event-stream",
                 headers={
                     "Cache-Control": "no-cache",
@@ -150,6 +342,81 @@ class AdapterServer:
                 },
             )
 
+        @app.get(
+            "/api/v1/sessions/{session_id}/messages",
+            summary="Session message history",
+            response_model=SessionMessagesPage,
+        )
+        async def session_messages(
+            session_id: str,
+            cursor: str | None = Query(default=None),
+            limit: int = Query(default=50, ge=1, le=500),
+            language: str | None = Query(default=None),
+            if_none_match: str | None = Header(default=None),
+        ):
+            """
+            Page through the message history of a session
+
+            Returns up to ``limit`` messages in StreamMessage format, oldest
+            first, ending with the latest message. Pass the returned
+            next_cursor as ``cursor`` to load the page before it. Responses
+            carry an ETag; with a matching If-None-Match the server answers
+            304 without converting the messages again.
+            """
+            snapshot = await self.history.load(session_id)
+            if snapshot is None:
+                raise HTTPException(
+                    status_code=404, detail=f"No history for session {session_id}"
+                )
+
+            etag = self.history.etag(snapshot, cursor, limit)
+            headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+            if if_none_match and (
+                if_none_match.strip() == "*"
+                or etag in {tag.strip() for tag in if_none_match.split(",")}
+            ):
+                return Response(status_code=304, headers=headers)
+
+            try:
+                page = self.history.page(session_id, snapshot, cursor, limit, language)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from None
+            return JSONResponse(page.model_dump(mode="json"), headers=headers)
+
+        if self.admission is not None:
+
+            @app.get("/api/v1/admission/stats", summary="Admission control metrics")
+            async def admission_stats():
+                """Running runs, queue depth and queue wait times"""
+                return self.admission.stats()
+
+        if self.adapter.metrics is not None:
+
+            @app.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+            async def metrics():
+                """Run latency histograms and outcome counters"""
+                return Response(
+                    self.adapter.metrics.render(),
+                    media_type=self.adapter.metrics.content_type,
+                )
+
+        @app.websocket("/api/v1/ws")
+        async def websocket_endpoint(websocket: WebSocket, encoding: str = "json"):
+            """
+            Multiplexed chat over one WebSocket
+
+            Carries chat, interrupt-resume, stop and new_message operations
+            for any number of sessions. Use ?encoding=msgpack for binary
+            msgpack frames. See langcrew.web.websocket for the frame format.
+            """
+            try:
+                connection = WebSocketConnection(self, websocket, encoding)
+            except ValueError as e:
+                await websocket.close(code=1008, reason=str(e))
+                return
+            await websocket.accept()
+            await connection.serve()
+
         @app.post("/api/v1/chat/stop", summary="Stop chat execution")
         async def stop_chat(request: StopRequest):
             """
@@ -176,6 +443,302 @@ class AdapterServer:
                 else "Session not found or stop failed",
             }
 
+    async def send_new_message(self, session_id: str, message: str) -> bool:
+        """Send a new message to the running task of a session.
+
+        Only supported when the adapter executes a RunnableCrew bound to
+        that session.
+        """
+        executor = self.adapter.executor
+        if not isinstance(executor, RunnableCrew) or executor.session_id != session_id:
+            logger.warning(f"New messages are not supported for session {session_id}")
+            return False
+        return await executor.send_new_message(message)
+
+    def _resolve_session(self, session_id: str | None) -> tuple[str, bool]:
+        """Return the session ID to use and whether it is a new session."""
+        # Session ID handling - unified logic for empty/None session_id
+        is_new_session = not session_id or session_id.strip() == ""
+        if is_new_session:
+            session_id = uuid.uuid4().hex[:16]  # 16位十六进制，无前缀
+        return session_id, is_new_session
+
+    def _admit(self, user_id: str | None) -> AdmissionTicket | None:
+        """Request a run slot.
+
+        Raises AdmissionRejected when the queue is full, ServerDraining when
+        the server is shutting down.
+        """
+        if self.draining:
+            raise ServerDraining("Server is shutting down", retry_after=1)
+        if self.admission is None:
+            return None
+        return self.admission.enqueue(user_id)
+
+    @staticmethod
+    def _chat_key(request: ChatRequest) -> str:
+        return json.dumps(
+            [
+                request.user_id,
+                request.message,
+                request.interrupt_data,
+                request.continue_run,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    def _find_duplicate(
+        self, session_id: str, request: ChatRequest
+    ) -> ResumableRun | None:
+        """Return the in-progress run a retried request should join.
+
+        Returns None when the session is idle, or busy and the conflict
+        policy queues the request. Raises SessionBusy for a request that
+        cannot run now.
+        """
+        chat = self._chats.get(session_id)
+        if chat is None:
+            return None
+        if chat.key == self._chat_key(request):
+            run = self.runs.get(session_id) if self.runs is not None else None
+            if run is not None and not run.done:
+                logger.info(
+                    f"Duplicate chat for session {session_id} joins run {run.run_id}"
+                )
+                return run
+            # Without a shared event log a retry cannot join, never run it twice
+            raise SessionBusy(
+                f"Session {session_id} is already running this request",
+                retry_after=1,
+            )
+        if self.session_conflict == "reject":
+            raise SessionBusy(
+                f"Session {session_id} already has a run in progress",
+                retry_after=1,
+            )
+        return None
+
+    def _chat_stream(
+        self,
+        request: ChatRequest,
+        session_id: str,
+        is_new_session: bool,
+        ticket: AdmissionTicket | None,
+    ) -> ChatStream:
+        """Register the chat as the session's latest and return its SSE chunks."""
+        chat = SessionChat(self._chat_key(request), self._chats.get(session_id))
+        self._chats[session_id] = chat
+        return ChatStream(
+            self._chat_chunks(request, session_id, is_new_session, ticket, chat),
+            functools.partial(self._end_chat, session_id, chat, ticket),
+        )
+
+    def _end_chat(
+        self, session_id: str, chat: SessionChat, ticket: AdmissionTicket | None
+    ) -> None:
+        """Free the run slot and unregister a chat, letting queued chats start."""
+        if ticket is not None:
+            ticket.release()
+        chat.done.set()
+        if self._chats.get(session_id) is chat:
+            del self._chats[session_id]
+
+    async def _chat_chunks(
+        self,
+        request: ChatRequest,
+        session_id: str,
+        is_new_session: bool,
+        ticket: AdmissionTicket | None,
+        chat: SessionChat,
+    ) -> AsyncGenerator[str, None]:
+        """SSE chunks of one chat run: session init, queue position, results."""
+        try:
+            # Send SESSION_INIT message for new sessions
+            if is_new_session:
+                init_message = StreamMessage(
+                    id=generate_message_id(),
+                    role="assistant",
+                    type=MessageType.SESSION_INIT,
+                    content=request.message,
+                    detail={
+                        "session_id": session_id,
+                        "title": request.message,
+                    },
+                    timestamp=int(time.time() * 1000),
+                    session_id=session_id,
+                    task_id="",
+                )
+                yield self.adapter._format_sse_message(init_message)
+
+            # Queued behind the session's previous run
+            if chat.previous is not None:
+                await chat.previous.done.wait()
+                chat.previous = None
+
+            # Wait for a run slot, reporting the queue position
+            if ticket is not None:
+                async for position in ticket.wait():
+                    yield self.adapter._format_sse_message(
+                        self._queue_status_message(session_id, position)
+                    )
+                if self.adapter.metrics is not None:
+                    self.adapter.metrics.observe_queue_wait(
+                        self.adapter.metrics_label, ticket.wait_seconds
+                    )
+
+            # The drain started while this run was queued
+            if self.draining:
+                yield self.adapter._handle_finish_signal(
+                    session_id,
+                    "",
+                    "Server shutting down before the run started",
+                    TaskExecutionStatus.SUSPENDED,
+                    {"resumable": False},
+                )
+                return
+
+            # Create task input
+            task_input = TaskInput(
+                session_id=session_id,
+                user_id=request.user_id,
+                message=request.message,
+                language=request.language,
+                interrupt_data=request.interrupt_data,
+                continue_run=request.continue_run,
+            )
+
+            # Stream execution results
+            self._run_started(session_id)
+            try:
+                async for chunk in self.adapter.execute(task_input):
+                    yield chunk
+            finally:
+                self._run_finished(session_id)
+
+        except asyncio.CancelledError:
+            # Client disconnected - just log and exit gracefully
+            # Don't re-raise, let the generator end naturally
+            logger.warning(f"Client disconnected for session: {session_id}")
+            return
+
+        except Exception as e:
+            logger.error(f"Execution failed for session {session_id}: {e}")
+
+        finally:
+            self._end_chat(session_id, chat, ticket)
+
+    async def warmup(self) -> None:
+        """Warm up the adapter and mark the server ready.
+
+        Runs ``LangGraphAdapter.awarmup`` (``Crew.awarmup`` for a Crew) so the
+        first chat does not pay for tool discovery, MCP tool loading or
+        creating checkpointer tables. Started by the application lifespan;
+        chats are served meanwhile. A failure is retried with exponential
+        backoff until warm-up succeeds; /ready stays at 503 meanwhile and
+        reports the last error.
+        """
+        self.warmup_status = "warming_up"
+        start = time.perf_counter()
+        failures = 0
+        while True:
+            try:
+                self.warmup_timings = await self.adapter.awarmup()
+                break
+            except Exception as e:
+                failures += 1
+                delay = min(
+                    self.WARMUP_RETRY_MAX,
+                    self.WARMUP_RETRY_BASE * 2 ** (failures - 1),
+                )
+                logger.error(f"Warm-up failed (retry in {delay:.1f}s): {e}")
+                self.warmup_error = str(e)
+                self.warmup_status = "failed"
+            await asyncio.sleep(delay)
+        self.warmup_error = None
+        self.warmup_status = "ready"
+        logger.info(f"Warm-up completed in {time.perf_counter() - start:.3f}s")
+
+    def _run_started(self, session_id: str) -> None:
+        self._inflight[session_id] += 1
+        self._idle.clear()
+
+    def _run_finished(self, session_id: str) -> None:
+        self._inflight[session_id] -= 1
+        if self._inflight[session_id] <= 0:
+            del self._inflight[session_id]
+        if not self._inflight:
+            self._idle.set()
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Stop admitting runs and wind down the in-flight ones.
+
+        New chats are rejected with 503 right away. In-flight runs may finish
+        until ``timeout`` (default ``drain_timeout``) expires; the rest are
+        suspended at their last checkpoint and end with a resumable
+        ``suspended`` finish signal, so a client can continue them on another
+        worker. Called on application shutdown, and by ``run()`` before
+        uvicorn starts closing connections. Idempotent.
+
+        Args:
+            timeout: Seconds to wait for in-flight runs before suspending them
+        """
+        self.draining = True
+        if not self._inflight:
+            return
+        timeout = self.drain_timeout if timeout is None else timeout
+        logger.info(
+            f"Draining {sum(self._inflight.values())} in-flight runs "
+            f"(timeout {timeout}s)"
+        )
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return
+        except asyncio.TimeoutError:
+            pass
+
+        sessions = list(self._inflight)
+        logger.warning(f"Drain timeout reached, suspending runs of {sessions}")
+        for session_id in sessions:
+            try:
+                await self.adapter.suspend_run(session_id)
+            except Exception as e:
+                logger.error(f"Failed to suspend session {session_id}: {e}")
+        try:
+            await asyncio.wait_for(self._idle.wait(), self.SUSPEND_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            logger.error(f"Runs of {list(self._inflight)} did not stop in time")
+
+    def _queue_status_message(self, session_id: str, position: int) -> StreamMessage:
+        """Build a live_status message reporting the wait queue position."""
+        return StreamMessage(
+            id=generate_message_id(),
+            role="assistant",
+            type=MessageType.LIVE_STATUS,
+            content="queued",
+            detail={
+                "status": "queued",
+                "queue_position": position,
+                "queue_depth": self.admission.queue_depth,
+            },
+            timestamp=int(time.time() * 1000),
+            session_id=session_id,
+            task_id="",
+        )
+
+    async def _subscribe(self, run: ResumableRun, last_event_id: str | None = None):
+        """Deliver the events of a background run to one client."""
+        try:
+            async for chunk in run.stream(last_event_id):
+                yield chunk
+        except asyncio.CancelledError:
+            # Client disconnected - the run keeps going and can be resumed
+            logger.warning(
+                f"Client disconnected for session: {run.session_id}, "
+                f"run {run.run_id} continues in background"
+            )
+            return
+
     def run(self, host: str = "0.0.0.0", port: int = 8000, **kwargs):
         """
         Start server - follows uvicorn.run() signature
@@ -189,15 +752,30 @@ class AdapterServer:
 
         logger.info(f"Starting server on {host}:{port}")
 
-        uvicorn.run(self.app, host=host, port=port, **kwargs)
+        adapter_server = self
+
+        class DrainingServer(uvicorn.Server):
+            async def shutdown(self, sockets=None):
+                # Drain before uvicorn waits on the open (streaming) connections
+                await adapter_server.drain()
+                await super().shutdown(sockets=sockets)
 
+        config = uvicorn.Config(self.app, host=host, port=port, **kwargs)
+        DrainingServer(config).run()
 
-def create_server(crew) -> AdapterServer:
+
+def create_server(
+    crew, server_options: dict[str, Any] | None = None, **adapter_options
+) -> AdapterServer:
     """
     Create minimal HTTP server for LangCrew
 
     Args:
         crew: LangCrew Crew instance
+        server_options: Additional AdapterServer options
+                        (resumable, admission, ...)
+        **adapter_options: Additional LangGraphAdapter options
+                          (stream_coalesce_ms, stop_flag_backend, ...)
 
     Returns:
         AdapterServer with .app attribute for adding custom routes
@@ -223,15 +801,44 @@ def create_server(crew) -> AdapterServer:
             return {"message": "Custom endpoint"}
 
         server.run()
+
+        # Cheaper stream-mode engine instead of astream_events
+        server = create_server(crew, engine="stream")
+
+        # Prometheus metrics at /metrics (pip install "langcrew[metrics]")
+        from langcrew.web import RunMetrics
+
+        server = create_server(crew, metrics=RunMetrics())
+
+        # Share stop requests between workers
+        from langcrew.web import RedisStopFlagBackend
+
+        server = create_server(
+            crew, stop_flag_backend=RedisStopFlagBackend(url="redis://localhost:6379")
+        )
+
+        # Limit concurrent runs and queue the overflow
+        from langcrew.web import AdmissionController
+
+        server = create_server(
+            crew,
+            server_options={
+                "admission": AdmissionController(
+                    max_concurrent_runs=20, max_concurrent_runs_per_user=2
+                )
+            },
+        )
     """
     if crew is None:
         raise ValueError("Crew instance must be provided")
 
-    adapter = LangGraphAdapter(crew)
-    return AdapterServer(adapter=adapter)
+    adapter = LangGraphAdapter(crew, **adapter_options)
+    return AdapterServer(adapter=adapter, **(server_options or {}))
 
 
-def create_langgraph_server(compiled_graph) -> AdapterServer:
+def create_langgraph_server(
+    compiled_graph, server_options: dict[str, Any] | None = None, **adapter_options
+) -> AdapterServer:
     """
     Create minimal HTTP server for pure LangGraph usage
 
@@ -243,6 +850,10 @@ def create_langgraph_server(compiled_graph) -> AdapterServer:
                        - AsyncSqliteSaver instead of SqliteSaver
                        - AsyncPostgresSaver instead of PostgresSaver
                        - InMemorySaver works for both sync/async
+        server_options: Additional AdapterServer options
+                        (resumable, admission, ...)
+        **adapter_options: Additional LangGraphAdapter options
+                          (stream_coalesce_ms, stop_flag_backend, ...)
 
     Returns:
         AdapterServer with .app attribute for adding custom routes
@@ -300,8 +911,8 @@ def create_langgraph_server(compiled_graph) -> AdapterServer:
     _log_performance_hint(compiled_graph)
 
     # Use graph directly without any LangCrew logic
-    adapter = LangGraphAdapter(compiled_graph=compiled_graph)
-    return AdapterServer(adapter=adapter)
+    adapter = LangGraphAdapter(compiled_graph=compiled_graph, **adapter_options)
+    return AdapterServer(adapter=adapter, **(server_options or {}))
 
 
 def _log_performance_hint(compiled_graph) -> None:
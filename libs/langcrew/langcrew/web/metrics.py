@@ -0,0 +1,475 @@
+"""Prometheus metrics for crew runs.
+
+RunMetrics breaks the latency of every run down into the parts an operator
+tunes separately: queue wait, graph compile, checkpoint load/save, graph
+nodes, model calls (time to first token, tokens per second) and tools. It
+also counts interrupted, cancelled, failed and suspended runs, and reports
+the circuit breakers of tools wrapped by a ToolPolicyWrapper.
+
+Timings are taken by RunRecorder, a synchronous callback handler that runs
+inline with each callback and only does a dict lookup and a timestamp per
+event, and by wrapping the checkpointer and graph compile methods. All series
+live in RunMetrics' own CollectorRegistry, served by AdapterServer at
+``/metrics``.
+
+Requires the optional ``prometheus-client`` dependency::
+
+    pip install "langcrew[metrics]"
+"""
+
+import functools
+import logging
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from ..tools.policies import CircuitState, tool_states
+from ..utils.runnable_config_utils import INTERNAL_RUN_TAG
+from .protocol import TaskExecutionStatus
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        CollectorRegistry,
+        Counter,
+        Histogram,
+        generate_latest,
+    )
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+except ImportError:
+    CollectorRegistry = None
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets, in seconds unless noted
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60, 120)
+FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+TOKENS_PER_SECOND_BUCKETS = (1, 5, 10, 20, 40, 60, 80, 120, 200, 400)
+
+# Checkpointer methods timed per operation label
+CHECKPOINT_METHODS = {
+    "get_tuple": "load",
+    "aget_tuple": "load",
+    "put": "save",
+    "aput": "save",
+    "put_writes": "save_writes",
+    "aput_writes": "save_writes",
+}
+
+# Order of breaker states when merging tools wrapped by several wrappers
+CIRCUIT_SEVERITY = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class RunMetrics:
+    """Latency histograms and outcome counters for crew runs.
+
+    Args:
+        registry: Registry the metrics are registered in. Defaults to a new
+            registry owned by this instance, so several servers in one process
+            do not clash. Pass ``prometheus_client.REGISTRY`` to expose them
+            through an existing exporter instead.
+        namespace: Prefix of every metric name
+    """
+
+    def __init__(
+        self, registry: "CollectorRegistry | None" = None, namespace: str = "langcrew"
+    ):
+        if CollectorRegistry is None:
+            raise ImportError(
+                "RunMetrics requires prometheus-client. "
+                "Install it with: pip install 'langcrew[metrics]'"
+            )
+        self.registry = registry if registry is not None else CollectorRegistry()
+
+        def histogram(name, documentation, labels, buckets):
+            return Histogram(
+                name,
+                documentation,
+                labels,
+                namespace=namespace,
+                buckets=buckets,
+                registry=self.registry,
+            )
+
+        def counter(name, documentation):
+            return Counter(
+                name,
+                documentation,
+                ["crew"],
+                namespace=namespace,
+                registry=self.registry,
+            )
+
+        self.time_to_first_token = histogram(
+            "time_to_first_token_seconds",
+            "Time from run start to the first model token",
+            ["crew", "agent"],
+            LATENCY_BUCKETS,
+        )
+        self.tokens_per_second = histogram(
+            "model_tokens_per_second",
+            "Output tokens per second of a model call after its first token",
+            ["crew", "agent"],
+            TOKENS_PER_SECOND_BUCKETS,
+        )
+        self.node_duration = histogram(
+            "node_duration_seconds",
+            "Duration of graph node executions",
+            ["crew", "node"],
+            LATENCY_BUCKETS,
+        )
+        self.tool_duration = histogram(
+            "tool_duration_seconds",
+            "Duration of tool calls",
+            ["crew", "agent", "tool"],
+            LATENCY_BUCKETS,
+        )
+        self.checkpoint_duration = histogram(
+            "checkpoint_duration_seconds",
+            "Duration of checkpointer loads and saves",
+            ["crew", "operation"],
+            FAST_BUCKETS,
+        )
+        self.graph_compile = histogram(
+            "graph_compile_seconds",
+            "Duration of graph compiles",
+            ["crew"],
+            FAST_BUCKETS,
+        )
+        self.queue_wait = histogram(
+            "queue_wait_seconds",
+            "Time runs waited for an admission slot",
+            ["crew"],
+            LATENCY_BUCKETS,
+        )
+        self.interrupts = counter(
+            "interrupts_total", "Runs that stopped waiting for user input"
+        )
+        self.cancellations = counter("cancellations_total", "Runs that were cancelled")
+        self.failures = counter("failures_total", "Runs that failed")
+        self.suspensions = counter(
+            "suspensions_total", "Runs suspended by a server drain"
+        )
+        self.registry.register(ToolPolicyCollector(namespace))
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPE_LATEST
+
+    def render(self) -> bytes:
+        """Metrics in the Prometheus text exposition format."""
+        return generate_latest(self.registry)
+
+    def recorder(self, crew: str) -> "RunRecorder":
+        """Callback handler timing the nodes, models and tools of one run."""
+        return RunRecorder(self, crew)
+
+    def observe_queue_wait(self, crew: str, seconds: float) -> None:
+        self.queue_wait.labels(crew).observe(seconds)
+
+    def record_finish(self, crew: str, status: TaskExecutionStatus) -> None:
+        """Count a run outcome."""
+        if status == TaskExecutionStatus.USER_INPUT:
+            self.interrupts.labels(crew).inc()
+        elif status == TaskExecutionStatus.CANCELLED:
+            self.cancellations.labels(crew).inc()
+        elif status == TaskExecutionStatus.FAILED:
+            self.failures.labels(crew).inc()
+        elif status == TaskExecutionStatus.SUSPENDED:
+            self.suspensions.labels(crew).inc()
+
+    # ============ INSTRUMENTATION ============
+
+    def instrument_executor(self, executor: Any, crew: str) -> None:
+        """Time graph compiles and checkpointer calls of a Crew or compiled graph.
+
+        A Crew compiles its graph (with a possibly new checkpointer) on every
+        run, so its compile method is wrapped; a compiled graph only has its
+        checkpointer instrumented.
+        """
+        compile_graph = getattr(executor, "_compile_graph", None)
+        if compile_graph is not None:
+            if getattr(compile_graph, "_langcrew_timed", False):
+                return
+
+            @functools.wraps(compile_graph)
+            def timed_compile(builder, checkpointer=None, store=None):
+                if checkpointer is not None:
+                    self.instrument_checkpointer(checkpointer, crew)
+                start = time.perf_counter()
+                try:
+                    return compile_graph(builder, checkpointer, store)
+                finally:
+                    self.graph_compile.labels(crew).observe(time.perf_counter() - start)
+
+            timed_compile._langcrew_timed = True
+            executor._compile_graph = timed_compile
+        elif getattr(executor, "checkpointer", None) not in (None, True, False):
+            self.instrument_checkpointer(executor.checkpointer, crew)
+
+    def instrument_checkpointer(self, checkpointer: Any, crew: str) -> None:
+        """Time the load and save methods of a checkpointer instance.
+
+        Idempotent: a checkpointer shared between runs is wrapped once.
+        """
+        if getattr(checkpointer, "_langcrew_timed", False):
+            return
+        for method_name, operation in CHECKPOINT_METHODS.items():
+            method = getattr(checkpointer, method_name, None)
+            if method is None:
+                continue
+            histogram = self.checkpoint_duration.labels(crew, operation)
+            if method_name.startswith("a"):
+                wrapper = _timed_async(method, histogram)
+            else:
+                wrapper = _timed(method, histogram)
+            setattr(checkpointer, method_name, wrapper)
+        checkpointer._langcrew_timed = True
+
+
+class RunRecorder(BaseCallbackHandler):
+    """Times the graph nodes, model calls and tool calls of one run.
+
+    Args:
+        metrics: RunMetrics receiving the observations
+        crew: Value of the ``crew`` label
+    """
+
+    run_inline = True
+    ignore_retriever = True
+    ignore_retry = True
+
+    def __init__(self, metrics: RunMetrics, crew: str):
+        self.metrics = metrics
+        self.crew = crew
+        self.started = time.perf_counter()
+        self.first_token_at: float | None = None
+        # Set when the run paused on an interrupt
+        self.interrupted = False
+        # Node name and start time of running nodes, by run_id
+        self._nodes: dict[UUID, tuple[str, float]] = {}
+        # [agent, start time, first token time, token count] of running models
+        self._models: dict[UUID, list] = {}
+        # Agent, tool name and start time of running tools, by run_id
+        self._tools: dict[UUID, tuple[str, str, float]] = {}
+
+    def finish(self, status: TaskExecutionStatus) -> None:
+        if self.interrupted and status == TaskExecutionStatus.COMPLETED:
+            status = TaskExecutionStatus.USER_INPUT
+        self.metrics.record_finish(self.crew, status)
+
+    # ============ NODES ============
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any],
+        inputs: dict[str, Any],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        # Node runs are named after the node; runnables inside inherit the
+        # langgraph_node metadata but have their own names
+        node = metadata.get("langgraph_node") if metadata else None
+        if node is not None and node == name:
+            self._nodes[run_id] = (node, time.perf_counter())
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_node(run_id)
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._end_node(run_id)
+
+    def _end_node(self, run_id: UUID) -> None:
+        node = self._nodes.pop(run_id, None)
+        if node is not None:
+            self.metrics.node_duration.labels(self.crew, node[0]).observe(
+                time.perf_counter() - node[1]
+            )
+
+    # ============ MODELS ============
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if tags and INTERNAL_RUN_TAG in tags:
+            return
+        agent = (metadata or {}).get("langcrew_agent") or ""
+        self._models[run_id] = [agent, time.perf_counter(), None, 0]
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        model = self._models.get(run_id)
+        if model is None:
+            return
+        if model[2] is None:
+            model[2] = self._first_output(model[0])
+        model[3] += 1
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        model = self._models.pop(run_id, None)
+        if model is None:
+            return
+        agent, started, first_token_at, tokens = model
+        now = time.perf_counter()
+        if first_token_at is None:
+            # Not streamed: the whole answer is the first output
+            first_token_at = self._first_output(agent, now)
+            tokens = _output_tokens(response)
+            elapsed = now - started
+        else:
+            # Decode rate after the first token
+            tokens -= 1
+            elapsed = now - first_token_at
+        if tokens > 0 and elapsed > 0:
+            self.metrics.tokens_per_second.labels(self.crew, agent).observe(
+                tokens / elapsed
+            )
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._models.pop(run_id, None)
+
+    def _first_output(self, agent: str, now: float | None = None) -> float:
+        now = now or time.perf_counter()
+        if self.first_token_at is None:
+            self.first_token_at = now
+            self.metrics.time_to_first_token.labels(self.crew, agent).observe(
+                now - self.started
+            )
+        return now
+
+    # ============ TOOLS ============
+
+    def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        agent = (metadata or {}).get("langcrew_agent") or ""
+        tool = name or (serialized or {}).get("name") or ""
+        self._tools[run_id] = (agent, tool, time.perf_counter())
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_tool(run_id)
+
+    def on_tool_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._end_tool(run_id)
+
+    def _end_tool(self, run_id: UUID) -> None:
+        tool = self._tools.pop(run_id, None)
+        if tool is not None:
+            agent, name, started = tool
+            self.metrics.tool_duration.labels(self.crew, agent, name).observe(
+                time.perf_counter() - started
+            )
+
+
+class ToolPolicyCollector:
+    """Circuit breaker states and in-flight calls of ToolPolicyWrapper tools.
+
+    Read at scrape time. Tools wrapped by several wrappers are reported once:
+    the most severe breaker state (open, then half open) and summed counts.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    def collect(self):
+        state = GaugeMetricFamily(
+            f"{self.namespace}_tool_circuit_state",
+            "Circuit breaker state of a tool: 0 closed, 1 open, 2 half open",
+            labels=["tool"],
+        )
+        failures = GaugeMetricFamily(
+            f"{self.namespace}_tool_consecutive_failures",
+            "Consecutive failed calls of a tool",
+            labels=["tool"],
+        )
+        in_flight = GaugeMetricFamily(
+            f"{self.namespace}_tool_calls_in_flight",
+            "Running calls of a tool with a concurrency limit",
+            labels=["tool"],
+        )
+        rejections = CounterMetricFamily(
+            f"{self.namespace}_tool_circuit_rejections",
+            "Tool calls rejected by an open circuit breaker",
+            labels=["tool"],
+        )
+        tools: dict[str, list[int]] = {}
+        for tool in tool_states():
+            totals = tools.setdefault(tool.name, [0, 0, 0, 0])
+            if CIRCUIT_SEVERITY[tool.breaker.state] > CIRCUIT_SEVERITY[totals[0]]:
+                totals[0] = tool.breaker.state
+            totals[1] += tool.breaker.failures
+            totals[2] += tool.in_flight
+            totals[3] += tool.breaker.rejections
+        for name, (circuit, failed, running, rejected) in tools.items():
+            state.add_metric([name], int(circuit))
+            failures.add_metric([name], failed)
+            in_flight.add_metric([name], running)
+            rejections.add_metric([name], rejected)
+        yield from (state, failures, in_flight, rejections)
+
+
+def _timed(method, histogram):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+def _timed_async(method, histogram):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+def _output_tokens(response: LLMResult) -> int:
+    """Output token count reported in the usage metadata of a model response."""
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                return usage.get("output_tokens") or 0
+    return 0
@@ -65,6 +65,7 @@ class TaskExecutionStatus(str, Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
     USER_INPUT = "user_input"  # Waiting for user input
+    SUSPENDED = "suspended"  # Stopped by a server drain, can be continued
 
 
 class StepStatus(str, Enum):
@@ -98,6 +99,7 @@ class TaskInput(BaseModel):
     user_id: str | None = None  # User identifier for personalization (optional)
     language: str | None = None  # Language field for tool display
     interrupt_data: dict[str, Any] | None = None  # Interrupt data for resume scenarios
+    continue_run: bool = False  # Continue a suspended run instead of sending message
 
     @property
     def is_resume(self) -> bool:
@@ -120,6 +122,7 @@ class ChatRequest(BaseModel):
     user_id: str | None = None  # User identifier for personalization (optional)
     language: str | None = None  # Language preference for tool display and responses
     interrupt_data: dict[str, Any] | None = None  # For resume scenarios
+    continue_run: bool = False  # Continue a run suspended by a server drain
 
 
 class StopRequest(BaseModel):
@@ -127,3 +130,12 @@ class StopRequest(BaseModel):
 
     session_id: str
     reason: str = "User stopped"
+
+
+class SessionMessagesPage(BaseModel):
+    """One page of a session's message history, oldest message first"""
+
+    session_id: str
+    messages: list[StreamMessage]
+    next_cursor: str | None = None  # Cursor of the previous (older) page, if any
+    total: int  # Messages in the whole session history
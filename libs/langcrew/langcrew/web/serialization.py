@@ -0,0 +1,131 @@
+"""Low-overhead JSON serialization for StreamMessage.
+
+``StreamMessage.model_dump_json()`` validates and walks the whole model for
+every SSE event. On the token path that cost dominates the actual work, so this
+module serializes messages with orjson and precomputes the fields that are
+static for a task (session_id, task_id, trace_id).
+
+The output is byte-compatible with ``model_dump_json()``: same field order,
+compact separators, UTF-8 text and pydantic's conversion rules for nested
+values. Whenever orjson cannot represent a value, serialization falls back to
+pydantic.
+"""
+
+import logging
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+from .protocol import MessageType, StreamMessage
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with langgraph/langsmith
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Datetimes and dataclasses are handed to pydantic so their format matches
+# model_dump_json() exactly (e.g. "Z" suffix for UTC datetimes)
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if orjson else 0
+)
+
+_FIELDS = tuple(StreamMessage.model_fields)
+
+
+def _dumps(value: Any) -> str:
+    return orjson.dumps(
+        value, default=to_jsonable_python, option=_ORJSON_OPTIONS
+    ).decode()
+
+
+def dumps_stream_message(message: StreamMessage) -> str:
+    """Serialize a StreamMessage, byte-compatible with ``model_dump_json()``."""
+    if orjson is None:
+        return message.model_dump_json()
+    try:
+        data = message.__dict__
+        return _dumps({name: data[name] for name in _FIELDS})
+    except (TypeError, ValueError, KeyError) as e:
+        logger.debug(f"Fast serialization failed, falling back to pydantic: {e}")
+        return message.model_dump_json()
+
+
+class TaskEnvelope:
+    """Precomputed static fields of the stream messages of one task.
+
+    Model token messages only differ in id, content, detail and timestamp, so
+    the rest of the JSON document is rendered once per task.
+    """
+
+    def __init__(
+        self,
+        session_id: str | None,
+        task_id: str | None,
+        trace_id: str | None = None,
+    ):
+        self.session_id = session_id
+        self.task_id = task_id
+        self.trace_id = trace_id
+        self._text_head = (
+            f',"role":"assistant","type":"{MessageType.TEXT.value}","content":'
+        )
+        self._text_tail = (
+            f',"session_id":{_json(session_id)}'
+            f',"task_id":{_json(task_id)}'
+            f',"trace_id":{_json(trace_id)}'
+            f',"field_name":"content"}}'
+        )
+
+    def text_chunk(
+        self,
+        message_id: str,
+        content: str,
+        detail: dict[str, Any],
+        timestamp: int,
+    ) -> str:
+        """Serialize a streaming TEXT message for model output."""
+        if orjson is None:
+            return self._text_chunk_message(
+                message_id, content, detail, timestamp
+            ).model_dump_json()
+        try:
+            return (
+                f'{{"id":{_dumps(message_id)}{self._text_head}{_dumps(content)}'
+                f',"detail":{_dumps(detail)},"timestamp":{int(timestamp)}'
+                f"{self._text_tail}"
+            )
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Fast serialization failed, falling back to pydantic: {e}")
+            return self._text_chunk_message(
+                message_id, content, detail, timestamp
+            ).model_dump_json()
+
+    def _text_chunk_message(
+        self,
+        message_id: str,
+        content: str,
+        detail: dict[str, Any],
+        timestamp: int,
+    ) -> StreamMessage:
+        return StreamMessage(
+            id=message_id,
+            type=MessageType.TEXT,
+            content=content,
+            detail=detail,
+            role="assistant",
+            timestamp=timestamp,
+            session_id=self.session_id,
+            task_id=self.task_id,
+            trace_id=self.trace_id,
+            field_name="content",
+        )
+
+
+def _json(value: Any) -> str:
+    if orjson is None:
+        import json
+
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return _dumps(value)
@@ -0,0 +1,179 @@
+"""Stop flag backends for cancelling running chat executions.
+
+A stop request may land on a different worker or pod than the one streaming
+the session. Backends store stop flags where every worker can see them and let
+the streaming worker wait for a flag instead of looking it up per event.
+
+- InMemoryStopFlagBackend: single-process deployments (default)
+- RedisStopFlagBackend: multi-worker deployments sharing a Redis server
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class StopFlagBackend(ABC):
+    """Interface for storing and observing per-session stop flags."""
+
+    @abstractmethod
+    async def set_flag(self, session_id: str, stop_info: dict[str, Any]) -> None:
+        """Request the session identified by ``session_id`` to stop."""
+
+    @abstractmethod
+    async def get_flag(self, session_id: str) -> dict[str, Any] | None:
+        """Return the stop info for a session, or None if no stop was requested."""
+
+    @abstractmethod
+    async def clear_flag(self, session_id: str) -> None:
+        """Remove the stop flag of a session."""
+
+    @abstractmethod
+    async def wait_for_flag(self, session_id: str) -> dict[str, Any]:
+        """Block until a stop is requested for the session and return its info."""
+
+
+class InMemoryStopFlagBackend(StopFlagBackend):
+    """Process-local stop flags with immediate notification of waiters."""
+
+    def __init__(self):
+        self._flags: dict[str, dict[str, Any]] = {}
+        self._waiters: dict[str, set[asyncio.Future]] = {}
+
+    async def set_flag(self, session_id: str, stop_info: dict[str, Any]) -> None:
+        self._flags[session_id] = stop_info
+        _notify_waiters(self._waiters, session_id, stop_info)
+
+    async def get_flag(self, session_id: str) -> dict[str, Any] | None:
+        return self._flags.get(session_id)
+
+    async def clear_flag(self, session_id: str) -> None:
+        self._flags.pop(session_id, None)
+
+    async def wait_for_flag(self, session_id: str) -> dict[str, Any]:
+        stop_info = self._flags.get(session_id)
+        if stop_info:
+            return stop_info
+        return await _wait(self._waiters, session_id)
+
+
+class RedisStopFlagBackend(StopFlagBackend):
+    """Stop flags shared through Redis (or any server speaking its protocol).
+
+    Flags are stored as JSON strings under ``{key_prefix}{session_id}`` with a
+    TTL so that abandoned flags expire. Waiters on the worker that received the
+    stop request are notified immediately; waiters on other workers poll the
+    key every ``poll_interval`` seconds, backing off up to
+    ``MAX_POLL_BACKOFF`` seconds while Redis fails.
+
+    Args:
+        client: Async Redis client (``redis.asyncio.Redis`` compatible: ``get``,
+            ``set`` with ``ex`` and ``delete``)
+        url: Redis URL used to create a client when ``client`` is not given
+        key_prefix: Prefix for stop flag keys
+        ttl: Expiration of stop flags in seconds
+        poll_interval: Seconds between checks for flags set by other workers
+    """
+
+    # Longest delay between polls while reading the flag fails
+    MAX_POLL_BACKOFF = 10.0
+
+    def __init__(
+        self,
+        client: Any | None = None,
+        url: str | None = None,
+        key_prefix: str = "langcrew:stop:",
+        ttl: int = 3600,
+        poll_interval: float = 0.5,
+    ):
+        if client is None:
+            if not url:
+                raise ValueError("Either client or url must be provided")
+            try:
+                import redis.asyncio as redis
+            except ImportError:
+                raise ImportError(
+                    "Redis stop flag backend requires the redis package: "
+                    "pip install redis"
+                )
+            client = redis.from_url(url)
+
+        self.client = client
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self._waiters: dict[str, set[asyncio.Future]] = {}
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    async def set_flag(self, session_id: str, stop_info: dict[str, Any]) -> None:
+        await self.client.set(self._key(session_id), json.dumps(stop_info), ex=self.ttl)
+        _notify_waiters(self._waiters, session_id, stop_info)
+
+    async def get_flag(self, session_id: str) -> dict[str, Any] | None:
+        value = await self.client.get(self._key(session_id))
+        if not value:
+            return None
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid stop flag for session {session_id}: {value!r}")
+            return {"stop_requested": True, "stop_reason": "User requested"}
+
+    async def clear_flag(self, session_id: str) -> None:
+        await self.client.delete(self._key(session_id))
+
+    async def wait_for_flag(self, session_id: str) -> dict[str, Any]:
+        local_waiter = asyncio.ensure_future(_wait(self._waiters, session_id))
+        delay = self.poll_interval
+        try:
+            while True:
+                try:
+                    stop_info = await self.get_flag(session_id)
+                except Exception as e:
+                    # Keep watching, a stop must not be lost to a Redis hiccup
+                    delay = min(self.MAX_POLL_BACKOFF, delay * 2)
+                    logger.warning(
+                        f"Failed to read stop flag for session {session_id} "
+                        f"(retry in {delay:.1f}s): {e}"
+                    )
+                else:
+                    if stop_info:
+                        return stop_info
+                    delay = self.poll_interval
+                done, _ = await asyncio.wait({local_waiter}, timeout=delay)
+                if done:
+                    return local_waiter.result()
+        finally:
+            local_waiter.cancel()
+
+
+async def _wait(
+    waiters: dict[str, set[asyncio.Future]], session_id: str
+) -> dict[str, Any]:
+    future = asyncio.get_running_loop().create_future()
+    session_waiters = waiters.setdefault(session_id, set())
+    session_waiters.add(future)
+    try:
+        return await future
+    finally:
+        session_waiters.discard(future)
+        if not session_waiters:
+            waiters.pop(session_id, None)
+
+
+def _notify_waiters(
+    waiters: dict[str, set[asyncio.Future]],
+    session_id: str,
+    stop_info: dict[str, Any],
+) -> None:
+    for future in list(waiters.get(session_id, ())):
+        if not future.done():
+            future.set_result(stop_info)
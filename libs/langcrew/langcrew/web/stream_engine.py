@@ -0,0 +1,364 @@
+"""Lightweight event source built on LangGraph stream modes.
+
+``astream_events(version="v2")`` runs a tracer callback for every runnable in
+the tree (prompts, parsers, graph nodes, channel writes), which costs CPU on
+every model token. StreamModeEventSource runs the executor with
+``astream(stream_mode=["messages", "updates", "custom"], subgraphs=True)``
+instead and translates the output into the subset of astream_events v2 dicts
+that ``LangGraphAdapter.execute()`` consumes, so both engines produce the same
+StreamMessage protocol:
+
+- ``messages`` chunks become ``on_chat_model_stream``
+- root ``__interrupt__`` updates become a root ``on_chain_stream`` chunk
+- model end/error, tool and custom event callbacks are written into the
+  ``custom`` stream by CallbackForwarder, a handler that ignores retriever
+  callbacks and only follows chains running inside tools
+- the end of the stream becomes a root ``on_chain_end`` (``on_chain_error``
+  when the run fails)
+
+Events are passed through the crew's output callbacks (the ToolCallback hooks
+of streaming tools) like ``Crew.astream_events`` does. Model events use the
+message id as run_id. Their parent_ids hold the parent run and the tools the
+run is nested in, so events of runs inside tools are hidden by the adapter as
+with astream_events.
+"""
+
+import logging
+from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables.config import RunnableConfig
+from langgraph.config import get_stream_writer
+
+from ..utils.runnable_config_utils import INTERNAL_RUN_TAG, with_callback_handler
+
+logger = logging.getLogger(__name__)
+
+# Marks custom stream payloads carrying a forwarded callback event
+FORWARDED_EVENT_KEY = "__langcrew_event__"
+
+
+class CallbackForwarder(AsyncCallbackHandler):
+    """Writes model, tool and custom event callbacks into the ``custom`` stream.
+
+    Events are written in astream_events v2 format. Retriever callbacks are
+    ignored and tokens are left to the ``messages`` stream. Chains are only
+    followed to know the tools each run is nested in.
+    """
+
+    run_inline = True
+    ignore_retriever = True
+    ignore_retry = True
+
+    def __init__(self):
+        # Name, tags and metadata of running models, by run_id
+        self._models: dict[UUID, dict[str, Any]] = {}
+        # Name, tags, metadata and inputs of running tools, by run_id
+        self._tools: dict[UUID, dict[str, Any]] = {}
+        # Ids of the tools enclosing (or being) each run inside a tool, by run_id
+        self._tool_scopes: dict[UUID, list[str]] = {}
+        # parent_ids of the models that streamed tokens, by message id
+        self._message_parents: dict[str, list[str]] = {}
+
+    def message_parent_ids(self, message_id: str | None) -> list[str] | None:
+        """parent_ids of the model run that streamed a message, if known."""
+        return self._message_parents.get(message_id) if message_id else None
+
+    async def on_chain_start(
+        self,
+        serialized: dict[str, Any],
+        inputs: dict[str, Any],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._enter(run_id, parent_run_id)
+
+    async def on_chain_end(
+        self, outputs: dict[str, Any], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._tool_scopes.pop(run_id, None)
+
+    async def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._tool_scopes.pop(run_id, None)
+
+    async def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if tags and INTERNAL_RUN_TAG in tags:
+            return
+        self._enter(run_id, parent_run_id)
+        self._models[run_id] = {
+            "name": _run_name(name, serialized),
+            "tags": tags or [],
+            "metadata": metadata or {},
+            "parent_ids": self._parent_ids(parent_run_id),
+        }
+
+    async def on_llm_new_token(
+        self,
+        token: str,
+        *,
+        chunk: Any = None,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        info = self._models.get(run_id)
+        message_id = getattr(getattr(chunk, "message", None), "id", None)
+        if info is not None and message_id:
+            self._message_parents.setdefault(message_id, info["parent_ids"])
+
+    async def on_llm_end(
+        self, response: LLMResult, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._tool_scopes.pop(run_id, None)
+        info = self._models.pop(run_id, None)
+        if info is None:
+            return
+        generation = response.generations[0][0] if response.generations else None
+        output = getattr(generation, "message", None)
+        message_id = getattr(output, "id", None) or str(run_id)
+        self._write(
+            {"event": "on_chat_model_end", "run_id": message_id, **info},
+            {"output": output},
+        )
+
+    async def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._tool_scopes.pop(run_id, None)
+        info = self._models.pop(run_id, None)
+        if info is None:
+            return
+        self._write(
+            {"event": "on_chat_model_error", "run_id": str(run_id), **info},
+            {"error": error},
+        )
+
+    async def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        inputs: dict[str, Any] | None = None,
+        name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if tags and INTERNAL_RUN_TAG in tags:
+            return
+        info = {
+            "name": _run_name(name, serialized),
+            "tags": tags or [],
+            "metadata": metadata or {},
+            "parent_ids": self._parent_ids(parent_run_id),
+        }
+        scope = self._tool_scopes.get(parent_run_id, []) if parent_run_id else []
+        self._tool_scopes[run_id] = [str(run_id), *scope]
+        self._tools[run_id] = {**info, "inputs": inputs or {}}
+        self._write(
+            {"event": "on_tool_start", "run_id": str(run_id), **info},
+            {"input": inputs or {}},
+        )
+
+    async def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._tool_scopes.pop(run_id, None)
+        info = self._tools.pop(run_id, None)
+        if info is None:
+            return
+        inputs = info.pop("inputs")
+        self._write(
+            {"event": "on_tool_end", "run_id": str(run_id), **info},
+            {"output": output, "input": inputs},
+        )
+
+    async def on_tool_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._tool_scopes.pop(run_id, None)
+        info = self._tools.pop(run_id, None)
+        if info is None:
+            return
+        inputs = info.pop("inputs")
+        self._write(
+            {"event": "on_tool_error", "run_id": str(run_id), **info},
+            {"error": error, "input": inputs},
+        )
+
+    async def on_custom_event(
+        self,
+        name: str,
+        data: Any,
+        *,
+        run_id: UUID,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if tags and INTERNAL_RUN_TAG in tags:
+            return
+        self._write(
+            {
+                "event": "on_custom_event",
+                "name": name,
+                "run_id": str(run_id),
+                "tags": tags or [],
+                "metadata": metadata or {},
+                # Tools enclosing the run that dispatched the event
+                "parent_ids": [
+                    tool_id
+                    for tool_id in self._tool_scopes.get(run_id, [])
+                    if tool_id != str(run_id)
+                ],
+            },
+            data,
+        )
+
+    def _enter(self, run_id: UUID, parent_run_id: UUID | None) -> None:
+        scope = self._tool_scopes.get(parent_run_id) if parent_run_id else None
+        if scope:
+            self._tool_scopes[run_id] = scope
+
+    def _parent_ids(self, parent_run_id: UUID | None) -> list[str]:
+        """Parent run and the tools it is nested in, like astream_events."""
+        if parent_run_id is None:
+            return []
+        parent = str(parent_run_id)
+        scope = self._tool_scopes.get(parent_run_id, [])
+        return [parent, *(tool_id for tool_id in scope if tool_id != parent)]
+
+    def _write(self, event: dict[str, Any], data: Any) -> None:
+        try:
+            writer = get_stream_writer()
+        except Exception as e:
+            logger.debug(f"{event['event']} raised outside a graph run: {e}")
+            return
+        writer({FORWARDED_EVENT_KEY: {**event, "data": data}})
+
+
+class StreamModeEventSource:
+    """Produces astream_events-shaped dicts from ``astream`` stream modes.
+
+    Args:
+        executor: Crew or compiled graph exposing ``astream``
+        root_name: Name reported on the synthetic root chain events
+    """
+
+    STREAM_MODES = ["messages", "updates", "custom"]
+
+    def __init__(self, executor: Any, root_name: str = "LangGraph"):
+        self.executor = executor
+        self.root_name = root_name
+
+    async def astream_events(
+        self, input: Any, config: RunnableConfig
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Run the executor and yield events in astream_events v2 format."""
+        forwarder = CallbackForwarder()
+        try:
+            async for namespace, mode, data in self.executor.astream(
+                input,
+                config=with_callback_handler(config, forwarder),
+                stream_mode=self.STREAM_MODES,
+                subgraphs=True,
+            ):
+                if mode == "messages":
+                    message, metadata = data
+                    tags = metadata.get("tags") or []
+                    if isinstance(message, AIMessageChunk) and (
+                        INTERNAL_RUN_TAG not in tags
+                    ):
+                        parent_ids = forwarder.message_parent_ids(message.id)
+                        event = {
+                            "event": "on_chat_model_stream",
+                            "name": metadata.get("ls_model_name", ""),
+                            "run_id": message.id,
+                            "parent_ids": (
+                                list(namespace) if parent_ids is None else parent_ids
+                            ),
+                            "tags": tags,
+                            "metadata": metadata,
+                            "data": {"chunk": message},
+                        }
+                        async for item in self._processed(event):
+                            yield item
+                elif mode == "updates":
+                    # Interrupts of subgraphs are repeated by the root graph
+                    if "__interrupt__" in data and not namespace:
+                        event = self._root_event(
+                            "on_chain_stream",
+                            {"chunk": {"__interrupt__": data["__interrupt__"]}},
+                        )
+                        async for item in self._processed(event):
+                            yield item
+                elif mode == "custom":
+                    if isinstance(data, dict) and FORWARDED_EVENT_KEY in data:
+                        async for item in self._processed(data[FORWARDED_EVENT_KEY]):
+                            yield item
+        except Exception as e:
+            logger.error(f"Stream mode run failed: {e}")
+            yield self._root_event("on_chain_error", {"error": e})
+            return
+        async for item in self._processed(self._root_event("on_chain_end", {})):
+            yield item
+
+    async def _processed(
+        self, event: dict[str, Any]
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Pass an event through the crew's output callbacks, if any.
+
+        Streaming tools turn their custom events into tool events there, as
+        for the events of ``Crew.astream_events``.
+        """
+        process_output = getattr(self.executor, "_aprocess_output", None)
+        if process_output is None:
+            yield event
+            return
+        processed = await process_output(event)
+        if not processed:
+            return
+        if isinstance(processed, list):
+            for item in processed:
+                yield item
+        else:
+            yield processed
+
+    def _root_event(self, event_type: str, data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "event": event_type,
+            "name": self.root_name,
+            "run_id": "",
+            "parent_ids": [],
+            "tags": [],
+            "metadata": {},
+            "data": data,
+        }
+
+
+def _run_name(name: str | None, serialized: dict[str, Any] | None) -> str:
+    """Run name as reported by astream_events."""
+    if name:
+        return name
+    serialized = serialized or {}
+    if serialized.get("name"):
+        return serialized["name"]
+    return (serialized.get("id") or [""])[-1]
@@ -0,0 +1,330 @@
+"""WebSocket transport for AdapterServer.
+
+One ``/api/v1/ws`` connection multiplexes any number of sessions. Clients send
+operation frames and receive the same StreamMessages the SSE endpoint emits,
+wrapped in a small envelope that names the session.
+
+Client frames::
+
+    {"op": "chat", "session_id": "...", "message": "...", "user_id": "...",
+     "language": "...", "interrupt_data": {...}, "request_id": "..."}
+    {"op": "resume", ...}            # chat with interrupt_data
+    {"op": "stop", "session_id": "...", "reason": "..."}
+    {"op": "new_message", "session_id": "...", "message": "..."}
+    {"op": "subscribe", "session_id": "...", "last_event_id": "..."}
+    {"op": "ping"}
+
+Server frames::
+
+    {"op": "message", "session_id": "...", "event_id": "...", "data": {...}}
+    {"op": "ack", "request": "<op>", "session_id": "...", "request_id": "...", ...}
+    {"op": "error", "request": "<op>", "session_id": "...", "detail": "..."}
+    {"op": "pong"}
+
+Frames are JSON text by default. Connecting with ``?encoding=msgpack`` switches
+both directions to binary msgpack frames.
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from .admission import AdmissionRejected
+from .protocol import ChatRequest
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with langgraph/langsmith
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - ormsgpack ships with langgraph
+    ormsgpack = None
+
+if TYPE_CHECKING:
+    from .http_server import AdapterServer
+
+logger = logging.getLogger(__name__)
+
+ENCODINGS = ("json", "msgpack")
+
+
+class WebSocketConnection:
+    """Serves one WebSocket connection carrying many sessions.
+
+    Args:
+        server: AdapterServer owning the adapter, run registry and admission
+        websocket: Accepted FastAPI WebSocket
+        encoding: "json" (text frames) or "msgpack" (binary frames)
+    """
+
+    def __init__(
+        self, server: "AdapterServer", websocket: WebSocket, encoding: str = "json"
+    ):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown encoding {encoding!r}, expected {ENCODINGS}")
+        if encoding == "msgpack" and ormsgpack is None:
+            raise ValueError(
+                "msgpack encoding requires ormsgpack. "
+                "Install it with: pip install ormsgpack"
+            )
+        self.server = server
+        self.websocket = websocket
+        self.encoding = encoding
+        self._send_lock = asyncio.Lock()
+        # Delivery task of every run followed on this connection, by run ID.
+        # Per run, not per session: a chat queued behind the session's
+        # running chat must not cut off the delivery of the first one.
+        self._deliveries: dict[str, asyncio.Task] = {}
+
+    async def serve(self) -> None:
+        """Handle client frames until the connection closes."""
+        try:
+            while True:
+                frame = await self.websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    break
+                try:
+                    request = self._decode(frame)
+                except ValueError as e:
+                    await self._send({"op": "error", "detail": f"Invalid frame: {e}"})
+                    continue
+                try:
+                    await self._dispatch(request)
+                except WebSocketDisconnect:
+                    raise
+                except Exception as e:
+                    # One failed operation must not close the other sessions
+                    logger.error(
+                        f"WebSocket {request.get('op')} for session "
+                        f"{request.get('session_id')} failed: {e}"
+                    )
+                    await self._error(request, f"{request.get('op')} failed: {e}")
+        except WebSocketDisconnect:
+            pass
+        finally:
+            for task in self._deliveries.values():
+                task.cancel()
+            logger.info(
+                f"WebSocket closed, stopped delivering {len(self._deliveries)} runs"
+            )
+
+    # ============ OPERATIONS ============
+
+    async def _dispatch(self, request: dict[str, Any]) -> None:
+        op = request.get("op")
+        if op in ("chat", "resume"):
+            await self._chat(request)
+        elif op == "stop":
+            await self._stop(request)
+        elif op == "new_message":
+            await self._new_message(request)
+        elif op == "subscribe":
+            await self._subscribe(request)
+        elif op == "ping":
+            await self._send({"op": "pong"})
+        else:
+            await self._error(request, f"Unknown op: {op}")
+
+    async def _chat(self, request: dict[str, Any]) -> None:
+        try:
+            chat_request = ChatRequest(**{
+                k: v for k, v in request.items() if k in ChatRequest.model_fields
+            })
+        except ValidationError as e:
+            await self._error(request, str(e))
+            return
+        if request["op"] == "resume" and chat_request.interrupt_data is None:
+            chat_request.interrupt_data = {}
+
+        server = self.server
+        session_id, is_new_session = server._resolve_session(chat_request.session_id)
+        try:
+            duplicate = server._find_duplicate(session_id, chat_request)
+            ticket = None if duplicate else server._admit(chat_request.user_id)
+        except AdmissionRejected as e:
+            logger.warning(f"Rejected chat for session {session_id}: {e}")
+            await self._error(
+                {**request, "session_id": session_id},
+                str(e),
+                retry_after=e.retry_after,
+            )
+            return
+
+        try:
+            await self._ack(request, session_id=session_id)
+        except BaseException:
+            # The run never starts, give its slot back
+            if ticket is not None:
+                ticket.release()
+            raise
+        if duplicate is not None:
+            # Already delivered on this connection, else replay it from the start
+            if duplicate.run_id not in self._deliveries:
+                self._deliver(duplicate.run_id, self._run_frames(duplicate))
+            return
+
+        chunks = server._chat_stream(chat_request, session_id, is_new_session, ticket)
+        if server.runs is not None:
+            run = server.runs.start(session_id, chunks)
+            self._deliver(run.run_id, self._run_frames(run))
+        else:
+            self._deliver(
+                uuid.uuid4().hex[:12],
+                self._chunk_frames(session_id, chunks),
+                release=chunks.release,
+            )
+
+    async def _stop(self, request: dict[str, Any]) -> None:
+        session_id = request.get("session_id")
+        if not session_id:
+            await self._error(request, "session_id is required")
+            return
+        success = False
+        try:
+            success = await self.server.adapter.set_stop_flag(
+                session_id, request.get("reason") or "User stopped"
+            )
+        except Exception as e:
+            logger.error(f"Failed to stop session {session_id}: {e}")
+        await self._ack(request, success=success)
+
+    async def _new_message(self, request: dict[str, Any]) -> None:
+        session_id = request.get("session_id")
+        message = request.get("message")
+        if not session_id or not message:
+            await self._error(request, "session_id and message are required")
+            return
+        success = await self.server.send_new_message(session_id, message)
+        await self._ack(request, success=success)
+
+    async def _subscribe(self, request: dict[str, Any]) -> None:
+        session_id = request.get("session_id")
+        runs = self.server.runs
+        run = runs.get(session_id) if runs is not None and session_id else None
+        if run is None:
+            await self._error(request, f"No active run for session {session_id}")
+            return
+        await self._ack(request)
+        self._deliver(run.run_id, self._run_frames(run, request.get("last_event_id")))
+
+    # ============ DELIVERY ============
+
+    def _deliver(self, run_id: str, frames, release=None) -> None:
+        """Send ``frames`` in the background, replacing the run's delivery.
+
+        ``release`` is called once the delivery ends, also when it is
+        cancelled before sending anything.
+        """
+        previous = self._deliveries.pop(run_id, None)
+        if previous is not None:
+            previous.cancel()
+
+        async def deliver():
+            try:
+                async for frame in frames:
+                    await self._send(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"WebSocket delivery of run {run_id} failed: {e}")
+            finally:
+                if self._deliveries.get(run_id) is task:
+                    del self._deliveries[run_id]
+
+        task = asyncio.create_task(deliver())
+        if release is not None:
+            task.add_done_callback(lambda _: release())
+        self._deliveries[run_id] = task
+
+    async def _run_frames(self, run, last_event_id: str | None = None):
+        """Frames for the events of a background run, resuming after an ID."""
+        async for seq, chunk in run.log.subscribe(run.parse_event_id(last_event_id)):
+            yield self._message_frame(run.session_id, chunk, run.format_event_id(seq))
+
+    async def _chunk_frames(self, session_id: str, chunks):
+        async for chunk in chunks:
+            yield self._message_frame(session_id, chunk)
+
+    def _message_frame(
+        self, session_id: str, chunk: str, event_id: str | None = None
+    ) -> dict[str, Any] | str:
+        # SSE chunks are "data: {json}\n\n"
+        payload = chunk[len("data: ") :].rstrip("\n")
+        if self.encoding == "json":
+            # Splice the serialized message instead of parsing it again
+            return (
+                f'{{"op":"message","session_id":{_dumps(session_id)}'
+                f',"event_id":{_dumps(event_id)},"data":{payload}}}'
+            )
+        return {
+            "op": "message",
+            "session_id": session_id,
+            "event_id": event_id,
+            "data": _loads(payload),
+        }
+
+    # ============ FRAMING ============
+
+    def _decode(self, frame: dict[str, Any]) -> dict[str, Any]:
+        try:
+            if frame.get("bytes") is not None:
+                if self.encoding != "msgpack":
+                    raise ValueError("binary frames require encoding=msgpack")
+                request = ormsgpack.unpackb(frame["bytes"])
+            else:
+                request = _loads(frame.get("text") or "")
+        except Exception as e:
+            raise ValueError(str(e)) from e
+        if not isinstance(request, dict):
+            raise ValueError("frame must be an object")
+        return request
+
+    async def _send(self, frame: dict[str, Any] | str) -> None:
+        async with self._send_lock:
+            if self.encoding == "msgpack":
+                await self.websocket.send_bytes(ormsgpack.packb(frame))
+            elif isinstance(frame, str):
+                await self.websocket.send_text(frame)
+            else:
+                await self.websocket.send_text(_dumps(frame))
+
+    async def _ack(self, request: dict[str, Any], **fields: Any) -> None:
+        frame = {
+            "op": "ack",
+            "request": request.get("op"),
+            "session_id": request.get("session_id"),
+            "request_id": request.get("request_id"),
+        }
+        await self._send({**frame, **fields})
+
+    async def _error(self, request: dict[str, Any], detail: str, **fields) -> None:
+        await self._send({
+            "op": "error",
+            "request": request.get("op"),
+            "session_id": request.get("session_id"),
+            "request_id": request.get("request_id"),
+            "detail": detail,
+            **fields,
+        })
+
+
+def _dumps(value: Any) -> str:
+    if orjson is None:
+        import json
+
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return orjson.dumps(value).decode()
+
+
+def _loads(value: str | bytes) -> Any:
+    if orjson is None:
+        import json
+
+        return json.loads(value)
+    return orjson.loads(value)
@@ -21,6 +21,7 @@ from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, Tool
 # Set test environment variables
 os.environ["LANGCREW_ENV"] = "test"
 os.environ["LANGCHAIN_TRACING_V2"] = "false"
+os.environ["LANGCREW_TOOL_INDEX"] = ""
 
 
 @pytest.fixture(scope="session")
@@ -1,14 +1,21 @@
 """Unit tests for guardrail module"""
 
 import asyncio
+import time
 from typing import Any
 from unittest.mock import patch
 
 import pytest
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
 
 from langcrew.guardrail import (
     GuardrailError,
+    VerdictCache,
     _check_guardrails_impl,
+    cached_guard,
     check_guardrails,
     check_guardrails_sync,
     input_guard,
@@ -380,3 +387,181 @@ class TestEdgeCases:
 
         # guard2 should not be called
         assert call_count == [1]
+
+
+# ==================== Concurrent Async Guards ====================
+
+
+def make_async_guard(delay: float, valid: bool = True, events: list | None = None):
+    """Async guard answering after a delay, recording start, end and cancellation"""
+
+    async def slow_guard(data):
+        name = f"guard_{delay}_{valid}"
+        if events is not None:
+            events.append(("start", name))
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if events is not None:
+                events.append(("cancelled", name))
+            raise
+        return valid, "ok" if valid else "flagged"
+
+    return slow_guard
+
+
+class TestConcurrentGuardrails:
+    """Test concurrent checks of async guardrails"""
+
+    async def test_async_guards_run_concurrently(self):
+        guards = [make_async_guard(0.05) for _ in range(4)]
+        start = time.perf_counter()
+        await check_guardrails(guards, {"query": "hello"})
+        assert time.perf_counter() - start < 0.15
+
+    async def test_first_failure_cancels_other_guards(self):
+        events = []
+        guards = [
+            make_async_guard(1.0, events=events),
+            make_async_guard(0.01, valid=False, events=events),
+        ]
+        start = time.perf_counter()
+        with pytest.raises(GuardrailError, match="flagged"):
+            await check_guardrails(guards, {})
+        assert time.perf_counter() - start < 0.5
+        await asyncio.sleep(0)
+        assert ("cancelled", "guard_1.0_True") in events
+
+    async def test_sync_guards_checked_first(self):
+        events = []
+        guards = [make_async_guard(0.01, events=events), failing_guard]
+        with pytest.raises(GuardrailError, match="Always fails"):
+            await check_guardrails(guards, {})
+        assert events == []
+
+    async def test_async_guard_exception_wrapped(self):
+        async def broken_guard(data):
+            raise ConnectionError("moderation API unavailable")
+
+        guards = [broken_guard, make_async_guard(0.01)]
+        with pytest.raises(GuardrailError, match="'broken_guard' error"):
+            await check_guardrails(guards, {})
+
+    def test_async_guard_in_sync_check(self):
+        with pytest.raises(GuardrailError, match="flagged"):
+            check_guardrails_sync([make_async_guard(0.01, valid=False)], {})
+
+
+# ==================== Verdict Cache ====================
+
+
+class TestVerdictCache:
+    """Test verdict caching of pure guardrails"""
+
+    async def test_verdicts_reused_for_same_content(self):
+        calls = []
+
+        @input_guard
+        @cached_guard
+        async def moderation_guard(data):
+            calls.append(data)
+            return "spam" not in data["text"], "spam detected"
+
+        await check_guardrails([moderation_guard], {"text": "hi", "lang": "en"})
+        check_guardrails_sync([moderation_guard], {"lang": "en", "text": "hi"})
+        for _ in range(2):
+            with pytest.raises(GuardrailError, match="input guardrail"):
+                await check_guardrails([moderation_guard], {"text": "spam"})
+        assert len(calls) == 2
+        assert len(moderation_guard._verdict_cache) == 2
+
+    def test_errors_not_cached(self):
+        calls = []
+
+        @cached_guard(maxsize=8)
+        def flaky_guard(data):
+            calls.append(data)
+            raise TimeoutError("classifier timed out")
+
+        for _ in range(2):
+            with pytest.raises(GuardrailError):
+                check_guardrails_sync([flaky_guard], "text")
+        assert len(calls) == 2
+        assert len(flaky_guard._verdict_cache) == 0
+
+    def test_lru_eviction(self):
+        cache = VerdictCache(maxsize=2)
+        cache.put("a", (True, "ok"))
+        cache.put("b", (True, "ok"))
+        cache.get("a")
+        cache.put("c", (False, "bad"))
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == (True, "ok")
+
+
+# ==================== Speculative Mode ====================
+
+
+class ModelRecorder(AsyncCallbackHandler):
+    """Records model results in a shared event list"""
+
+    def __init__(self, events: list):
+        self.events = events
+
+    async def on_llm_end(self, response, **kwargs):
+        self.events.append(f"model {response.generations[0][0].text}")
+
+
+class TestSpeculativeGuards:
+    """Test methods started while their input guardrails are checked"""
+
+    def make_runner(self, guard, events: list):
+        @tool
+        async def deploy(target: str) -> str:
+            """Deploy to a target"""
+            events.append(f"deployed {target}")
+            return "deployed"
+
+        model = GenericFakeChatModel(messages=iter([AIMessage(content="plan")]))
+
+        class Runner:
+            input_guards = [guard]
+            output_guards = []
+            speculative_guards = True
+
+            @with_guardrails
+            async def process(self, data, config=None):
+                events.append("started")
+                try:
+                    await model.ainvoke("plan the deployment", config)
+                    return await deploy.ainvoke({"target": "prod"}, config)
+                except asyncio.CancelledError:
+                    events.append("cancelled")
+                    raise
+
+        return Runner()
+
+    def passing_guard(self, events: list):
+        async def slow_guard(data):
+            await asyncio.sleep(0.05)
+            events.append("guards passed")
+            return True, "ok"
+
+        return slow_guard
+
+    async def test_method_runs_while_guards_check(self):
+        events = []
+        runner = self.make_runner(self.passing_guard(events), events)
+        config = {"callbacks": [ModelRecorder(events)]}
+        assert await runner.process({"query": "hello"}, config) == "deployed"
+        # Started right away, model output and tools held until the guards passed
+        assert events == ["started", "guards passed", "model plan", "deployed prod"]
+
+    async def test_no_tool_runs_when_guard_fails(self):
+        events = []
+        runner = self.make_runner(make_async_guard(0.05, valid=False), events)
+        config = {"callbacks": [ModelRecorder(events)]}
+        with pytest.raises(GuardrailError):
+            await runner.process({"query": "hello"}, config)
+        assert events == ["started", "cancelled"]
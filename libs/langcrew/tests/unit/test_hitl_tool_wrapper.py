@@ -6,7 +6,7 @@ This test suite covers:
 2. Thread ID extraction and execution isolation
 3. Interrupt before/after logic with user feedback
 4. Prevention of duplicate tool execution
-5. Execution cache management
+5. Execution state store management, bounded and shared between workers
 6. Schema preservation and validation
 """
 
@@ -19,7 +19,13 @@ from langchain_core.tools import BaseTool, tool
 from pydantic import BaseModel, Field
 
 from langcrew.hitl.config import HITLConfig
+from langcrew.hitl.execution_state import (
+    ExecutionState,
+    InMemoryExecutionStateStore,
+    SharedExecutionStateStore,
+)
 from langcrew.hitl.tool_wrapper import HITLToolWrapper
+from langcrew.tools.result_cache import InMemoryToolResultCache
 
 
 class SearchInput(BaseModel):
@@ -358,13 +364,13 @@ class TestHITLToolWrapper:
         with patch("langcrew.hitl.tool_wrapper.interrupt") as mock_interrupt:
             mock_interrupt.return_value = {"approved": True}
 
-            initial_cache_size = len(wrapper._execution_cache)
+            initial_cache_size = len(wrapper.state_store)
 
             # Execute tool
             asyncio.run(wrapped_tool._arun(query="cache_test"))
 
             # Cache should be cleaned up after execution
-            final_cache_size = len(wrapper._execution_cache)
+            final_cache_size = len(wrapper.state_store)
             assert final_cache_size == initial_cache_size
 
     @pytest.mark.asyncio
@@ -443,4 +449,89 @@ class TestHITLToolWrapper:
             assert tool.execution_count == 1
 
             # Verify cache is cleaned up
-            assert len(wrapper._execution_cache) == 0
+            assert len(wrapper.state_store) == 0
+
+
+class CountingTool(BaseTool):
+    """Tool counting its executions"""
+
+    name: str = "counting_tool"
+    description: str = "Tool counting its executions"
+    execution_count: int = 0
+
+    def _run(self, query: str) -> str:
+        self.execution_count += 1
+        return f"Execution #{self.execution_count}: {query}"
+
+
+class PendingInterrupt(Exception):
+    """Stands in for GraphInterrupt of an unanswered interrupt"""
+
+
+class TestExecutionStateStore:
+    """Tests for execution state stores of HITLToolWrapper"""
+
+    async def test_in_memory_store_bounded(self):
+        store = InMemoryExecutionStateStore(max_entries=2)
+        for execution_id in ("a", "b", "c"):
+            await store.set(execution_id, ExecutionState())
+        assert len(store) == 2
+        assert await store.get("a") is None
+
+    async def test_in_memory_store_ttl(self):
+        store = InMemoryExecutionStateStore(ttl=0.01)
+        await store.set("a", ExecutionState())
+        await asyncio.sleep(0.02)
+        assert await store.get("a") is None
+        assert len(store) == 0
+
+    async def test_abandoned_interrupts_bounded(self):
+        wrapper = HITLToolWrapper(
+            HITLConfig(interrupt_before_tools=["counting_tool"]),
+            state_store=InMemoryExecutionStateStore(max_entries=3),
+        )
+        wrapped_tool = wrapper.wrap_tools([CountingTool()])[0]
+        with patch("langcrew.hitl.tool_wrapper.interrupt") as mock_interrupt:
+            mock_interrupt.side_effect = PendingInterrupt
+            for i in range(10):
+                with pytest.raises(PendingInterrupt):
+                    await wrapped_tool._arun(query=f"query {i}")
+        assert len(wrapper.state_store) == 3
+
+    async def test_resume_on_other_worker_without_duplicate_execution(self):
+        shared_backend = InMemoryToolResultCache()
+        hitl_config = HITLConfig(
+            interrupt_before_tools=["counting_tool"],
+            interrupt_after_tools=["counting_tool"],
+            tool_state_store=SharedExecutionStateStore(shared_backend),
+        )
+        tool = CountingTool()
+        first_worker = HITLToolWrapper(hitl_config).wrap_tools([tool])[0]
+        second_worker = HITLToolWrapper(hitl_config).wrap_tools([tool])[0]
+        config = RunnableConfig(configurable={"thread_id": "thread-1"})
+
+        with patch("langcrew.hitl.tool_wrapper.interrupt") as mock_interrupt:
+            # Approved before execution, the review is still pending
+            mock_interrupt.side_effect = [{"approved": True}, PendingInterrupt]
+            with pytest.raises(PendingInterrupt):
+                await first_worker._arun(query="deploy", config=config)
+        assert tool.execution_count == 1
+
+        with patch("langcrew.hitl.tool_wrapper.interrupt") as mock_interrupt:
+            mock_interrupt.return_value = {"approved": True}
+            result = await second_worker._arun(query="deploy", config=config)
+
+        assert result == "Execution #1: deploy"
+        assert tool.execution_count == 1
+        assert len(shared_backend) == 0
+
+    async def test_execution_id_independent_of_argument_order(self):
+        wrapper = HITLToolWrapper(HITLConfig(interrupt_before_tools=["custom_search"]))
+        wrapped_tool = wrapper.wrap_tools([CustomTool()])[0]
+        with patch("langcrew.hitl.tool_wrapper.interrupt") as mock_interrupt:
+            mock_interrupt.return_value = {"approved": True}
+            await wrapped_tool._arun(query="a", limit=5)
+            await wrapped_tool._arun(limit=5, query="a")
+        first, second = (call[0][0] for call in mock_interrupt.call_args_list)
+        assert first["execution_id"] == second["execution_id"]
+        assert first["execution_id"].startswith("default_custom_search:")
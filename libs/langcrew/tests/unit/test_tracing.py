@@ -0,0 +1,169 @@
+"""
+Unit tests for OpenTelemetry crew run tracing.
+
+Tests run a LangGraph agent (streaming model, tool node, checkpointer) with
+tracing enabled and check the span tree, attributes and sampling.
+"""
+
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import START, StateGraph
+from langgraph.graph.message import add_messages
+from langgraph.prebuilt import ToolNode, tools_condition
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from langcrew.utils.tracing import (
+    _handler,
+    _usage_attributes,
+    configure_tracing,
+    trace_checkpointer,
+    trace_span,
+    with_tracing,
+)
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.protocol import TaskInput
+
+from .web.test_stream_engine import ToolCallingFakeModel
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+@tool
+async def lookup(query: str) -> str:
+    """Look up a query."""
+    with trace_span("s3.read_object", {"s3.bucket": "docs"}):
+        return f"result for {query}"
+
+
+def _graph():
+    model = ToolCallingFakeModel(
+        messages=iter([
+            AIMessage(
+                content="Let me check",
+                tool_calls=[{"name": "lookup", "args": {"query": "docs"}, "id": "c1"}],
+            ),
+            AIMessage(content="All done"),
+        ])
+    )
+
+    async def agent(state: State):
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    builder = StateGraph(State)
+    builder.add_node("agent", agent)
+    builder.add_node("tools", ToolNode([lookup]))
+    builder.add_edge(START, "agent")
+    builder.add_conditional_edges("agent", tools_condition)
+    builder.add_edge("tools", "agent")
+    return builder.compile(checkpointer=InMemorySaver())
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    monkeypatch.delenv("OTEL_SDK_DISABLED", raising=False)
+    provider = TracerProvider()
+    provider.exporter = InMemorySpanExporter()
+    provider.add_span_processor(SimpleSpanProcessor(provider.exporter))
+    configure_tracing(enabled=True, sample_ratio=1.0, tracer_provider=provider)
+    yield provider
+    configure_tracing(enabled=False, sample_ratio=1.0)
+
+
+async def _run(engine: str = "events") -> None:
+    adapter = LangGraphAdapter(compiled_graph=_graph(), engine=engine)
+    async for _ in adapter.execute(TaskInput(session_id="s1", message="hi")):
+        pass
+
+
+def _parent_name(span, spans) -> str | None:
+    if span.parent is None:
+        return None
+    by_id = {s.context.span_id: s.name for s in spans}
+    return by_id.get(span.parent.span_id)
+
+
+class TestTracing:
+    """Test cases for crew run tracing."""
+
+    @pytest.mark.parametrize("engine", LangGraphAdapter.ENGINES)
+    async def test_span_tree(self, provider, engine):
+        await _run(engine)
+        spans = provider.exporter.get_finished_spans()
+        parents = {(s.name, _parent_name(s, spans)) for s in spans}
+
+        assert ("langcrew.crew", "super_agent_start") in parents
+        assert ("langcrew.node agent", "langcrew.crew") in parents
+        assert ("langcrew.node tools", "langcrew.crew") in parents
+        assert ("chat", "langcrew.node agent") in parents
+        assert ("execute_tool lookup", "langcrew.node tools") in parents
+        assert ("s3.read_object", "execute_tool lookup") in parents
+        assert ("langcrew.checkpoint.load", "langcrew.crew") in parents
+        assert ("langcrew.checkpoint.save", "langcrew.crew") in parents
+
+        crew = next(s for s in spans if s.name == "langcrew.crew")
+        assert crew.attributes["langcrew.thread_id"] == "s1"
+        model = next(s for s in spans if s.name == "chat")
+        assert [event.name for event in model.events] == ["first_token"]
+        tool_span = next(s for s in spans if s.name == "execute_tool lookup")
+        assert tool_span.attributes["gen_ai.tool.call.id"] == "c1"
+        # Finished runs leave no state behind
+        assert not _handler._scopes and not _handler._spans
+        assert not _handler._threads
+
+    async def test_sampled_out_run_has_no_spans(self, provider):
+        configure_tracing(enabled=True, sample_ratio=0.0, tracer_provider=provider)
+        await _run()
+        names = {s.name for s in provider.exporter.get_finished_spans()}
+        assert names == {"super_agent_start"}
+
+    def test_disabled_leaves_config_untouched(self):
+        configure_tracing(enabled=False)
+        config = {"configurable": {"thread_id": "t"}}
+        assert with_tracing(config) is config
+        with trace_span("sandbox.get") as span:
+            assert span is None
+
+    def test_handler_attached_once(self, provider):
+        config = with_tracing(with_tracing({}))
+        assert len(config["callbacks"]) == 1
+
+    def test_trace_checkpointer_idempotent(self):
+        saver = InMemorySaver()
+        trace_checkpointer(saver)
+        wrapped = saver.aput
+        trace_checkpointer(saver)
+        assert saver.aput is wrapped
+        assert trace_checkpointer(None) is None
+
+    def test_usage_attributes(self):
+        message = AIMessage(
+            content="hi",
+            usage_metadata={
+                "input_tokens": 120,
+                "output_tokens": 8,
+                "total_tokens": 128,
+                "input_token_details": {"cache_read": 100},
+            },
+        )
+        result = LLMResult(generations=[[ChatGeneration(message=message)]])
+        assert _usage_attributes(result) == {
+            "gen_ai.usage.input_tokens": 120,
+            "gen_ai.usage.output_tokens": 8,
+            "gen_ai.usage.cache_read_input_tokens": 100,
+            "langcrew.cache_hit": True,
+        }
+
+    def test_invalid_sample_ratio(self):
+        with pytest.raises(ValueError):
+            configure_tracing(sample_ratio=1.5)
@@ -0,0 +1,358 @@
+"""
+Unit tests for langcrew.tools.astream_tool module.
+
+Tests the run-scoped state of streaming tools: concurrent invocations of one
+tool instance, external completions routed by tool call, run and thread, and
+stop signals of GraphStreamingBaseTool runs. Also tests batched dispatch of
+intermediate events and the conversion of batches by the crew hook and
+LangGraphAdapter, and sync invocations running on the shared bridge loop.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+import pytest
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import RunnableLambda
+
+from langcrew.tools import (
+    EventType,
+    GraphStreamingBaseTool,
+    StreamEventType,
+    StreamingBaseTool,
+    StreamRunState,
+)
+from langcrew.tools.astream_tool import STREAM_EVENT_BATCH
+from langcrew.utils.async_utils import get_async_bridge, run_coroutine
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.protocol import MessageType
+
+
+@dataclass
+class CounterRunState(StreamRunState):
+    steps: list[str] = field(default_factory=list)
+
+
+class CounterTool(StreamingBaseTool):
+    name: str = "counter"
+    description: str = "Count steps slowly"
+    run_state_class: ClassVar[type[StreamRunState]] = CounterRunState
+
+    async def _astream_events(self, label: str, steps: int = 3):
+        state = self.run_state
+        yield StreamEventType.START, self.start_standard_stream_event(label)
+        for i in range(steps):
+            await asyncio.sleep(0.02)
+            state.steps.append(f"{label}-{i}")
+            yield (
+                StreamEventType.INTERMEDIATE,
+                self.start_standard_stream_event(state.steps[-1]),
+            )
+        yield StreamEventType.END, self.end_standard_stream_event(",".join(state.steps))
+
+    async def handle_external_completion(
+        self, event_type: EventType, event_data: Any
+    ) -> Any:
+        state = self.run_state
+        return f"stopped {state.tool_call_id} after {len(state.steps)} steps"
+
+
+class GraphTool(GraphStreamingBaseTool):
+    name: str = "graph"
+    description: str = "Run a graph"
+
+    async def _arun_work(self, label: str) -> str:
+        await asyncio.sleep(0.2)
+        return f"done {label}"
+
+
+class ChattyTool(StreamingBaseTool):
+    name: str = "chatty"
+    description: str = "Print lines quickly"
+
+    async def _astream_events(self, lines: int, fail: bool = False):
+        for i in range(lines):
+            yield StreamEventType.INTERMEDIATE, {"line": i}
+            await asyncio.sleep(0.001)
+        if fail:
+            raise RuntimeError("command failed")
+        yield StreamEventType.END, self.end_standard_stream_event(lines)
+
+
+class LoopTool(StreamingBaseTool):
+    name: str = "loop"
+    description: str = "Report the event loop"
+
+    async def _astream_events(self, fail: bool = False):
+        await asyncio.sleep(0)
+        if fail:
+            raise ValueError("tool failed")
+        yield (
+            StreamEventType.END,
+            self.end_standard_stream_event(asyncio.get_running_loop()),
+        )
+
+
+class EventCollector(AsyncCallbackHandler):
+    def __init__(self):
+        self.events = []
+
+    async def on_custom_event(self, name, data, **kwargs):
+        self.events.append((name, data))
+
+    def lines(self) -> list[int]:
+        lines = []
+        for name, data in self.events:
+            batch = data["events"] if name == STREAM_EVENT_BATCH else [data]
+            lines.extend(event["line"] for event in batch)
+        return lines
+
+
+async def run_with_events(
+    tool: StreamingBaseTool, args: dict, collector: EventCollector
+) -> Any:
+    """Run a tool inside a parent run, so it can dispatch custom events"""
+
+    async def parent(tool_input: dict, config) -> Any:
+        return await tool.ainvoke(tool_input, config)
+
+    return await RunnableLambda(parent).ainvoke(args, {"callbacks": [collector]})
+
+
+def tool_call(name: str, call_id: str, args: dict) -> dict:
+    return {"name": name, "args": args, "id": call_id, "type": "tool_call"}
+
+
+def thread(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+async def wait_for_runs(tool: StreamingBaseTool, count: int) -> None:
+    while len(tool.active_runs) < count:
+        await asyncio.sleep(0.005)
+
+
+class TestStreamRunState:
+    """Test cases for concurrent invocations of one StreamingBaseTool"""
+
+    async def test_concurrent_calls_keep_separate_state(self):
+        tool = CounterTool()
+        messages = await asyncio.gather(
+            *(
+                tool.ainvoke(tool_call("counter", f"call-{label}", {"label": label}))
+                for label in ("a", "b", "c")
+            )
+        )
+        assert [m.content for m in messages] == [
+            "a-0,a-1,a-2",
+            "b-0,b-1,b-2",
+            "c-0,c-1,c-2",
+        ]
+        assert tool.active_runs == []
+
+    async def test_run_ids_recorded(self):
+        tool = CounterTool()
+        task = asyncio.create_task(
+            tool.ainvoke(tool_call("counter", "call-1", {"label": "a"}), thread("s1"))
+        )
+        await wait_for_runs(tool, 1)
+        (state,) = tool.active_runs
+        assert isinstance(state, CounterRunState)
+        assert state.run_key == state.tool_call_id == "call-1"
+        assert state.run_id is not None
+        assert state.thread_id == "s1"
+        await task
+
+    async def test_completion_routed_to_tool_call(self):
+        tool = CounterTool(stream_event_timeout_seconds=5)
+        first = asyncio.create_task(
+            tool.ainvoke(tool_call("counter", "call-1", {"label": "a", "steps": 10}))
+        )
+        second = asyncio.create_task(
+            tool.ainvoke(tool_call("counter", "call-2", {"label": "b", "steps": 5}))
+        )
+        await wait_for_runs(tool, 2)
+        await asyncio.sleep(0.03)
+
+        result = await tool.trigger_external_completion(
+            EventType.STOP, True, tool_call_id="call-1"
+        )
+        assert result.startswith("stopped call-1")
+        message = await first
+        assert isinstance(message, ToolMessage)
+        assert message.content == result
+        assert (await second).content == "b-0,b-1,b-2,b-3,b-4"
+
+    async def test_completion_routed_to_thread(self):
+        tool = CounterTool()
+        runs = {
+            session: asyncio.create_task(
+                tool.ainvoke({"label": session, "steps": 10}, thread(session))
+            )
+            for session in ("s1", "s2")
+        }
+        await wait_for_runs(tool, 2)
+
+        result = await tool.trigger_external_completion(
+            EventType.STOP, True, thread_id="s1"
+        )
+        assert result.startswith("stopped None")
+        assert await runs["s1"] == result
+        assert await runs["s2"] == ",".join(f"s2-{i}" for i in range(10))
+        assert (
+            await tool.trigger_external_completion(EventType.STOP, True, thread_id="s1")
+            is None
+        )
+
+    async def test_completion_of_all_runs(self):
+        tool = CounterTool()
+        runs = [
+            asyncio.create_task(
+                tool.ainvoke(tool_call("counter", f"call-{i}", {"label": str(i)}))
+            )
+            for i in range(2)
+        ]
+        await wait_for_runs(tool, 2)
+        results = await tool.trigger_external_completion(EventType.STOP, True)
+        assert len(results) == 2
+        assert {m.content for m in await asyncio.gather(*runs)} == set(results)
+
+    def test_sync_invocation(self):
+        tool = CounterTool()
+        message = tool.invoke(tool_call("counter", "call-1", {"label": "a"}))
+        assert message.content == "a-0,a-1,a-2"
+        assert tool.active_runs == []
+
+
+class TestGraphStreamingBaseTool:
+    """Test cases for stop signals of GraphStreamingBaseTool runs"""
+
+    async def test_stop_routed_to_thread(self):
+        tool = GraphTool()
+        stopped = asyncio.create_task(tool.ainvoke({"label": "a"}, thread("s1")))
+        running = asyncio.create_task(tool.ainvoke({"label": "b"}, thread("s2")))
+        await wait_for_runs(tool, 2)
+
+        result = await tool.trigger_external_completion(
+            EventType.NEW_MESSAGE, "next task", thread_id="s1"
+        )
+        assert result == "Agent add new task: next task"
+        assert await stopped == result
+        assert await running == "done b"
+        assert tool.active_runs == []
+
+
+class TestEventBatching:
+    """Test cases for batched dispatch of intermediate events"""
+
+    async def test_unbatched_by_default(self):
+        collector = EventCollector()
+        await run_with_events(ChattyTool(), {"lines": 5}, collector)
+        assert [name for name, _ in collector.events] == ["chatty"] * 5
+
+    @pytest.mark.parametrize("timeout", [-1, 5])
+    async def test_events_batched_by_size(self, timeout):
+        tool = ChattyTool(
+            stream_event_batch_ms=1000,
+            stream_event_batch_size=4,
+            stream_event_timeout_seconds=timeout,
+        )
+        collector = EventCollector()
+        assert await run_with_events(tool, {"lines": 10}, collector) == 10
+        # Full batches, then the rest flushed on END
+        assert [len(data["events"]) for _, data in collector.events] == [4, 4, 2]
+        assert all(data["name"] == "chatty" for _, data in collector.events)
+        assert collector.lines() == list(range(10))
+
+    async def test_events_batched_by_window(self):
+        class SlowTool(ChattyTool):
+            async def _astream_events(self, lines: int, fail: bool = False):
+                for i in range(lines):
+                    yield StreamEventType.INTERMEDIATE, {"line": i}
+                    await asyncio.sleep(0.03 if i == 2 else 0)
+                yield StreamEventType.END, self.end_standard_stream_event(lines)
+
+        tool = SlowTool(stream_event_batch_ms=10, stream_event_batch_size=100)
+        collector = EventCollector()
+        await run_with_events(tool, {"lines": 5}, collector)
+        assert len(collector.events) == 2
+        assert collector.lines() == list(range(5))
+
+    async def test_events_flushed_on_error(self):
+        tool = ChattyTool(stream_event_batch_ms=1000)
+        collector = EventCollector()
+        with pytest.raises(RuntimeError, match="command failed"):
+            await run_with_events(tool, {"lines": 3, "fail": True}, collector)
+        assert [name for name, _ in collector.events] == [STREAM_EVENT_BATCH]
+        assert collector.lines() == [0, 1, 2]
+
+    async def test_crew_hook_unpacks_batches(self):
+        tool = CounterTool()
+        batch = {
+            "event": "on_custom_event",
+            "name": STREAM_EVENT_BATCH,
+            "run_id": "run-1",
+            "data": {
+                "name": "counter",
+                "events": [
+                    tool.start_standard_stream_event("a-0"),
+                    tool.start_standard_stream_event("a-1"),
+                ],
+            },
+        }
+        events = await tool.custom_event_hook(batch)
+        assert [event["data"] for event in events] == [
+            {"input": "a-0"},
+            {"input": "a-1"},
+        ]
+        assert all(event["run_id"] == "run-1" for event in events)
+        # Batches of other tools are passed on unchanged
+        assert await GraphTool().custom_event_hook(batch) is batch
+
+    def test_adapter_converts_batches(self):
+        event = {
+            "event": "on_custom_event",
+            "name": STREAM_EVENT_BATCH,
+            "run_id": "run-1",
+            "metadata": {},
+            "data": {
+                "name": "on_langcrew_new_message",
+                "events": [{"new_message": "first"}, {"new_message": "second"}],
+            },
+        }
+        messages = LangGraphAdapter(compiled_graph=object())._handle_custom_event(
+            event, "session-1", "task-1", "en"
+        )
+        assert [m.content for m in messages] == ["first", "second"]
+        assert all(m.type == MessageType.TEXT for m in messages)
+
+
+class TestSyncInvocation:
+    """Test cases for sync calls of streaming tools on the shared bridge loop"""
+
+    def test_sync_calls_share_loop(self):
+        tool = LoopTool()
+        first = tool.invoke({})
+        assert tool.invoke({}) is first
+        assert first is get_async_bridge()._loop
+        assert first.is_running()
+
+    def test_errors_raised(self):
+        with pytest.raises(ValueError, match="tool failed"):
+            LoopTool().invoke({"fail": True})
+
+    async def test_sync_call_from_running_loop(self):
+        assert LoopTool().invoke({}) is not asyncio.get_running_loop()
+
+    def test_run_coroutine_rejected_on_bridge_loop(self):
+        async def nested():
+            return run_coroutine(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError, match="bridge loop itself"):
+            run_coroutine(nested())
+
+    def test_run_coroutine_timeout(self):
+        with pytest.raises(TimeoutError):
+            run_coroutine(asyncio.sleep(1), timeout=0.01)
@@ -0,0 +1,119 @@
+"""
+Unit tests for langcrew.tools.mcp module.
+
+Tests MCPToolAdapter's concurrent server loading, per-server timeouts and the
+process-wide tool schema cache, with a fake MultiServerMCPClient.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake import FakeListLLM
+from langchain_core.tools import StructuredTool
+
+from langcrew.agent import Agent
+from langcrew.tools.mcp import MCPToolAdapter
+
+SERVERS = {
+    "search": {"command": "search-server", "transport": "stdio"},
+    "files": {"command": "files-server", "transport": "stdio"},
+}
+
+
+class FakeMCPClient:
+    """MultiServerMCPClient listing one tool per server after a delay."""
+
+    calls: Counter = Counter()
+
+    def __init__(self, connections, **kwargs):
+        self.connections = connections
+
+    async def get_tools(self, server_name):
+        FakeMCPClient.calls[server_name] += 1
+        await asyncio.sleep(self.connections[server_name].get("delay", 0.1))
+        return [
+            StructuredTool.from_function(
+                func=lambda: server_name,
+                name=f"{server_name}_tool",
+                description=f"Tool of {server_name}",
+            )
+        ]
+
+
+@pytest.fixture(autouse=True)
+def fake_client():
+    """Patch the MCP client and start from an empty cache."""
+    MCPToolAdapter.clear_cache()
+    FakeMCPClient.calls.clear()
+    with patch("langcrew.tools.mcp.MultiServerMCPClient", FakeMCPClient):
+        yield
+    MCPToolAdapter.clear_cache()
+
+
+class TestMCPToolAdapter:
+    """Test cases for MCPToolAdapter.from_servers."""
+
+    async def test_servers_loaded_concurrently(self):
+        start = time.perf_counter()
+        tools = await MCPToolAdapter().from_servers(SERVERS)
+        elapsed = time.perf_counter() - start
+
+        assert [t.name for t in tools] == ["search_tool", "files_tool"]
+        assert elapsed < 0.18
+
+    async def test_tool_filter(self):
+        tools = await MCPToolAdapter().from_servers(SERVERS, tool_filter=["files_tool"])
+        assert [t.name for t in tools] == ["files_tool"]
+
+    async def test_server_timeout(self):
+        servers = {**SERVERS, "slow": {"command": "slow-server", "delay": 5}}
+        start = time.perf_counter()
+        with pytest.raises(ConnectionError, match="'slow': no response within 0.2s"):
+            await MCPToolAdapter(timeout=0.2).from_servers(servers)
+        assert time.perf_counter() - start < 1
+
+        # Servers that answered are cached, the slow one is not
+        assert MCPToolAdapter().from_cache(SERVERS) is not None
+        assert MCPToolAdapter().from_cache(servers) is None
+
+    async def test_concurrent_adapters_share_one_load(self):
+        first, second = await asyncio.gather(
+            MCPToolAdapter().from_servers(SERVERS),
+            MCPToolAdapter().from_servers({"search": SERVERS["search"]}),
+        )
+        assert FakeMCPClient.calls == {"search": 1, "files": 1}
+        assert first[0] is second[0]
+
+        again = await MCPToolAdapter().from_servers(SERVERS)
+        assert FakeMCPClient.calls == {"search": 1, "files": 1}
+        assert again == first
+
+    async def test_cache_keyed_by_config_and_ttl(self):
+        await MCPToolAdapter().from_servers(SERVERS)
+
+        changed = {**SERVERS, "search": {**SERVERS["search"], "args": ["--v2"]}}
+        assert MCPToolAdapter().from_cache(changed) is None
+        await MCPToolAdapter(schema_ttl=0.05).from_servers(changed)
+        assert FakeMCPClient.calls == {"search": 2, "files": 1}
+
+        await asyncio.sleep(0.06)
+        assert MCPToolAdapter().from_cache(changed) is None
+
+    def test_agents_share_tools(self):
+        agents = [
+            Agent(
+                role=f"Agent {i}",
+                goal="Help",
+                backstory="Helpful",
+                llm=FakeListLLM(responses=["ok"]),
+                mcp_servers=SERVERS,
+            )
+            for i in range(3)
+        ]
+
+        assert FakeMCPClient.calls == {"search": 1, "files": 1}
+        assert agents[0]._mcp_tools[0] is agents[2]._mcp_tools[0]
+        assert agents[1]._mcp_tools is not agents[2]._mcp_tools
@@ -0,0 +1,217 @@
+"""
+Unit tests for langcrew.tools.mcp_sessions module.
+
+Tests the pooled MCP sessions with a fake session factory (pool growth,
+concurrency limit, idle reaping, health checks, reconnect backoff) and with a
+real stdio FastMCP server called through MCPToolAdapter tools.
+"""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from langcrew.tools.mcp import MCPToolAdapter
+from langcrew.tools.mcp_sessions import MCPSessionManager
+
+
+class FakeSession:
+    """ClientSession answering tool calls after a delay."""
+
+    opened = 0
+    active_calls = 0
+    peak_calls = 0
+
+    def __init__(self):
+        FakeSession.opened += 1
+        self.number = FakeSession.opened
+        self.ping_error: Exception | None = None
+        self.exited = False
+
+    async def initialize(self):
+        pass
+
+    async def send_ping(self):
+        if self.ping_error:
+            raise self.ping_error
+
+    async def call_tool(self, name, arguments=None):
+        FakeSession.active_calls += 1
+        FakeSession.peak_calls = max(FakeSession.peak_calls, FakeSession.active_calls)
+        try:
+            await asyncio.sleep(arguments.get("delay", 0))
+            if arguments.get("fail"):
+                raise BrokenPipeError("server exited")
+        finally:
+            FakeSession.active_calls -= 1
+        return CallToolResult(content=[TextContent(type="text", text=str(self.number))])
+
+
+@pytest.fixture
+def sessions():
+    """Patch create_session with FakeSessions, collecting them."""
+    FakeSession.opened = FakeSession.peak_calls = 0
+    created: list[FakeSession] = []
+    failures: list[Exception] = []
+
+    @asynccontextmanager
+    async def create_session(connection, mcp_callbacks=None):
+        if failures:
+            raise failures.pop(0)
+        session = FakeSession()
+        created.append(session)
+        try:
+            yield session
+        finally:
+            session.exited = True
+
+    with patch("langcrew.tools.mcp_sessions.create_session", create_session):
+        yield created, failures
+
+
+def _pool(manager: MCPSessionManager):
+    return manager.get_pool("server", {"command": "server", "transport": "stdio"})
+
+
+class TestMCPServerPool:
+    """Test cases for MCPServerPool."""
+
+    async def test_sessions_reused_and_grown_when_busy(self, sessions):
+        created, _ = sessions
+        manager = MCPSessionManager(max_sessions=2, max_concurrency=3)
+        pool = _pool(manager)
+
+        for _ in range(3):
+            await pool.call_tool("tool", {})
+        assert len(created) == 1
+
+        results = await asyncio.gather(
+            *(pool.call_tool("tool", {"delay": 0.05}) for _ in range(6))
+        )
+        assert len(created) == 2
+        assert {r.content[0].text for r in results} == {"1", "2"}
+        assert FakeSession.peak_calls == 3
+        await manager.aclose()
+        assert all(session.exited for session in created)
+
+    async def test_idle_sessions_closed(self, sessions):
+        created, _ = sessions
+        manager = MCPSessionManager(idle_timeout=0.05, health_check_interval=0.02)
+        pool = _pool(manager)
+
+        await pool.call_tool("tool", {})
+        assert pool.size == 1
+        await asyncio.sleep(0.15)
+        assert pool.size == 0
+        assert created[0].exited
+
+    async def test_failed_health_check_reconnects(self, sessions):
+        created, _ = sessions
+        manager = MCPSessionManager(health_check_interval=0.02)
+        pool = _pool(manager)
+
+        await pool.call_tool("tool", {})
+        created[0].ping_error = TimeoutError()
+        await asyncio.sleep(0.05)
+        assert created[0].exited
+
+        result = await pool.call_tool("tool", {})
+        assert result.content[0].text == "2"
+        await manager.aclose()
+
+    async def test_transport_failure_drops_session(self, sessions):
+        created, _ = sessions
+        manager = MCPSessionManager()
+        pool = _pool(manager)
+
+        with pytest.raises(BrokenPipeError):
+            await pool.call_tool("tool", {"fail": True})
+        assert created[0].exited
+        assert (await pool.call_tool("tool", {})).content[0].text == "2"
+        await manager.aclose()
+
+    async def test_call_timeout_keeps_session(self, sessions):
+        created, _ = sessions
+        manager = MCPSessionManager(call_timeout=0.02)
+        pool = _pool(manager)
+
+        with pytest.raises(TimeoutError, match="did not answer within 0.02s"):
+            await pool.call_tool("tool", {"delay": 1})
+        assert not created[0].exited
+        assert (await pool.call_tool("tool", {})).content[0].text == "1"
+        await manager.aclose()
+
+    async def test_reconnect_backoff(self, sessions):
+        _, failures = sessions
+        failures.extend([OSError("spawn failed"), OSError("spawn failed")])
+        manager = MCPSessionManager()
+        pool = _pool(manager)
+
+        loop = asyncio.get_running_loop()
+        with patch("langcrew.tools.mcp_sessions.RECONNECT_BACKOFF_BASE", 0.1):
+            with pytest.raises(ConnectionError, match="retry in 0.1s"):
+                await pool.call_tool("tool", {})
+            start = loop.time()
+            with pytest.raises(ConnectionError, match="retry in 0.2s"):
+                await pool.call_tool("tool", {})
+            assert loop.time() - start >= 0.09
+
+            start = loop.time()
+            assert (await pool.call_tool("tool", {})).content[0].text == "1"
+            assert loop.time() - start >= 0.19
+        await manager.aclose()
+
+
+SERVER = """
+import os
+
+from mcp.server.fastmcp import FastMCP
+
+server = FastMCP("pid", log_level="WARNING")
+
+
+@server.tool()
+def pid() -> str:
+    \"\"\"Process ID of the server.\"\"\"
+    return str(os.getpid())
+
+
+server.run()
+"""
+
+
+class TestPooledMCPTools:
+    """Test cases for MCPToolAdapter tools called on pooled sessions."""
+
+    @pytest.fixture
+    def servers(self, tmp_path):
+        script = tmp_path / "pid_server.py"
+        script.write_text(SERVER)
+        MCPToolAdapter.clear_cache()
+        yield {
+            "pid": {
+                "command": sys.executable,
+                "args": [str(script)],
+                "transport": "stdio",
+            }
+        }
+        MCPToolAdapter.clear_cache()
+
+    async def _pids(self, adapter: MCPToolAdapter, servers) -> set[str]:
+        (tool,) = await adapter.from_servers(servers)
+        results = [await tool.ainvoke({}) for _ in range(3)]
+        return {result[0]["text"] for result in results}
+
+    async def test_calls_share_one_server_process(self, servers):
+        manager = MCPSessionManager()
+        pids = await self._pids(MCPToolAdapter(session_manager=manager), servers)
+        await manager.aclose()
+        assert len(pids) == 1
+
+    async def test_without_pool_each_call_spawns_server(self, servers, monkeypatch):
+        monkeypatch.setenv("LANGCREW_MCP_SESSION_POOL", "false")
+        pids = await self._pids(MCPToolAdapter(), servers)
+        assert len(pids) == 3
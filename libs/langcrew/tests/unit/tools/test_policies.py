@@ -0,0 +1,204 @@
+"""
+Unit tests for langcrew.tools.policies module.
+
+Tests ToolPolicyWrapper's concurrency limits, timeouts, retries and circuit
+breakers on sync and async tools, the error ToolMessages of rejected calls
+and the breaker metrics of RunMetrics.
+"""
+
+import asyncio
+import time
+from collections import Counter
+
+import pytest
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool, ToolException, tool
+
+from langcrew.tools.policies import (
+    CircuitState,
+    ToolPolicy,
+    ToolPolicyWrapper,
+)
+from langcrew.web.metrics import RunMetrics
+
+calls: Counter = Counter()
+
+
+class CrawlTool(BaseTool):
+    name: str = "crawl"
+    description: str = "Crawl a page"
+    delay: float = 0.05
+    failures: int = 0  # Calls that fail before the backend recovers
+    active: int = 0
+    peak: int = 0
+
+    def _run(self, url: str) -> str:
+        raise NotImplementedError
+
+    async def _arun(self, url: str) -> str:
+        calls["crawl"] += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if calls["crawl"] <= self.failures:
+            raise ConnectionError("backend unavailable")
+        return f"page {url}"
+
+
+@tool
+def slow_lookup(key: str) -> str:
+    """Look up a key slowly"""
+    calls["slow_lookup"] += 1
+    time.sleep(0.3)
+    return key
+
+
+@tool
+def strict_tool(key: str) -> str:
+    """Tool reporting its own errors"""
+    calls["strict_tool"] += 1
+    raise ToolException("invalid key")
+
+
+def tool_call(args: dict) -> dict:
+    return {"name": "crawl", "args": args, "id": "call-1", "type": "tool_call"}
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+class TestToolPolicyWrapper:
+    """Test cases for ToolPolicyWrapper"""
+
+    async def test_concurrency_limit(self):
+        crawl = CrawlTool()
+        wrapped = ToolPolicyWrapper({"crawl": ToolPolicy(max_concurrency=2)}).wrap_tool(
+            crawl
+        )
+        await asyncio.gather(*(wrapped.ainvoke({"url": str(i)}) for i in range(6)))
+        assert calls["crawl"] == 6
+        assert crawl.peak == 2
+
+    async def test_timeout_returns_error_message(self):
+        wrapped = ToolPolicyWrapper({"crawl": ToolPolicy(timeout=0.01)}).wrap_tool(
+            CrawlTool()
+        )
+        message = await wrapped.ainvoke(tool_call({"url": "a"}))
+        assert isinstance(message, ToolMessage)
+        assert message.status == "error"
+        assert "did not respond within 0.01s" in message.content
+
+    async def test_retries_until_success(self):
+        wrapped = ToolPolicyWrapper({
+            "crawl": ToolPolicy(retries=2, retry_backoff=0.01)
+        }).wrap_tool(CrawlTool(failures=2))
+        assert await wrapped.ainvoke({"url": "a"}) == "page a"
+        assert calls["crawl"] == 3
+
+    async def test_breaker_fails_fast_and_recovers(self):
+        policies = ToolPolicyWrapper({
+            "crawl": ToolPolicy(failure_threshold=2, recovery_timeout=0.1)
+        })
+        wrapped = policies.wrap_tool(CrawlTool(failures=3))
+        breaker = policies.states["crawl"].breaker
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await wrapped.ainvoke({"url": "a"})
+        assert breaker.state == CircuitState.OPEN
+
+        start = time.perf_counter()
+        message = await wrapped.ainvoke(tool_call({"url": "a"}))
+        assert time.perf_counter() - start < 0.01
+        assert message.status == "error"
+        assert "temporarily unavailable" in message.content
+        assert calls["crawl"] == 2
+
+        # A failed trial call opens the breaker again
+        await asyncio.sleep(0.1)
+        with pytest.raises(ConnectionError):
+            await wrapped.ainvoke({"url": "a"})
+        assert "temporarily unavailable" in await wrapped.ainvoke({"url": "a"})
+
+        await asyncio.sleep(0.1)
+        assert await wrapped.ainvoke({"url": "a"}) == "page a"
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.rejections == 2
+
+    async def test_only_one_trial_call_when_half_open(self):
+        policies = ToolPolicyWrapper({
+            "crawl": ToolPolicy(failure_threshold=1, recovery_timeout=0.05)
+        })
+        wrapped = policies.wrap_tool(CrawlTool(failures=1))
+        with pytest.raises(ConnectionError):
+            await wrapped.ainvoke({"url": "a"})
+        await asyncio.sleep(0.05)
+
+        results = await asyncio.gather(
+            *(wrapped.ainvoke(tool_call({"url": "a"})) for _ in range(3))
+        )
+        assert calls["crawl"] == 2
+        assert [r.status for r in results].count("error") == 2
+
+    def test_sync_tool_timeout(self):
+        wrapped = ToolPolicyWrapper({
+            "slow_lookup": ToolPolicy(timeout=0.05)
+        }).wrap_tool(slow_lookup)
+        start = time.perf_counter()
+        result = wrapped.invoke({"key": "a"})
+        assert time.perf_counter() - start < 0.25
+        assert "did not respond" in result
+
+    async def test_sync_call_from_async_code(self):
+        wrapped = ToolPolicyWrapper({
+            "slow_lookup": ToolPolicy(timeout=0.05)
+        }).wrap_tool(slow_lookup)
+        start = time.perf_counter()
+        # Sync invoke on a thread with a running loop still gets the policy
+        result = wrapped.invoke({"key": "a"})
+        assert time.perf_counter() - start < 0.25
+        assert "did not respond" in result
+
+    async def test_timed_out_sync_tool_keeps_slot(self):
+        policies = ToolPolicyWrapper({
+            "slow_lookup": ToolPolicy(max_concurrency=1, timeout=0.05)
+        })
+        wrapped = policies.wrap_tool(slow_lookup)
+        state = policies.states["slow_lookup"]
+
+        assert "did not respond" in await wrapped.ainvoke({"key": "a"})
+        assert state.in_flight == 1
+        await asyncio.sleep(0.3)
+        assert state.in_flight == 0
+
+    async def test_tool_errors_unchanged(self):
+        policies = ToolPolicyWrapper({
+            "strict_tool": ToolPolicy(retries=2, failure_threshold=1)
+        })
+        wrapped = policies.wrap_tool(strict_tool)
+        with pytest.raises(ToolException, match="invalid key"):
+            await wrapped.ainvoke({"key": "a"})
+        # Errors reported by the tool are neither retried nor counted
+        assert calls["strict_tool"] == 1
+        assert policies.states["strict_tool"].breaker.state == CircuitState.CLOSED
+
+    def test_breaker_metrics(self):
+        policies = ToolPolicyWrapper({
+            "monitored_crawl": ToolPolicy(failure_threshold=1, max_concurrency=4)
+        })
+        wrapped = policies.wrap_tool(CrawlTool(name="monitored_crawl", failures=1))
+        with pytest.raises(ConnectionError):
+            asyncio.run(wrapped.ainvoke({"url": "a"}))
+
+        registry = RunMetrics().registry
+        labels = {"tool": "monitored_crawl"}
+        assert registry.get_sample_value("langcrew_tool_circuit_state", labels) == 1
+        assert (
+            registry.get_sample_value("langcrew_tool_consecutive_failures", labels) == 1
+        )
+        assert registry.get_sample_value("langcrew_tool_calls_in_flight", labels) == 0
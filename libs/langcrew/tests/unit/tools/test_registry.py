@@ -5,6 +5,7 @@ Tests the ToolRegistry functionality including tool registration, discovery,
 caching, naming conventions, and error handling.
 """
 
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -359,8 +360,8 @@ class TestToolRegistryDiscovery:
         mock_nonexistent.exists.return_value = False
 
         # Configure the __truediv__ method using side_effect
-        mock_current_dir.__truediv__.side_effect = (
-            lambda path: mock_tools_dir if path == "tools" else mock_nonexistent
+        mock_current_dir.__truediv__.side_effect = lambda path: (
+            mock_tools_dir if path == "tools" else mock_nonexistent
         )
         mock_parent_dir.__truediv__.side_effect = lambda path: mock_nonexistent
         mock_grandparent_dir.__truediv__.side_effect = lambda path: mock_nonexistent
@@ -1007,3 +1008,136 @@ class TestToolRegistryPerformance:
         # With provider prefix, should get provider-specific tool
         langchain_tool = ToolRegistry.get_tool("langchain:conflict_tool")
         assert isinstance(langchain_tool, AnotherMockTool)
+
+
+class TestToolRegistryDiscoveryIndex:
+    """Test the persisted tool discovery index."""
+
+    TOOL_FILE = """
+from pathlib import Path
+
+from langchain_core.tools import BaseTool
+
+with open(Path(__file__).parent.parent / "imports.log", "a") as log:
+    log.write("{name}\\n")
+
+class IndexedTool(BaseTool):
+    name: str = "{name}"
+    description: str = "A tool found through the discovery index"
+
+    def _run(self) -> str:
+        return "indexed result"
+"""
+
+    @pytest.fixture(autouse=True)
+    def tool_index(self, tmp_path, monkeypatch):
+        """Use an index file in tmp_path and reset indexed tools."""
+        monkeypatch.setenv("LANGCREW_TOOL_INDEX", str(tmp_path / "index.json"))
+        ToolRegistry._index = None
+        for provider_tools in ToolRegistry._indexed_tools.values():
+            provider_tools.clear()
+        yield
+        ToolRegistry._index = None
+        for provider_tools in ToolRegistry._indexed_tools.values():
+            provider_tools.clear()
+
+    @staticmethod
+    def _restart():
+        """Forget discovered tools, as a new process would."""
+        ToolRegistry._index = None
+        ToolRegistry._tool_cache.clear()
+        for provider_tools in ToolRegistry._discovered_tools.values():
+            provider_tools.clear()
+        for provider_tools in ToolRegistry._indexed_tools.values():
+            provider_tools.clear()
+
+    def _scan(self, tmp_path):
+        ToolRegistry._scan_directory_for_tools(
+            tmp_path / "tools", ToolRegistryConfig.CUSTOM_PROVIDER
+        )
+
+    def _imports(self, tmp_path) -> list[str]:
+        return (tmp_path / "imports.log").read_text().split()
+
+    def test_unchanged_file_imported_on_request(self, tmp_path):
+        """Test that indexed files are only imported when a tool is requested."""
+        tools_dir = tmp_path / "tools"
+        tools_dir.mkdir()
+        (tools_dir / "indexed.py").write_text(self.TOOL_FILE.format(name="indexed"))
+        self._scan(tmp_path)
+        assert self._imports(tmp_path) == ["indexed"]
+
+        self._restart()
+        self._scan(tmp_path)
+        assert self._imports(tmp_path) == ["indexed"]
+        assert "indexed" in ToolRegistry.list_tools()
+
+        tool = ToolRegistry.get_tool("indexed")
+        assert tool._run() == "indexed result"
+        assert self._imports(tmp_path) == ["indexed", "indexed"]
+        assert not ToolRegistry._indexed_tools[ToolRegistryConfig.CUSTOM_PROVIDER]
+
+    def test_changed_file_rescanned(self, tmp_path):
+        """Test that files changed since indexing are imported again."""
+        tools_dir = tmp_path / "tools"
+        tools_dir.mkdir()
+        tool_file = tools_dir / "indexed.py"
+        tool_file.write_text(self.TOOL_FILE.format(name="before"))
+        self._scan(tmp_path)
+
+        self._restart()
+        tool_file.write_text(self.TOOL_FILE.format(name="after_change"))
+        self._scan(tmp_path)
+        assert self._imports(tmp_path) == ["before", "after_change"]
+        custom_tools = ToolRegistry._discovered_tools[
+            ToolRegistryConfig.CUSTOM_PROVIDER
+        ]
+        assert "after_change" in custom_tools
+
+        # The index now holds the new name only
+        self._restart()
+        self._scan(tmp_path)
+        assert ToolRegistry.list_tools() == ["after_change"]
+
+    def test_external_package_indexed_by_version(self):
+        """Test that an indexed package version is not imported at discovery."""
+        package = Mock()
+        package.MockTool = MockTool
+
+        with (
+            patch("langcrew.tools.index.package_version", return_value="1.0"),
+            patch("langcrew.tools.registry.importlib.import_module") as mock_import,
+        ):
+            mock_import.return_value = package
+            ToolRegistry._discover_external_tools("crewai_tools")
+            mock_import.assert_called_once_with("crewai_tools")
+
+            self._restart()
+            mock_import.reset_mock()
+            mock_import.return_value = sys.modules[__name__]
+            ToolRegistry._discover_external_tools("crewai_tools")
+            mock_import.assert_not_called()
+
+            tool = ToolRegistry.get_tool("crewai:mock_tool")
+            assert isinstance(tool, MockTool)
+            mock_import.assert_called_once_with(MockTool.__module__)
+
+    def test_tool_name_read_without_instantiation(self):
+        """Test that tool names come from field defaults."""
+
+        class ExpensiveTool(BaseTool):
+            name: str = "expensive_tool"
+            description: str = "Connects to a service when constructed"
+
+            def __init__(self):
+                raise RuntimeError("Should not be constructed")
+
+            def _run(self) -> str:
+                return "never reached"
+
+        module = Mock()
+        module.ExpensiveTool = ExpensiveTool
+        ToolRegistry._extract_tools_from_module(
+            module, ToolRegistryConfig.CUSTOM_PROVIDER
+        )
+        assert "expensive_tool" in ToolRegistry.list_tools()
@@ -0,0 +1,270 @@
+"""
+Unit tests for langcrew.tools.result_cache module.
+
+Tests ToolResultCache wrapping of sync and async tools: argument
+normalization, TTL, size limits, LRU eviction, single-flight of concurrent
+identical calls, cache-hit events and integration with Agent and ToolRegistry.
+"""
+
+import asyncio
+from collections import Counter
+from typing import Any
+
+import pytest
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.language_models.fake import FakeListLLM
+from langchain_core.tools import BaseTool, tool
+from pydantic import BaseModel, Field
+
+from langcrew.agent import Agent
+from langcrew.tools.registry import ToolRegistry
+from langcrew.tools.result_cache import (
+    CACHE_HIT_EVENT,
+    InMemoryToolResultCache,
+    ToolCachePolicy,
+    ToolResultCache,
+)
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.protocol import MessageType
+
+calls: Counter = Counter()
+
+
+class SearchInput(BaseModel):
+    query: str = Field(description="Search query")
+    limit: int | None = Field(default=None, description="Number of results")
+
+
+class WebSearchTool(BaseTool):
+    name: str = "web_search"
+    description: str = "Search the web"
+    args_schema: type[BaseModel] = SearchInput
+
+    def _run(self, query: str, limit: int | None = None) -> str:
+        raise NotImplementedError
+
+    async def _arun(self, query: str, limit: int | None = None) -> dict[str, Any]:
+        calls["web_search"] += 1
+        await asyncio.sleep(0.05)
+        if query == "fail":
+            raise ValueError("search failed")
+        return {"query": query, "results": [f"result {calls['web_search']}"]}
+
+
+@tool
+def fetch_page(url: str) -> str:
+    """Fetch a page"""
+    calls["fetch_page"] += 1
+    return f"<html>{url} {calls['fetch_page']}</html>"
+
+
+@tool
+def write_file(path: str) -> str:
+    """Write a file"""
+    calls["write_file"] += 1
+    return "written"
+
+
+class EventCollector(AsyncCallbackHandler):
+    def __init__(self):
+        self.events = []
+
+    async def on_custom_event(self, name, data, **kwargs):
+        self.events.append((name, data))
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def cache():
+    return ToolResultCache({"web_search": ToolCachePolicy(ttl=60), "fetch_page": 60})
+
+
+class TestToolResultCache:
+    """Test cases for ToolResultCache"""
+
+    async def test_results_shared_across_wrapped_instances(self, cache):
+        first = cache.wrap_tool(WebSearchTool())
+        second = cache.wrap_tool(WebSearchTool())
+
+        result = await first.ainvoke({"query": "langcrew"})
+        assert await second.ainvoke({"query": "langcrew", "limit": None}) == result
+        assert calls["web_search"] == 1
+
+        await second.ainvoke({"query": "langcrew", "limit": 5})
+        assert calls["web_search"] == 2
+
+    async def test_tools_without_policy_not_wrapped(self, cache):
+        assert cache.wrap_tool(write_file) is write_file
+        wrapped = cache.wrap_tool(fetch_page)
+        assert wrapped is not fetch_page
+        assert cache.wrap_tool(wrapped) is wrapped
+
+    async def test_ttl_expiry(self):
+        cache = ToolResultCache({"web_search": 0.05})
+        search = cache.wrap_tool(WebSearchTool())
+
+        await search.ainvoke({"query": "a"})
+        await search.ainvoke({"query": "a"})
+        assert calls["web_search"] == 1
+        await asyncio.sleep(0.06)
+        await search.ainvoke({"query": "a"})
+        assert calls["web_search"] == 2
+
+    async def test_concurrent_identical_calls_share_execution(self, cache):
+        search = cache.wrap_tool(WebSearchTool())
+        results = await asyncio.gather(
+            *(search.ainvoke({"query": "same"}) for _ in range(5))
+        )
+        assert calls["web_search"] == 1
+        assert all(result == results[0] for result in results)
+
+    async def test_cancelled_call_run_by_a_waiter(self, cache):
+        search = cache.wrap_tool(WebSearchTool())
+        first = asyncio.create_task(search.ainvoke({"query": "same"}))
+        await asyncio.sleep(0.01)
+        waiters = [
+            asyncio.create_task(search.ainvoke({"query": "same"})) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        results = await asyncio.gather(*waiters)
+        assert first.cancelled()
+        assert calls["web_search"] == 2
+        assert all(result == results[0] for result in results)
+
+    async def test_cancelled_while_storing(self):
+        class SlowBackend(InMemoryToolResultCache):
+            def __init__(self):
+                super().__init__()
+                self.storing = asyncio.Event()
+
+            async def set(self, key, value, ttl):
+                if not self.storing.is_set():
+                    self.storing.set()
+                    await asyncio.sleep(3600)
+                await super().set(key, value, ttl)
+
+        backend = SlowBackend()
+        search = ToolResultCache({"web_search": 60}, backend).wrap_tool(WebSearchTool())
+        leader = asyncio.create_task(search.ainvoke({"query": "same"}))
+        await backend.storing.wait()
+        waiter = asyncio.create_task(search.ainvoke({"query": "same"}))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert (await asyncio.wait_for(waiter, 1))["query"] == "same"
+        later = await asyncio.wait_for(search.ainvoke({"query": "same"}), 1)
+        assert later["query"] == "same"
+
+    async def test_identical_calls_of_other_caches_not_shared(self, cache):
+        other = ToolResultCache({"web_search": 60})
+        cancelled = asyncio.create_task(
+            cache.wrap_tool(WebSearchTool()).ainvoke({"query": "same"})
+        )
+        await asyncio.sleep(0.01)
+        other_call = asyncio.create_task(
+            other.wrap_tool(WebSearchTool()).ainvoke({"query": "same"})
+        )
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+
+        assert (await other_call)["query"] == "same"
+        assert calls["web_search"] == 2
+
+    async def test_errors_not_cached(self, cache):
+        search = cache.wrap_tool(WebSearchTool())
+        for _ in range(2):
+            with pytest.raises(ValueError, match="search failed"):
+                await search.ainvoke({"query": "fail"})
+        assert calls["web_search"] == 2
+
+    async def test_large_results_not_cached(self):
+        cache = ToolResultCache({"fetch_page": ToolCachePolicy(max_result_size=10)})
+        fetch = cache.wrap_tool(fetch_page)
+        await fetch.ainvoke({"url": "https://example.com"})
+        await fetch.ainvoke({"url": "https://example.com"})
+        assert calls["fetch_page"] == 2
+
+    def test_sync_tool_cached_in_sync_and_async_calls(self, cache):
+        fetch = cache.wrap_tool(fetch_page)
+        first = fetch.invoke({"url": "https://example.com"})
+        assert asyncio.run(fetch.ainvoke({"url": "https://example.com"})) == first
+        assert calls["fetch_page"] == 1
+
+    async def test_sync_call_from_async_code_cached(self, cache):
+        fetch = cache.wrap_tool(fetch_page)
+        first = fetch.invoke({"url": "https://example.com"})
+        assert fetch.invoke({"url": "https://example.com"}) == first
+        assert calls["fetch_page"] == 1
+
+    async def test_cache_hit_event(self, cache):
+        search = cache.wrap_tool(WebSearchTool())
+        collector = EventCollector()
+
+        await search.ainvoke({"query": "a"}, config={"callbacks": [collector]})
+        assert collector.events == []
+        await search.ainvoke({"query": "a"}, config={"callbacks": [collector]})
+
+        ((name, data),) = collector.events
+        assert name == CACHE_HIT_EVENT
+        assert data["tool_name"] == "web_search"
+        assert data["ttl"] == 60
+        assert data["age"] >= 0
+
+        message = LangGraphAdapter(compiled_graph=object())._handle_custom_event(
+            {"name": name, "data": data, "run_id": "run-1", "metadata": {}},
+            "session-1",
+            "task-1",
+            "en",
+        )
+        assert message.type == MessageType.LIVE_STATUS
+        assert message.detail["tool"] == "web_search"
+
+    async def test_lru_eviction(self):
+        backend = InMemoryToolResultCache(max_entries=2)
+        for key in ("a", "b"):
+            await backend.set(key, key, ttl=60)
+        await backend.get("a")
+        await backend.set("c", "c", ttl=60)
+
+        assert len(backend) == 2
+        assert await backend.get("b") is None
+        assert await backend.get("a") == "a"
+
+
+class TestToolResultCacheIntegration:
+    """Test cases for caching tools of agents and the registry"""
+
+    def test_agent_tools_wrapped(self, cache):
+        agent = Agent(
+            role="Researcher",
+            goal="Research",
+            backstory="Curious",
+            llm=FakeListLLM(responses=["ok"]),
+            tools=[fetch_page, write_file],
+            tool_cache=cache,
+        )
+        fetched, written = agent.tools
+        assert fetched is not fetch_page
+        assert written is write_file
+
+        fetched.invoke({"url": "https://example.com"})
+        fetched.invoke({"url": "https://example.com"})
+        assert calls["fetch_page"] == 1
+
+    def test_registry_tool_wrapped(self, cache):
+        ToolRegistry.register("web_search", WebSearchTool)
+        try:
+            search = ToolRegistry.get_tool("web_search", result_cache=cache)
+            assert search is not ToolRegistry.get_tool("web_search")
+            asyncio.run(search.ainvoke({"query": "a"}))
+            asyncio.run(search.ainvoke({"query": "a"}))
+            assert calls["web_search"] == 1
+        finally:
+            ToolRegistry._registered_tools.pop("web_search", None)
+            ToolRegistry._tool_cache.pop("web_search", None)
@@ -0,0 +1,6 @@
+"""
+Web package unit tests.
+
+This module contains unit tests for the langcrew.web package, including the
+LangGraph adapter, SSE streaming and the HTTP server.
+"""
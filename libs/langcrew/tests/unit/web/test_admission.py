@@ -0,0 +1,195 @@
+"""
+Unit tests for admission control.
+
+Tests cover global and per-user concurrency limits, FIFO queueing with
+position updates, fail-fast rejection and the AdapterServer integration.
+"""
+
+import asyncio
+import gc
+import json
+
+import httpx
+import pytest
+
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.admission import AdmissionController, AdmissionRejected
+from langcrew.web.http_server import AdapterServer
+from langcrew.web.protocol import ChatRequest
+from langcrew.web.websocket import WebSocketConnection
+
+
+class TestAdmissionController:
+    """Test cases for AdmissionController."""
+
+    def test_admits_up_to_global_limit(self):
+        controller = AdmissionController(max_concurrent_runs=2)
+
+        first = controller.enqueue("u1")
+        second = controller.enqueue("u2")
+        third = controller.enqueue("u3")
+
+        assert first.admitted and second.admitted
+        assert not third.admitted
+        assert third.position == 1
+        assert controller.running == 2
+        assert controller.queue_depth == 1
+
+    def test_release_admits_next_in_line(self):
+        controller = AdmissionController(max_concurrent_runs=1)
+        first = controller.enqueue("u1")
+        second = controller.enqueue("u2")
+        third = controller.enqueue("u3")
+
+        first.release()
+
+        assert second.admitted
+        assert third.position == 1
+        assert controller.stats()["admitted_total"] == 2
+
+    def test_per_user_limit_skips_blocked_user(self):
+        controller = AdmissionController(
+            max_concurrent_runs=10, max_concurrent_runs_per_user=1
+        )
+        controller.enqueue("u1")
+        blocked = controller.enqueue("u1")
+        other = controller.enqueue("u2")
+
+        assert not blocked.admitted
+        assert other.admitted
+
+    def test_anonymous_requests_only_use_global_limit(self):
+        controller = AdmissionController(max_concurrent_runs_per_user=1)
+
+        assert controller.enqueue(None).admitted
+        assert controller.enqueue(None).admitted
+
+    def test_rejects_when_queue_full(self):
+        controller = AdmissionController(
+            max_concurrent_runs=1, max_queue_size=1, retry_after_seconds=7
+        )
+        controller.enqueue("u1")
+        controller.enqueue("u2")
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            controller.enqueue("u3")
+
+        assert exc_info.value.retry_after == 7
+        assert controller.queue_depth == 1
+        assert controller.stats()["rejected_total"] == 1
+
+    async def test_wait_yields_positions_until_admitted(self):
+        controller = AdmissionController(max_concurrent_runs=1)
+        running = controller.enqueue("u1")
+        ahead = controller.enqueue("u2")
+        ticket = controller.enqueue("u3")
+
+        positions = []
+
+        async def wait():
+            async for position in ticket.wait():
+                positions.append(position)
+
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0)
+        running.release()
+        await asyncio.sleep(0)
+        ahead.release()
+        await asyncio.wait_for(waiter, 1)
+
+        assert positions == [2, 1]
+        assert ticket.admitted
+
+    async def test_abandoned_wait_leaves_queue(self):
+        controller = AdmissionController(max_concurrent_runs=1)
+        controller.enqueue("u1")
+        ticket = controller.enqueue("u2")
+
+        waiter = ticket.wait()
+        assert await waiter.__anext__() == 1
+        await waiter.aclose()
+
+        assert controller.queue_depth == 0
+
+
+class FakeGraph:
+    async def astream_events(self, input, config, **kwargs):
+        yield {"event": "on_chain_end", "run_id": "root", "parent_ids": [], "data": {}}
+
+
+class TestServerAdmission:
+    """Test cases for admission control in AdapterServer."""
+
+    def _server(self, admission: AdmissionController) -> AdapterServer:
+        return AdapterServer(
+            LangGraphAdapter(compiled_graph=FakeGraph()), admission=admission
+        )
+
+    async def test_slot_released_when_stream_never_read(self):
+        admission = AdmissionController(max_concurrent_runs=1)
+        server = self._server(admission)
+        ticket = server._admit(None)
+        chunks = server._chat_stream(
+            ChatRequest(message="hi", session_id="s1"), "s1", False, ticket
+        )
+        assert admission.running == 1
+
+        del chunks
+        gc.collect()
+        assert admission.running == 0
+
+    async def test_slot_released_when_ack_fails(self):
+        admission = AdmissionController(max_concurrent_runs=1)
+
+        class ClosedWebSocket:
+            async def send_text(self, text):
+                raise RuntimeError("WebSocket is closed")
+
+        connection = WebSocketConnection(self._server(admission), ClosedWebSocket())
+        with pytest.raises(RuntimeError):
+            await connection._chat({"op": "chat", "session_id": "s1", "message": "hi"})
+        assert admission.running == 0
+
+    async def test_queue_full_returns_429(self):
+        admission = AdmissionController(
+            max_concurrent_runs=1, max_queue_size=0, retry_after_seconds=3
+        )
+        admission.enqueue("someone-else")
+        server = self._server(admission)
+
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/chat", json={"message": "hi", "session_id": "s1"}
+            )
+            stats = (await client.get("/api/v1/admission/stats")).json()
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "3"
+        assert stats["rejected_total"] == 1
+
+    async def test_queued_run_reports_position_then_executes(self):
+        admission = AdmissionController(max_concurrent_runs=1)
+        blocker = admission.enqueue("someone-else")
+        server = self._server(admission)
+
+        asyncio.get_running_loop().call_later(0.05, blocker.release)
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/chat", json={"message": "hi", "session_id": "s1"}
+            )
+
+        messages = [
+            json.loads(line[len("data: ") :])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert messages[0]["type"] == "live_status"
+        assert messages[0]["detail"]["queue_position"] == 1
+        assert messages[-1]["type"] == "finish_reason"
+        assert admission.running == 0
@@ -0,0 +1,124 @@
+"""
+Unit tests for SSE text chunk coalescing.
+
+Tests cover the TextChunkCoalescer batching rules and the LangGraphAdapter
+integration that merges model tokens into fewer SSE messages.
+"""
+
+import json
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.coalescer import TextChunkCoalescer
+from langcrew.web.protocol import TaskInput
+
+
+def _stream_event(text: str, run_id: str = "run-1") -> dict:
+    return {
+        "event": "on_chat_model_stream",
+        "run_id": run_id,
+        "parent_ids": ["root"],
+        "data": {"chunk": AIMessageChunk(content=text)},
+        "metadata": {"langcrew_agent": "writer"},
+    }
+
+
+class FakeGraph:
+    """Minimal executor exposing astream_events."""
+
+    def __init__(self, events: list[dict]):
+        self.events = events
+
+    async def astream_events(self, input, config, **kwargs):
+        for event in self.events:
+            yield event
+
+
+def _parse(chunks: list[str]) -> list[dict]:
+    return [json.loads(chunk[len("data: ") :]) for chunk in chunks]
+
+
+class TestTextChunkCoalescer:
+    """Test cases for TextChunkCoalescer."""
+
+    def test_disabled_by_default(self):
+        assert not TextChunkCoalescer().enabled
+
+    def test_merges_same_run_within_window(self):
+        coalescer = TextChunkCoalescer(window_ms=10_000, max_bytes=1024)
+
+        assert coalescer.add(_stream_event("Hel"), "Hel") == []
+        assert coalescer.add(_stream_event("lo"), "lo") == []
+
+        batch = coalescer.flush()
+        assert batch.content == "Hello"
+        assert batch.run_id == "run-1"
+        assert coalescer.flush() is None
+
+    def test_flushes_on_byte_threshold(self):
+        coalescer = TextChunkCoalescer(window_ms=10_000, max_bytes=4)
+
+        assert coalescer.add(_stream_event("ab"), "ab") == []
+        ready = coalescer.add(_stream_event("cd"), "cd")
+
+        assert [batch.content for batch in ready] == ["abcd"]
+        assert not coalescer.has_pending
+
+    def test_flushes_on_run_change(self):
+        coalescer = TextChunkCoalescer(window_ms=10_000, max_bytes=1024)
+
+        coalescer.add(_stream_event("first", "run-1"), "first")
+        ready = coalescer.add(_stream_event("second", "run-2"), "second")
+
+        assert [batch.content for batch in ready] == ["first"]
+        assert coalescer.flush().run_id == "run-2"
+
+
+class TestAdapterCoalescing:
+    """Test cases for coalescing in LangGraphAdapter.execute."""
+
+    async def _run(self, adapter: LangGraphAdapter) -> list[dict]:
+        task_input = TaskInput(session_id="session-1", message="hi")
+        return _parse([chunk async for chunk in adapter.execute(task_input)])
+
+    def _events(self) -> list[dict]:
+        return [
+            _stream_event("Hel"),
+            _stream_event("lo "),
+            _stream_event("world"),
+            {
+                "event": "on_chat_model_end",
+                "run_id": "run-1",
+                "parent_ids": ["root"],
+                "data": {"output": AIMessage(content="Hello world")},
+                "metadata": {},
+            },
+            {"event": "on_chain_end", "run_id": "root", "parent_ids": [], "data": {}},
+        ]
+
+    async def test_tokens_sent_individually_when_disabled(self):
+        adapter = LangGraphAdapter(
+            compiled_graph=FakeGraph(self._events()), stream_coalesce_ms=0
+        )
+
+        messages = await self._run(adapter)
+        streamed = [m for m in messages if (m.get("detail") or {}).get("streaming")]
+
+        assert [m["content"] for m in streamed] == ["Hel", "lo ", "world"]
+
+    async def test_tokens_merged_and_flushed_before_model_end(self):
+        adapter = LangGraphAdapter(
+            compiled_graph=FakeGraph(self._events()), stream_coalesce_ms=10_000
+        )
+
+        messages = await self._run(adapter)
+
+        assert messages[0]["content"] == "Hello world"
+        assert messages[0]["detail"]["streaming"] is True
+        assert messages[0]["detail"]["run_id"] == "run-1"
+        assert messages[0]["detail"]["langcrew_agent"] == "writer"
+        assert messages[0]["field_name"] == "content"
+        assert messages[1]["detail"]["full_content"] == "Hello world"
+        assert messages[-1]["type"] == "finish_reason"
+        assert messages[-1]["detail"]["status"] == "completed"
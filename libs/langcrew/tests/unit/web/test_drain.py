@@ -0,0 +1,115 @@
+"""
+Unit tests for draining AdapterServer on shutdown.
+
+Tests run a two-node LangGraph graph with a checkpointer in background runs,
+drain the server and check that finished runs complete, late runs are
+suspended and can be continued by another server, and new chats are
+rejected while draining.
+"""
+
+import asyncio
+import json
+from typing import Annotated, TypedDict
+
+import httpx
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import START, StateGraph
+from langgraph.graph.message import add_messages
+
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.http_server import AdapterServer
+from langcrew.web.protocol import ChatRequest
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+def _graph(delays: list[float], calls: list[str]):
+    """Graph running "plan" then "work", which sleeps for the next delay."""
+
+    async def plan(state: State):
+        calls.append("plan")
+        return {"messages": [AIMessage(content="planned")]}
+
+    async def work(state: State):
+        calls.append("work")
+        await asyncio.sleep(delays.pop(0))
+        return {"messages": [AIMessage(content="worked")]}
+
+    builder = StateGraph(State)
+    builder.add_node("plan", plan)
+    builder.add_node("work", work)
+    builder.add_edge(START, "plan")
+    builder.add_edge("plan", "work")
+    return builder.compile(checkpointer=InMemorySaver())
+
+
+def _start(server: AdapterServer, session_id: str, **request):
+    request = ChatRequest(session_id=session_id, **{"message": "go", **request})
+    chunks = server._chat_stream(request, session_id, False, None)
+    return server.runs.start(session_id, chunks)
+
+
+async def _finish(run) -> dict:
+    messages = [
+        json.loads(line[len("data: ") :])
+        async for chunk in run.stream()
+        for line in chunk.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert messages[-1]["type"] == "finish_reason"
+    return messages[-1]["detail"]
+
+
+class TestDrain:
+    """Test cases for AdapterServer.drain."""
+
+    async def test_in_flight_run_finishes(self):
+        graph = _graph([0.05], [])
+        server = AdapterServer(LangGraphAdapter(compiled_graph=graph))
+        run = _start(server, "s1")
+        await asyncio.sleep(0.01)
+
+        await server.drain(timeout=5)
+        assert (await _finish(run))["status"] == "completed"
+        assert not server._inflight
+
+    async def test_late_run_suspended_and_continued(self):
+        calls = []
+        graph = _graph([30, 0], calls)
+        server = AdapterServer(LangGraphAdapter(compiled_graph=graph))
+        run = _start(server, "s1")
+        while "work" not in calls:
+            await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(server.drain(timeout=0.05), 5)
+        detail = await _finish(run)
+        assert detail["status"] == "suspended"
+        assert detail["resumable"] is True
+
+        # Another worker sharing the checkpointer continues the run
+        other = AdapterServer(LangGraphAdapter(compiled_graph=graph))
+        detail = await _finish(_start(other, "s1", message="", continue_run=True))
+        assert detail["status"] == "completed"
+        assert calls == ["plan", "work", "work"]
+        state = await graph.aget_state({"configurable": {"thread_id": "s1"}})
+        assert [m.content for m in state.values["messages"]] == [
+            "go",
+            "planned",
+            "worked",
+        ]
+
+    async def test_rejects_new_runs_while_draining(self):
+        graph = _graph([], [])
+        server = AdapterServer(LangGraphAdapter(compiled_graph=graph))
+        await server.drain()
+
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.post("/api/v1/chat", json={"message": "hi"})
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,177 @@
+"""
+Unit tests for event filtering pushed into astream_events.
+
+Tests cover the filter arguments LangGraphAdapter passes to the executor and
+their effect on a real LangGraph run with a model, a tool and internal runs.
+"""
+
+import json
+from typing import Annotated, TypedDict
+
+from langchain_core.callbacks import adispatch_custom_event
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import tool
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from langcrew.utils.runnable_config_utils import (
+    INTERNAL_RUN_TAG,
+    internal_run_config,
+)
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.protocol import TaskInput
+
+from .test_stream_engine import _build_crew, _messages
+
+
+class RecordingGraph:
+    """Executor recording the keyword arguments of astream_events."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def astream_events(self, input, config, **kwargs):
+        self.calls.append((config, kwargs))
+        yield {"event": "on_chain_end", "parent_ids": [], "data": {}}
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+@tool
+async def lookup(query: str) -> str:
+    """Look up a query."""
+    # Runs started inside the tool: a tagged helper and a custom event
+    await RunnableLambda(lambda x: x.upper()).ainvoke(
+        query, config=internal_run_config()
+    )
+    await adispatch_custom_event("on_langcrew_new_message", {"content": query})
+    return f"result for {query}"
+
+
+def _build_graph():
+    model = GenericFakeChatModel(messages=iter([AIMessage(content="Hello there")]))
+
+    async def agent(state: State):
+        # Summarization-style internal model call, must never reach clients
+        await GenericFakeChatModel(
+            messages=iter([AIMessage(content="internal summary")])
+        ).ainvoke("summarize", config=internal_run_config())
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    async def tools(state: State):
+        return {"messages": [HumanMessage(content=await lookup.ainvoke("docs"))]}
+
+    builder = StateGraph(State)
+    builder.add_node("agent", agent)
+    builder.add_node("tools", tools)
+    builder.add_edge(START, "agent")
+    builder.add_edge("agent", "tools")
+    builder.add_edge("tools", END)
+    return builder.compile()
+
+
+async def _collect(adapter: LangGraphAdapter) -> list[dict]:
+    config = adapter._build_config("s1")
+    return [
+        event
+        async for event in adapter._astream_events_until_stopped(
+            "s1", {"messages": [HumanMessage(content="hi")]}, config
+        )
+    ]
+
+
+class TestEventFilters:
+    """Test cases for LangGraphAdapter event filters."""
+
+    async def test_filters_passed_to_executor(self):
+        graph = RecordingGraph()
+        adapter = LangGraphAdapter(compiled_graph=graph)
+
+        async for _ in adapter.execute(TaskInput(session_id="s1", message="hi")):
+            pass
+
+        config, kwargs = graph.calls[0]
+        assert config["run_name"] == "LangGraph"
+        assert kwargs["include_names"][0] == "LangGraph"
+        assert "on_langcrew_user_input_required" in kwargs["include_names"]
+        assert kwargs["include_types"] == ["chat_model", "llm", "tool"]
+        assert kwargs["exclude_tags"] == [INTERNAL_RUN_TAG]
+
+    async def test_keeps_user_run_name(self):
+        graph = RecordingGraph()
+        adapter = LangGraphAdapter(compiled_graph=graph)
+
+        filters = adapter._event_filters({"run_name": "support"})
+
+        assert filters["include_names"][0] == "support"
+
+    async def test_filtering_can_be_disabled(self):
+        graph = RecordingGraph()
+        adapter = LangGraphAdapter(compiled_graph=graph, filter_events=False)
+
+        async for _ in adapter.execute(TaskInput(session_id="s1", message="hi")):
+            pass
+
+        config, kwargs = graph.calls[0]
+        assert kwargs == {}
+        assert "run_name" not in config
+
+    async def test_filtered_run_keeps_consumed_events(self):
+        unfiltered = await _collect(
+            LangGraphAdapter(compiled_graph=_build_graph(), filter_events=False)
+        )
+        filtered = await _collect(LangGraphAdapter(compiled_graph=_build_graph()))
+
+        assert len(filtered) < len(unfiltered)
+        for event in filtered:
+            assert INTERNAL_RUN_TAG not in event.get("tags", [])
+            if event["event"].startswith("on_chain"):
+                assert event["parent_ids"] == []
+
+        kinds = {event["event"] for event in filtered}
+        assert {"on_chat_model_stream", "on_tool_start", "on_tool_end"} <= kinds
+        assert "on_custom_event" in kinds
+        assert filtered[-1]["event"] == "on_chain_end"
+        assert filtered[-1]["parent_ids"] == []
+
+        streamed = "".join(
+            event["data"]["chunk"].content
+            for event in filtered
+            if event["event"] == "on_chat_model_stream"
+        )
+        assert streamed == "Hello there"
+
+    async def test_execute_drops_internal_model_output(self):
+        async def run(filter_events: bool) -> list[dict]:
+            adapter = LangGraphAdapter(
+                compiled_graph=_build_graph(), filter_events=filter_events
+            )
+            messages = []
+            async for chunk in adapter.execute(
+                TaskInput(session_id="s1", message="hi")
+            ):
+                message = json.loads(chunk[len("data: ") :])
+                messages.append((message["type"], message["content"]))
+            return messages
+
+        filtered = await run(True)
+        unfiltered = await run(False)
+
+        # Without filters the internal summary is streamed as assistant text
+        assert "".join(content for _, content in unfiltered[:4]) == "internal summary"
+        assert filtered == unfiltered[4:]
+
+    async def test_streaming_tool_events_kept(self):
+        unfiltered = await _messages(
+            LangGraphAdapter(crew=_build_crew(), filter_events=False)
+        )
+        filtered = await _messages(LangGraphAdapter(crew=_build_crew()))
+
+        assert filtered == unfiltered
+        # The tool run, its START event and its three INTERMEDIATE events
+        tool_calls = [m[1] for m in filtered if m[0] == "tool_call"]
+        assert tool_calls == ["", "", "step 0", "step 1", "step 2"]
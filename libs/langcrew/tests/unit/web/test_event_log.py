@@ -0,0 +1,147 @@
+"""
+Unit tests for resumable SSE streams.
+
+Tests cover the per-run event log (replay and live tailing), event ID
+handling and the Last-Event-ID reconnect endpoint of AdapterServer.
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.event_log import ResumableRun, RunEventLog, RunRegistry
+from langcrew.web.http_server import AdapterServer
+
+
+class FakeGraph:
+    """Executor emitting a fixed list of events."""
+
+    def __init__(self, events: list[dict]):
+        self.events = events
+
+    async def astream_events(self, input, config, **kwargs):
+        for event in self.events:
+            yield event
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    frames = []
+    for frame in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.split("\n"))
+        frames.append((fields.get("id"), json.loads(fields["data"])))
+    return frames
+
+
+class TestRunEventLog:
+    """Test cases for RunEventLog."""
+
+    async def test_replay_then_live(self):
+        log = RunEventLog()
+        await log.append("a")
+        await log.append("b")
+
+        received = []
+
+        async def consume():
+            async for seq, chunk in log.subscribe(after_seq=0):
+                received.append((seq, chunk))
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        await log.append("c")
+        await log.close()
+        await asyncio.wait_for(consumer, 1)
+
+        assert received == [(1, "b"), (2, "c")]
+
+    async def test_bounded_buffer_drops_oldest(self):
+        log = RunEventLog(max_events=2)
+        for chunk in "abc":
+            await log.append(chunk)
+        await log.close()
+
+        received = [chunk async for _, chunk in log.subscribe()]
+
+        assert received == ["b", "c"]
+
+
+class TestResumableRun:
+    """Test cases for ResumableRun event IDs."""
+
+    def test_parse_event_id(self):
+        run = ResumableRun("s1")
+
+        assert run.parse_event_id(run.format_event_id(5)) == 5
+        assert run.parse_event_id(None) == -1
+        assert run.parse_event_id("other-run:5") == -1
+        assert run.parse_event_id(f"{run.run_id}:bogus") == -1
+
+    async def test_run_continues_without_subscribers(self):
+        registry = RunRegistry()
+
+        async def chunks():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield f"data: {i}\n\n"
+
+        run = registry.start("s1", chunks())
+        await asyncio.wait_for(run.task, 1)
+
+        assert registry.get("s1") is run
+        assert [chunk async for chunk in run.stream(run.format_event_id(1))] == [
+            f"id: {run.run_id}:2\ndata: 2\n\n"
+        ]
+
+
+class TestResumeEndpoint:
+    """Test cases for the Last-Event-ID reconnect endpoint."""
+
+    def _server(self) -> AdapterServer:
+        events = [
+            {
+                "event": "on_custom_event",
+                "name": "on_langcrew_new_message",
+                "run_id": "r",
+                "parent_ids": ["root"],
+                "data": {"new_message": f"message {i}"},
+            }
+            for i in range(3)
+        ]
+        events.append({
+            "event": "on_chain_end",
+            "run_id": "root",
+            "parent_ids": [],
+            "data": {},
+        })
+        return AdapterServer(LangGraphAdapter(compiled_graph=FakeGraph(events)))
+
+    async def test_reconnect_replays_missed_events(self):
+        server = self._server()
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/chat", json={"message": "hi", "session_id": "s1"}
+            )
+            frames = _parse_sse(response.text)
+            assert all(event_id for event_id, _ in frames)
+            assert frames[-1][1]["type"] == "finish_reason"
+
+            resumed = await client.get(
+                "/api/v1/chat/s1/stream", headers={"Last-Event-ID": frames[1][0]}
+            )
+
+        assert _parse_sse(resumed.text) == frames[2:]
+
+    async def test_reconnect_unknown_session(self):
+        server = self._server()
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.get("/api/v1/chat/missing/stream")
+
+        assert response.status_code == 404
@@ -0,0 +1,173 @@
+"""
+Unit tests for the session message history endpoint.
+
+Tests run a LangGraph agent (model, tool node, checkpointer) through the
+AdapterServer, then page through /api/v1/sessions/{id}/messages and check the
+StreamMessage conversion, cursors and ETag handling.
+"""
+
+from typing import Annotated, TypedDict
+
+import httpx
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import START, StateGraph
+from langgraph.graph.message import add_messages
+from langgraph.prebuilt import ToolNode, tools_condition
+
+from langcrew.agent import Agent
+from langcrew.crew import Crew
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.history import SessionHistory, SessionSnapshot, to_stream_messages
+from langcrew.web.http_server import AdapterServer
+
+from .test_stream_engine import ToolCallingFakeModel
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+@tool
+async def lookup(query: str) -> str:
+    """Look up a query."""
+    return f"result for {query}"
+
+
+def _builder() -> StateGraph:
+    model = ToolCallingFakeModel(
+        messages=iter([
+            AIMessage(
+                content="Checking",
+                tool_calls=[{"name": "lookup", "args": {"query": "docs"}, "id": "c1"}],
+            ),
+            AIMessage(content="Done"),
+        ])
+    )
+
+    async def agent(state: State):
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    builder = StateGraph(State)
+    builder.add_node("agent", agent)
+    builder.add_node("tools", ToolNode([lookup]))
+    builder.add_edge(START, "agent")
+    builder.add_conditional_edges("agent", tools_condition)
+    builder.add_edge("tools", "agent")
+    return builder
+
+
+def _client(adapter: LangGraphAdapter) -> httpx.AsyncClient:
+    server = AdapterServer(adapter, resumable=False)
+    transport = httpx.ASGITransport(app=server.app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def _chat(client: httpx.AsyncClient) -> str:
+    response = await client.post("/api/v1/chat", json={"message": "hi"})
+    assert response.status_code == 200
+    return response.headers["X-Session-ID"]
+
+
+class TestSessionHistory:
+    """Test cases for the session history endpoint."""
+
+    async def test_pages_newest_first(self):
+        graph = _builder().compile(checkpointer=InMemorySaver())
+        async with _client(LangGraphAdapter(compiled_graph=graph)) as client:
+            session_id = await _chat(client)
+            url = f"/api/v1/sessions/{session_id}/messages"
+
+            latest = await client.get(url, params={"limit": 2})
+            assert latest.status_code == 200
+            page = latest.json()
+            assert page["total"] == 4
+            assert page["next_cursor"] == "2"
+            types = [(m["type"], m["content"]) for m in page["messages"]]
+            assert types == [("tool_result", ""), ("text", "Done")]
+            assert page["messages"][0]["detail"]["result"] == "result for docs"
+            assert page["messages"][0]["detail"]["status"] == "success"
+
+            older = (await client.get(url, params={"limit": 2, "cursor": "2"})).json()
+            assert older["next_cursor"] is None
+            messages = older["messages"]
+            assert [m["role"] for m in messages] == ["user", "assistant", "assistant"]
+            assert [m["type"] for m in messages] == ["text", "text", "tool_call"]
+            assert messages[2]["detail"]["param"] == {"query": "docs"}
+            assert messages[2]["detail"]["tool_call_id"] == "c1"
+
+    async def test_etag(self):
+        graph = _builder().compile(checkpointer=InMemorySaver())
+        async with _client(LangGraphAdapter(compiled_graph=graph)) as client:
+            session_id = await _chat(client)
+            url = f"/api/v1/sessions/{session_id}/messages"
+
+            first = await client.get(url)
+            etag = first.headers["ETag"]
+            cached = await client.get(url, headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.headers["ETag"] == etag
+            other_page = await client.get(
+                url, params={"limit": 1}, headers={"If-None-Match": etag}
+            )
+            assert other_page.status_code == 200
+
+    async def test_crew_history(self):
+        agent = Agent(
+            role="Assistant",
+            goal="Help",
+            backstory="Helpful",
+            llm=GenericFakeChatModel(messages=iter([])),
+        )
+        crew = Crew(
+            agents=[agent], graph=_builder(), async_checkpointer=InMemorySaver()
+        )
+        async with _client(LangGraphAdapter(crew=crew)) as client:
+            session_id = await _chat(client)
+            page = (await client.get(f"/api/v1/sessions/{session_id}/messages")).json()
+        assert page["total"] == 4
+        assert page["messages"][-1]["content"] == "Done"
+
+    async def test_errors(self):
+        graph = _builder().compile(checkpointer=InMemorySaver())
+        async with _client(LangGraphAdapter(compiled_graph=graph)) as client:
+            missing = await client.get("/api/v1/sessions/unknown/messages")
+            assert missing.status_code == 404
+
+            session_id = await _chat(client)
+            url = f"/api/v1/sessions/{session_id}/messages"
+            for cursor in ("abc", "99", "-1"):
+                response = await client.get(url, params={"cursor": cursor})
+                assert response.status_code == 400
+            assert (await client.get(url, params={"limit": 0})).status_code == 422
+
+    @pytest.mark.parametrize(
+        "message,expected",
+        [
+            (HumanMessage(content="hi", id="h1"), [("text", "user")]),
+            (
+                AIMessage(
+                    content=[{"type": "text", "text": "thinking"}],
+                    tool_calls=[{"name": "user_input", "args": {}, "id": "c2"}],
+                ),
+                [("text", "assistant")],
+            ),
+            (
+                ToolMessage(content="boom", tool_call_id="c3", status="error"),
+                [("tool_result", "assistant")],
+            ),
+        ],
+    )
+    def test_to_stream_messages(self, message, expected):
+        converted = to_stream_messages(message, "s1", timestamp=1)
+        assert [(m.type.value, m.role) for m in converted] == expected
+        if isinstance(message, ToolMessage):
+            assert converted[0].detail["status"] == "failed"
+
+    def test_snapshot_page_bounds(self):
+        snapshot = SessionSnapshot(version="v", timestamp=0, messages=[None] * 5)
+        assert SessionHistory.page_bounds(snapshot, None, 2) == (3, 5)
+        assert SessionHistory.page_bounds(snapshot, "3", 10) == (0, 3)
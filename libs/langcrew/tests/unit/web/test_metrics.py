@@ -0,0 +1,177 @@
+"""
+Unit tests for the Prometheus run metrics.
+
+Tests run a LangGraph agent (streaming model, tool node, checkpointer) through
+LangGraphAdapter with RunMetrics enabled and check the recorded histograms,
+outcome counters and the /metrics endpoint.
+"""
+
+import asyncio
+from typing import Annotated, TypedDict
+
+import httpx
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import START, StateGraph
+from langgraph.graph.message import add_messages
+from langgraph.prebuilt import ToolNode, tools_condition
+from langgraph.types import interrupt
+
+from langcrew.agent import Agent
+from langcrew.crew import Crew
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.admission import AdmissionController
+from langcrew.web.http_server import AdapterServer
+from langcrew.web.metrics import RunMetrics
+from langcrew.web.protocol import TaskInput
+
+from .test_stream_engine import ToolCallingFakeModel
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+@tool
+async def lookup(query: str) -> str:
+    """Look up a query."""
+    await asyncio.sleep(0.01)
+    return f"result for {query}"
+
+
+def _builder(ask_user: bool = False) -> StateGraph:
+    model = ToolCallingFakeModel(
+        messages=iter([
+            AIMessage(
+                content="Let me check the docs",
+                tool_calls=[{"name": "lookup", "args": {"query": "docs"}, "id": "c1"}],
+            ),
+            AIMessage(content="All done"),
+        ])
+    )
+
+    async def agent(state: State):
+        if ask_user:
+            interrupt({"question": "Continue?"})
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    builder = StateGraph(State)
+    builder.add_node("agent", agent)
+    builder.add_node("tools", ToolNode([lookup]))
+    builder.add_edge(START, "agent")
+    builder.add_conditional_edges("agent", tools_condition)
+    builder.add_edge("tools", "agent")
+    return builder
+
+
+async def _run(adapter: LangGraphAdapter) -> None:
+    async for _ in adapter.execute(TaskInput(session_id="s1", message="hi")):
+        pass
+
+
+def _value(metrics: RunMetrics, name: str, **labels) -> float | None:
+    return metrics.registry.get_sample_value(name, labels)
+
+
+class TestRunMetrics:
+    """Test cases for RunMetrics."""
+
+    @pytest.mark.parametrize("engine", LangGraphAdapter.ENGINES)
+    async def test_records_run_breakdown(self, engine):
+        metrics = RunMetrics()
+        graph = _builder().compile(checkpointer=InMemorySaver())
+        adapter = LangGraphAdapter(compiled_graph=graph, engine=engine, metrics=metrics)
+        await _run(adapter)
+
+        crew = adapter.metrics_label
+        assert crew == "LangGraph"
+        ttft = "langcrew_time_to_first_token_seconds_count"
+        assert _value(metrics, ttft, crew=crew, agent="") == 1
+        rate = "langcrew_model_tokens_per_second_count"
+        assert _value(metrics, rate, crew=crew, agent="") == 2
+        node = "langcrew_node_duration_seconds_count"
+        assert _value(metrics, node, crew=crew, node="agent") == 2
+        assert _value(metrics, node, crew=crew, node="tools") == 1
+        tool_sum = _value(
+            metrics,
+            "langcrew_tool_duration_seconds_sum",
+            crew=crew,
+            agent="",
+            tool="lookup",
+        )
+        assert tool_sum >= 0.01
+        checkpoint = "langcrew_checkpoint_duration_seconds_count"
+        assert _value(metrics, checkpoint, crew=crew, operation="load") >= 1
+        assert _value(metrics, checkpoint, crew=crew, operation="save") >= 1
+        assert _value(metrics, "langcrew_failures_total", crew=crew) is None
+
+    async def test_counts_outcomes(self):
+        metrics = RunMetrics()
+        graph = _builder(ask_user=True).compile(checkpointer=InMemorySaver())
+        adapter = LangGraphAdapter(compiled_graph=graph, metrics=metrics)
+        await _run(adapter)
+        assert _value(metrics, "langcrew_interrupts_total", crew="LangGraph") == 1
+
+        stream = adapter.execute(TaskInput(session_id="s2", message="hi"))
+        await stream.__anext__()
+        await stream.aclose()
+        assert _value(metrics, "langcrew_cancellations_total", crew="LangGraph") == 1
+
+    async def test_crew_compile_timed(self):
+        metrics = RunMetrics()
+        agent = Agent(
+            role="Assistant",
+            goal="Help",
+            backstory="Helpful",
+            llm=GenericFakeChatModel(messages=iter([])),
+        )
+        crew = Crew(
+            agents=[agent], graph=_builder(), async_checkpointer=InMemorySaver()
+        )
+        adapter = LangGraphAdapter(crew=crew, metrics=metrics)
+        # Instrumenting twice must not wrap twice
+        metrics.instrument_executor(crew, adapter.metrics_label)
+        await _run(adapter)
+
+        label = adapter.metrics_label
+        assert label == "Crew"
+        assert _value(metrics, "langcrew_graph_compile_seconds_count", crew=label) == 1
+        assert _value(
+            metrics,
+            "langcrew_checkpoint_duration_seconds_count",
+            crew=label,
+            operation="save",
+        )
+
+    async def test_metrics_endpoint(self):
+        metrics = RunMetrics()
+        graph = _builder().compile(checkpointer=InMemorySaver())
+        server = AdapterServer(
+            LangGraphAdapter(compiled_graph=graph, metrics=metrics),
+            resumable=False,
+            admission=AdmissionController(max_concurrent_runs=1),
+        )
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.post("/api/v1/chat", json={"message": "hi"})
+            assert response.status_code == 200
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'langcrew_queue_wait_seconds_count{crew="LangGraph"} 1.0' in (
+            response.text
+        )
+        assert "langcrew_tool_duration_seconds_bucket" in response.text
+
+    def test_endpoint_disabled_without_metrics(self, monkeypatch):
+        monkeypatch.delenv("LANGCREW_METRICS", raising=False)
+        graph = GenericFakeChatModel(messages=iter([]))
+        server = AdapterServer(LangGraphAdapter(compiled_graph=graph))
+        paths = {route.path for route in server.app.routes}
+        assert "/metrics" not in paths
@@ -0,0 +1,84 @@
+"""
+Unit tests for StreamMessage fast serialization.
+
+The fast path must stay byte-compatible with pydantic's model_dump_json().
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from langchain_core.messages import ToolMessage
+
+from langcrew.web.protocol import MessageType, StreamMessage, ToolResult
+from langcrew.web.serialization import TaskEnvelope, dumps_stream_message
+
+
+class TestDumpsStreamMessage:
+    """Test cases for dumps_stream_message."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "plain text",
+            'quotes " and backslash \\ and slash /',
+            "control \x00\x01\x1f\n\t\r\b\f chars",
+            "中文 émoji 😀  ",
+        ],
+    )
+    def test_matches_model_dump_json(self, content):
+        message = StreamMessage(
+            id="1748438204041_a7k9",
+            type=MessageType.TOOL_RESULT,
+            content=content,
+            detail={
+                "status": ToolResult.SUCCESS,
+                "result": ToolMessage(content=content, tool_call_id="call_1"),
+                "numbers": [1, 1.5, 1e20, float("nan")],
+                "nested": {"none": None, "flag": True},
+                "at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            },
+            timestamp=1748438204041,
+            session_id="session-1",
+            task_id="session-1_204041",
+        )
+
+        assert dumps_stream_message(message) == message.model_dump_json()
+
+    def test_falls_back_for_unsupported_values(self):
+        message = StreamMessage(
+            id="1",
+            type=MessageType.TEXT,
+            content="",
+            detail={"big": 2**70},
+            timestamp=1,
+        )
+
+        assert dumps_stream_message(message) == message.model_dump_json()
+
+
+class TestTaskEnvelope:
+    """Test cases for the precomputed token path."""
+
+    @pytest.mark.parametrize("trace_id", [None, "abc123"])
+    def test_text_chunk_matches_model_dump_json(self, trace_id):
+        envelope = TaskEnvelope("session-1", "session-1_204041", trace_id)
+        detail = {"streaming": True, "run_id": "run-1", "langcrew_agent": "writer"}
+
+        expected = StreamMessage(
+            id="1748438204041_a7k9",
+            type=MessageType.TEXT,
+            content='tok"en 😀\n',
+            detail=detail,
+            role="assistant",
+            timestamp=1748438204041,
+            session_id="session-1",
+            task_id="session-1_204041",
+            trace_id=trace_id,
+            field_name="content",
+        ).model_dump_json()
+
+        actual = envelope.text_chunk(
+            "1748438204041_a7k9", 'tok"en 😀\n', detail, 1748438204041
+        )
+
+        assert actual == expected
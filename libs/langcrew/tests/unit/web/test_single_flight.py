@@ -0,0 +1,111 @@
+"""
+Unit tests for single-flight chat handling in AdapterServer.
+
+Tests send concurrent chats for one session and check that retries join the
+running run, and that other requests are rejected or queued.
+"""
+
+import asyncio
+import gc
+from typing import Annotated, TypedDict
+
+import httpx
+import pytest
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import START, StateGraph
+from langgraph.graph.message import add_messages
+
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.http_server import AdapterServer
+from langcrew.web.protocol import ChatRequest
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+def _server(calls: list[str], **server_options) -> AdapterServer:
+    async def agent(state: State):
+        calls.append(state["messages"][-1].content)
+        await asyncio.sleep(0.1)
+        return {"messages": [AIMessage(content="done")]}
+
+    builder = StateGraph(State)
+    builder.add_node("agent", agent)
+    builder.add_edge(START, "agent")
+    graph = builder.compile(checkpointer=InMemorySaver())
+    return AdapterServer(LangGraphAdapter(compiled_graph=graph), **server_options)
+
+
+async def _post_twice(server: AdapterServer, first: str, second: str):
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+
+        async def post(message: str, delay: float):
+            await asyncio.sleep(delay)
+            return await c.post(
+                "/api/v1/chat", json={"message": message, "session_id": "s1"}
+            )
+
+        return await asyncio.gather(post(first, 0), post(second, 0.02))
+
+
+class TestSingleFlight:
+    """Test cases for concurrent chats of one session."""
+
+    async def test_retry_joins_running_run(self):
+        calls = []
+        server = _server(calls)
+        first, retry = await _post_twice(server, "hi", "hi")
+
+        assert calls == ["hi"]
+        assert retry.status_code == 200
+        assert "finish_reason" in retry.text
+        # Both clients received the same events
+        assert first.text == retry.text
+        # The joined retry registers no chat of its own
+        assert not server._chats
+
+    async def test_unread_chat_stream_released(self):
+        calls = []
+        server = _server(calls, resumable=False)
+        request = ChatRequest(message="hi", session_id="s1")
+        chunks = server._chat_stream(request, "s1", False, None)
+        assert "s1" in server._chats
+
+        # Client gone before the response body was read
+        del chunks
+        gc.collect()
+        assert not server._chats
+        assert calls == []
+
+    async def test_different_message_rejected(self):
+        calls = []
+        first, other = await _post_twice(_server(calls), "hi", "bye")
+
+        assert first.status_code == 200
+        assert other.status_code == 409
+        assert calls == ["hi"]
+
+    async def test_different_message_queued(self):
+        calls = []
+        server = _server(calls, session_conflict="queue")
+        first, other = await _post_twice(server, "hi", "bye")
+
+        assert first.status_code == other.status_code == 200
+        assert calls == ["hi", "bye"]
+        assert not server._chats
+
+    async def test_retry_without_resumable_runs_rejected(self):
+        calls = []
+        server = _server(calls, resumable=False, session_conflict="queue")
+        first, retry = await _post_twice(server, "hi", "hi")
+
+        assert first.status_code == 200
+        assert retry.status_code == 409
+        assert calls == ["hi"]
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            _server([], session_conflict="drop")
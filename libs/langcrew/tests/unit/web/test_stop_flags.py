@@ -0,0 +1,212 @@
+"""
+Unit tests for stop flag backends and adapter cancellation.
+
+Tests cover the in-memory and Redis-protocol backends (with a local fake
+client) and the active cancellation of running graphs in LangGraphAdapter.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.protocol import TaskInput
+from langcrew.web.stop_flags import InMemoryStopFlagBackend, RedisStopFlagBackend
+
+
+class FakeRedis:
+    """In-process stand-in for an async Redis client shared by workers."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.expirations: dict[str, int] = {}
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode("utf-8") if isinstance(value, str) else value
+        self.expirations[key] = ex
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+class FlakyRedis(FakeRedis):
+    """FakeRedis whose first ``failures`` reads fail."""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    async def get(self, key):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("connection reset")
+        return await super().get(key)
+
+
+class BrokenStopFlagBackend(InMemoryStopFlagBackend):
+    """Backend that cannot watch for stop flags."""
+
+    async def wait_for_flag(self, session_id):
+        raise ConnectionError("backend down")
+
+
+class ShortGraph:
+    """Executor that emits one event and finishes shortly after."""
+
+    async def astream_events(self, input, config, **kwargs):
+        yield {"event": "on_chain_start", "run_id": "root", "parent_ids": []}
+        await asyncio.sleep(0.05)
+        yield {"event": "on_chain_end", "run_id": "root", "parent_ids": [], "data": {}}
+
+
+class BlockingGraph:
+    """Executor that emits one event and then hangs until cancelled."""
+
+    def __init__(self):
+        self.cancelled = asyncio.Event()
+
+    async def astream_events(self, input, config, **kwargs):
+        yield {"event": "on_chain_start", "run_id": "root", "parent_ids": []}
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+
+class TestInMemoryStopFlagBackend:
+    """Test cases for InMemoryStopFlagBackend."""
+
+    async def test_set_get_clear(self):
+        backend = InMemoryStopFlagBackend()
+
+        await backend.set_flag("s1", {"stop_reason": "bye"})
+        assert await backend.get_flag("s1") == {"stop_reason": "bye"}
+
+        await backend.clear_flag("s1")
+        assert await backend.get_flag("s1") is None
+
+    async def test_wait_is_notified(self):
+        backend = InMemoryStopFlagBackend()
+        waiter = asyncio.create_task(backend.wait_for_flag("s1"))
+        await asyncio.sleep(0)
+
+        await backend.set_flag("s1", {"stop_reason": "bye"})
+
+        assert await asyncio.wait_for(waiter, 1) == {"stop_reason": "bye"}
+        assert backend._waiters == {}
+
+
+class TestRedisStopFlagBackend:
+    """Test cases for RedisStopFlagBackend."""
+
+    def test_requires_client_or_url(self):
+        with pytest.raises(ValueError):
+            RedisStopFlagBackend()
+
+    async def test_flag_stored_as_json_with_ttl(self):
+        redis = FakeRedis()
+        backend = RedisStopFlagBackend(client=redis, ttl=60)
+
+        await backend.set_flag("s1", {"stop_reason": "bye"})
+
+        assert json.loads(redis.data["langcrew:stop:s1"]) == {"stop_reason": "bye"}
+        assert redis.expirations["langcrew:stop:s1"] == 60
+        assert await backend.get_flag("s1") == {"stop_reason": "bye"}
+
+        await backend.clear_flag("s1")
+        assert await backend.get_flag("s1") is None
+
+    async def test_wait_sees_flag_set_by_other_worker(self):
+        redis = FakeRedis()
+        streaming_worker = RedisStopFlagBackend(client=redis, poll_interval=0.01)
+        stopping_worker = RedisStopFlagBackend(client=redis)
+
+        waiter = asyncio.create_task(streaming_worker.wait_for_flag("s1"))
+        await asyncio.sleep(0.02)
+        assert not waiter.done()
+
+        await stopping_worker.set_flag("s1", {"stop_reason": "remote"})
+
+        assert await asyncio.wait_for(waiter, 1) == {"stop_reason": "remote"}
+
+    async def test_wait_survives_read_errors(self):
+        redis = FlakyRedis(failures=3)
+        streaming_worker = RedisStopFlagBackend(client=redis, poll_interval=0.01)
+        streaming_worker.MAX_POLL_BACKOFF = 0.02
+        stopping_worker = RedisStopFlagBackend(client=redis)
+
+        waiter = asyncio.create_task(streaming_worker.wait_for_flag("s1"))
+        await asyncio.sleep(0.1)
+        assert redis.failures == 0
+        assert not waiter.done()
+
+        await stopping_worker.set_flag("s1", {"stop_reason": "remote"})
+
+        assert await asyncio.wait_for(waiter, 1) == {"stop_reason": "remote"}
+
+
+class TestAdapterCancellation:
+    """Test cases for stop handling in LangGraphAdapter.execute."""
+
+    @pytest.mark.parametrize(
+        "backend_factory",
+        [
+            InMemoryStopFlagBackend,
+            lambda: RedisStopFlagBackend(client=FakeRedis(), poll_interval=0.01),
+        ],
+    )
+    async def test_stop_cancels_running_graph(self, backend_factory):
+        graph = BlockingGraph()
+        adapter = LangGraphAdapter(
+            compiled_graph=graph, stop_flag_backend=backend_factory()
+        )
+        task_input = TaskInput(session_id="s1", message="hi")
+
+        async def consume():
+            return [chunk async for chunk in adapter.execute(task_input)]
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        await adapter.set_stop_flag("s1", "User stopped")
+
+        chunks = await asyncio.wait_for(consumer, 1)
+        finish = json.loads(chunks[-1][len("data: ") :])
+
+        assert graph.cancelled.is_set()
+        assert finish["type"] == "finish_reason"
+        assert finish["detail"]["status"] == "cancelled"
+        assert finish["content"] == "User stopped"
+        assert await adapter.stop_flag_backend.get_flag("s1") is None
+
+    async def test_closing_stream_cancels_graph(self):
+        graph = BlockingGraph()
+        adapter = LangGraphAdapter(compiled_graph=graph)
+        stream = adapter.execute(TaskInput(session_id="s1", message="hi"))
+
+        consumer = asyncio.create_task(stream.__anext__())
+        await asyncio.sleep(0.05)
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+        await stream.aclose()
+
+        assert graph.cancelled.is_set()
+
+    async def test_watcher_error_logged(self, caplog):
+        adapter = LangGraphAdapter(
+            compiled_graph=ShortGraph(), stop_flag_backend=BrokenStopFlagBackend()
+        )
+        task_input = TaskInput(session_id="s1", message="hi")
+
+        chunks = [chunk async for chunk in adapter.execute(task_input)]
+
+        # The run is not affected, the watcher error is reported
+        finish = json.loads(chunks[-1][len("data: ") :])
+        assert finish["type"] == "finish_reason"
+        assert "Stop flag watcher for session s1 failed" in caplog.text
+        assert "backend down" in caplog.text
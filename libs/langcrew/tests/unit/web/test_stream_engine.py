@@ -0,0 +1,220 @@
+"""
+Unit tests for the stream-mode adapter engine.
+
+Tests run the same LangGraph agent (streaming model, tool node, custom events,
+interrupts) through both LangGraphAdapter engines and compare the produced
+stream messages.
+"""
+
+import json
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.callbacks import adispatch_custom_event
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+from langgraph.prebuilt import ToolNode, tools_condition
+from langgraph.types import interrupt
+
+from langcrew.agent import Agent
+from langcrew.crew import Crew
+from langcrew.tools import StreamEventType, StreamingBaseTool
+from langcrew.utils.runnable_config_utils import internal_run_config
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.protocol import TaskInput
+
+
+class ToolCallingFakeModel(GenericFakeChatModel):
+    """Fake chat model that also streams the tool calls of its messages."""
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        message = next(self.messages)
+        for token in message.content.split(" "):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+        if message.tool_calls:
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": call["name"],
+                            "args": json.dumps(call["args"]),
+                            "id": call["id"],
+                            "index": index,
+                        }
+                        for index, call in enumerate(message.tool_calls)
+                    ],
+                )
+            )
+
+
+class ToolCallingAgentModel(ToolCallingFakeModel):
+    """ToolCallingFakeModel usable as the model of a langcrew Agent."""
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+class BrowseTool(StreamingBaseTool):
+    name: str = "browse"
+    description: str = "Browse pages step by step"
+
+    async def _astream_events(self, query: str):
+        yield StreamEventType.START, self.start_standard_stream_event({"query": query})
+        for step in range(3):
+            yield (
+                StreamEventType.INTERMEDIATE,
+                self.start_standard_stream_event({"brief": f"step {step}"}),
+            )
+        # Untagged model call inside the tool, its tokens are not streamed
+        summarizer = GenericFakeChatModel(messages=iter([AIMessage(content="page")]))
+        async for _ in summarizer.astream("summarize"):
+            pass
+        yield StreamEventType.END, self.end_standard_stream_event("browsed")
+
+
+def _build_crew() -> Crew:
+    """Crew whose agent calls the streaming BrowseTool once."""
+    model = ToolCallingAgentModel(
+        messages=iter([
+            AIMessage(
+                content="Let me check",
+                tool_calls=[{"name": "browse", "args": {"query": "docs"}, "id": "c1"}],
+            ),
+            AIMessage(content="All done"),
+        ])
+    )
+    agent = Agent(
+        role="Researcher",
+        goal="Browse",
+        backstory="Browses the web",
+        llm=model,
+        tools=[BrowseTool()],
+    )
+    return Crew(agents=[agent])
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+@tool
+async def lookup(query: str) -> str:
+    """Look up a query."""
+    await adispatch_custom_event("on_langcrew_new_message", {"new_message": query})
+    return f"result for {query}"
+
+
+@tool
+async def broken(query: str) -> str:
+    """Always fails."""
+    raise ValueError("lookup service down")
+
+
+def _build_graph(tool_name: str = "lookup", ask_user: bool = False):
+    model = ToolCallingFakeModel(
+        messages=iter([
+            AIMessage(
+                content="Let me check",
+                tool_calls=[{"name": tool_name, "args": {"query": "docs"}, "id": "c1"}],
+            ),
+            AIMessage(content="All done"),
+        ])
+    )
+
+    async def agent(state: State):
+        await GenericFakeChatModel(
+            messages=iter([AIMessage(content="internal summary")])
+        ).ainvoke("summarize", config=internal_run_config())
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    def confirm(state: State):
+        interrupt({"question": "Continue?"})
+        return {}
+
+    builder = StateGraph(State)
+    builder.add_node("agent", agent)
+    builder.add_node("tools", ToolNode([lookup, broken], handle_tool_errors=True))
+    builder.add_edge(START, "agent")
+    builder.add_conditional_edges("agent", tools_condition)
+    builder.add_edge("tools", "agent")
+    if ask_user:
+        builder.add_node("confirm", confirm)
+        builder.add_edge(START, "confirm")
+        builder.add_edge("confirm", END)
+    return builder.compile(checkpointer=InMemorySaver())
+
+
+async def _run(engine: str, **graph_options) -> list[tuple]:
+    adapter = LangGraphAdapter(
+        compiled_graph=_build_graph(**graph_options), engine=engine
+    )
+    return await _messages(adapter)
+
+
+async def _messages(adapter: LangGraphAdapter) -> list[tuple]:
+    messages = []
+    async for chunk in adapter.execute(TaskInput(session_id="s1", message="hi")):
+        message = json.loads(chunk[len("data: ") :])
+        detail = message["detail"]
+        messages.append((
+            message["type"],
+            message["content"],
+            detail.get("tool"),
+            detail.get("status"),
+            detail.get("full_content"),
+        ))
+    return messages
+
+
+class TestStreamEngine:
+    """Test cases for the stream-mode engine."""
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError):
+            LangGraphAdapter(compiled_graph=_build_graph(), engine="fast")
+
+    async def test_same_messages_as_events_engine(self):
+        events = await _run("events")
+        stream = await _run("stream")
+
+        assert stream == events
+        types = [message[0] for message in stream]
+        assert types[-1] == "finish_reason"
+        assert "tool_call" in types
+        assert ("text", "docs", None, None, None) in stream
+        assert ("tool_result", "", "lookup", "success", None) in stream
+        assert not any("internal" in str(message[1]) for message in stream)
+
+        # Streaming tool events are converted by the crew's tool callbacks
+        events = await _messages(LangGraphAdapter(crew=_build_crew()))
+        stream = await _messages(LangGraphAdapter(crew=_build_crew(), engine="stream"))
+
+        assert stream == events
+        tool_calls = [m[1] for m in stream if m[0] == "tool_call"]
+        assert tool_calls == ["", "", "step 0", "step 1", "step 2"]
+        assert not any(m[1] == "page" for m in stream)
+
+    async def test_tool_error(self):
+        events = await _run("events", tool_name="broken")
+        stream = await _run("stream", tool_name="broken")
+
+        assert stream == events
+        failed = [m for m in stream if m[0] == "tool_result"]
+        assert failed[0][3] == "failed"
+        assert "lookup service down" in failed[0][1]
+
+    async def test_interrupt(self):
+        events = await _run("events", ask_user=True)
+        stream = await _run("stream", ask_user=True)
+
+        assert stream == events
+        assert stream[0][0] == "user_input"
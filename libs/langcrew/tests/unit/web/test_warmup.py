@@ -0,0 +1,116 @@
+"""
+Unit tests for warming up the executor on server startup.
+
+Tests run Crew.awarmup and AdapterServer.warmup and check the /ready endpoint
+before, during and after warm-up, while retrying a failure and while draining.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langgraph.checkpoint.memory import InMemorySaver
+
+from langcrew.agent import Agent
+from langcrew.crew import Crew
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.http_server import AdapterServer
+
+
+def _crew() -> Crew:
+    agent = Agent(
+        role="Assistant",
+        goal="Help",
+        backstory="Helpful",
+        llm=GenericFakeChatModel(messages=iter([])),
+    )
+    return Crew(agents=[agent], async_checkpointer=InMemorySaver())
+
+
+async def _ready(server: AdapterServer) -> httpx.Response:
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        return await c.get("/ready")
+
+
+class TestWarmup:
+    """Test cases for Crew.awarmup and the readiness endpoint."""
+
+    async def test_crew_awarmup(self):
+        crew = _crew()
+        timings = await crew.awarmup()
+        assert set(timings) == {"tool_discovery", "graph"}
+        # Safe to call again
+        assert set(await crew.awarmup()) == {"tool_discovery", "graph"}
+
+    async def test_ready_after_warmup(self):
+        server = AdapterServer(LangGraphAdapter(crew=_crew()))
+        response = await _ready(server)
+        assert response.status_code == 503
+        assert response.json()["status"] == "starting"
+
+        await server.warmup()
+        response = await _ready(server)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert set(body["warmup"]) == {"tool_discovery", "graph", "stop_flags"}
+
+    async def test_not_ready_while_warming_up(self):
+        server = AdapterServer(LangGraphAdapter(crew=_crew()))
+        release = asyncio.Event()
+
+        async def slow_awarmup():
+            await release.wait()
+            return {}
+
+        with patch.object(server.adapter, "awarmup", slow_awarmup):
+            task = asyncio.create_task(server.warmup())
+            await asyncio.sleep(0)
+            response = await _ready(server)
+            assert response.status_code == 503
+            assert response.json()["status"] == "warming_up"
+            release.set()
+            await task
+        assert (await _ready(server)).status_code == 200
+
+    async def test_failed_warmup_retried(self):
+        server = AdapterServer(LangGraphAdapter(crew=_crew()))
+        server.WARMUP_RETRY_BASE = 0.01
+        attempts = 0
+        retried = asyncio.Event()
+
+        async def flaky_awarmup():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 2:
+                await retried.wait()
+            if attempts <= 2:
+                raise ConnectionError(f"database unreachable ({attempts})")
+            return {"graph": 0.1}
+
+        with patch.object(server.adapter, "awarmup", flaky_awarmup):
+            task = asyncio.create_task(server.warmup())
+            while attempts < 2:
+                await asyncio.sleep(0.01)
+            response = await _ready(server)
+            assert response.status_code == 503
+            assert response.json()["status"] == "failed"
+            assert response.json()["error"] == "database unreachable (1)"
+
+            retried.set()
+            await asyncio.wait_for(task, 1)
+        assert attempts == 3
+        response = await _ready(server)
+        assert response.status_code == 200
+        assert "error" not in response.json()
+
+    async def test_not_ready_while_draining(self):
+        server = AdapterServer(LangGraphAdapter(crew=_crew()), warmup=False)
+        async with server.app.router.lifespan_context(server.app):
+            assert (await _ready(server)).status_code == 200
+            await server.drain()
+            response = await _ready(server)
+        assert response.status_code == 503
+        assert response.json()["status"] == "draining"
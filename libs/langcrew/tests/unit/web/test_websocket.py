@@ -0,0 +1,238 @@
+"""
+Unit tests for the multiplexed WebSocket transport.
+
+Tests cover chat on several sessions over one connection, msgpack framing,
+stop and new_message operations, reconnecting with last_event_id, invalid
+frames and failing operations.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import ormsgpack
+import pytest
+from langchain_core.messages import AIMessageChunk
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from langcrew.web.adapter import LangGraphAdapter
+from langcrew.web.http_server import AdapterServer
+from langcrew.web.websocket import WebSocketConnection
+
+
+class FakeGraph:
+    """Executor streaming the user message back token by token."""
+
+    async def astream_events(self, input, config, **kwargs):
+        text = input["messages"][0].content
+        for token in text.split(" "):
+            yield {
+                "event": "on_chat_model_stream",
+                "run_id": "model",
+                "parent_ids": ["root"],
+                "data": {"chunk": AIMessageChunk(content=token)},
+            }
+        yield {"event": "on_chain_end", "run_id": "root", "parent_ids": [], "data": {}}
+
+
+class BlockingGraph:
+    """Executor that emits one token and then hangs until cancelled."""
+
+    async def astream_events(self, input, config, **kwargs):
+        yield {
+            "event": "on_chat_model_stream",
+            "run_id": "model",
+            "parent_ids": ["root"],
+            "data": {"chunk": AIMessageChunk(content="working")},
+        }
+        await asyncio.sleep(3600)
+
+
+class RecordingWebSocket:
+    """WebSocket stand-in recording the text frames sent."""
+
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_text(self, text: str):
+        self.sent.append(text)
+
+
+def _client(graph, **server_options) -> TestClient:
+    server = AdapterServer(LangGraphAdapter(compiled_graph=graph), **server_options)
+    return TestClient(server.app)
+
+
+def _receive_until_finished(ws, sessions: int, receive=None) -> list[dict]:
+    receive = receive or ws.receive_json
+    frames = []
+    finished = 0
+    while finished < sessions:
+        frame = receive()
+        frames.append(frame)
+        if frame["op"] == "message" and frame["data"]["type"] == "finish_reason":
+            finished += 1
+    return frames
+
+
+def _texts(frames: list[dict], session_id: str) -> list[str]:
+    return [
+        frame["data"]["content"]
+        for frame in frames
+        if frame["op"] == "message"
+        and frame["session_id"] == session_id
+        and frame["data"]["type"] == "text"
+    ]
+
+
+class TestWebSocket:
+    """Test cases for the /api/v1/ws endpoint."""
+
+    def test_multiplexes_sessions(self):
+        with _client(FakeGraph()).websocket_connect("/api/v1/ws") as ws:
+            ws.send_json({"op": "chat", "session_id": "s1", "message": "hello one"})
+            ws.send_json({"op": "chat", "session_id": "s2", "message": "hi two"})
+            frames = _receive_until_finished(ws, sessions=2)
+
+        acks = [frame for frame in frames if frame["op"] == "ack"]
+        assert {ack["session_id"] for ack in acks} == {"s1", "s2"}
+        assert _texts(frames, "s1") == ["hello", "one"]
+        assert _texts(frames, "s2") == ["hi", "two"]
+        message = next(frame for frame in frames if frame["op"] == "message")
+        assert message["event_id"].endswith(":0")
+
+    def test_new_session_gets_id(self):
+        with _client(FakeGraph()).websocket_connect("/api/v1/ws") as ws:
+            ws.send_json({"op": "chat", "message": "hello", "request_id": "r1"})
+            frames = _receive_until_finished(ws, sessions=1)
+
+        ack = frames[0]
+        assert ack["request_id"] == "r1"
+        assert ack["session_id"]
+        assert frames[1]["data"]["type"] == "session_init"
+        assert frames[1]["session_id"] == ack["session_id"]
+
+    def test_msgpack_encoding(self):
+        client = _client(FakeGraph(), resumable=False)
+        with client.websocket_connect("/api/v1/ws?encoding=msgpack") as ws:
+            ws.send_bytes(
+                ormsgpack.packb({"op": "chat", "session_id": "s1", "message": "a b"})
+            )
+            frames = _receive_until_finished(
+                ws, sessions=1, receive=lambda: ormsgpack.unpackb(ws.receive_bytes())
+            )
+
+        assert frames[0]["op"] == "ack"
+        assert _texts(frames, "s1") == ["a", "b"]
+        assert frames[1]["event_id"] is None
+
+    def test_stop_and_new_message(self):
+        with _client(BlockingGraph()).websocket_connect("/api/v1/ws") as ws:
+            ws.send_json({"op": "chat", "session_id": "s1", "message": "go"})
+            assert ws.receive_json()["op"] == "ack"
+            assert ws.receive_json()["data"]["content"] == "working"
+
+            ws.send_json({"op": "new_message", "session_id": "s1", "message": "x"})
+            ack = ws.receive_json()
+            assert ack["request"] == "new_message"
+            assert ack["success"] is False
+
+            ws.send_json({"op": "stop", "session_id": "s1", "reason": "enough"})
+            frames = _receive_until_finished(ws, sessions=1)
+
+        assert {"op": "ack", "request": "stop"}.items() <= frames[0].items()
+        assert frames[0]["success"] is True
+        finish = frames[-1]["data"]
+        assert finish["detail"]["status"] == "cancelled"
+
+    def test_subscribe_replays_after_event_id(self):
+        client = _client(FakeGraph())
+        with client.websocket_connect("/api/v1/ws") as ws:
+            ws.send_json({"op": "chat", "session_id": "s1", "message": "a b c"})
+            frames = _receive_until_finished(ws, sessions=1)
+
+        messages = [frame for frame in frames if frame["op"] == "message"]
+        with client.websocket_connect("/api/v1/ws") as ws:
+            ws.send_json({
+                "op": "subscribe",
+                "session_id": "s1",
+                "last_event_id": messages[0]["event_id"],
+            })
+            assert ws.receive_json()["op"] == "ack"
+            replayed = _receive_until_finished(ws, sessions=1)
+
+        assert replayed == messages[1:]
+
+    def test_invalid_frames(self):
+        with _client(FakeGraph()).websocket_connect("/api/v1/ws") as ws:
+            ws.send_text("not json")
+            assert ws.receive_json()["op"] == "error"
+
+            ws.send_json({"op": "dance"})
+            assert ws.receive_json()["detail"] == "Unknown op: dance"
+
+            ws.send_json({"op": "subscribe", "session_id": "missing"})
+            assert ws.receive_json()["op"] == "error"
+
+            ws.send_json({"op": "ping"})
+            assert ws.receive_json() == {"op": "pong"}
+
+    def test_failed_operation_keeps_connection(self):
+        server = AdapterServer(LangGraphAdapter(compiled_graph=FakeGraph()))
+        with patch.object(
+            server, "send_new_message", side_effect=RuntimeError("queue broken")
+        ):
+            with TestClient(server.app).websocket_connect("/api/v1/ws") as ws:
+                ws.send_json({
+                    "op": "new_message",
+                    "session_id": "s1",
+                    "message": "x",
+                    "request_id": "r1",
+                })
+                error = ws.receive_json()
+                assert error["op"] == "error"
+                assert error["request_id"] == "r1"
+                assert error["detail"] == "new_message failed: queue broken"
+
+                ws.send_json({"op": "ping"})
+                assert ws.receive_json() == {"op": "pong"}
+
+    def test_unknown_encoding_rejected(self):
+        with pytest.raises(WebSocketDisconnect):
+            with _client(FakeGraph()).websocket_connect("/api/v1/ws?encoding=xml"):
+                pass
+
+    async def test_chat_released_when_delivery_never_starts(self):
+        server = AdapterServer(
+            LangGraphAdapter(compiled_graph=BlockingGraph()), resumable=False
+        )
+        connection = WebSocketConnection(server, RecordingWebSocket())
+        await connection._chat({"op": "chat", "session_id": "s1", "message": "hi"})
+        assert "s1" in server._chats
+
+        # Connection closed right after the chat op
+        deliveries = list(connection._deliveries.values())
+        for task in deliveries:
+            task.cancel()
+        await asyncio.gather(*deliveries, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert not server._chats
+
+    @pytest.mark.parametrize("resumable", [True, False])
+    async def test_queued_chat_keeps_running_delivery(self, resumable):
+        server = AdapterServer(
+            LangGraphAdapter(compiled_graph=FakeGraph()),
+            resumable=resumable,
+            session_conflict="queue",
+        )
+        websocket = RecordingWebSocket()
+        connection = WebSocketConnection(server, websocket)
+        await connection._chat({"op": "chat", "session_id": "s1", "message": "a b"})
+        # Queued behind the first chat of the session
+        await connection._chat({"op": "chat", "session_id": "s1", "message": "c d"})
+        assert len(connection._deliveries) == 2
+
+        await asyncio.gather(*connection._deliveries.values())
+        frames = [json.loads(text) for text in websocket.sent]
+        assert _texts(frames, "s1") == ["a", "b", "c", "d"]